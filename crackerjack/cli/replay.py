@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-from collections.abc import Iterator
 from pathlib import Path
 
 from rich.console import Console
@@ -19,7 +18,9 @@ from crackerjack.core.ai_fix_events import (
     RunFinished,
     RunStarted,
 )
-from crackerjack.core.ai_fix_sinks import JsonlSink
+from crackerjack.core.ai_fix_run_store import EVENT_CLASSES, RunReader
+
+_KIND_NAMES: dict[str, str] = {cls.kind: cls.__name__ for cls in EVENT_CLASSES}
 
 
 def _format_event(event: AIFixEvent) -> str:
@@ -83,12 +84,8 @@ def _is_tier_transitioned(event: AIFixEvent) -> bool:
     return isinstance(event, TierTransitioned)
 
 
-def _summary(events: list[AIFixEvent]) -> dict[str, int]:
-    summary: dict[str, int] = {}
-    for e in events:
-        kind = type(e).__name__
-        summary[kind] = summary.get(kind, 0) + 1
-    return summary
+def _summary(counts: dict[str, int]) -> dict[str, int]:
+    return {_KIND_NAMES.get(kind, kind): count for kind, count in counts.items()}
 
 
 def render_replay(
@@ -96,47 +93,55 @@ def render_replay(
     *,
     base_dir: Path | None = None,
     console: Console | None = None,
+    iteration: int | None = None,
+    kind: str | None = None,
+    issue: str | None = None,
 ) -> int:
     console = console or Console()
-    events: Iterator[AIFixEvent] = JsonlSink.restore_run(run_id, base_dir=base_dir)
-    events_list = list(events)
-    if not events_list:
+    run_dir = (base_dir or Path.cwd()) / ".crackerjack" / "runs" / run_id
+    reader = RunReader(run_dir)
+    if not len(reader):
         console.print(
             f"[red]No events.jsonl found for run_id={run_id!r}[/red]\n"
-            f"Checked: {(base_dir or Path.cwd()) / '.crackerjack' / 'runs' / run_id / 'events.jsonl'}"
+            f"Checked: {run_dir / 'events.jsonl'}"
         )
         return 1
 
+    counts = reader.counts_by_kind()
     console.print(f"[bold]crackerjack replay[/bold] — run_id={run_id}")
-    console.print(f" events: {len(events_list)}")
-    summary = _summary(events_list)
+    console.print(f" events: {len(reader)}")
     console.print(
         " summary: "
-        + ", ".join(f"{kind}={count}" for kind, count in sorted(summary.items()))
+        + ", ".join(
+            f"{name}={count}" for name, count in sorted(_summary(counts).items())
+        )
     )
     console.print()
 
-    for event in events_list:
+    for event in reader.events(iteration=iteration, kind=kind, issue=issue):
         console.print(_format_event(event))
 
     table = Table(title="Run summary", show_header=True, header_style="bold cyan")
     table.add_column("Metric")
     table.add_column("Value", justify="right")
-    resolved = sum(1 for e in events_list if isinstance(e, IssueResolved))
-    failed = sum(1 for e in events_list if isinstance(e, IssueFailed))
-    dispatched = sum(1 for e in events_list if isinstance(e, AgentDispatched))
-    sessions_started = sum(1 for e in events_list if isinstance(e, FixSessionStarted))
-    sessions_finished = sum(1 for e in events_list if isinstance(e, FixSessionFinished))
     no_ops = sum(
-        e.no_op_count for e in events_list if isinstance(e, FixSessionFinished)
+        e.no_op_count
+        for e in reader.events(kind=FixSessionFinished.kind)
+        if isinstance(e, FixSessionFinished)
+    )
+    run_finished = next(
+        (e for e in reader.events(kind=RunFinished.kind) if isinstance(e, RunFinished)),
+        None,
+    )
+    table.add_row("iterations started", str(counts.get(IterationStarted.kind, 0)))
+    table.add_row("agents dispatched", str(counts.get(AgentDispatched.kind, 0)))
+    table.add_row("issues resolved", str(counts.get(IssueResolved.kind, 0)))
+    table.add_row("issues failed", str(counts.get(IssueFailed.kind, 0)))
+    table.add_row(
+        "fix sessions",
+        f"{counts.get(FixSessionFinished.kind, 0)}"
+        f"/{counts.get(FixSessionStarted.kind, 0)}",
     )
-    iterations = sum(1 for e in events_list if isinstance(e, IterationStarted))
-    run_finished = next((e for e in events_list if isinstance(e, RunFinished)), None)
-    table.add_row("iterations started", str(iterations))
-    table.add_row("agents dispatched", str(dispatched))
-    table.add_row("issues resolved", str(resolved))
-    table.add_row("issues failed", str(failed))
-    table.add_row("fix sessions", f"{sessions_finished}/{sessions_started}")
     table.add_row("total no-op fixes", str(no_ops))
     if run_finished is not None:
         table.add_row("run success", str(run_finished.success))
@@ -157,8 +162,31 @@ def main(argv: list[str] | None = None) -> int:
         default=None,
         help="Project base directory (defaults to cwd).",
     )
+    parser.add_argument(
+        "--iteration",
+        type=int,
+        default=None,
+        help="Only show events from this iteration.",
+    )
+    parser.add_argument(
+        "--kind",
+        choices=sorted(_KIND_NAMES),
+        default=None,
+        help="Only show events of this kind.",
+    )
+    parser.add_argument(
+        "--issue",
+        default=None,
+        help="Only show events for this issue signature.",
+    )
     args = parser.parse_args(argv)
-    return render_replay(args.run_id, base_dir=args.base_dir)
+    return render_replay(
+        args.run_id,
+        base_dir=args.base_dir,
+        iteration=args.iteration,
+        kind=args.kind,
+        issue=args.issue,
+    )
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 from contextlib import suppress
 from dataclasses import dataclass
@@ -60,39 +61,85 @@ class CloneGroup:
     line_count: int
 
 
+class _UnionFind:
+    def __init__(self) -> None:
+        self._parent: dict[str, str] = {}
+        self._rank: dict[str, int] = {}
+
+    def add(self, item: str) -> None:
+        if item not in self._parent:
+            self._parent[item] = item
+            self._rank[item] = 0
+
+    def find(self, item: str) -> str:
+        root = item
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[item] != root:
+            self._parent[item], item = root, self._parent[item]
+        return root
+
+    def union(self, a: str, b: str) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self._rank[root_a] < self._rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        if self._rank[root_a] == self._rank[root_b]:
+            self._rank[root_a] += 1
+
+
 class CloneGrouper:
+    MAX_CONCURRENT_LOOKUPS = 32
+
     def __init__(self, dhara: Any | None = None) -> None:
         self._dhara = dhara
 
     def group_pairs(self, raw_pairs: list[dict[str, Any]]) -> list[CloneGroup]:
-        groups: list[CloneGroup] = []
+        uf = _UnionFind()
+        locations: dict[str, CloneLocation] = {}
+        pairs_by_key: list[tuple[str, CloneType, float]] = []
+        pair_ids: dict[str, str] = {}
+
         for pair in raw_pairs:
             clone_type = CloneType.from_pyscn(pair.get("type", 1))
             similarity = float(pair.get("similarity", 0.0))
 
             loc1 = CloneLocation.from_dict(pair["clone1"])
             loc2 = CloneLocation.from_dict(pair["clone2"])
-            line_count = max(
-                loc1.end_line - loc1.start_line + 1,
-                loc2.end_line - loc2.start_line + 1,
-            )
-
-            group_id = self._make_group_id(pair, clone_type, similarity)
-            description = (
-                f"Type {clone_type.value} clone between "
-                f"{loc1.file_path.name} and {loc2.file_path.name}"
-            )
-
-            groups.append(
-                CloneGroup(
-                    group_id=group_id,
-                    clone_type=clone_type,
-                    similarity=similarity,
-                    locations=[loc1, loc2],
-                    pattern_description=description,
-                    line_count=line_count,
-                )
+            key1, key2 = self._location_key(loc1), self._location_key(loc2)
+            for key, loc in ((key1, loc1), (key2, loc2)):
+                locations.setdefault(key, loc)
+                uf.add(key)
+            uf.union(key1, key2)
+            pairs_by_key.append((key1, clone_type, similarity))
+            pair_ids.setdefault(key1, self._make_pair_id(pair, clone_type))
+
+        components: dict[str, list[str]] = {}
+        for key in locations:
+            components.setdefault(uf.find(key), []).append(key)
+
+        types: dict[str, CloneType] = {}
+        similarities: dict[str, float] = {}
+        for key, clone_type, similarity in pairs_by_key:
+            root = uf.find(key)
+            types[root] = max(types.get(root, clone_type), clone_type)
+            similarities[root] = min(similarities.get(root, similarity), similarity)
+
+        # A plain pair keeps the id it had before pairs were merged into
+        # families, so its dhara clone-handled/<id> entry still matches.
+        family_pair_ids = {uf.find(key): pair_id for key, pair_id in pair_ids.items()}
+        groups = [
+            self._build_group(
+                [locations[key] for key in sorted(members)],
+                types[root],
+                similarities[root],
+                family_pair_ids[root] if len(members) == 2 else None,
             )
+            for root, members in components.items()
+        ]
+        groups.sort(key=lambda g: g.group_id)
 
         logger.info(
             "CloneGrouper: grouped %d pairs into %d groups", len(raw_pairs), len(groups)
@@ -103,28 +150,76 @@ class CloneGrouper:
         self, raw_pairs: list[dict[str, Any]]
     ) -> list[CloneGroup]:
         groups = self.group_pairs(raw_pairs)
-        if self._dhara is None:
+        if self._dhara is None or not groups:
             return groups
 
+        handled = await self._lookup_handled([g.group_id for g in groups])
+
         filtered: list[CloneGroup] = []
         for group in groups:
-            with suppress(Exception):
-                existing = await self._dhara.get_async(
-                    f"clone-handled/{group.group_id}"
-                )
-                if existing:
-                    logger.info(
-                        "CloneGrouper: skipping handled group %s", group.group_id
-                    )
-                    continue
+            if group.group_id in handled:
+                logger.info("CloneGrouper: skipping handled group %s", group.group_id)
+                continue
             filtered.append(group)
 
         return filtered
 
+    async def _lookup_handled(self, group_ids: list[str]) -> set[str]:
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_LOOKUPS)
+
+        async def _is_handled(group_id: str) -> bool:
+            async with semaphore:
+                with suppress(Exception):
+                    existing = await self._dhara.get_async(f"clone-handled/{group_id}")
+                    return bool(existing)
+            return False
+
+        results = await asyncio.gather(*(_is_handled(gid) for gid in group_ids))
+        return {gid for gid, handled in zip(group_ids, results) if handled}
+
+    def _build_group(
+        self,
+        locations: list[CloneLocation],
+        clone_type: CloneType,
+        similarity: float,
+        group_id: str | None = None,
+    ) -> CloneGroup:
+        line_count = max(loc.end_line - loc.start_line + 1 for loc in locations)
+        if len(locations) == 2:
+            description = (
+                f"Type {clone_type.value} clone between "
+                f"{locations[0].file_path.name} and {locations[1].file_path.name}"
+            )
+        else:
+            file_count = len({loc.file_path for loc in locations})
+            description = (
+                f"Type {clone_type.value} clone family of {len(locations)} "
+                f"locations across {file_count} files"
+            )
+
+        return CloneGroup(
+            group_id=group_id or self._make_group_id(locations, clone_type),
+            clone_type=clone_type,
+            similarity=similarity,
+            locations=locations,
+            pattern_description=description,
+            line_count=line_count,
+        )
+
     @staticmethod
+    def _location_key(loc: CloneLocation) -> str:
+        return f"{loc.file_path}:{loc.start_line}-{loc.end_line}"
+
+    @classmethod
     def _make_group_id(
-        pair: dict[str, Any], clone_type: CloneType, similarity: float
+        cls, locations: list[CloneLocation], clone_type: CloneType
     ) -> str:
+        members = sorted(cls._location_key(loc) for loc in locations)
+        key = "|".join([*members, f"type{clone_type.value}"])
+        return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _make_pair_id(pair: dict[str, Any], clone_type: CloneType) -> str:
         loc1 = pair["clone1"].get("location", pair["clone1"])
         loc2 = pair["clone2"].get("location", pair["clone2"])
         key = (
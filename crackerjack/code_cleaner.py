@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import ast
 import typing as t
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol, cast
@@ -10,7 +11,9 @@ from pydantic import BaseModel, ConfigDict
 
 from .errors import ErrorCode, ExecutionError
 from .services.backup_service import BackupMetadata, PackageBackupService
+from .services.process_pool import process_context, resolve_worker_count, shard_items
 from .services.regex_patterns import SAFE_PATTERNS
+from .services.repo_snapshot import invalidate_repo_snapshots
 from .services.secure_path_utils import (
     AtomicFileOperations,
     SecurePathValidator,
@@ -175,6 +178,7 @@ class FileProcessor(BaseModel):
     def write_file_safely(self, file_path: Path, content: str) -> None:
         try:
             AtomicFileOperations.atomic_write(file_path, content, self.base_directory)
+            invalidate_repo_snapshots()
 
             self.security_logger.log_atomic_operation("write", file_path, True)
 
@@ -412,6 +416,8 @@ class CodeCleaner(BaseModel):
     backup_service: t.Any = None
     strip_comments_only: bool = False
     strip_docstrings_only: bool = False
+    max_workers: int = 0
+    parallel_threshold: int = 16
 
     def model_post_init(self, _: t.Any) -> None:
         if self.logger is None:
@@ -506,22 +512,116 @@ class CodeCleaner(BaseModel):
             if self.should_process_file(file_path)
         ]
 
-        results: list[CleaningResult] = []
         self.logger.info(f"Starting clean_files for {len(files_to_process)} files")
 
-        cleaning_steps = [
+        return self.clean_files_parallel(files_to_process, full_cleaning=True)
+
+    def clean_files_parallel(
+        self,
+        files: list[Path],
+        full_cleaning: bool = False,
+    ) -> list[CleaningResult]:
+        workers = resolve_worker_count(
+            len(files), self.max_workers, self.parallel_threshold
+        )
+        if workers <= 1:
+            return self._clean_files_sequential(files, full_cleaning)
+
+        chunks = shard_items(files, workers)
+        self.logger.info(
+            f"Cleaning {len(files)} files across {workers} worker processes "
+            f"({len(chunks)} shards)",
+        )
+
+        try:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=process_context(),
+            )
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Process pool unavailable, cleaning in-process: {e}")
+            return self._clean_files_sequential(files, full_cleaning)
+
+        strip_comments = self.strip_comments_only and not full_cleaning
+        strip_docstrings = self.strip_docstrings_only and not full_cleaning
+
+        results: list[CleaningResult] = []
+        with executor:
+            futures = [
+                executor.submit(
+                    _clean_files_in_worker,
+                    chunk,
+                    self.base_directory,
+                    strip_comments,
+                    strip_docstrings,
+                )
+                for chunk in chunks
+            ]
+            for chunk, future in zip(chunks, futures, strict=True):
+                try:
+                    results.extend(future.result())
+                except Exception as e:
+                    self.logger.exception(f"Cleaning worker failed: {e}")
+                    results.extend(
+                        self._failed_result(file_path, f"Worker failure: {e}")
+                        for file_path in chunk
+                    )
+
+        # Workers rewrite files in their own processes, where invalidation
+        # never reaches this process's snapshots.
+        invalidate_repo_snapshots()
+        for result in results:
+            self.error_handler.log_cleaning_result(result)
+        return results
+
+    def _clean_files_sequential(
+        self,
+        files: list[Path],
+        full_cleaning: bool,
+    ) -> list[CleaningResult]:
+        if not full_cleaning:
+            return [self._clean_file_safely(file_path) for file_path in files]
+
+        cleaning_steps = self._full_cleaning_steps()
+        return [
+            self._clean_file_safely(file_path, cleaning_steps) for file_path in files
+        ]
+
+    def _clean_file_safely(
+        self,
+        file_path: Path,
+        cleaning_steps: list[CleaningStepProtocol] | None = None,
+    ) -> CleaningResult:
+        try:
+            if cleaning_steps is None:
+                return self.clean_file(file_path)
+            return t.cast(
+                "CleaningResult",
+                self.pipeline.clean_file(file_path, cleaning_steps),
+            )
+        except Exception as e:
+            return self._failed_result(file_path, f"Exception during cleaning: {e}")
+
+    @staticmethod
+    def _failed_result(file_path: Path, warning: str) -> CleaningResult:
+        return CleaningResult(
+            file_path=file_path,
+            success=False,
+            steps_completed=[],
+            steps_failed=["file_processing"],
+            warnings=[warning],
+            original_size=0,
+            cleaned_size=0,
+        )
+
+    def _full_cleaning_steps(self) -> list[CleaningStepProtocol]:
+        return [
             self._create_line_comment_step(),
             self._create_docstring_step(),
             self._create_whitespace_step(),
             self._create_formatting_step(),
         ]
 
-        for file_path in files_to_process:
-            result = self.pipeline.clean_file(file_path, cleaning_steps)
-            results.append(result)
-
-        return results
-
     def clean_files_with_backup(
         self,
         pkg_dir: Path | None = None,
@@ -729,41 +829,16 @@ class CodeCleaner(BaseModel):
     ) -> dict[str, t.Any]:
         self.console.print(f"[cyan]🧹 Cleaning {len(files_to_process)} files...[/cyan]")
 
-        cleaning_steps = [
-            self._create_line_comment_step(),
-            self._create_docstring_step(),
-            self._create_whitespace_step(),
-            self._create_formatting_step(),
-        ]
-
-        file_results: list[CleaningResult] = []
+        file_results = self.clean_files_parallel(files_to_process, full_cleaning=True)
         cleaning_errors: list[Exception] = []
 
-        for file_path in files_to_process:
-            try:
-                result = self.pipeline.clean_file(file_path, cleaning_steps)
-                result.backup_metadata = backup_metadata
-                file_results.append(result)
-
-                if not result.success:
-                    cleaning_errors.append(
-                        ExecutionError(
-                            message=f"Cleaning failed for {file_path}: {result.steps_failed}",
-                            error_code=ErrorCode.CODE_CLEANING_ERROR,
-                        ),
-                    )
-            except Exception as e:
-                cleaning_errors.append(e)
-                file_results.append(
-                    CleaningResult(
-                        file_path=file_path,
-                        success=False,
-                        steps_completed=[],
-                        steps_failed=["file_processing"],
-                        warnings=[f"Exception during cleaning: {e}"],
-                        original_size=0,
-                        cleaned_size=0,
-                        backup_metadata=backup_metadata,
+        for result in file_results:
+            result.backup_metadata = backup_metadata
+            if not result.success:
+                cleaning_errors.append(
+                    ExecutionError(
+                        message=f"Cleaning failed for {result.file_path}: {result.steps_failed}",
+                        error_code=ErrorCode.CODE_CLEANING_ERROR,
                     ),
                 )
 
@@ -959,7 +1034,10 @@ class CodeCleaner(BaseModel):
 
     def verify_backup_integrity(self, backup_metadata: BackupMetadata) -> bool:
         try:
-            validation_result = self.backup_service._validate_backup(backup_metadata)
+            validation_result = self.backup_service._validate_backup(
+                backup_metadata,
+                verify_content=True,
+            )
 
             if validation_result.is_valid:
                 self.console.print(
@@ -1368,3 +1446,21 @@ class CodeCleaner(BaseModel):
         file_path = file_path or Path("temp.py")
         step = self._create_formatting_step()
         return step(code, file_path)
+
+
+def _clean_files_in_worker(
+    files: list[Path],
+    base_directory: Path | None,
+    strip_comments_only: bool,
+    strip_docstrings_only: bool,
+) -> list[CleaningResult]:
+    from rich.console import Console
+
+    cleaner = CodeCleaner(
+        console=Console(quiet=True),
+        base_directory=base_directory,
+        strip_comments_only=strip_comments_only,
+        strip_docstrings_only=strip_docstrings_only,
+        max_workers=1,
+    )
+    return [cleaner._clean_file_safely(file_path) for file_path in files]
@@ -42,6 +42,7 @@ class HookDefinition:
     disabled: bool = False
     run_schedule: str | None = None
     allow_unsafe_fixes: bool = False
+    max_batches: int = 1
     _direct_cmd_cache: list[str] | None = field(default=None, init=False, repr=False)
 
     def get_command(self) -> list[str]:
@@ -65,11 +66,8 @@ class HookDefinition:
         base_cmd = self.get_command()
 
         if files and self.accepts_file_paths:
-            base_cmd.extend([str(f) for f in files])
-        else:
-            base_cmd.append("crackerjack/")
-
-        return base_cmd
+            return [*base_cmd, *(str(f) for f in files)]
+        return [*base_cmd, "crackerjack/"]
 
 
 @dataclass
@@ -162,6 +160,7 @@ FAST_HOOKS = [
         name="codespell",
         command=[],
         is_formatting=True,
+        max_batches=4,
         timeout=150,
         retry_on_failure=True,
         security_level=SecurityLevel.LOW,
@@ -189,6 +188,7 @@ FAST_HOOKS = [
         name="mdformat",
         command=[],
         is_formatting=True,
+        max_batches=4,
         timeout=180,
         retry_on_failure=True,
         security_level=SecurityLevel.LOW,
@@ -11,6 +11,7 @@ class CleaningSettings(OneiricMCPConfig):
     clean: bool = True
     strip_comments_only: bool = False
     strip_docstrings_only: bool = False
+    cleaning_workers: int = 0
     update_docs: bool = False
     force_update_docs: bool = False
     compress_docs: bool = False
@@ -65,6 +66,8 @@ class GitSettings(OneiricMCPConfig):
     create_pr: bool = False
     auth_fallback: bool = True
     persist_fallback: bool = False
+    # Ref the up-front repo snapshot diffs against.
+    snapshot_base_ref: str = "HEAD~1"
 
 
 class FixStrategyMemorySettings(OneiricMCPConfig):
@@ -122,6 +125,8 @@ class ExecutionSettings(OneiricMCPConfig):
     verbose: bool = False
     async_mode: bool = False
     no_config_updates: bool = False
+    # Cancel the remaining hooks once one has failed the stage.
+    fail_fast: bool = False
 
 
 class ProgressSettings(OneiricMCPConfig):
@@ -3,9 +3,12 @@ from __future__ import annotations
 import asyncio
 import datetime
 import logging
+import time
+from collections.abc import Sequence
 from contextlib import suppress
+from dataclasses import dataclass
 from datetime import UTC
-from typing import Protocol
+from typing import Literal, Protocol, runtime_checkable
 
 from uuid_utils import uuid4 as _uuid4
 
@@ -13,36 +16,197 @@ from .ai_fix_events import AIFixEvent
 
 logger = logging.getLogger(__name__)
 
+OverflowPolicy = Literal["block", "drop_newest", "drop_oldest"]
+
 
 class Sink(Protocol):
     async def handle(self, event: AIFixEvent) -> None: ...
 
 
+@runtime_checkable
+class BatchSink(Protocol):
+    async def handle_batch(self, events: Sequence[AIFixEvent]) -> None: ...
+
+
+@dataclass(frozen=True)
+class SinkQueueConfig:
+    maxsize: int = 1024
+    policy: OverflowPolicy = "block"
+    batch_size: int = 64
+    flush_interval_s: float = 0.05
+
+
+class _SinkWorker:
+    def __init__(self, sink: Sink, config: SinkQueueConfig) -> None:
+        self.sink = sink
+        self.config = config
+        self.dropped = 0
+        self._queue: asyncio.Queue[AIFixEvent] = asyncio.Queue(config.maxsize)
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def put(self, event: AIFixEvent) -> None:
+        queue = self._ensure_consumer()
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            if self.config.policy == "block":
+                await queue.put(event)
+            else:
+                self._overflow(queue, event)
+
+    def put_nowait(self, event: AIFixEvent) -> None:
+        queue = self._ensure_consumer()
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A synchronous emitter cannot wait for room, and a detached put
+            # would pile up tasks and reorder events, so "block" drops here.
+            self._overflow(queue, event)
+
+    def _overflow(self, queue: asyncio.Queue[AIFixEvent], event: AIFixEvent) -> None:
+        self.dropped += 1
+        if self.config.policy != "drop_oldest":
+            return
+        with suppress(asyncio.QueueEmpty):
+            queue.get_nowait()
+            queue.task_done()
+        queue.put_nowait(event)
+
+    def _ensure_consumer(self) -> asyncio.Queue[AIFixEvent]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # The bus outlived the loop it was first used on; carry any
+            # undelivered events over to a queue bound to the current one.
+            pending: list[AIFixEvent] = []
+            with suppress(asyncio.QueueEmpty):
+                while True:
+                    pending.append(self._queue.get_nowait())
+            self._queue = asyncio.Queue(self.config.maxsize)
+            for event in pending:
+                self._queue.put_nowait(event)
+            self._loop = loop
+            self._task = None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._consume())
+        return self._queue
+
+    async def _consume(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._deliver(batch)
+            except Exception:
+                logger.exception(
+                    "Sink %s raised on a batch of %d events",
+                    type(self.sink).__name__,
+                    len(batch),
+                )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _next_batch(self) -> list[AIFixEvent]:
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.config.flush_interval_s
+        while len(batch) < self.config.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _deliver(self, batch: list[AIFixEvent]) -> None:
+        if isinstance(self.sink, BatchSink):
+            await self.sink.handle_batch(batch)
+            return
+        for event in batch:
+            await self.sink.handle(event)
+
+    async def join(self) -> None:
+        if self._loop is asyncio.get_running_loop() and self._task is not None:
+            await self._queue.join()
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
 class AIFixEventBus:
     def __init__(self) -> None:
         self._sinks: list[Sink] = []
+        self._workers: dict[int, _SinkWorker] = {}
         self._fix_seq: int = 0
 
-    def subscribe(self, sink: Sink) -> None:
+    def subscribe(self, sink: Sink, queue: SinkQueueConfig | None = None) -> None:
         self._sinks.append(sink)
+        if queue is not None:
+            self._workers[id(sink)] = _SinkWorker(sink, queue)
 
     def unsubscribe(self, sink: Sink) -> None:
         self._sinks.remove(sink)
+        worker = self._workers.pop(id(sink), None)
+        if worker is not None:
+            worker.cancel()
+
+    @property
+    def dropped(self) -> dict[str, int]:
+        return {
+            type(worker.sink).__name__: worker.dropped
+            for worker in self._workers.values()
+        }
 
     async def emit(self, event: AIFixEvent) -> None:
         for sink in self._sinks:
-            try:
-                await sink.handle(event)
-            except Exception:
-                logger.exception(
-                    "Sink %s raised on event %s",
-                    type(sink).__name__,
-                    type(event).__name__,
-                )
+            worker = self._workers.get(id(sink))
+            if worker is not None:
+                await worker.put(event)
+            else:
+                await self._handle(sink, event)
+
+    async def _handle_direct(self, event: AIFixEvent) -> None:
+        for sink in self._sinks:
+            if id(sink) not in self._workers:
+                await self._handle(sink, event)
+
+    @staticmethod
+    async def _handle(sink: Sink, event: AIFixEvent) -> None:
+        try:
+            await sink.handle(event)
+        except Exception:
+            logger.exception(
+                "Sink %s raised on event %s",
+                type(sink).__name__,
+                type(event).__name__,
+            )
 
     def emit_nowait(self, event: AIFixEvent) -> None:
         with suppress(RuntimeError):
-            asyncio.get_running_loop().create_task(self.emit(event))
+            loop = asyncio.get_running_loop()
+            # Queued sinks are fed in call order right here; only sinks
+            # without a queue need a task to be awaited on.
+            for worker in self._workers.values():
+                worker.put_nowait(event)
+            if len(self._workers) < len(self._sinks):
+                loop.create_task(self._handle_direct(event))
+
+    async def flush(self) -> None:
+        for worker in list(self._workers.values()):
+            await worker.join()
+
+    async def aclose(self) -> None:
+        await self.flush()
+        for worker in self._workers.values():
+            worker.cancel()
 
     def next_fix_task_id(self) -> str:
         task_id = f"fix-{self._fix_seq:04d}"
@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+import dataclasses
+import gzip
+import json
+import logging
+import os
+import sys
+import typing as t
+import zlib
+from array import array
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .ai_fix_events import (
+    AgentDispatched,
+    AIFixEvent,
+    FixSessionFinished,
+    FixSessionStarted,
+    IssueFailed,
+    IssueResolved,
+    IterationFinished,
+    IterationStarted,
+    PhaseChanged,
+    PreflightFinished,
+    PreflightStarted,
+    RunFinished,
+    RunStarted,
+    TierTransitioned,
+)
+
+logger = logging.getLogger(__name__)
+
+EVENTS_FILE = "events.jsonl"
+COMPRESSED_FILE = "events.jsonl.gz"
+INDEX_FILE = "events.idx"
+INDEX_VERSION = 1
+_INDEX_MAGIC = b"CJRUNIDX"
+BLOCK_EVENTS = 4096
+
+EVENT_CLASSES: tuple[type[AIFixEvent], ...] = (
+    RunStarted,
+    IterationStarted,
+    AgentDispatched,
+    IssueResolved,
+    IssueFailed,
+    IterationFinished,
+    RunFinished,
+    PhaseChanged,
+    PreflightStarted,
+    PreflightFinished,
+    FixSessionStarted,
+    TierTransitioned,
+    FixSessionFinished,
+)
+
+_KIND_TO_CLS: dict[str, type[AIFixEvent]] = {cls.kind: cls for cls in EVENT_CLASSES}
+_VALID_FIELDS: dict[str, frozenset[str]] = {
+    cls.kind: frozenset(f.name for f in dataclasses.fields(cls))
+    for cls in EVENT_CLASSES
+}
+
+
+def encode_event(event: AIFixEvent) -> str:
+    payload = dataclasses.asdict(event)
+    kind = getattr(type(event), "kind", None)
+    if isinstance(kind, str):
+        payload["kind"] = kind
+    # json.dumps escapes non-ASCII by default, so len(line) is its byte size.
+    return json.dumps(payload, default=str) + "\n"
+
+
+def decode_event(line: str | bytes) -> AIFixEvent | None:
+    if not line.strip():
+        return None
+    try:
+        data = json.loads(line)
+    except ValueError:
+        return None
+    kind = data.pop("kind", None)
+    event_cls = _KIND_TO_CLS.get(kind) if isinstance(kind, str) else None
+    if event_cls is None:
+        return None
+    valid = _VALID_FIELDS[event_cls.kind]
+    return event_cls(**{k: v for k, v in data.items() if k in valid})
+
+
+def _postings() -> defaultdict[t.Any, array[int]]:
+    return defaultdict(lambda: array("I"))
+
+
+def _take(
+    raw: memoryview, pos: int, typecode: str, size: int
+) -> tuple[array[int], int]:
+    values: array[int] = array(typecode)
+    end = pos + size * values.itemsize
+    values.frombytes(raw[pos:end])
+    return values, end
+
+
+@dataclass
+class RunIndex:
+    count: int = 0
+    indexed_bytes: int = 0
+    offsets: array[int] = field(default_factory=lambda: array("Q"))
+    blocks: list[int] = field(default_factory=list)
+    block_events: int = 0
+    iterations: dict[int, array[int]] = field(default_factory=_postings)
+    kinds: dict[str, array[int]] = field(default_factory=_postings)
+    issues: dict[str, array[int]] = field(default_factory=_postings)
+
+    @property
+    def compressed(self) -> bool:
+        return bool(self.blocks)
+
+    def record(
+        self,
+        offset: int,
+        length: int,
+        iteration: object,
+        kind: object,
+        issue: object = None,
+    ) -> None:
+        ordinal = self.count
+        self.count += 1
+        self.offsets.append(offset)
+        self.indexed_bytes = offset + length
+        if isinstance(iteration, int):
+            self.iterations[iteration].append(ordinal)
+        if isinstance(kind, str):
+            self.kinds[kind].append(ordinal)
+        if isinstance(issue, str) and issue:
+            self.issues[issue].append(ordinal)
+
+    def record_event(self, offset: int, length: int, event: AIFixEvent) -> None:
+        self.record(
+            offset,
+            length,
+            event.iteration,
+            type(event).kind,
+            getattr(event, "issue_signature", None),
+        )
+
+    def select(
+        self,
+        *,
+        iteration: int | None = None,
+        kind: str | None = None,
+        issue: str | None = None,
+    ) -> list[int]:
+        postings = [
+            postings
+            for postings, wanted in (
+                (self.iterations.get(iteration, ()), iteration is not None),
+                (self.kinds.get(kind, ()), kind is not None),
+                (self.issues.get(issue, ()), issue is not None),
+            )
+            if wanted
+        ]
+        if not postings:
+            return list(range(self.count))
+        if len(postings) == 1:
+            return list(postings[0])
+        selected = set(min(postings, key=len))
+        for other in postings:
+            selected.intersection_update(other)
+        return sorted(selected)
+
+    def counts_by_kind(self) -> dict[str, int]:
+        return {kind: len(ordinals) for kind, ordinals in self.kinds.items()}
+
+    def to_bytes(self) -> bytes:
+        sections = (self.iterations, self.kinds, self.issues)
+        header = json.dumps(
+            {
+                "version": INDEX_VERSION,
+                "byteorder": sys.byteorder,
+                "count": self.count,
+                "indexed_bytes": self.indexed_bytes,
+                "offsets": len(self.offsets),
+                "blocks": self.blocks,
+                "block_events": self.block_events,
+                "postings": [
+                    [[key, len(ordinals)] for key, ordinals in section.items()]
+                    for section in sections
+                ],
+            },
+            separators=(",", ":"),
+        ).encode()
+        body = [len(header).to_bytes(4, "little"), header, self.offsets.tobytes()]
+        body.extend(
+            ordinals.tobytes() for section in sections for ordinals in section.values()
+        )
+        return _INDEX_MAGIC + zlib.compress(b"".join(body), 1)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> RunIndex | None:
+        if not data.startswith(_INDEX_MAGIC):
+            return None
+        raw = memoryview(zlib.decompress(data[len(_INDEX_MAGIC) :]))
+        header_end = 4 + int.from_bytes(raw[:4], "little")
+        header = json.loads(bytes(raw[4:header_end]))
+        if (
+            header.get("version") != INDEX_VERSION
+            or header.get("byteorder") != sys.byteorder
+        ):
+            return None
+
+        offsets, pos = _take(raw, header_end, "Q", header["offsets"])
+        index = cls(
+            count=header["count"],
+            indexed_bytes=header["indexed_bytes"],
+            offsets=offsets,
+            blocks=header["blocks"],
+            block_events=header["block_events"],
+        )
+        for section, entries in zip(
+            (index.iterations, index.kinds, index.issues),
+            header["postings"],
+            strict=True,
+        ):
+            for key, size in entries:
+                section[key], pos = _take(raw, pos, "I", size)
+        return index
+
+    def save(self, path: Path) -> None:
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(self.to_bytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> RunIndex | None:
+        try:
+            return cls.from_bytes(path.read_bytes())
+        except (OSError, ValueError, KeyError, TypeError, zlib.error):
+            return None
+
+
+def scan_events(path: Path, index: RunIndex) -> RunIndex:
+    with path.open("rb") as f:
+        f.seek(index.indexed_bytes)
+        offset = index.indexed_bytes
+        for line in f:
+            if not line.endswith(b"\n"):
+                # Partially written trailing line from a crash; leave it for
+                # the next scan.
+                break
+            try:
+                data: dict[str, t.Any] = json.loads(line) if line.strip() else {}
+            except ValueError:
+                data = {}
+            if data:
+                index.record(
+                    offset,
+                    len(line),
+                    data.get("iteration"),
+                    data.get("kind"),
+                    data.get("issue_signature"),
+                )
+            else:
+                index.indexed_bytes = offset + len(line)
+            offset += len(line)
+    return index
+
+
+def load_run_index(run_dir: Path) -> RunIndex | None:
+    plain = run_dir / EVENTS_FILE
+    index = RunIndex.load(run_dir / INDEX_FILE)
+
+    if plain.exists():
+        # The plain log is the source of truth whenever it exists (including
+        # a compaction interrupted before the plain file was removed).
+        size = plain.stat().st_size
+        if index is None or index.compressed or index.indexed_bytes > size:
+            index = RunIndex()
+        if index.indexed_bytes < size:
+            scan_events(plain, index)
+            with suppress(OSError):
+                index.save(run_dir / INDEX_FILE)
+        return index
+
+    compressed = run_dir / COMPRESSED_FILE
+    if not compressed.exists():
+        return None
+    if index is not None and index.compressed:
+        return index
+
+    with gzip.open(compressed, "rb") as src, plain.open("wb") as dst:
+        dst.writelines(src)
+    if not compact_run(run_dir):
+        return load_run_index(run_dir)
+    return RunIndex.load(run_dir / INDEX_FILE)
+
+
+def compact_run(run_dir: Path) -> bool:
+    plain = run_dir / EVENTS_FILE
+    index = load_run_index(run_dir) if plain.exists() else None
+    if index is None:
+        return False
+
+    compressed = run_dir / COMPRESSED_FILE
+    tmp_path = compressed.with_name(compressed.name + ".tmp")
+    blocks: list[int] = []
+    try:
+        with plain.open("rb") as src, tmp_path.open("wb") as dst:
+            for start in range(0, index.count, BLOCK_EVENTS):
+                chunk = []
+                for offset in index.offsets[start : start + BLOCK_EVENTS]:
+                    src.seek(offset)
+                    chunk.append(src.readline())
+                blocks.append(dst.tell())
+                dst.write(gzip.compress(b"".join(chunk), mtime=0))
+        os.replace(tmp_path, compressed)
+
+        compacted = dataclasses.replace(
+            index,
+            indexed_bytes=0,
+            offsets=array("Q"),
+            blocks=blocks or [0],
+            block_events=BLOCK_EVENTS,
+        )
+        compacted.save(run_dir / INDEX_FILE)
+        plain.unlink()
+    except OSError as exc:
+        logger.warning("Could not compact run log in %s: %s", run_dir, exc)
+        with suppress(OSError):
+            tmp_path.unlink()
+        return False
+    return True
+
+
+class RunReader:
+    def __init__(self, run_dir: Path) -> None:
+        self.run_dir = run_dir
+        self.index = load_run_index(run_dir) if run_dir.is_dir() else None
+
+    @property
+    def exists(self) -> bool:
+        return self.index is not None
+
+    def __len__(self) -> int:
+        return self.index.count if self.index is not None else 0
+
+    def counts_by_kind(self) -> dict[str, int]:
+        return self.index.counts_by_kind() if self.index is not None else {}
+
+    def iterations(self) -> list[int]:
+        return sorted(self.index.iterations) if self.index is not None else []
+
+    def events(
+        self,
+        *,
+        iteration: int | None = None,
+        kind: str | None = None,
+        issue: str | None = None,
+    ) -> Iterator[AIFixEvent]:
+        if self.index is None:
+            return
+        ordinals = self.index.select(iteration=iteration, kind=kind, issue=issue)
+        for line in self._lines(ordinals):
+            event = decode_event(line)
+            if event is not None:
+                yield event
+
+    def _lines(self, ordinals: list[int]) -> Iterator[bytes]:
+        assert self.index is not None
+        if not ordinals:
+            return
+        if not self.index.compressed:
+            with (self.run_dir / EVENTS_FILE).open("rb") as f:
+                for ordinal in ordinals:
+                    f.seek(self.index.offsets[ordinal])
+                    yield f.readline()
+            return
+
+        blocks = self.index.blocks
+        with (self.run_dir / COMPRESSED_FILE).open("rb") as f:
+            current_block = -1
+            lines: list[bytes] = []
+            for ordinal in ordinals:
+                block, position = divmod(ordinal, self.index.block_events)
+                if block != current_block:
+                    f.seek(blocks[block])
+                    size = (
+                        blocks[block + 1] - blocks[block]
+                        if block + 1 < len(blocks)
+                        else -1
+                    )
+                    lines = gzip.decompress(f.read(size)).splitlines(keepends=True)
+                    current_block = block
+                yield lines[position]
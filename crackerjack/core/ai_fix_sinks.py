@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import dataclasses
-import json
 import logging
 import time
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import IO
 
@@ -17,32 +15,25 @@ from .ai_fix_events import (
     IssueResolved,
     IterationFinished,
     IterationStarted,
-    PhaseChanged,
     PreflightFinished,
     PreflightStarted,
     RunFinished,
     RunStarted,
     TierTransitioned,
 )
+from .ai_fix_run_store import (
+    COMPRESSED_FILE,
+    EVENTS_FILE,
+    INDEX_FILE,
+    RunIndex,
+    RunReader,
+    compact_run,
+    encode_event,
+    load_run_index,
+)
 
 logger = logging.getLogger(__name__)
 
-_EVENT_CLASSES: tuple[type[AIFixEvent], ...] = (
-    RunStarted,
-    IterationStarted,
-    AgentDispatched,
-    IssueResolved,
-    IssueFailed,
-    IterationFinished,
-    RunFinished,
-    PhaseChanged,
-    PreflightStarted,
-    PreflightFinished,
-    FixSessionStarted,
-    TierTransitioned,
-    FixSessionFinished,
-)
-
 
 class LoggingSink:
     async def handle(self, event: AIFixEvent) -> None:
@@ -106,41 +97,78 @@ class LoggingSink:
 
 
 class JsonlSink:
-    def __init__(self, base_dir: Path | None = None) -> None:
+    def __init__(
+        self, base_dir: Path | None = None, compress_finished: bool = True
+    ) -> None:
         self._base_dir = base_dir or Path.cwd()
+        self._compress_finished = compress_finished
         self._file: IO[str] | None = None
         self._run_dir: Path | None = None
+        self._index: RunIndex | None = None
+        self._offset = 0
+        self._finished = False
 
     async def handle(self, event: AIFixEvent) -> None:
-        if isinstance(event, RunStarted):
-            self._open(event.run_id)
-        if self._file is None:
+        await self.handle_batch((event,))
+
+    async def handle_batch(self, events: Sequence[AIFixEvent]) -> None:
+        pending: list[tuple[AIFixEvent, str]] = []
+        for event in events:
+            if isinstance(event, RunStarted):
+                self._write(pending)
+                pending = []
+                self._open(event.run_id)
+            if self._file is not None:
+                pending.append((event, encode_event(event)))
+            if isinstance(event, RunFinished):
+                self._finished = True
+        self._write(pending)
+
+    def _write(self, pending: list[tuple[AIFixEvent, str]]) -> None:
+        if self._file is None or not pending:
             return
         try:
-            payload = dataclasses.asdict(event)
-            kind = getattr(type(event), "kind", None)
-            if isinstance(kind, str):
-                payload["kind"] = kind
-            line = json.dumps(payload, default=str)
-            self._file.write(line + "\n")
+            self._file.write("".join(line for _, line in pending))
             self._file.flush()
         except OSError as exc:
-            logger.warning("JsonlSink dropped event after write error: %s", exc)
+            logger.warning(
+                "JsonlSink dropped %d events after write error: %s", len(pending), exc
+            )
             self._file = None
+            return
+        if self._index is not None:
+            for event, line in pending:
+                self._index.record_event(self._offset, len(line), event)
+                self._offset += len(line)
 
     def _open(self, run_id: str) -> None:
+        self._close_file()
         run_dir = self._base_dir / ".crackerjack" / "runs" / run_id
         run_dir.mkdir(parents=True, exist_ok=True)
-        self._file = (run_dir / "events.jsonl").open("a", encoding="utf-8")
+        self._index = load_run_index(run_dir) or RunIndex()
+        self._offset = self._index.indexed_bytes
+        self._file = (run_dir / EVENTS_FILE).open("a", encoding="utf-8")
         self._run_dir = run_dir
+        self._finished = False
 
         (run_dir / ".open").write_text(str(time.time()))
 
-    def close(self) -> None:
+    def _close_file(self) -> None:
         if self._file is not None:
             self._file.close()
             self._file = None
+        if self._index is not None and self._run_dir is not None:
+            try:
+                self._index.save(self._run_dir / INDEX_FILE)
+            except OSError as exc:
+                logger.warning("JsonlSink could not write run index: %s", exc)
+        self._index = None
+
+    def close(self) -> None:
+        self._close_file()
         if self._run_dir is not None:
+            if self._finished and self._compress_finished:
+                compact_run(self._run_dir)
             sidecar = self._run_dir / ".open"
             if sidecar.exists():
                 sidecar.unlink()
@@ -153,20 +181,7 @@ class JsonlSink:
         base_dir: Path | None = None,
     ) -> Iterator[AIFixEvent]:
         root = (base_dir or Path.cwd()) / ".crackerjack" / "runs" / run_id
-        jsonl_path = root / "events.jsonl"
-        if not jsonl_path.exists():
-            return
-        kind_to_cls = {event_cls.kind: event_cls for event_cls in _EVENT_CLASSES}
-        for line in jsonl_path.read_text(encoding="utf-8").splitlines():
-            if not line.strip():
-                continue
-            data = json.loads(line)
-            kind = data.pop("kind", None)
-            event_cls = kind_to_cls.get(kind) if isinstance(kind, str) else None
-            if event_cls is None:
-                continue
-            valid_fields = {f.name for f in dataclasses.fields(event_cls)}
-            yield event_cls(**{k: v for k, v in data.items() if k in valid_fields})
+        yield from RunReader(root).events()
 
 
 class DebugFileSink:
@@ -177,20 +192,22 @@ class DebugFileSink:
         self._run_dir: Path | None = None
 
     async def handle(self, event: AIFixEvent) -> None:
+        await self.handle_batch((event,))
+
+    async def handle_batch(self, events: Sequence[AIFixEvent]) -> None:
         if self._file is None:
             self._open()
-        if self._file is None:
+        if self._file is None or not events:
             return
         try:
-            payload = dataclasses.asdict(event)
-            kind = getattr(type(event), "kind", None)
-            if isinstance(kind, str):
-                payload["kind"] = kind
-            line = json.dumps(payload, default=str)
-            self._file.write(line + "\n")
+            self._file.write("".join(encode_event(event) for event in events))
             self._file.flush()
         except OSError as exc:
-            logger.warning("DebugFileSink dropped event after write error: %s", exc)
+            logger.warning(
+                "DebugFileSink dropped %d events after write error: %s",
+                len(events),
+                exc,
+            )
             self._file = None
 
     def _open(self) -> None:
@@ -251,11 +268,11 @@ class MetricsSink:
 
 
 def build_default_bus(base_dir: Path | None = None) -> object:
-    from .ai_fix_event_bus import AIFixEventBus
+    from .ai_fix_event_bus import AIFixEventBus, SinkQueueConfig
 
     bus = AIFixEventBus()
-    bus.subscribe(LoggingSink())
-    bus.subscribe(JsonlSink(base_dir=base_dir))
+    bus.subscribe(LoggingSink(), SinkQueueConfig(policy="drop_oldest"))
+    bus.subscribe(JsonlSink(base_dir=base_dir), SinkQueueConfig(policy="block"))
     bus.subscribe(MetricsSink())
     return bus
 
@@ -269,7 +286,9 @@ def detect_orphan_sidecars(base_dir: Path | None = None) -> list[str]:
         if not child.is_dir():
             continue
         sidecar = child / ".open"
-        events = child / "events.jsonl"
-        if sidecar.exists() and events.exists():
+        has_events = (child / EVENTS_FILE).exists() or (
+            child / COMPRESSED_FILE
+        ).exists()
+        if sidecar.exists() and has_events:
             orphans.append(child.name)
     return orphans
@@ -10,7 +10,6 @@ import shutil
 import subprocess
 import typing as t
 from collections.abc import Callable, Sequence
-from contextlib import suppress
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -26,6 +25,8 @@ from crackerjack.core.ai_fix_events import (
 )
 from crackerjack.core.ai_fix_sinks import build_default_bus
 from crackerjack.core.preflight import PreflightConfig, PreflightFixer
+from crackerjack.core.verification_planner import VerificationPlanner
+from crackerjack.models.autofix import StepResult
 from crackerjack.models.fix_plan import FixPlan
 from crackerjack.models.issues import Issue, IssueType
 from crackerjack.parsers.factory import (
@@ -39,6 +40,7 @@ from crackerjack.services.pycharm_mcp_integration import (
     PyCharmMCPAdapter,
 )
 from crackerjack.services.refurb_fixer import SafeRefurbFixer
+from crackerjack.services.refurb_fixer import fix_file as refurb_fix_file
 from crackerjack.utils.issue_detection import extract_issue_lines
 
 if t.TYPE_CHECKING:
@@ -66,40 +68,6 @@ logger = logging.getLogger(__name__)
 
 _VALIDATION_DETAIL_LINES: int = 30
 
-_HOOK_SCOPES: dict[str, tuple[str, ...]] = {
-    "refurb": ("**/*.py", "**/*.pyi"),
-    "complexipy": ("**/*.py",),
-    "pyscn": ("**/*.py",),
-    "zuban": ("**/*.py", "**/*.pyi"),
-    "ruff": ("**/*.py", "**/*.pyi"),
-    "ruff-format": ("**/*.py", "**/*.pyi"),
-    "semgrep": ("**/*.py",),
-    "bandit": ("**/*.py",),
-    "check-ast": ("**/*.py",),
-    "linkcheckmd": ("**/*.md", "**/*.markdown"),
-    "lychee": ("**/*.md", "**/*.markdown"),
-    "check-local-links": ("**/*.md", "**/*.markdown"),
-    "check-jsonschema": ("**/*.json",),
-    "check-yaml": ("**/*.yml", "**/*.yaml"),
-    "check-toml": ("**/*.toml",),
-    "check-json": ("**/*.json",),
-    "format-json": ("**/*.json",),
-    "creosote": (
-        "**/pyproject.toml",
-        "**/uv.lock",
-        "**/requirements*.txt",
-        "**/*.py",
-    ),
-    "pip-audit": (
-        "**/pyproject.toml",
-        "**/uv.lock",
-        "**/requirements*.txt",
-    ),
-    "gitleaks": ("**",),
-    "check-added-large-files": ("**",),
-    "pytest": ("**/*.py", "**/tests/**"),
-}
-
 
 class AutofixCoordinator:
     def __init__(
@@ -140,6 +108,8 @@ class AutofixCoordinator:
         self._success_count = 0
         self._total_count = 0
         self._failed_issue_keys: set[str] = set()
+        self._verification_planner = VerificationPlanner(self.pkg_path)
+        self._rechecked_files: dict[str, set[Path]] = {}
         self._pycharm_adapter = pycharm_adapter or self._create_pycharm_adapter()
 
     def _create_pycharm_adapter(self) -> PyCharmMCPAdapter | None:
@@ -349,6 +319,7 @@ class AutofixCoordinator:
             result = False
         finally:
             self._display_error_summary()
+            await self._event_bus.flush()
 
         return result
 
@@ -386,6 +357,7 @@ class AutofixCoordinator:
         self, hook_results: Sequence[object]
     ) -> bool:
         self._failed_issue_keys = set()
+        self._rechecked_files = {}
         if not await self._execute_fast_fixes():
             return False
 
@@ -1093,14 +1065,16 @@ class AutofixCoordinator:
                 except Exception:
                     continue
 
+            tracker = _FileChangeTracker(self.pkg_path)
+            tracker.capture(file_paths)
             if not self._run_native_tool_fix(adapter, tool_name, file_paths):
                 continue
 
-            refreshed_issues[tool_name] = await self._rerun_type_tool_check(
-                adapter,
-                tool_name,
-                file_paths,
+            rerun_issues = await self._reverify_after_fix(
+                adapter, tool_name, file_paths, tracker
             )
+            if rerun_issues is not None:
+                refreshed_issues[tool_name] = rerun_issues
 
         return refreshed_issues
 
@@ -1113,14 +1087,20 @@ class AutofixCoordinator:
         if not ruff_files:
             return refreshed_issues
 
-        if not self._run_ruff_safe_fixes(ruff_files):
+        tracker = _FileChangeTracker(self.pkg_path)
+        tracker.capture(ruff_files)
+        if not await self._run_ruff_safe_fixes(ruff_files):
             return refreshed_issues
 
         adapter = self._create_type_tool_adapter("ruff")
         if adapter is None:
             return refreshed_issues
 
-        rerun_issues = await self._rerun_type_tool_check(adapter, "ruff", ruff_files)
+        rerun_issues = await self._reverify_after_fix(
+            adapter, "ruff", ruff_files, tracker, stage="ruff-check"
+        )
+        if rerun_issues is None:
+            return refreshed_issues
         for issue in rerun_issues:
             issue.stage = "ruff-check"
 
@@ -1136,18 +1116,20 @@ class AutofixCoordinator:
         if not refurb_files:
             return refreshed_issues
 
-        if not self._run_refurb_safe_fixes(refurb_files):
+        tracker = _FileChangeTracker(self.pkg_path)
+        tracker.capture(refurb_files)
+        if not await self._run_refurb_safe_fixes(refurb_files):
             return refreshed_issues
 
         adapter = self._create_type_tool_adapter("refurb")
         if adapter is None:
             return refreshed_issues
 
-        refreshed_issues["refurb"] = await self._rerun_type_tool_check(
-            adapter,
-            "refurb",
-            refurb_files,
+        rerun_issues = await self._reverify_after_fix(
+            adapter, "refurb", refurb_files, tracker
         )
+        if rerun_issues is not None:
+            refreshed_issues["refurb"] = rerun_issues
 
         return refreshed_issues
 
@@ -1206,6 +1188,8 @@ class AutofixCoordinator:
             and "import-not-found" in (getattr(i, "code", "") or "")
         ]
 
+        tracker = _FileChangeTracker(self.pkg_path)
+        tracker.capture([*zuban_files, self.pkg_path / "mypy.ini"])
         if import_errors:
             fixed = self._fix_zuban_missing_imports_in_mypy_ini()
             if fixed:
@@ -1218,9 +1202,11 @@ class AutofixCoordinator:
         if adapter is None:
             return refreshed
 
-        refreshed["zuban"] = await self._rerun_type_tool_check(
-            adapter, "zuban", zuban_files
+        rerun_issues = await self._reverify_after_fix(
+            adapter, "zuban", zuban_files, tracker
         )
+        if rerun_issues is not None:
+            refreshed["zuban"] = rerun_issues
         return refreshed
 
     async def _apply_pycharm_diagnostics_context(
@@ -1372,22 +1358,24 @@ class AutofixCoordinator:
 
         return files
 
-    def _run_refurb_safe_fixes(self, file_paths: list[Path]) -> bool:
+    async def _run_refurb_safe_fixes(self, file_paths: list[Path]) -> bool:
         if not file_paths:
             return False
 
-        fixer = SafeRefurbFixer()
-        total_fixes = 0
-        for file_path in file_paths:
-            total_fixes += fixer.fix_file(file_path)
+        from crackerjack.core.autofix_pool import AutofixWorkerPool
 
-        if total_fixes <= 0:
+        step = await AutofixWorkerPool().map_files(
+            file_paths, refurb_fix_file, mode="process"
+        )
+        if step.failure_reason:
+            self.logger.debug("Refurb prepass errors: %s", step.failure_reason)
+        if step.fixes_applied <= 0:
             return False
 
         self.logger.info(
             "Applied deterministic refurb prepass to %s file(s) for %s fix(es)",
             len(file_paths),
-            total_fixes,
+            step.fixes_applied,
         )
         return True
 
@@ -1415,14 +1403,18 @@ class AutofixCoordinator:
 
         return files
 
-    def _run_ruff_safe_fixes(self, file_paths: list[Path]) -> bool:
+    async def _run_ruff_safe_fixes(self, file_paths: list[Path]) -> bool:
         if not file_paths:
             return False
 
-        any_fixed = False
-        for file_path in file_paths:
-            if self._run_targeted_python_fixes(file_path):  # type: ignore
-                any_fixed = True
+        from crackerjack.core.autofix_pool import AutofixWorkerPool
+
+        step = await AutofixWorkerPool().map_files(
+            file_paths,
+            lambda path: self._run_targeted_python_fixes(str(path)),
+            mode="thread",
+        )
+        any_fixed = step.fixes_applied > 0
 
         if any_fixed:
             self.logger.info(
@@ -1571,6 +1563,28 @@ class AutofixCoordinator:
             self.logger.debug("Could not build fix command for %s: %s", tool_name, e)
             return None
 
+    async def _reverify_after_fix(
+        self,
+        adapter: object,
+        tool_name: str,
+        file_paths: list[Path],
+        tracker: _FileChangeTracker,
+        stage: str | None = None,
+    ) -> list[Issue] | None:
+        plan = self._verification_planner.plan(tracker.changed_files(), [tool_name])
+        step = plan.step_for(tool_name)
+        if step is None:
+            self.logger.debug(f"Skip {tool_name} re-check: fix changed no files")
+            return None
+
+        if step.files is None:
+            return await self._rerun_type_tool_check(adapter, tool_name, file_paths)
+
+        self._rechecked_files[stage or tool_name] = {
+            Path(f).resolve() for f in step.files
+        }
+        return await self._rerun_type_tool_check(adapter, tool_name, list(step.files))
+
     async def _rerun_type_tool_check(
         self,
         adapter: object,
@@ -1612,12 +1626,20 @@ class AutofixCoordinator:
             return issues
 
         updated_issues = [
-            issue for issue in issues if issue.stage not in refreshed_tools
+            issue
+            for issue in issues
+            if issue.stage not in refreshed_tools
+            or self._was_not_rechecked(issue, self._rechecked_files.get(issue.stage))
         ]
         for tool_name in sorted(refreshed_tools):
             updated_issues.extend(refreshed_type_issues[tool_name])
         return updated_issues
 
+    def _was_not_rechecked(self, issue: Issue, rechecked: set[Path] | None) -> bool:
+        if rechecked is None or not issue.file_path:
+            return False
+        return Path(issue.file_path).resolve() not in rechecked
+
     def _filter_fixable_issues(self, issues: list[Issue]) -> list[Issue]:
         fixable_issues = [i for i in issues if i.file_path]
         skipped_issues = [i for i in issues if not i.file_path]
@@ -1681,21 +1703,6 @@ def _count_list_data(data: object) -> int | None:
     return len(data) if isinstance(data, list) else None
 
 
-@dataclass
-class StepResult:
-    success: bool
-    fixes_applied: int = 0
-    files_modified: list[Path] = field(default_factory=list)
-    failure_reason: str = ""
-
-
-@dataclass
-class RouterOutcome:
-    remaining_issues: list[Issue] = field(default_factory=list)
-    fixes_applied: int = 0
-    fully_resolved: bool = False
-
-
 @dataclass
 class AutoFixContext:
     iteration: int = 0
@@ -1720,24 +1727,30 @@ IterationStepFn = Callable[[AutoFixContext], t.Awaitable[StepResult]]
 class _FileChangeTracker:
     def __init__(self, pkg_path: Path) -> None:
         self._pkg_path = pkg_path
-        self._baseline: dict[Path, float] | None = None
+        self._baseline: dict[Path, float | None] | None = None
 
-    def capture(self) -> None:
-        mtimes: dict[Path, float] = {}
-        for path in self._pkg_path.rglob("*.py"):
-            with suppress(OSError):
-                mtimes[path] = path.stat().st_mtime
-        self._baseline = mtimes
+    def capture(self, paths: Sequence[Path] | None = None) -> None:
+        candidates = self._pkg_path.rglob("*.py") if paths is None else paths
+        self._baseline = {path: self._mtime(path) for path in candidates}
 
-    def delta(self) -> int:
+    def changed_files(self) -> list[Path]:
         if self._baseline is None:
-            return 0
-        changed = 0
-        for path, mtime_before in self._baseline.items():
-            with suppress(OSError):
-                if path.stat().st_mtime != mtime_before:
-                    changed += 1
-        return changed
+            return []
+        return [
+            path
+            for path, mtime_before in self._baseline.items()
+            if self._mtime(path) != mtime_before
+        ]
+
+    def delta(self) -> int:
+        return len(self.changed_files())
+
+    @staticmethod
+    def _mtime(path: Path) -> float | None:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
 
 
 def _count_bandit_results(data: object) -> int | None:
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import typing as t
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Literal
+
+from crackerjack.executors.hook_lock_manager import FileEditLock
+from crackerjack.models.autofix import StepResult
+from crackerjack.services.process_pool import process_context, resolve_worker_count
+
+logger = logging.getLogger(__name__)
+
+FileFix = Callable[[Path], int | bool]
+AsyncFileFix = Callable[[Path], Awaitable[int | bool]]
+ExecutionMode = Literal["async", "thread", "process"]
+
+
+class AutofixWorkerPool:
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        process_workers: int | None = None,
+        process_threshold: int = 4,
+    ) -> None:
+        cpu_count = os.cpu_count() or 1
+        self.max_concurrency = max(1, max_concurrency or min(32, cpu_count * 4))
+        self.process_workers = max(1, process_workers or cpu_count)
+        self.process_threshold = process_threshold
+
+    async def map_files(
+        self,
+        files: Iterable[Path],
+        fix: FileFix | AsyncFileFix,
+        mode: ExecutionMode = "thread",
+    ) -> StepResult:
+        unique_files = list(dict.fromkeys(files))
+        if not unique_files:
+            return StepResult(success=True)
+
+        executor = (
+            self._create_process_pool(len(unique_files)) if mode == "process" else None
+        )
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def run_one(path: Path) -> int | bool:
+            async with semaphore, FileEditLock(path):
+                if mode == "async":
+                    return await t.cast(AsyncFileFix, fix)(path)
+                return await loop.run_in_executor(executor, t.cast(FileFix, fix), path)
+
+        try:
+            outcomes = await asyncio.gather(
+                *(run_one(path) for path in unique_files), return_exceptions=True
+            )
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        return self._step_result(unique_files, outcomes)
+
+    def _create_process_pool(self, file_count: int) -> Executor | None:
+        workers = resolve_worker_count(
+            file_count, self.process_workers, self.process_threshold
+        )
+        if workers <= 1:
+            return None
+        try:
+            return ProcessPoolExecutor(
+                max_workers=workers, mp_context=process_context()
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(f"Process pool unavailable, fixing in threads: {e}")
+            return None
+
+    @staticmethod
+    def _step_result(
+        files: list[Path], outcomes: list[int | bool | BaseException]
+    ) -> StepResult:
+        result = StepResult(success=True)
+        failures: list[str] = []
+        for path, outcome in zip(files, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                failures.append(f"{path}: {outcome}")
+                continue
+            fixes = int(outcome)
+            if fixes > 0:
+                result.fixes_applied += fixes
+                result.files_modified.append(path)
+
+        if failures:
+            result.success = False
+            result.failure_reason = "; ".join(failures)
+        return result
@@ -92,6 +92,7 @@ class PhaseCoordinator:
         from crackerjack.managers.test_manager import TestManagementImpl
         from crackerjack.services.filesystem import FileSystemService
         from crackerjack.services.git import GitService
+        from crackerjack.services.repo_snapshot import get_repo_snapshot
 
         self.console = console or CrackerjackConsole()
         self.pkg_path = pkg_path or Path.cwd()
@@ -123,9 +124,14 @@ class PhaseCoordinator:
         )
 
         self.filesystem = filesystem or FileSystemService()
+        self.repo_snapshot = get_repo_snapshot(
+            self.pkg_path,
+            base_ref=getattr(self._settings.git, "snapshot_base_ref", None),
+        )
         self.git_service = git_service or GitService(
             console=self.console,
             pkg_path=self.pkg_path,
+            snapshot=self.repo_snapshot,
         )
         self.hook_manager = hook_manager or HookManagerImpl(
             pkg_path=self.pkg_path,
@@ -135,6 +141,7 @@ class PhaseCoordinator:
             settings=self._settings,
             enable_hooks=enable_hooks,
             adapter_learner_integration=self._adapter_learning,
+            fail_fast=getattr(self._settings.execution, "fail_fast", False),
         )
         self.test_manager = test_manager or TestManagementImpl(
             console=self.console,
@@ -161,6 +168,7 @@ class PhaseCoordinator:
             strip_docstrings_only=getattr(settings, "strip_docstrings_only", False)
             if settings
             else False,
+            max_workers=self._settings.cleaning.cleaning_workers,
         )
 
         self._logger = logger or logging.getLogger(__name__)
@@ -186,6 +194,11 @@ class PhaseCoordinator:
         self._fast_hooks_started: bool = False
         self._event_publisher = event_publisher
 
+    def refresh_repo_snapshot(self) -> None:
+        # One status and base-ref diff up front; later phases read from it
+        # until something invalidates it.
+        self.repo_snapshot.refresh()
+
     def set_event_publisher(self, event_publisher: t.Any | None) -> None:
         self._event_publisher = event_publisher
 
@@ -524,20 +537,15 @@ class PhaseCoordinator:
     def _get_snob_affected_tests(self) -> list[Path]:
         import subprocess
 
+        from crackerjack.services.repo_snapshot import get_repo_snapshot
+
         try:
-            git_result = subprocess.run(
-                ["git", "diff", "HEAD", "--name-only"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if git_result.returncode != 0:
+            changed = get_repo_snapshot(self.pkg_path).changed_since("HEAD")
+            if changed is None:
                 return []
 
             changed_py = [
-                f
-                for f in git_result.stdout.strip().split("\n")
-                if f.endswith(".py") and not f.startswith("tests/")
+                f for f in changed if f.endswith(".py") and not f.startswith("tests/")
             ]
             if not changed_py:
                 return []
@@ -1497,13 +1505,15 @@ class PhaseCoordinator:
         return True
 
     def _clean_python_files(self, files: list[Path]) -> list[str]:
-        cleaned_files = []
-        for file in files:
-            if self.code_cleaner.should_process_file(file):
-                result = self.code_cleaner.clean_file(file)
-                if result.success:
-                    cleaned_files.append(str(file))
-        return cleaned_files
+        files_to_clean = [
+            file for file in files if self.code_cleaner.should_process_file(file)
+        ]
+        results = self.code_cleaner.clean_files_parallel(files_to_clean)
+        return [
+            str(file)
+            for file, result in zip(files_to_clean, results, strict=True)
+            if result.success
+        ]
 
     def _report_cleaning_results(self, cleaned_files: list[str]) -> None:
         if cleaned_files:
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from crackerjack.config.hooks import COMPREHENSIVE_HOOKS, FAST_HOOKS, HookDefinition
+
+HOOK_SCOPES: dict[str, tuple[str, ...]] = {
+    "refurb": ("**/*.py", "**/*.pyi"),
+    "complexipy": ("**/*.py",),
+    "pyscn": ("**/*.py",),
+    "zuban": ("**/*.py", "**/*.pyi"),
+    "ruff": ("**/*.py", "**/*.pyi"),
+    "ruff-check": ("**/*.py", "**/*.pyi"),
+    "ruff-format": ("**/*.py", "**/*.pyi"),
+    "semgrep": ("**/*.py",),
+    "bandit": ("**/*.py",),
+    "check-ast": ("**/*.py",),
+    "linkcheckmd": ("**/*.md", "**/*.markdown"),
+    "lychee": ("**/*.md", "**/*.markdown"),
+    "check-local-links": ("**/*.md", "**/*.markdown"),
+    "mdformat": ("**/*.md",),
+    "codespell": ("**/*.py", "**/*.md", "**/*.txt", "**/*.rst"),
+    "check-jsonschema": ("**/*.json",),
+    "check-yaml": ("**/*.yml", "**/*.yaml"),
+    "check-toml": ("**/*.toml",),
+    "check-json": ("**/*.json",),
+    "format-json": ("**/*.json",),
+    "creosote": (
+        "**/pyproject.toml",
+        "**/uv.lock",
+        "**/requirements*.txt",
+        "**/*.py",
+    ),
+    "pip-audit": (
+        "**/pyproject.toml",
+        "**/uv.lock",
+        "**/requirements*.txt",
+    ),
+    "gitleaks": ("**",),
+    "check-added-large-files": ("**",),
+    "pytest": ("**/*.py", "**/tests/**"),
+}
+
+CROSS_FILE_TOOLS: frozenset[str] = frozenset(
+    {"ty", "zuban", "pyrefly", "skylos", "creosote", "pytest"}
+)
+
+FILE_SCOPED_ALIASES: dict[str, str] = {"ruff": "ruff-check"}
+
+CONFIG_FILES: frozenset[str] = frozenset(
+    {"pyproject.toml", "mypy.ini", "setup.cfg", "ruff.toml", ".ruff.toml"}
+)
+
+
+@dataclass(frozen=True)
+class VerificationStep:
+    hook_name: str
+    files: tuple[Path, ...] | None
+
+    @property
+    def is_full_run(self) -> bool:
+        return self.files is None
+
+
+@dataclass
+class VerificationPlan:
+    steps: list[VerificationStep] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+
+    def step_for(self, hook_name: str) -> VerificationStep | None:
+        return next((s for s in self.steps if s.hook_name == hook_name), None)
+
+    @property
+    def full_runs(self) -> list[str]:
+        return [step.hook_name for step in self.steps if step.is_full_run]
+
+
+class VerificationPlanner:
+    def __init__(
+        self,
+        pkg_path: Path,
+        hooks: t.Iterable[HookDefinition] | None = None,
+    ) -> None:
+        self.pkg_path = Path(pkg_path)
+        hook_list = (
+            list(hooks)
+            if hooks is not None
+            else [
+                *FAST_HOOKS,
+                *COMPREHENSIVE_HOOKS,
+            ]
+        )
+        self._hooks = {hook.name: hook for hook in hook_list}
+
+    def is_file_scoped(self, hook_name: str) -> bool:
+        if hook_name in CROSS_FILE_TOOLS:
+            return False
+        hook = self._hooks.get(FILE_SCOPED_ALIASES.get(hook_name, hook_name))
+        return hook is not None and hook.accepts_file_paths
+
+    def in_scope(self, hook_name: str, file_path: Path) -> bool:
+        if file_path.name in CONFIG_FILES:
+            return True
+        patterns = HOOK_SCOPES.get(hook_name)
+        if not patterns:
+            return True
+        relative = self._relative(file_path)
+        return any(relative.full_match(pattern) for pattern in patterns)
+
+    def plan(
+        self,
+        modified_files: t.Iterable[Path],
+        hook_names: t.Iterable[str],
+    ) -> VerificationPlan:
+        modified = list(dict.fromkeys(Path(f) for f in modified_files))
+        plan = VerificationPlan()
+
+        for hook_name in dict.fromkeys(hook_names):
+            relevant = [f for f in modified if self.in_scope(hook_name, f)]
+            if not relevant:
+                plan.skipped.append(hook_name)
+            elif not self.is_file_scoped(hook_name) or any(
+                f.name in CONFIG_FILES for f in relevant
+            ):
+                plan.steps.append(VerificationStep(hook_name, None))
+            else:
+                plan.steps.append(VerificationStep(hook_name, tuple(relevant)))
+
+        return plan
+
+    def _relative(self, file_path: Path) -> Path:
+        try:
+            return file_path.resolve().relative_to(self.pkg_path.resolve())
+        except ValueError:
+            return file_path
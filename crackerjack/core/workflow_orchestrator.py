@@ -109,6 +109,7 @@ class WorkflowPipeline:
 
     def _initialize_workflow_session(self, options: t.Any) -> None:
         self.session.initialize_session_tracking(options)
+        self.phases.refresh_repo_snapshot()
 
     def _clear_oneiric_cache(self) -> None:
         import sqlite3
@@ -5,7 +5,7 @@ import logging
 import time
 import typing as t
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 from rich.console import Console
@@ -17,12 +17,26 @@ from crackerjack.config.hooks import (
     HookStrategy,
     RetryPolicy,
 )
+from crackerjack.executors.fail_fast import (
+    CANCEL_GRACE_SECONDS,
+    CANCELLED,
+    KILL_SIGNAL,
+    cancelled_result,
+    is_blocking_failure,
+    order_for_fail_fast,
+    restore_order,
+    signal_process_group,
+)
 from crackerjack.models.protocols import (
     ConsoleInterface,
     HookLockManagerProtocol,
 )
 from crackerjack.models.task import HookResult
 from crackerjack.services.logging import LoggingContext
+from crackerjack.services.tool_resolver import resolve_command
+
+if t.TYPE_CHECKING:
+    from crackerjack.services.run_history import RunHistory
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +92,8 @@ class AsyncHookExecutor:
         test_dir: str = "tests",
         logger: t.Any | None = None,
         hook_lock_manager: HookLockManagerProtocol | None = None,
+        fail_fast: bool = False,
+        run_history: RunHistory | None = None,
     ) -> None:
         self.console = console
         self.pkg_path = pkg_path
@@ -92,6 +108,9 @@ class AsyncHookExecutor:
         self._running_processes: set = set()
         self._last_stdout: bytes | None = None
         self._last_stderr: bytes | None = None
+        self.fail_fast = fail_fast
+        self.run_history = run_history
+        self._stage_decided = False
 
         if hook_lock_manager is None:
             from crackerjack.executors.hook_lock_manager import (
@@ -145,12 +164,23 @@ class AsyncHookExecutor:
                 getattr(hook, "timeout", 30) for hook in strategy.hooks
             )
 
+            self._stage_decided = False
+            run_strategy = strategy
+            if self.fail_fast:
+                run_strategy = replace(
+                    strategy,
+                    hooks=order_for_fail_fast(strategy.hooks, self._hook_stats()),
+                )
+
             if strategy.parallel and len(strategy.hooks) > 1:
-                results = await self._execute_parallel(strategy)
+                results = await self._execute_parallel(run_strategy)
             else:
-                results = await self._execute_sequential(strategy)
+                results = await self._execute_sequential(run_strategy)
+            if self.fail_fast:
+                results = restore_order(strategy.hooks, results)
 
-            if strategy.retry_policy != RetryPolicy.NONE:
+            # Once fail-fast has decided the stage, retries cannot change it.
+            if strategy.retry_policy != RetryPolicy.NONE and not self._stage_decided:
                 results = await self._handle_retries(strategy, results)
 
             total_duration = time.time() - start_time
@@ -198,10 +228,40 @@ class AsyncHookExecutor:
     def _print_strategy_header(self, strategy: HookStrategy) -> None:
         return None
 
+    def _hook_stats(self) -> dict[str, dict[str, float]] | None:
+        if self.run_history is None:
+            return None
+        try:
+            return self.run_history.summary()
+        except Exception as e:
+            self._log_debug("No run history for fail-fast ordering", error=str(e))
+            return None
+
+    def _check_verdict(
+        self, hook: HookDefinition, result: HookResult, strategy: HookStrategy
+    ) -> bool:
+        if (
+            not self.fail_fast
+            or self._stage_decided
+            or not is_blocking_failure(hook, result, strategy.retry_policy)
+        ):
+            return False
+        self._stage_decided = True
+        self._log_info(
+            "Hook failed the stage, cancelling remaining hooks",
+            hook=hook.name,
+            strategy=strategy.name,
+        )
+        return True
+
     async def _execute_sequential(self, strategy: HookStrategy) -> list[HookResult]:
         results: list[HookResult] = []
         for hook in strategy.hooks:
-            result = await self._execute_single_hook(hook)
+            if self._stage_decided:
+                result = cancelled_result(hook)
+            else:
+                result = await self._execute_single_hook(hook)
+                self._check_verdict(hook, result, strategy)
             results.append(result)
             self._display_hook_result(result)
         return results
@@ -217,11 +277,19 @@ class AsyncHookExecutor:
         ]
 
         for hook in formatting_hooks:
-            result = await self._execute_single_hook(hook)
+            if self._stage_decided:
+                result = cancelled_result(hook)
+            else:
+                result = await self._execute_single_hook(hook)
+                self._check_verdict(hook, result, strategy)
             results.append(result)
             self._display_hook_result(result)
 
-        if other_hooks:
+        if other_hooks and self.fail_fast:
+            results.extend(
+                await self._execute_parallel_fail_fast(strategy, other_hooks)
+            )
+        elif other_hooks:
             tasks = [self._execute_single_hook(hook) for hook in other_hooks]
             parallel_results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -245,6 +313,51 @@ class AsyncHookExecutor:
 
         return results
 
+    async def _execute_parallel_fail_fast(
+        self, strategy: HookStrategy, hooks: list[HookDefinition]
+    ) -> list[HookResult]:
+        if self._stage_decided:
+            results = [cancelled_result(hook) for hook in hooks]
+            for result in results:
+                self._display_hook_result(result)
+            return results
+
+        # Tasks queue on the semaphore in creation order, so the ordering
+        # chosen by order_for_fail_fast is also the start order.
+        tasks = {
+            asyncio.create_task(
+                self._execute_single_hook(hook), name=f"hook-{hook.name}"
+            ): hook
+            for hook in hooks
+        }
+        results: list[HookResult] = []
+        pending: set[asyncio.Task[HookResult]] = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                hook = tasks[task]
+                if task.cancelled():
+                    result = cancelled_result(hook)
+                elif (error := task.exception()) is not None:
+                    result = HookResult(
+                        id=hook.name,
+                        name=hook.name,
+                        status="error",
+                        duration=0.0,
+                        issues_found=[str(error)],
+                        stage=hook.stage.value,
+                    )
+                else:
+                    result = task.result()
+                results.append(result)
+                self._display_hook_result(result)
+                if self._check_verdict(hook, result, strategy):
+                    for other in pending:
+                        other.cancel()
+        return results
+
     async def cleanup(self) -> None:
         await self._cleanup_running_processes()
         self._running_processes.clear()
@@ -353,21 +466,30 @@ class AsyncHookExecutor:
             )
 
             repo_root = self._get_repo_root()
+            cmd, tool_env = resolve_command(cmd, repo_root)
+            # With fail-fast a session of its own lets cancellation signal
+            # the whole tool tree.
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 cwd=repo_root,
+                env=tool_env,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                start_new_session=self.fail_fast,
             )
 
             self._running_processes.add(process)
 
-            result = await self._execute_process_with_timeout(
-                process,
-                hook,
-                timeout_val,
-                start_time,
-            )
+            try:
+                result = await self._execute_process_with_timeout(
+                    process,
+                    hook,
+                    timeout_val,
+                    start_time,
+                )
+            except asyncio.CancelledError:
+                await self._terminate_process_group(process)
+                raise
             if result is not None:
                 return result
 
@@ -465,6 +587,17 @@ class AsyncHookExecutor:
             is_timeout=True,
         )
 
+    async def _terminate_process_group(
+        self, process: asyncio.subprocess.Process
+    ) -> None:
+        signal_process_group(process)
+        try:
+            await asyncio.wait_for(process.wait(), timeout=CANCEL_GRACE_SECONDS)
+        except TimeoutError:
+            signal_process_group(process, KILL_SIGNAL)
+        finally:
+            self._running_processes.discard(process)
+
     async def _terminate_process_safely(
         self,
         process: asyncio.subprocess.Process,
@@ -916,8 +1049,10 @@ class AsyncHookExecutor:
             return
         width = get_console_width()
         dots = "." * max(0, (width - len(result.name)))
-        status_text = "Passed" if result.status == "passed" else "Failed"
-        status_color = "green" if result.status == "passed" else "red"
+        status_text, status_color = {
+            "passed": ("Passed", "green"),
+            CANCELLED: ("Cancelled", "yellow"),
+        }.get(result.status, ("Failed", "red"))
 
         self.console.print(
             f"{result.name}{dots}[{status_color}]{status_text}[/{status_color}]",
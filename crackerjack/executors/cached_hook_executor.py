@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import time
 import typing as t
+from dataclasses import replace
 from pathlib import Path
 
 from rich.console import Console
@@ -116,7 +117,7 @@ class CachedHookExecutor:
         context: dict[str, t.Any],
     ) -> None:
         self.logger.debug(f"Using cached result for hook: {hook_def.name}")
-        context["results"].append(cached_result)
+        context["results"].append(replace(cached_result, cache_hit=True))
         context["cache_hits"] += 1
 
     def _handle_cache_miss(
@@ -127,6 +128,7 @@ class CachedHookExecutor:
         self.logger.debug(f"Executing hook (cache miss): {hook_def.name}")
 
         hook_result = self.base_executor.execute_single_hook(hook_def)
+        hook_result.cache_hit = False
         context["results"].append(hook_result)
         context["cache_misses"] += 1
 
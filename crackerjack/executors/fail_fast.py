@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import typing as t
+from collections.abc import Mapping, Sequence
+from contextlib import suppress
+
+from crackerjack.config.hooks import HookDefinition, RetryPolicy
+from crackerjack.models.task import HookResult
+
+if t.TYPE_CHECKING:
+    import asyncio
+
+CANCELLED = "cancelled"
+BLOCKING_STATUSES = frozenset({"failed", "timeout", "error"})
+# Grace period between SIGTERM and SIGKILL for cancelled process groups.
+CANCEL_GRACE_SECONDS = 3.0
+KILL_SIGNAL: int = getattr(signal, "SIGKILL", signal.SIGTERM)
+_MIN_DURATION = 0.05
+
+
+class HookCancelledError(Exception):
+    def __init__(self, hook_name: str) -> None:
+        super().__init__(f"{hook_name} cancelled after the stage failed")
+        self.hook_name = hook_name
+
+
+def is_blocking_failure(
+    hook: HookDefinition, result: HookResult, retry_policy: RetryPolicy
+) -> bool:
+    if result.status not in BLOCKING_STATUSES:
+        return False
+    # Plain failures the retry pass may still fix do not decide the stage.
+    if result.status == "failed":
+        if retry_policy == RetryPolicy.ALL_HOOKS:
+            return False
+        if retry_policy == RetryPolicy.FORMATTING_ONLY and (
+            hook.is_formatting or hook.retry_on_failure
+        ):
+            return False
+    return True
+
+
+def order_for_fail_fast(
+    hooks: Sequence[HookDefinition],
+    stats: Mapping[str, Mapping[str, float]] | None,
+) -> list[HookDefinition]:
+    # Formatters rewrite files the checks read, so they keep running first.
+    # The checks are ordered by how often they fail per second of runtime,
+    # which reaches a failing verdict soonest on average; hooks without
+    # history keep their configured order after those with it.
+    stats = stats or {}
+
+    def score(hook: HookDefinition) -> float:
+        hook_stats = stats.get(hook.name)
+        if not hook_stats:
+            return 0.0
+        return hook_stats.get("failure_rate", 0.0) / max(
+            hook_stats.get("p50", 0.0), _MIN_DURATION
+        )
+
+    formatting = [hook for hook in hooks if hook.is_formatting]
+    checks = [hook for hook in hooks if not hook.is_formatting]
+    return [*formatting, *sorted(checks, key=lambda hook: -score(hook))]
+
+
+def restore_order(
+    hooks: Sequence[HookDefinition], results: list[HookResult]
+) -> list[HookResult]:
+    # Retry handling pairs results with the strategy's hooks by position.
+    position = {hook.name: i for i, hook in enumerate(hooks)}
+    return sorted(results, key=lambda result: position.get(result.name, len(hooks)))
+
+
+def cancelled_result(hook: HookDefinition, duration: float = 0.0) -> HookResult:
+    return HookResult(
+        id=hook.name,
+        name=hook.name,
+        status=CANCELLED,
+        duration=duration,
+        issues_found=[],
+        issues_count=0,
+        stage=hook.stage.value,
+        error_message="Cancelled after another hook failed the stage",
+        is_timeout=False,
+    )
+
+
+def signal_process_group(
+    process: subprocess.Popen[t.Any] | asyncio.subprocess.Process,
+    sig: int = signal.SIGTERM,
+) -> None:
+    # Processes started with start_new_session lead their own group, so the
+    # whole tool tree (uv run -> python -> workers) gets the signal.
+    if process.returncode is not None:
+        return
+    killpg = getattr(os, "killpg", None)
+    if killpg is not None:
+        with suppress(ProcessLookupError, PermissionError):
+            killpg(process.pid, sig)
+            return
+    with suppress(ProcessLookupError, OSError):
+        process.send_signal(sig)
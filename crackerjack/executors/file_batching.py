@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import typing as t
+from pathlib import Path
+
+DEFAULT_ARG_MAX = 128 * 1024
+WINDOWS_ARG_MAX = 32 * 1024
+ARG_MAX_HEADROOM = 4 * 1024
+MIN_FILES_PER_BATCH = 8
+
+
+def command_budget(env: t.Mapping[str, str] | None = None) -> int:
+    if sys.platform == "win32":
+        limit = WINDOWS_ARG_MAX
+    else:
+        try:
+            limit = os.sysconf("SC_ARG_MAX")
+        except (AttributeError, OSError, ValueError):
+            limit = DEFAULT_ARG_MAX
+        if limit <= 0:
+            limit = DEFAULT_ARG_MAX
+
+    environ = os.environ if env is None else env
+    env_size = sum(len(k) + len(v) + 2 for k, v in environ.items())
+    return max(limit - env_size - ARG_MAX_HEADROOM, 4 * 1024)
+
+
+def command_length(command: t.Sequence[str]) -> int:
+    return sum(len(os.fsencode(arg)) + 1 for arg in command)
+
+
+def file_cost(path: Path) -> int:
+    try:
+        return max(path.stat().st_size, 1)
+    except OSError:
+        return 1
+
+
+def partition_files(
+    base_command: t.Sequence[str],
+    files: t.Sequence[Path],
+    max_batches: int = 1,
+    budget: int | None = None,
+    cost: t.Callable[[Path], int] = file_cost,
+) -> list[list[Path]]:
+    if not files:
+        return []
+
+    budget = command_budget() if budget is None else budget
+    available = budget - command_length(base_command)
+    arg_sizes = [len(os.fsencode(str(path))) + 1 for path in files]
+    costs = [cost(path) for path in files]
+
+    wanted = max(1, min(max_batches, len(files) // MIN_FILES_PER_BATCH))
+    bin_costs = [0] * wanted
+    bin_sizes = [0] * wanted
+    bins: list[list[int]] = [[] for _ in range(wanted)]
+
+    for index in sorted(range(len(files)), key=lambda i: -costs[i]):
+        size = arg_sizes[index]
+        candidates = [
+            b
+            for b in range(len(bins))
+            if not bins[b] or bin_sizes[b] + size <= available
+        ]
+        if candidates:
+            target = min(candidates, key=lambda b: bin_costs[b])
+        else:
+            bins.append([])
+            bin_costs.append(0)
+            bin_sizes.append(0)
+            target = len(bins) - 1
+        bins[target].append(index)
+        bin_costs[target] += costs[index]
+        bin_sizes[target] += size
+
+    return [[files[i] for i in sorted(indices)] for indices in bins if indices]
+
+
+def merge_completed_processes(
+    command: list[str],
+    results: t.Sequence[subprocess.CompletedProcess[str]],
+) -> subprocess.CompletedProcess[str]:
+    if len(results) == 1:
+        return results[0]
+
+    returncode = max(
+        (result.returncode for result in results),
+        key=lambda code: (code != 0, abs(code)),
+    )
+    return subprocess.CompletedProcess(
+        args=command,
+        returncode=returncode,
+        stdout=_merge_stdout([result.stdout or "" for result in results]),
+        stderr="".join(result.stderr or "" for result in results),
+    )
+
+
+def _merge_stdout(outputs: list[str]) -> str:
+    stripped = [output.strip() for output in outputs if output.strip()]
+    if stripped and all(output.startswith("[") for output in stripped):
+        try:
+            merged: list[t.Any] = []
+            for output in stripped:
+                merged.extend(json.loads(output))
+            return json.dumps(merged)
+        except (json.JSONDecodeError, TypeError):
+            pass
+    return "".join(
+        output if output.endswith("\n") or not output else f"{output}\n"
+        for output in outputs
+    )
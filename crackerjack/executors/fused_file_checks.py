@@ -0,0 +1,436 @@
+from __future__ import annotations
+
+import json
+import logging
+import subprocess
+import time
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from crackerjack.config.hooks import HookDefinition
+from crackerjack.models.task import HookResult
+from crackerjack.services.process_pool import (
+    process_context,
+    resolve_worker_count,
+    shard_items,
+)
+from crackerjack.tools._git_utils import get_files_by_extension
+from crackerjack.tools.check_added_large_files import (
+    format_size,
+    get_file_size,
+    suggest_gitignore_action,
+)
+from crackerjack.tools.check_ast import validate_ast_content
+from crackerjack.tools.check_json import validate_json_content
+from crackerjack.tools.check_toml import validate_toml_content
+from crackerjack.tools.check_yaml import validate_yaml_content
+from crackerjack.tools.end_of_file_fixer import needs_newline_fix
+from crackerjack.tools.format_json import format_json_content
+from crackerjack.tools.local_link_checker import check_content
+from crackerjack.tools.trailing_whitespace import strip_trailing_whitespace
+
+logger = logging.getLogger(__name__)
+
+TEXT_EXTENSIONS: tuple[str, ...] = (
+    ".py",
+    ".md",
+    ".txt",
+    ".yaml",
+    ".yml",
+    ".toml",
+    ".json",
+)
+
+HOOK_EXTENSIONS: dict[str, tuple[str, ...]] = {
+    "trailing-whitespace": TEXT_EXTENSIONS,
+    "end-of-file-fixer": TEXT_EXTENSIONS,
+    "format-json": (".json",),
+    "check-yaml": (".yaml", ".yml"),
+    "check-toml": (".toml",),
+    "check-json": (".json",),
+    "check-ast": (".py",),
+    "check-local-links": (".md", ".markdown"),
+    "check-added-large-files": (),
+}
+
+FUSED_HOOKS: frozenset[str] = frozenset(HOOK_EXTENSIONS)
+
+LARGE_FILE_MAX_KB = 1000
+LARGE_FILE_EXEMPT: frozenset[str] = frozenset(
+    {"uv.lock", "poetry.lock", "Pipfile.lock", "package-lock.json", "yarn.lock"}
+)
+
+_FIX_MESSAGES: dict[str, str] = {
+    "trailing-whitespace": "Fixed trailing whitespace",
+    "end-of-file-fixer": "Fixed end-of-file",
+    "format-json": "Formatted",
+}
+
+_VALIDATORS: dict[str, t.Callable[[str], tuple[bool, str | None]]] = {
+    "check-yaml": validate_yaml_content,
+    "check-toml": validate_toml_content,
+    "check-json": validate_json_content,
+    "check-ast": validate_ast_content,
+}
+
+
+@dataclass
+class FileCheckOutcome:
+    path: Path
+    issues: dict[str, list[str]] = field(default_factory=dict)
+    fixed: list[str] = field(default_factory=list)
+
+    def add_issue(self, hook_name: str, message: str) -> None:
+        self.issues.setdefault(hook_name, []).append(f"{self.path}: {message}")
+
+
+def check_file(
+    path: Path,
+    hook_names: tuple[str, ...],
+    repo_root: Path,
+    max_size_bytes: int = LARGE_FILE_MAX_KB * 1024,
+) -> FileCheckOutcome:
+    outcome = FileCheckOutcome(path=path)
+
+    if "check-added-large-files" in hook_names:
+        _check_file_size(outcome, max_size_bytes)
+
+    content_hooks = [h for h in hook_names if h != "check-added-large-files"]
+    if not content_hooks:
+        return outcome
+
+    try:
+        data = path.read_bytes()
+    except OSError as e:
+        for hook_name in content_hooks:
+            outcome.add_issue(hook_name, f"Error reading file: {e}")
+        return outcome
+
+    fixed_data = _apply_fixers(outcome, data, hook_names)
+    if fixed_data != data:
+        try:
+            path.write_bytes(fixed_data)
+        except OSError as e:
+            for hook_name in outcome.fixed:
+                outcome.add_issue(hook_name, f"Error writing file: {e}")
+            outcome.fixed.clear()
+
+    _apply_validators(outcome, fixed_data, hook_names, repo_root)
+    return outcome
+
+
+def _check_file_size(outcome: FileCheckOutcome, max_size_bytes: int) -> None:
+    if outcome.path.name in LARGE_FILE_EXEMPT:
+        return
+
+    size = get_file_size(outcome.path)
+    if size <= max_size_bytes:
+        return
+
+    message = format_size(size)
+    action = suggest_gitignore_action(outcome.path)
+    if action:
+        message = f"{message} (SUGGESTION: {action})"
+    outcome.add_issue("check-added-large-files", message)
+
+
+def _apply_fixers(
+    outcome: FileCheckOutcome, data: bytes, hook_names: tuple[str, ...]
+) -> bytes:
+    if "trailing-whitespace" in hook_names:
+        try:
+            modified, content = strip_trailing_whitespace(data.decode("utf-8"))
+        except UnicodeDecodeError:
+            modified = False
+        if modified:
+            data = content.encode("utf-8")
+            outcome.fixed.append("trailing-whitespace")
+
+    if "end-of-file-fixer" in hook_names:
+        needs_fix, fixed_content = needs_newline_fix(data)
+        if needs_fix and fixed_content is not None:
+            data = fixed_content
+            outcome.fixed.append("end-of-file-fixer")
+
+    if "format-json" in hook_names:
+        data = _format_json(outcome, data)
+
+    return data
+
+
+def _format_json(outcome: FileCheckOutcome, data: bytes) -> bytes:
+    try:
+        content = data.decode("utf-8").strip()
+    except UnicodeDecodeError as e:
+        outcome.add_issue("format-json", f"Error formatting file: {e}")
+        return data
+
+    if not content:
+        return data
+
+    try:
+        formatted = format_json_content(content).encode("utf-8")
+    except json.JSONDecodeError as e:
+        outcome.add_issue("format-json", f"Invalid JSON syntax: {e}")
+        return data
+
+    if formatted != data:
+        outcome.fixed.append("format-json")
+    return formatted
+
+
+def _apply_validators(
+    outcome: FileCheckOutcome,
+    data: bytes,
+    hook_names: tuple[str, ...],
+    repo_root: Path,
+) -> None:
+    validators = {
+        name: validate for name, validate in _VALIDATORS.items() if name in hook_names
+    }
+    if not validators and "check-local-links" not in hook_names:
+        return
+
+    try:
+        content = data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        for hook_name in validators:
+            outcome.add_issue(hook_name, f"Error reading file: {e}")
+        if "check-local-links" in hook_names:
+            outcome.add_issue("check-local-links", f"Failed to read file: {e}")
+        return
+
+    for hook_name, validate in validators.items():
+        is_valid, error_msg = validate(content)
+        if not is_valid:
+            outcome.add_issue(hook_name, error_msg or "invalid")
+
+    if "check-local-links" in hook_names and not outcome.path.is_symlink():
+        for link_url, line_num, error_msg in check_content(
+            content, outcome.path, repo_root
+        ):
+            outcome.issues.setdefault("check-local-links", []).append(
+                f"{_relative_to(outcome.path, repo_root)}:{line_num}: "
+                f"{link_url} - {error_msg}"
+            )
+
+
+def _relative_to(path: Path, root: Path) -> Path:
+    return path.relative_to(root) if path.is_relative_to(root) else path
+
+
+def _check_files_in_worker(
+    items: list[tuple[Path, tuple[str, ...]]],
+    repo_root: Path,
+    max_size_bytes: int,
+) -> list[FileCheckOutcome]:
+    return [
+        check_file(path, hook_names, repo_root, max_size_bytes)
+        for path, hook_names in items
+    ]
+
+
+def _list_tracked_files(repo_root: Path) -> list[Path]:
+    # One plain listing filtered by extension in process; get_git_tracked_files
+    # re-matches every path against the .gitignore files, which dominates
+    # the run on large trees.
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z"],
+            capture_output=True,
+            check=True,
+            cwd=repo_root,
+        )
+    except (subprocess.CalledProcessError, OSError):
+        return []
+    return [
+        repo_root / name
+        for name in result.stdout.decode("utf-8", errors="replace").split("\x00")
+        if name
+    ]
+
+
+class FusedFileCheckRunner:
+    def __init__(
+        self,
+        repo_root: Path,
+        max_workers: int = 0,
+        parallel_threshold: int = 256,
+        max_size_bytes: int = LARGE_FILE_MAX_KB * 1024,
+    ) -> None:
+        self.repo_root = repo_root.resolve()
+        self.max_workers = max_workers
+        self.parallel_threshold = parallel_threshold
+        self.max_size_bytes = max_size_bytes
+
+    def run(
+        self,
+        hooks: list[HookDefinition],
+        hook_files: dict[str, list[Path] | None] | None = None,
+    ) -> list[HookResult]:
+        start_time = time.time()
+        hook_files = hook_files or {}
+        hook_names = [hook.name for hook in hooks if hook.name in FUSED_HOOKS]
+
+        files_by_hook = self._resolve_files(hook_names, hook_files)
+        plan = self._build_plan(files_by_hook)
+        outcomes = self._check_all(plan)
+
+        duration = time.time() - start_time
+        return [
+            self._build_hook_result(hook, files_by_hook[hook.name], outcomes, duration)
+            for hook in hooks
+            if hook.name in FUSED_HOOKS
+        ]
+
+    def _resolve_files(
+        self,
+        hook_names: list[str],
+        hook_files: dict[str, list[Path] | None],
+    ) -> dict[str, list[Path]]:
+        tracked: list[Path] | None = None
+        files_by_hook: dict[str, list[Path]] = {}
+
+        for hook_name in hook_names:
+            explicit = hook_files.get(hook_name)
+            if explicit:
+                files_by_hook[hook_name] = [
+                    self._absolute(path)
+                    for path in explicit
+                    if self._absolute(path).is_file()
+                ]
+                continue
+
+            if tracked is None:
+                tracked = self._discover_tracked_files()
+            files_by_hook[hook_name] = self._default_files(hook_name, tracked)
+
+        return files_by_hook
+
+    def _discover_tracked_files(self) -> list[Path]:
+        return [path for path in _list_tracked_files(self.repo_root) if path.is_file()]
+
+    def _default_files(self, hook_name: str, tracked: list[Path]) -> list[Path]:
+        extensions = HOOK_EXTENSIONS[hook_name]
+        if not extensions:
+            return tracked
+
+        if tracked:
+            files = [path for path in tracked if path.suffix in extensions]
+        else:
+            files = [
+                self._absolute(path)
+                for path in get_files_by_extension(
+                    list(extensions), use_git=False, root=self.repo_root
+                )
+            ]
+
+        if hook_name == "check-local-links":
+            archive = self.repo_root / "docs" / "archive"
+            return [path for path in files if not path.is_relative_to(archive)]
+        return files
+
+    def _absolute(self, path: Path) -> Path:
+        return path if path.is_absolute() else self.repo_root / path
+
+    @staticmethod
+    def _build_plan(
+        files_by_hook: dict[str, list[Path]],
+    ) -> list[tuple[Path, tuple[str, ...]]]:
+        per_file: dict[Path, list[str]] = {}
+        for hook_name, files in files_by_hook.items():
+            for path in files:
+                per_file.setdefault(path, []).append(hook_name)
+        return [(path, tuple(names)) for path, names in per_file.items()]
+
+    def _check_all(
+        self, plan: list[tuple[Path, tuple[str, ...]]]
+    ) -> dict[Path, FileCheckOutcome]:
+        workers = resolve_worker_count(
+            len(plan), self.max_workers, self.parallel_threshold
+        )
+        if workers <= 1:
+            outcomes = _check_files_in_worker(plan, self.repo_root, self.max_size_bytes)
+            return {outcome.path: outcome for outcome in outcomes}
+
+        shards = shard_items(plan, workers)
+        try:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=process_context(),
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(f"Process pool unavailable, checking in-process: {e}")
+            outcomes = _check_files_in_worker(plan, self.repo_root, self.max_size_bytes)
+            return {outcome.path: outcome for outcome in outcomes}
+
+        results: dict[Path, FileCheckOutcome] = {}
+        with executor:
+            futures = [
+                executor.submit(
+                    _check_files_in_worker,
+                    shard,
+                    self.repo_root,
+                    self.max_size_bytes,
+                )
+                for shard in shards
+            ]
+            for shard, future in zip(shards, futures, strict=True):
+                try:
+                    outcomes = future.result()
+                except Exception as e:
+                    logger.exception(f"File check worker failed: {e}")
+                    outcomes = self._failed_outcomes(shard, e)
+                results.update((outcome.path, outcome) for outcome in outcomes)
+        return results
+
+    @staticmethod
+    def _failed_outcomes(
+        shard: list[tuple[Path, tuple[str, ...]]], error: Exception
+    ) -> list[FileCheckOutcome]:
+        outcomes = []
+        for path, hook_names in shard:
+            outcome = FileCheckOutcome(path=path)
+            for hook_name in hook_names:
+                outcome.add_issue(hook_name, f"Worker failure: {error}")
+            outcomes.append(outcome)
+        return outcomes
+
+    def _build_hook_result(
+        self,
+        hook: HookDefinition,
+        files: list[Path],
+        outcomes: dict[Path, FileCheckOutcome],
+        duration: float,
+    ) -> HookResult:
+        issues: list[str] = []
+        output_lines: list[str] = []
+        for path in files:
+            outcome = outcomes.get(path)
+            if outcome is None:
+                continue
+            issues.extend(outcome.issues.get(hook.name, []))
+            if hook.name in outcome.fixed:
+                output_lines.append(
+                    f"{_FIX_MESSAGES[hook.name]}: {_relative_to(path, self.repo_root)}"
+                )
+
+        status = "failed" if issues else "passed"
+        return HookResult(
+            id=hook.name,
+            name=hook.name,
+            status=status,
+            duration=duration,
+            files_processed=len(files),
+            files_checked=[str(path) for path in files],
+            issues_found=issues,
+            issues_count=len(issues),
+            stage=hook.stage.value,
+            exit_code=1 if issues else None,
+            error_message="\n".join(issues)[:500] if issues else None,
+            is_timeout=False,
+            output="\n".join(output_lines),
+            error="",
+        )
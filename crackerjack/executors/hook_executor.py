@@ -4,19 +4,43 @@ import json
 import logging
 import os
 import re
+import sqlite3
 import subprocess
+import threading
 import time
 import typing as t
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 from crackerjack.config import get_console_width
 from crackerjack.config.hooks import HookDefinition, HookStrategy, RetryPolicy
+from crackerjack.executors.fail_fast import (
+    CANCEL_GRACE_SECONDS,
+    CANCELLED,
+    KILL_SIGNAL,
+    HookCancelledError,
+    cancelled_result,
+    is_blocking_failure,
+    order_for_fail_fast,
+    restore_order,
+    signal_process_group,
+)
+from crackerjack.executors.file_batching import (
+    command_budget,
+    merge_completed_processes,
+    partition_files,
+)
+from crackerjack.executors.fused_file_checks import FUSED_HOOKS, FusedFileCheckRunner
+from crackerjack.executors.process_monitor import ChildUsage
 from crackerjack.models.protocols import ConsoleInterface
 from crackerjack.models.task import HookResult
+from crackerjack.services.adaptive_timeouts import AdaptiveTimeouts
+from crackerjack.services.repo_snapshot import invalidate_repo_snapshots
+from crackerjack.services.run_history import RunRecorder, tool_version
 from crackerjack.services.security_logger import get_security_logger
+from crackerjack.services.tool_resolver import resolve_command
 from crackerjack.utils.issue_detection import (
     extract_issue_lines,
 )
@@ -97,6 +121,14 @@ class HookExecutionResult:
         }
 
 
+def _decode_partial(output: str | bytes | None) -> str:
+    # subprocess.run hands back bytes even with text=True, Popen.communicate
+    # hands back str.
+    if isinstance(output, bytes):
+        return output.decode("utf-8", errors="ignore")
+    return output or ""
+
+
 class HookExecutor:
     _REPORTING_TOOLS: frozenset[str] = frozenset(
         {
@@ -126,6 +158,7 @@ class HookExecutor:
         skip_offline_pip_audit: bool = True,
         adapter_learner_integration: t.Any | None = None,
         test_dir: str = "tests",
+        fail_fast: bool = False,
     ) -> None:
         self.console = console
         self.pkg_path = pkg_path
@@ -147,6 +180,22 @@ class HookExecutor:
         self._started_hooks: int = 0
         self._completed_hooks: int = 0
 
+        self._fused_results: dict[str, HookResult] = {}
+        self._fused_lock = threading.Lock()
+
+        self._resource_usage: dict[str, dict[str, float]] = {}
+        self._usage_lock = threading.Lock()
+
+        self.run_recorder: RunRecorder | None = None
+        self.timeout_model: AdaptiveTimeouts | None = None
+
+        self.fail_fast = fail_fast
+        self._cancelled = threading.Event()
+        self._cancelled_hooks: set[str] = set()
+        self._live_processes: dict[subprocess.Popen[str], str] = {}
+        self._monitored_hooks: set[str] = set()
+        self._live_lock = threading.Lock()
+
     def set_progress_callbacks(
         self,
         *,
@@ -162,18 +211,92 @@ class HookExecutor:
 
     def execute_strategy(self, strategy: HookStrategy) -> HookExecutionResult:
         start_time = time.time()
+        self._cancelled.clear()
+        self._cancelled_hooks.clear()
 
+        self._prime_fused_hooks(strategy)
         results = self._execute_hooks(strategy)
 
-        results = self._apply_retries_if_needed(strategy, results)
+        # Once fail-fast has decided the stage, retries cannot change it.
+        if not self._cancelled.is_set():
+            results = self._apply_retries_if_needed(strategy, results)
 
         return self._create_execution_result(strategy, results, start_time)
 
     def _execute_hooks(self, strategy: HookStrategy) -> list[HookResult]:
+        if not self.fail_fast:
+            return self._run_strategy_hooks(strategy)
+
+        ordered = replace(
+            strategy, hooks=order_for_fail_fast(strategy.hooks, self._hook_stats())
+        )
+        return restore_order(strategy.hooks, self._run_strategy_hooks(ordered))
+
+    def _run_strategy_hooks(self, strategy: HookStrategy) -> list[HookResult]:
         if strategy.parallel and len(strategy.hooks) > 1:
             return self._execute_parallel(strategy)
         return self._execute_sequential(strategy)
 
+    def _hook_stats(self) -> dict[str, dict[str, float]] | None:
+        if self.run_recorder is None:
+            return None
+        try:
+            return self.run_recorder.history.summary()
+        except sqlite3.Error as e:
+            logger.debug(f"No run history for fail-fast ordering: {e}")
+            return None
+
+    def _check_verdict(
+        self, hook: HookDefinition, result: HookResult, strategy: HookStrategy
+    ) -> bool:
+        if (
+            not self.fail_fast
+            or self._cancelled.is_set()
+            or not is_blocking_failure(hook, result, strategy.retry_policy)
+        ):
+            return False
+        logger.info(
+            f"{hook.name} failed the {strategy.name} stage, cancelling the rest"
+        )
+        self._cancel_running()
+        return True
+
+    def _cancel_running(self) -> None:
+        from crackerjack.executors.process_monitor import get_process_monitor
+
+        with self._live_lock:
+            self._cancelled.set()
+            processes = list(self._live_processes.items())
+            monitored = list(self._monitored_hooks)
+            self._cancelled_hooks.update(name for _, name in processes)
+            self._cancelled_hooks.update(monitored)
+
+        for process, _ in processes:
+            signal_process_group(process)
+        for hook_name in monitored:
+            get_process_monitor().terminate(hook_name)
+        if processes:
+            timer = threading.Timer(
+                CANCEL_GRACE_SECONDS,
+                self._kill_processes,
+                args=([process for process, _ in processes],),
+            )
+            timer.daemon = True
+            timer.start()
+
+    @staticmethod
+    def _kill_processes(processes: list[subprocess.Popen[str]]) -> None:
+        for process in processes:
+            if process.poll() is None:
+                signal_process_group(process, KILL_SIGNAL)
+
+    def _append_cancelled(
+        self, hook: HookDefinition, results: list[HookResult]
+    ) -> None:
+        result = cancelled_result(hook)
+        results.append(result)
+        self._display_hook_result(result)
+
     def _apply_retries_if_needed(
         self,
         strategy: HookStrategy,
@@ -258,11 +381,16 @@ class HookExecutor:
         total_hooks = len(enabled_hooks)
 
         for hook in enabled_hooks:
+            if self._cancelled.is_set():
+                self._append_cancelled(hook, results)
+                self._handle_progress_completion(total_hooks)
+                continue
             self._handle_progress_start(total_hooks)
             result = self.execute_single_hook(hook)
             results.append(result)
             self._display_hook_result(result)
             self._handle_progress_completion(total_hooks)
+            self._check_verdict(hook, result, strategy)
         return results
 
     def _handle_progress_start(self, total_hooks: int) -> None:
@@ -321,9 +449,16 @@ class HookExecutor:
         other_hooks = [h for h in enabled_hooks if not h.is_formatting]
 
         for hook in formatting_hooks:
+            if self._cancelled.is_set():
+                self._append_cancelled(hook, results)
+                continue
             self._execute_single_hook_with_progress(hook, results)
+            self._check_verdict(hook, results[-1], strategy)
 
-        if other_hooks:
+        if other_hooks and self._cancelled.is_set():
+            for hook in other_hooks:
+                self._append_cancelled(hook, results)
+        elif other_hooks:
             self._execute_parallel_hooks(other_hooks, strategy, results)
 
         return results
@@ -364,6 +499,13 @@ class HookExecutor:
 
             for future in as_completed(future_to_hook):
                 self._handle_future_result(future, future_to_hook, results)
+                if not future.cancelled() and self._check_verdict(
+                    future_to_hook[future], results[-1], strategy
+                ):
+                    # Hooks that have not started are dropped; running ones
+                    # were signalled and report themselves as cancelled.
+                    for pending in future_to_hook:
+                        pending.cancel()
 
     def _create_run_hook_func(
         self,
@@ -386,6 +528,10 @@ class HookExecutor:
         future_to_hook: dict,
         results: list[HookResult],
     ) -> None:
+        if future.cancelled():
+            self._append_cancelled(future_to_hook[future], results)
+            self._update_progress_on_completion()
+            return
         try:
             result = future.result()
             results.append(result)
@@ -416,21 +562,75 @@ class HookExecutor:
                 total = self._total_hooks or self._completed_hooks
                 self._progress_callback(self._completed_hooks, total)
 
+    def _prime_fused_hooks(self, strategy: HookStrategy) -> None:
+        hooks = [
+            h
+            for h in strategy.hooks
+            if h.name in FUSED_HOOKS and (not h.disabled or h.name in self.enable_hooks)
+        ]
+        with self._fused_lock:
+            self._fused_results.clear()
+        if len(hooks) < 2:
+            return
+
+        try:
+            results = self._run_fused_hooks(hooks)
+        except Exception as e:
+            logger.warning(f"Fused file checks failed, running hooks one by one: {e}")
+            return
+        finally:
+            invalidate_repo_snapshots()
+
+        with self._fused_lock:
+            self._fused_results = {result.name: result for result in results}
+
+    def _run_fused_hooks(self, hooks: list[HookDefinition]) -> list[HookResult]:
+        hook_files = {
+            hook.name: self._get_changed_files_for_hook(hook) for hook in hooks
+        }
+        return FusedFileCheckRunner(self.pkg_path).run(hooks, hook_files)
+
+    def _execute_fused_hook(
+        self, hook: HookDefinition, start_time: float
+    ) -> HookResult:
+        with self._fused_lock:
+            primed = self._fused_results.pop(hook.name, None)
+        if primed is not None:
+            return primed
+
+        try:
+            return self._run_fused_hooks([hook])[0]
+        except Exception as e:
+            return self._create_error_result(hook, start_time, e)
+        finally:
+            if hook.is_formatting:
+                invalidate_repo_snapshots()
+
     def execute_single_hook(self, hook: HookDefinition) -> HookResult:
         start_time = time.time()
+        if self._cancelled.is_set():
+            return cancelled_result(hook)
+
+        if hook.name in FUSED_HOOKS:
+            return self._execute_fused_hook(hook, start_time)
 
         try:
             result = self._run_hook_subprocess(hook)
             duration = time.time() - start_time
+            if hook.is_formatting:
+                invalidate_repo_snapshots()
 
             self._display_hook_output_if_needed(result, hook.name)
             return self._create_hook_result_from_process(hook, result, duration)
 
+        except HookCancelledError:
+            return cancelled_result(hook, time.time() - start_time)
+
         except subprocess.TimeoutExpired as e:
-            partial_output = (e.stdout or b"").decode("utf-8", errors="ignore")
-            partial_stderr = (e.stderr or b"").decode("utf-8", errors="ignore")
+            partial_output = _decode_partial(e.stdout)
+            partial_stderr = _decode_partial(e.stderr)
             return self._create_timeout_result(
-                hook, start_time, partial_output, partial_stderr
+                hook, start_time, partial_output, partial_stderr, e.timeout
             )
 
         except Exception as e:
@@ -521,30 +721,23 @@ class HookExecutor:
             repo_root = self.pkg_path
 
             changed_files = self._get_changed_files_for_hook(hook)
+            batches = self._plan_file_batches(hook, changed_files, clean_env)
 
-            command = (
-                hook.build_command(changed_files)
-                if changed_files
-                else hook.get_command()
-            )
+            if len(batches) > 1:
+                return self._run_file_batches(hook, batches, repo_root, clean_env)
+
+            command = hook.build_command(batches[0]) if batches else hook.get_command()
 
             if self.verbose and hook.name == "ty":
                 command = (
                     [*command, "--verbose"] if "--verbose" not in command else command
                 )
 
-            if hook.timeout > 120:
-                return self._run_with_monitoring(command, hook, repo_root, clean_env)
-
-            return subprocess.run(
-                command,
-                cwd=repo_root,
-                env=clean_env,
-                timeout=hook.timeout,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            files = len(batches[0]) if batches else 0
+            return self._run_command(command, hook, repo_root, clean_env, files)
+        except (subprocess.TimeoutExpired, HookCancelledError):
+            # Reported by execute_single_hook as such, not as a spawn failure.
+            raise
         except Exception as e:
             security_logger = get_security_logger()
             security_logger.log_subprocess_failure(
@@ -560,59 +753,241 @@ class HookExecutor:
                 stderr=str(e),
             )
 
+    def _run_command(
+        self,
+        command: list[str],
+        hook: HookDefinition,
+        repo_root: Path,
+        clean_env: dict[str, str],
+        files: int = 0,
+    ) -> subprocess.CompletedProcess[str]:
+        result, usage = self._run_measured(command, hook, repo_root, clean_env, files)
+        if usage:
+            self._record_resource_usage(hook.name, usage)
+        return result
+
+    def _run_measured(
+        self,
+        command: list[str],
+        hook: HookDefinition,
+        repo_root: Path,
+        clean_env: dict[str, str],
+        files: int = 0,
+    ) -> tuple[subprocess.CompletedProcess[str], dict[str, float]]:
+        timeout = self._timeout_for(hook, files)
+        command, tool_env = resolve_command(command, repo_root, clean_env)
+        if tool_env is not None:
+            clean_env = tool_env
+        # The process monitor samples the tree itself and records the hook's
+        # usage directly.
+        monitored = hook.timeout > 120
+        start_time = time.perf_counter()
+        try:
+            with ChildUsage() as child_usage:
+                if monitored:
+                    result = self._run_with_monitoring(
+                        command, hook, repo_root, clean_env, timeout
+                    )
+                elif self.fail_fast:
+                    result = self._run_cancellable(
+                        command, hook, repo_root, clean_env, timeout
+                    )
+                else:
+                    result = subprocess.run(
+                        command,
+                        cwd=repo_root,
+                        env=clean_env,
+                        timeout=timeout,
+                        capture_output=True,
+                        text=True,
+                        check=False,
+                    )
+        except subprocess.TimeoutExpired:
+            self._record_invocation(
+                hook, files, time.perf_counter() - start_time, None, {}, timeout
+            )
+            raise
+
+        if hook.name in self._cancelled_hooks:
+            raise HookCancelledError(hook.name)
+
+        usage = {} if monitored else child_usage.usage
+        self._record_invocation(
+            hook, files, time.perf_counter() - start_time, result.returncode, usage
+        )
+        return result, usage
+
+    def _run_cancellable(
+        self,
+        command: list[str],
+        hook: HookDefinition,
+        repo_root: Path,
+        clean_env: dict[str, str],
+        timeout: float,
+    ) -> subprocess.CompletedProcess[str]:
+        # Checking and registering under the lock means a process either
+        # sees the cancellation or is signalled by it.
+        with self._live_lock:
+            if self._cancelled.is_set():
+                raise HookCancelledError(hook.name)
+            # A session of its own lets cancellation signal the whole tool tree.
+            process = subprocess.Popen(
+                command,
+                cwd=repo_root,
+                env=clean_env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                start_new_session=True,
+            )
+            self._live_processes[process] = hook.name
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            signal_process_group(process, KILL_SIGNAL)
+            stdout, stderr = process.communicate()
+            raise subprocess.TimeoutExpired(command, timeout, stdout, stderr)
+        finally:
+            with self._live_lock:
+                self._live_processes.pop(process, None)
+        return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+
+    def _timeout_for(self, hook: HookDefinition, files: int) -> float:
+        if self.timeout_model is None:
+            return hook.timeout
+        return self.timeout_model.timeout(hook.name, hook.timeout, files)
+
+    def _record_invocation(
+        self,
+        hook: HookDefinition,
+        files: int,
+        duration: float,
+        exit_code: int | None,
+        usage: dict[str, float],
+        timed_out_after: float | None = None,
+    ) -> None:
+        if timed_out_after is not None and self.timeout_model is not None:
+            self.timeout_model.observe_timeout(hook.name, timed_out_after, files)
+        if self.run_recorder is not None:
+            self.run_recorder.record_batch(
+                hook.name,
+                duration,
+                files,
+                exit_code,
+                usage,
+                tool_version(hook.get_command()),
+                timed_out=timed_out_after is not None,
+            )
+
+    def _plan_file_batches(
+        self,
+        hook: HookDefinition,
+        files: list[Path] | None,
+        clean_env: dict[str, str],
+    ) -> list[list[Path]]:
+        if not files:
+            return []
+
+        batches = partition_files(
+            hook.get_command(),
+            files,
+            max_batches=hook.max_batches,
+            budget=command_budget(clean_env),
+        )
+        if len(batches) > 1 and hook.max_batches <= 1:
+            logger.info(
+                f"{hook.name}: {len(files)} changed files exceed the command "
+                "line limit, running on the whole project instead"
+            )
+            return []
+        return batches
+
+    def _run_file_batches(
+        self,
+        hook: HookDefinition,
+        batches: list[list[Path]],
+        repo_root: Path,
+        clean_env: dict[str, str],
+    ) -> subprocess.CompletedProcess[str]:
+        workers = max(1, min(hook.max_batches, len(batches)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._run_batch, hook, batch, repo_root, clean_env)
+                for batch in batches
+            ]
+            results = [future.result() for future in futures]
+
+        return merge_completed_processes(hook.get_command(), results)
+
+    def _run_batch(
+        self,
+        hook: HookDefinition,
+        batch: list[Path],
+        repo_root: Path,
+        clean_env: dict[str, str],
+    ) -> subprocess.CompletedProcess[str]:
+        return self._run_command(
+            hook.build_command(batch), hook, repo_root, clean_env, len(batch)
+        )
+
     def _run_with_monitoring(
         self,
         command: list[str],
         hook: HookDefinition,
         cwd: Path,
         env: dict[str, str],
+        timeout: float | None = None,
     ) -> subprocess.CompletedProcess[str]:
         from crackerjack.executors.process_monitor import (
             ProcessMetrics,
-            ProcessMonitor,
-        )
-
-        process = subprocess.Popen(
-            command,
-            cwd=cwd,
-            env=env,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-
-        monitor = ProcessMonitor(
-            check_interval=30.0,
-            cpu_threshold=0.1,
-            stall_timeout=180.0,
+            get_process_monitor,
         )
 
         def on_stall(hook_name: str, metrics: ProcessMetrics) -> None:
             self.console.print(
                 f"[yellow]⚠️ {hook_name} may be hung "
-                f"(CPU < 0.1% for 3+ min, elapsed: {metrics.elapsed_seconds:.1f}s)[/yellow]",
+                f"(no CPU or output for {metrics.stall_seconds:.0f}s, "
+                f"elapsed: {metrics.elapsed_seconds:.1f}s)[/yellow]",
             )
 
-        monitor.monitor_process(process, hook.name, hook.timeout, on_stall)
-
+        with self._live_lock:
+            if self._cancelled.is_set():
+                raise HookCancelledError(hook.name)
+            self._monitored_hooks.add(hook.name)
         try:
-            stdout, stderr = process.communicate(timeout=hook.timeout)
-            returncode = process.returncode
-
-            return subprocess.CompletedProcess(
-                args=command,
-                returncode=returncode,
-                stdout=stdout,
-                stderr=stderr,
+            result, metrics = get_process_monitor().run(
+                command,
+                hook.name,
+                hook.timeout if timeout is None else timeout,
+                cwd=cwd,
+                env=env,
+                on_stall=on_stall,
             )
+        finally:
+            with self._live_lock:
+                self._monitored_hooks.discard(hook.name)
+        self._record_resource_usage(hook.name, metrics.as_dict())
+        return result
+
+    def _record_resource_usage(self, hook_name: str, usage: dict[str, float]) -> None:
+        from crackerjack.core.performance import get_performance_monitor
+
+        with self._usage_lock:
+            merged = self._resource_usage.setdefault(hook_name, {})
+            for key, value in usage.items():
+                if key in ("cpu_seconds", "output_bytes"):
+                    merged[key] = merged.get(key, 0.0) + value
+                else:
+                    merged[key] = max(merged.get(key, 0.0), value)
 
-        except subprocess.TimeoutExpired:
-            process.kill()
-            stdout, stderr = process.communicate()
-            raise
+        monitor = get_performance_monitor()
+        for key in ("cpu_seconds", "peak_memory_mb"):
+            if key in usage:
+                monitor.record_metric(f"hook.{hook_name}.{key}", usage[key])
 
-        finally:
-            monitor.stop_monitoring()
+    def _pop_resource_usage(self, hook_name: str) -> dict[str, float]:
+        with self._usage_lock:
+            return self._resource_usage.pop(hook_name, {})
 
     def _display_hook_output_if_needed(
         self,
@@ -695,6 +1070,7 @@ class HookExecutor:
             error=result.stderr,
             advisory_issues=parsed_output.get("advisory_issues", []),
             qa_result=qa_result,
+            resource_usage=self._pop_resource_usage(hook.name),
         )
 
     def _create_skipped_hook_result(
@@ -1500,8 +1876,10 @@ class HookExecutor:
         start_time: float,
         partial_output: str = "",
         partial_stderr: str = "",
+        timeout: float | None = None,
     ) -> HookResult:
         duration = time.time() - start_time
+        timeout = hook.timeout if timeout is None else timeout
 
         subprocess.CompletedProcess(
             args=[],
@@ -1536,7 +1914,7 @@ class HookExecutor:
             issues_count=len(issues_found),
             stage=hook.stage.value,
             exit_code=124,
-            error_message=f"Execution exceeded timeout of {hook.timeout}s "
+            error_message=f"Execution exceeded timeout of {timeout:.0f}s "
             f"(completed in {duration:.1f}s)",
             is_timeout=True,
             output=partial_output,
@@ -1753,7 +2131,7 @@ class HookExecutor:
     def _display_hook_result(self, result: HookResult) -> None:
         if self.quiet:
             return
-        status_icon = "✅" if result.status == "passed" else "❌"
+        status_icon = {"passed": "✅", CANCELLED: "⏹️"}.get(result.status, "❌")
 
         max_width = get_console_width()
         content_width = max_width - 4
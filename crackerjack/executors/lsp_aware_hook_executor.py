@@ -60,6 +60,7 @@ class LSPAwareHookExecutor(HookExecutor):
         results = []
 
         lsp_available = self._check_lsp_availability()
+        self._prime_fused_hooks(strategy)
 
         for hook in strategy.hooks:
             self._handle_progress_start(len(strategy.hooks))
@@ -1,251 +1,451 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import signal
 import subprocess
+import sys
 import threading
 import time
+import typing as t
 from collections.abc import Callable
-from dataclasses import dataclass
+from concurrent.futures import Future
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import psutil
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+StallCallback = Callable[[str, "ProcessMetrics"], None]
+
 
 @dataclass
 class ProcessMetrics:
     pid: int
-    cpu_percent: float
-    memory_mb: float
-    elapsed_seconds: float
-    is_responsive: bool
-    last_activity_time: float
-
-
-class ProcessMonitor:
-    WARNING_THRESHOLDS = [0.50, 0.75, 0.90]
-
-    def __init__(
-        self,
-        check_interval: float = 30.0,
-        cpu_threshold: float = 0.1,
-        stall_timeout: float = 180.0,
-    ) -> None:
-        self.check_interval = check_interval
-        self.cpu_threshold = cpu_threshold
-        self.stall_timeout = stall_timeout
-        self._stop_event = threading.Event()
-        self._monitor_thread: threading.Thread | None = None
-        self._warned_hooks: set[str] = set()
-        self._timeout_warned: set[tuple[str, float]] = set()
-
-    def monitor_process(
-        self,
-        process: subprocess.Popen[str],
-        hook_name: str,
-        timeout: int,
-        on_stall: Callable[[str, ProcessMetrics], None] | None = None,
-    ) -> None:
-        self._stop_event.clear()
-        self._warned_hooks.discard(hook_name)
-
-        self._timeout_warned = {
-            (h, t) for (h, t) in self._timeout_warned if h != hook_name
+    cpu_percent: float = 0.0
+    memory_mb: float = 0.0
+    elapsed_seconds: float = 0.0
+    is_responsive: bool = True
+    last_activity_time: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_memory_mb: float = 0.0
+    output_bytes: int = 0
+    stall_seconds: float = 0.0
+    escalation: str = ""
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "cpu_seconds": round(self.cpu_seconds, 3),
+            "peak_memory_mb": round(self.peak_memory_mb, 1),
+            "output_bytes": float(self.output_bytes),
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "stall_seconds": round(self.stall_seconds, 1),
         }
-        self._monitor_thread = threading.Thread(
-            target=self._monitor_loop,
-            args=(process, hook_name, timeout, on_stall),
-            daemon=True,
-        )
-        self._monitor_thread.start()
-
-    def stop_monitoring(self) -> None:
-        self._stop_event.set()
-        if self._monitor_thread and self._monitor_thread.is_alive():
-            self._monitor_thread.join(timeout=5.0)
 
-    def _monitor_loop(
-        self,
-        process: subprocess.Popen[str],
-        hook_name: str,
-        timeout: int,
-        on_stall: Callable[[str, ProcessMetrics], None] | None,
-    ) -> None:
-        start_time = time.time()
-        last_cpu_check = start_time
-        consecutive_zero_cpu = 0
 
-        while not self._stop_event.is_set():
-            elapsed = time.time() - start_time
+class ChildUsage:
+    # RUSAGE_CHILDREN is process-wide, so a delta is only attributed to a
+    # command when no other measured command overlapped with it. ru_maxrss is
+    # a high-water mark over all children: it only identifies this command's
+    # peak when the command raised it.
+    _lock = threading.Lock()
+    _active: t.ClassVar[set[ChildUsage]] = set()
 
-            if self._should_stop_monitoring(process, hook_name, elapsed, timeout):
-                return
+    def __init__(self) -> None:
+        self.usage: dict[str, float] = {}
+        self.overlapped = False
+        self._start: t.Any = None
 
-            self._check_timeout_warnings(hook_name, elapsed, timeout)
+    def __enter__(self) -> t.Self:
+        with ChildUsage._lock:
+            if ChildUsage._active:
+                self.overlapped = True
+                for other in ChildUsage._active:
+                    other.overlapped = True
+            ChildUsage._active.add(self)
+            self._start = _children_rusage()
+        return self
 
-            if time.time() - last_cpu_check >= self.check_interval:
-                consecutive_zero_cpu = self._perform_health_check(
-                    process.pid,
-                    hook_name,
-                    elapsed,
-                    consecutive_zero_cpu,
-                    on_stall,
-                )
-                last_cpu_check = time.time()
+    def __exit__(self, *exc_info: object) -> None:
+        with ChildUsage._lock:
+            ChildUsage._active.discard(self)
+            end = _children_rusage()
+        if self.overlapped or self._start is None or end is None:
+            return
 
-            time.sleep(min(5.0, self.check_interval / 6))
+        start = self._start
+        cpu = (end.ru_utime - start.ru_utime) + (end.ru_stime - start.ru_stime)
+        self.usage["cpu_seconds"] = round(cpu, 3)
+        if end.ru_maxrss > start.ru_maxrss:
+            self.usage["peak_memory_mb"] = round(_maxrss_mb(end.ru_maxrss), 1)
 
-    def _should_stop_monitoring(
-        self,
-        process: subprocess.Popen[str],
-        hook_name: str,
-        elapsed: float,
-        timeout: int,
-    ) -> bool:
-        if process.poll() is not None:
-            logger.debug(f"{hook_name}: Process completed, stopping monitor")
-            return True
 
-        if elapsed > timeout:
-            logger.warning(
-                f"{hook_name}: Timeout of {timeout}s exceeded (elapsed: {elapsed:.1f}s)",
-            )
-            return True
+def _children_rusage() -> t.Any:
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_CHILDREN)
 
-        return False
 
-    def _perform_health_check(
-        self,
-        pid: int,
-        hook_name: str,
-        elapsed: float,
-        consecutive_zero_cpu: int,
-        on_stall: Callable[[str, ProcessMetrics], None] | None,
-    ) -> int:
-        metrics = self._get_process_metrics(pid, elapsed)
+def _maxrss_mb(maxrss: int) -> float:
+    # Linux reports kilobytes, macOS bytes.
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
 
-        if not metrics:
-            return consecutive_zero_cpu
 
-        self._log_metrics(hook_name, metrics)
+@dataclass
+class _WatchedProcess:
+    hook_name: str
+    process: asyncio.subprocess.Process
+    timeout: float
+    on_stall: StallCallback | None
+    started: float = field(default_factory=time.monotonic)
+    metrics: ProcessMetrics = field(init=False)
+    handle: psutil.Process | None = None
+    cpu_by_pid: dict[int, float] = field(default_factory=dict)
+    last_sample: float = 0.0
+    last_output_bytes: int = 0
+    timeout_warned: set[float] = field(default_factory=set)
+    terminated_at: float | None = None
+    timed_out: bool = False
+
+    def __post_init__(self) -> None:
+        self.metrics = ProcessMetrics(pid=self.process.pid)
+        self.last_sample = self.started
+        with suppress(psutil.Error):
+            self.handle = psutil.Process(self.process.pid)
 
-        return self._check_cpu_activity(
-            hook_name,
-            metrics,
-            consecutive_zero_cpu,
-            on_stall,
-        )
 
-    def _log_metrics(self, hook_name: str, metrics: ProcessMetrics) -> None:
-        logger.debug(
-            f"{hook_name}: CPU={metrics.cpu_percent:.1f}%, "
-            f"MEM={metrics.memory_mb:.1f}MB, "
-            f"elapsed={metrics.elapsed_seconds:.1f}s",
-        )
+class ProcessMonitor:
+    WARNING_THRESHOLDS = [0.50, 0.75, 0.90]
 
-    def _check_cpu_activity(
+    def __init__(
+        self,
+        check_interval: float = 5.0,
+        cpu_threshold: float = 0.1,
+        stall_timeout: float = 180.0,
+        terminate_after: float | None = 420.0,
+        kill_grace: float = 15.0,
+    ) -> None:
+        self.check_interval = check_interval
+        self.cpu_threshold = cpu_threshold
+        self.stall_timeout = stall_timeout
+        self.terminate_after = terminate_after
+        self.kill_grace = kill_grace
+        self._watched: dict[int, _WatchedProcess] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._sampler: asyncio.Task[None] | None = None
+        self._start_lock = threading.Lock()
+
+    @property
+    def active_count(self) -> int:
+        return len(self._watched)
+
+    def run(
         self,
+        command: list[str],
         hook_name: str,
-        metrics: ProcessMetrics,
-        consecutive_zero_cpu: int,
-        on_stall: Callable[[str, ProcessMetrics], None] | None,
-    ) -> int:
-        if metrics.cpu_percent < self.cpu_threshold:
-            consecutive_zero_cpu += 1
-            return self._handle_potential_stall(
-                hook_name,
-                metrics,
-                consecutive_zero_cpu,
-                on_stall,
+        timeout: float,
+        cwd: Path | None = None,
+        env: dict[str, str] | None = None,
+        on_stall: StallCallback | None = None,
+    ) -> tuple[subprocess.CompletedProcess[str], ProcessMetrics]:
+        future: Future[tuple[subprocess.CompletedProcess[str], ProcessMetrics]] = (
+            asyncio.run_coroutine_threadsafe(
+                self.supervise(command, hook_name, timeout, cwd, env, on_stall),
+                self._ensure_loop(),
             )
+        )
+        return future.result()
 
-        return 0
-
-    def _handle_potential_stall(
+    async def supervise(
         self,
+        command: list[str],
         hook_name: str,
-        metrics: ProcessMetrics,
-        consecutive_zero_cpu: int,
-        on_stall: Callable[[str, ProcessMetrics], None] | None,
-    ) -> int:
-
-        if metrics.cpu_percent >= self.cpu_threshold:
-            return 0
-
-        stall_duration = consecutive_zero_cpu * self.check_interval
-
-        if stall_duration >= self.stall_timeout:
-            if hook_name not in self._warned_hooks:
-                self._warned_hooks.add(hook_name)
-                if on_stall:
-                    on_stall(hook_name, metrics)
-
-            return 0
-
-        return consecutive_zero_cpu
-
-    def _get_process_metrics(self, pid: int, elapsed: float) -> ProcessMetrics | None:
+        timeout: float,
+        cwd: Path | None = None,
+        env: dict[str, str] | None = None,
+        on_stall: StallCallback | None = None,
+    ) -> tuple[subprocess.CompletedProcess[str], ProcessMetrics]:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=cwd,
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            # Its own session, so a deadline can reach children that outlive
+            # it and still hold the output pipes.
+            start_new_session=True,
+        )
+        watched = _WatchedProcess(hook_name, process, timeout, on_stall)
+        self._watched[process.pid] = watched
+        loop = asyncio.get_running_loop()
+        if self._sampler is None or self._sampler.done():
+            self._sampler = loop.create_task(self._sample())
+        deadline = loop.call_later(timeout, self._on_timeout, watched)
+
+        out: list[bytes] = []
+        err: list[bytes] = []
+        readers = [
+            loop.create_task(self._drain(process.stdout, watched, out)),
+            loop.create_task(self._drain(process.stderr, watched, err)),
+        ]
         try:
-            result = subprocess.run(
-                ["ps", "-p", str(pid), "-o", "%cpu, %mem"],
-                capture_output=True,
-                text=True,
-                timeout=5.0,
-                check=False,
-            )
+            await process.wait()
+            await self._finish_drains(readers, watched)
+        finally:
+            deadline.cancel()
+            self._watched.pop(process.pid, None)
+            for reader in readers:
+                reader.cancel()
+
+        stdout, stderr = b"".join(out), b"".join(err)
+        metrics = watched.metrics
+        metrics.elapsed_seconds = time.monotonic() - watched.started
+        if watched.timed_out:
+            raise subprocess.TimeoutExpired(command, timeout, stdout, stderr)
+
+        return (
+            subprocess.CompletedProcess(
+                args=command,
+                returncode=process.returncode or 0,
+                stdout=stdout.decode("utf-8", errors="replace"),
+                stderr=stderr.decode("utf-8", errors="replace"),
+            ),
+            metrics,
+        )
 
-            if result.returncode != 0:
-                return None
+    async def _drain(
+        self,
+        stream: asyncio.StreamReader | None,
+        watched: _WatchedProcess,
+        chunks: list[bytes],
+    ) -> None:
+        if stream is None:
+            return
+        while chunk := await stream.read(65536):
+            chunks.append(chunk)
+            watched.metrics.output_bytes += len(chunk)
+
+    async def _finish_drains(
+        self, readers: list[asyncio.Task[None]], watched: _WatchedProcess
+    ) -> None:
+        # Children that outlived the tool keep the pipes open. Wait for them
+        # while the deadline and stall checks still apply, but stop reading
+        # once they have been killed, or a grace period after SIGTERM.
+        while pending := [reader for reader in readers if not reader.done()]:
+            if watched.metrics.escalation == "killed" or (
+                watched.terminated_at is not None
+                and time.monotonic() - watched.terminated_at >= 2 * self.kill_grace
+            ):
+                return
+            await asyncio.wait(pending, timeout=self.check_interval)
+
+    async def _sample(self) -> None:
+        while self._watched:
+            await asyncio.sleep(self.check_interval)
+            now = time.monotonic()
+            for watched in list(self._watched.values()):
+                self._check(watched, now)
+
+    def terminate(self, hook_name: str) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+
+        def escalate() -> None:
+            now = time.monotonic()
+            for watched in list(self._watched.values()):
+                if watched.hook_name == hook_name:
+                    self._escalate(watched, now, "terminated")
+
+        # Escalation to SIGKILL after kill_grace is left to the sampler.
+        with suppress(RuntimeError):
+            loop.call_soon_threadsafe(escalate)
+
+    def _on_timeout(self, watched: _WatchedProcess) -> None:
+        watched.timed_out = True
+        logger.warning(
+            f"{watched.hook_name}: Timeout of {watched.timeout}s exceeded "
+            f"(elapsed: {time.monotonic() - watched.started:.1f}s)"
+        )
+        self._escalate(watched, time.monotonic(), "terminated")
 
-            lines = result.stdout.strip().split("\n")
-            if len(lines) < 2:
-                return None
+    def _check(self, watched: _WatchedProcess, now: float) -> None:
+        elapsed = now - watched.started
+        self._check_timeout_warnings(watched, elapsed)
 
-            values = lines[1].split()
-            if len(values) < 2:
-                return None
+        if watched.terminated_at is not None:
+            if now - watched.terminated_at >= self.kill_grace:
+                self._escalate(watched, now, "killed")
+            return
 
-            cpu_percent = float(values[0])
-            mem_percent = float(values[1])
+        self._update_metrics(watched, now, elapsed)
+        self._check_stall(watched, now)
 
-            memory_mb = mem_percent * 16384 / 100
+    def _update_metrics(
+        self, watched: _WatchedProcess, now: float, elapsed: float
+    ) -> None:
+        metrics = watched.metrics
+        interval = max(now - watched.last_sample, 1e-6)
+        watched.last_sample = now
+        metrics.elapsed_seconds = elapsed
+
+        cpu_seconds, rss = self._sample_tree(watched)
+        delta = max(0.0, cpu_seconds - metrics.cpu_seconds)
+        metrics.cpu_seconds = max(metrics.cpu_seconds, cpu_seconds)
+        metrics.cpu_percent = delta / interval * 100
+        metrics.memory_mb = rss / (1024 * 1024)
+        metrics.peak_memory_mb = max(metrics.peak_memory_mb, metrics.memory_mb)
+
+        progressed = metrics.output_bytes != watched.last_output_bytes
+        watched.last_output_bytes = metrics.output_bytes
+        metrics.is_responsive = progressed or metrics.cpu_percent >= self.cpu_threshold
+        if metrics.is_responsive:
+            metrics.last_activity_time = time.time()
+            metrics.stall_seconds = 0.0
+        else:
+            metrics.stall_seconds += interval
 
-            is_responsive = cpu_percent >= self.cpu_threshold
+        logger.debug(
+            f"{watched.hook_name}: CPU={metrics.cpu_percent:.1f}%, "
+            f"MEM={metrics.memory_mb:.1f}MB, out={metrics.output_bytes}B, "
+            f"elapsed={elapsed:.1f}s"
+        )
 
-            return ProcessMetrics(
-                pid=pid,
-                cpu_percent=cpu_percent,
-                memory_mb=memory_mb,
-                elapsed_seconds=elapsed,
-                is_responsive=is_responsive,
-                last_activity_time=time.time() if is_responsive else 0.0,
+    @staticmethod
+    def _sample_tree(watched: _WatchedProcess) -> tuple[float, int]:
+        if watched.handle is None:
+            return 0.0, 0
+        try:
+            processes = [watched.handle, *watched.handle.children(recursive=True)]
+        except psutil.Error:
+            return sum(watched.cpu_by_pid.values()), 0
+
+        rss = 0
+        for proc in processes:
+            try:
+                with proc.oneshot():
+                    times = proc.cpu_times()
+                    rss += proc.memory_info().rss
+            except psutil.Error:
+                continue
+            # Exited children keep contributing the CPU they used.
+            watched.cpu_by_pid[proc.pid] = times.user + times.system
+        return sum(watched.cpu_by_pid.values()), rss
+
+    def _check_stall(self, watched: _WatchedProcess, now: float) -> None:
+        metrics = watched.metrics
+        if (
+            self.terminate_after is not None
+            and metrics.stall_seconds >= self.terminate_after
+        ):
+            logger.warning(
+                f"{watched.hook_name}: no CPU or output for "
+                f"{metrics.stall_seconds:.0f}s, terminating"
             )
+            self._escalate(watched, now, "terminated")
+        elif metrics.stall_seconds >= self.stall_timeout and not metrics.escalation:
+            metrics.escalation = "warned"
+            if watched.on_stall is not None:
+                watched.on_stall(watched.hook_name, metrics)
+
+    def _escalate(self, watched: _WatchedProcess, now: float, stage: str) -> None:
+        # The tool itself may be gone while children it left behind still
+        # run; those are signalled through its session.
+        if stage == "terminated":
+            if watched.terminated_at is not None:
+                return
+            watched.terminated_at = now
+        watched.metrics.escalation = stage
+        self._signal_tree(
+            watched, signal.SIGKILL if stage == "killed" else signal.SIGTERM
+        )
 
-        except (
-            subprocess.TimeoutExpired,
-            PermissionError,
-            OSError,
-            ValueError,
-            IndexError,
-        ) as e:
-            logger.debug(f"Failed to get metrics for PID {pid}: {e}")
-            return None
+    @staticmethod
+    def _signal_tree(watched: _WatchedProcess, sig: signal.Signals) -> None:
+        targets: list[psutil.Process] = []
+        if watched.handle is not None:
+            try:
+                targets = [*watched.handle.children(recursive=True), watched.handle]
+            except psutil.Error:
+                targets = [watched.handle]
+        for proc in targets:
+            try:
+                proc.send_signal(sig)
+            except psutil.Error:
+                continue
+        if hasattr(os, "killpg"):
+            with suppress(ProcessLookupError, PermissionError):
+                os.killpg(watched.process.pid, sig)
+        elif not targets and watched.process.returncode is None:
+            with suppress(ProcessLookupError):
+                watched.process.send_signal(sig)
 
     def _check_timeout_warnings(
         self,
-        hook_name: str,
+        watched: _WatchedProcess,
         elapsed: float,
-        timeout: int,
     ) -> None:
-        timeout_percent = elapsed / timeout
+        timeout_percent = elapsed / watched.timeout if watched.timeout else 0.0
 
         for threshold in self.WARNING_THRESHOLDS:
-            if timeout_percent >= threshold:
-                warning_key = (hook_name, threshold)
-                if warning_key not in self._timeout_warned:
-                    self._timeout_warned.add(warning_key)
-                    percent_str = f"{threshold * 100:.0f}%"
-                    remaining = timeout - elapsed
-
-                    logger.debug(
-                        f"⏱️ {hook_name}: {percent_str} of timeout elapsed "
-                        f"({elapsed:.1f}s / {timeout}s), {remaining:.1f}s remaining"
-                    )
+            if timeout_percent >= threshold and threshold not in watched.timeout_warned:
+                watched.timeout_warned.add(threshold)
+                remaining = watched.timeout - elapsed
+                logger.debug(
+                    f"⏱️ {watched.hook_name}: {threshold * 100:.0f}% of timeout "
+                    f"elapsed ({elapsed:.1f}s / {watched.timeout}s), "
+                    f"{remaining:.1f}s remaining"
+                )
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is not None and self._thread and self._thread.is_alive():
+                return self._loop
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def serve() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._thread = threading.Thread(
+                target=serve, name="crackerjack-process-monitor", daemon=True
+            )
+            self._thread.start()
+            ready.wait()
+            self._loop = loop
+            return loop
+
+    def shutdown(self) -> None:
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5.0)
+        if not loop.is_running():
+            loop.close()
+
+
+_process_monitor: ProcessMonitor | None = None
+_process_monitor_lock = threading.Lock()
+
+
+def get_process_monitor() -> ProcessMonitor:
+    global _process_monitor
+    with _process_monitor_lock:
+        if _process_monitor is None:
+            _process_monitor = ProcessMonitor()
+        return _process_monitor
@@ -52,6 +52,7 @@ class ProgressHookExecutor(HookExecutor):
         if not self.show_progress:
             return super().execute_strategy(strategy)
 
+        self._prime_fused_hooks(strategy)
         with self._create_progress_bar() as progress:
             main_task = progress.add_task(
                 f"[cyan]Running {len(strategy.hooks)} hooks...",
@@ -1,4 +1,4 @@
-from .engine import ASTTransformEngine
+from .engine import ASTTransformEngine, ChangeSpec, LineEdit, apply_line_edits
 from .exceptions import (
     AsyncPatternUnsupported,
     BehaviorChanged,
@@ -39,6 +39,7 @@ __all__ = [
     "BaseSurgeon",
     "BehaviorChanged",
     "BothSurgeonsFailed",
+    "ChangeSpec",
     "ComplexityIncreased",
     "ComplexityNotReduced",
     "ComplexityTimeout",
@@ -49,6 +50,7 @@ __all__ = [
     "FormattingLost",
     "GuardClausePattern",
     "LibcstSurgeon",
+    "LineEdit",
     "NoPatternMatch",
     "ParseError",
     "PatternMatch",
@@ -62,4 +64,5 @@ __all__ = [
     "ValidationFailed",
     "ValidationResult",
     "WalrusOperatorConflict",
+    "apply_line_edits",
 ]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import ast
 import asyncio
+import difflib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -14,6 +15,25 @@ from .surgeons.base import BaseSurgeon
 from .validator import TransformValidator
 
 
+@dataclass(frozen=True)
+class LineEdit:
+    start: int
+    end: int
+    lines: tuple[str, ...]
+
+    def overlaps(self, other: LineEdit) -> bool:
+        if self.start == self.end or other.start == other.end:
+            return self.start <= other.end and other.start <= self.end
+        return self.start < other.end and other.start < self.end
+
+
+def apply_line_edits(lines: list[str], edits: list[LineEdit]) -> list[str]:
+    result = list(lines)
+    for edit in sorted(edits, key=lambda e: (e.start, e.end), reverse=True):
+        result[edit.start : edit.end] = edit.lines
+    return result
+
+
 @dataclass
 class ChangeSpec:
     file_path: Path
@@ -25,6 +45,16 @@ class ChangeSpec:
     complexity_reduction: int
     confidence: float = 0.8
 
+    def line_edits(self) -> list[LineEdit]:
+        original = self.original_content.splitlines(keepends=True)
+        transformed = self.transformed_content.splitlines(keepends=True)
+        matcher = difflib.SequenceMatcher(None, original, transformed, autojunk=False)
+        return [
+            LineEdit(i1, i2, tuple(transformed[j1:j2]))
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+            if tag != "equal"
+        ]
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "file_path": str(self.file_path),
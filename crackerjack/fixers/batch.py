@@ -0,0 +1,256 @@
+"""Per-file batched autofix transactions.
+
+The ``fix_*_issue`` entry points in this package each read, parse and write
+their target file once per issue. ``BatchAutofixEngine`` instead groups the
+issues of an iteration by file and runs one transaction per file:
+
+1. read the file once;
+2. ask the edit producer for a ``ChangeSpec`` per issue, all computed
+   against that same snapshot of the content;
+3. turn each spec into line-level ``LineEdit`` hunks and accept the specs
+   whose hunks do not overlap an already accepted spec (identical hunks --
+   e.g. two issues fixed by the same whole-file rewrite -- are merged, not
+   treated as a conflict);
+4. apply every accepted hunk in reverse offset order, validate the result
+   once, back the file up once and write it atomically once.
+
+Issues whose edits overlap are deferred and retried against the freshly
+written content on the next iteration, up to ``max_iterations``.
+
+Producers are plain callables ``(content, issue) -> ChangeSpec | None``
+(sync or async). ``content_fixer`` adapts the content-in/content-out
+fixers already in this package (``fix_refurb_issue`` and friends).
+"""
+
+from __future__ import annotations
+
+import ast
+import inspect
+import logging
+import shutil
+import typing as t
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from crackerjack.errors import ExecutionError
+from crackerjack.fixers.ast_transform.engine import (
+    ChangeSpec,
+    LineEdit,
+    apply_line_edits,
+)
+from crackerjack.models.issues import FixResult, Issue
+from crackerjack.services.repo_snapshot import invalidate_repo_snapshots
+from crackerjack.services.secure_path_utils import AtomicFileOperations
+
+logger = logging.getLogger(__name__)
+
+EditProducer = t.Callable[
+    [str, Issue], "ChangeSpec | None | t.Awaitable[ChangeSpec | None]"
+]
+ContentValidator = t.Callable[[Path, str], str | None]
+
+
+def content_fixer(
+    fix: t.Callable[[str, Issue], tuple[str, str]],
+) -> EditProducer:
+    def produce(content: str, issue: Issue) -> ChangeSpec | None:
+        new_content, description = fix(content, issue)
+        if new_content == content:
+            return None
+        line = issue.line_number or 1
+        return ChangeSpec(
+            file_path=Path(issue.file_path or ""),
+            original_content=content,
+            transformed_content=new_content,
+            line_start=line,
+            line_end=line,
+            pattern_name=description,
+            complexity_reduction=0,
+        )
+
+    return produce
+
+
+def validate_python_syntax(file_path: Path, content: str) -> str | None:
+    if file_path.suffix != ".py":
+        return None
+    try:
+        ast.parse(content, filename=str(file_path))
+    except SyntaxError as e:
+        return f"Syntax error at line {e.lineno}: {e.msg}"
+    return None
+
+
+@dataclass
+class FileTransaction:
+    file_path: Path
+    applied: list[Issue] = field(default_factory=list)
+    deferred: list[Issue] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    descriptions: dict[str, str] = field(default_factory=dict)
+    written: bool = False
+
+
+@dataclass
+class BatchAutofixResult:
+    results: dict[str, FixResult] = field(default_factory=dict)
+    deferred: list[Issue] = field(default_factory=list)
+    files_modified: list[str] = field(default_factory=list)
+    iterations: int = 0
+    file_reads: int = 0
+    file_writes: int = 0
+
+    @property
+    def fixed_count(self) -> int:
+        return sum(1 for result in self.results.values() if result.success)
+
+
+class BatchAutofixEngine:
+    def __init__(
+        self,
+        producer: EditProducer,
+        project_root: Path,
+        validator: ContentValidator = validate_python_syntax,
+        create_backup: bool = True,
+        max_iterations: int = 3,
+    ) -> None:
+        self.producer = producer
+        self.project_root = Path(project_root)
+        self.validator = validator
+        self.create_backup = create_backup
+        self.max_iterations = max(1, max_iterations)
+
+    async def run(self, issues: t.Iterable[Issue]) -> BatchAutofixResult:
+        result = BatchAutofixResult()
+        pending = list(issues)
+        modified: set[str] = set()
+
+        while pending and result.iterations < self.max_iterations:
+            result.iterations += 1
+            by_file = self._group_by_file(pending, result)
+            pending = []
+
+            for file_path, file_issues in by_file.items():
+                transaction = await self._run_transaction(file_path, file_issues)
+                result.file_reads += 1
+                if transaction.written:
+                    result.file_writes += 1
+                    modified.add(str(file_path))
+                self._record(transaction, result)
+                pending.extend(transaction.deferred)
+
+        for issue in pending:
+            result.results[issue.id] = FixResult(
+                success=False,
+                remaining_issues=["Edit overlaps another fix; deferred"],
+            )
+        result.deferred = pending
+        result.files_modified = sorted(modified)
+        return result
+
+    def _group_by_file(
+        self, issues: list[Issue], result: BatchAutofixResult
+    ) -> dict[Path, list[Issue]]:
+        by_file: dict[Path, list[Issue]] = defaultdict(list)
+        for issue in issues:
+            if not issue.file_path:
+                result.results[issue.id] = FixResult(
+                    success=False, remaining_issues=["No file path provided"]
+                )
+                continue
+            path = Path(issue.file_path)
+            if not path.is_absolute():
+                path = self.project_root / path
+            by_file[path].append(issue)
+        return by_file
+
+    async def _run_transaction(
+        self, file_path: Path, issues: list[Issue]
+    ) -> FileTransaction:
+        transaction = FileTransaction(file_path)
+        try:
+            content = file_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            for issue in issues:
+                transaction.failed[issue.id] = f"Could not read file: {e}"
+            return transaction
+
+        accepted: list[LineEdit] = []
+        for issue in issues:
+            spec = await self._produce(content, issue, transaction)
+            if spec is None:
+                continue
+            edits = spec.line_edits()
+            new_edits = [edit for edit in edits if edit not in accepted]
+            if any(edit.overlaps(other) for edit in new_edits for other in accepted):
+                transaction.deferred.append(issue)
+                continue
+            accepted.extend(new_edits)
+            transaction.applied.append(issue)
+            transaction.descriptions[issue.id] = spec.pattern_name
+
+        if not accepted:
+            return transaction
+
+        lines = content.splitlines(keepends=True)
+        new_content = "".join(apply_line_edits(lines, accepted))
+        error = self.validator(file_path, new_content)
+        if error is None:
+            error = self._write(file_path, new_content)
+
+        if error is not None:
+            for issue in transaction.applied:
+                transaction.failed[issue.id] = error
+            transaction.applied = []
+            return transaction
+
+        transaction.written = True
+        return transaction
+
+    async def _produce(
+        self, content: str, issue: Issue, transaction: FileTransaction
+    ) -> ChangeSpec | None:
+        try:
+            spec = self.producer(content, issue)
+            if inspect.isawaitable(spec):
+                spec = await spec
+        except Exception as e:
+            logger.debug(f"Edit producer failed for {issue.id}: {e}")
+            transaction.failed[issue.id] = f"Fix generation failed: {e}"
+            return None
+
+        if spec is None or spec.transformed_content == content:
+            transaction.failed[issue.id] = "No applicable fix"
+            return None
+        if spec.original_content != content:
+            transaction.failed[issue.id] = "Fix was computed against stale content"
+            return None
+        return spec
+
+    def _write(self, file_path: Path, content: str) -> str | None:
+        if self.create_backup:
+            try:
+                backup_path = file_path.with_suffix(file_path.suffix + ".bak")
+                shutil.copy2(file_path, backup_path)
+            except OSError as e:
+                return f"Failed to create backup: {e}"
+        try:
+            AtomicFileOperations.atomic_write(file_path, content, self.project_root)
+        except ExecutionError as e:
+            return f"Failed to write file: {e}"
+        invalidate_repo_snapshots()
+        return None
+
+    def _record(self, transaction: FileTransaction, result: BatchAutofixResult) -> None:
+        for issue in transaction.applied:
+            result.results[issue.id] = FixResult(
+                success=True,
+                confidence=0.8,
+                fixes_applied=[transaction.descriptions[issue.id]],
+                files_modified=[str(transaction.file_path)],
+            )
+        for issue_id, reason in transaction.failed.items():
+            result.results[issue_id] = FixResult(
+                success=False, remaining_issues=[reason]
+            )
@@ -163,6 +163,7 @@ from pathlib import Path
 from crackerjack.models.fix_plan import ChangeSpec, FixPlan
 from crackerjack.models.issues import FixResult, Issue, IssueType, Priority
 from crackerjack.services.regex_patterns import apply_formatting_fixes
+from crackerjack.services.tool_resolver import resolve_command
 
 
 def _read_file(file_path: str | Path) -> str | None:
@@ -186,9 +187,11 @@ async def _run_command(
     timeout: int = 300,
 ) -> tuple[int, str, str]:
     try:
+        cmd, env = resolve_command(cmd, cwd)
         process = await asyncio.create_subprocess_exec(
             *cmd,
             cwd=cwd,
+            env=env,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
@@ -556,9 +559,13 @@ def _run_post_write_ruff_format(file_path: Path, project_path: Path) -> None:
     with suppress(Exception):
         import subprocess
 
+        cmd, env = resolve_command(
+            ["uv", "run", "ruff", "format", str(file_path)], project_path
+        )
         subprocess.run(
-            ["uv", "run", "ruff", "format", file_path],
+            cmd,
             cwd=project_path,
+            env=env,
             capture_output=True,
             text=True,
             timeout=30,
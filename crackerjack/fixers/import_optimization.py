@@ -143,6 +143,12 @@ requirements"):
    ``TestUnusedImportDetection.test_extract_unused_imports_from_result`` and
    ``TestUnusedImportDetection.test_run_vulture_analysis_real_subprocess``
    for tests that pin this exact behavior against real subprocess output.
+
+   Callers that pass an ``UnusedSymbolIndex`` (``analyze_files``,
+   ``get_diagnostics``, or ``fix_import_issue(..., unused_index=...)``) skip
+   that subprocess path entirely: unused imports then come from one
+   in-process vulture pass over the whole batch of files (see
+   ``crackerjack/fixers/unused_symbols.py``), as clean names.
 """
 
 from __future__ import annotations
@@ -155,8 +161,10 @@ import typing as t
 from collections import defaultdict
 from pathlib import Path
 
+from crackerjack.fixers.unused_symbols import UnusedSymbolIndex
 from crackerjack.models.issues import FixResult, Issue
 from crackerjack.services.regex_patterns import SAFE_PATTERNS
+from crackerjack.services.tool_resolver import resolve_command
 
 
 class ImportAnalysis(t.NamedTuple):
@@ -216,11 +224,26 @@ def _write_file(file_path: str | Path, content: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
-async def analyze_file(file_path: Path, project_root: Path) -> ImportAnalysis:
+async def analyze_file(
+    file_path: Path,
+    project_root: Path,
+    unused_index: UnusedSymbolIndex | None = None,
+) -> ImportAnalysis:
     if not _is_valid_python_file(file_path):
         return _create_empty_import_analysis(file_path)
 
-    return await _parse_and_analyze_file(file_path, project_root)
+    return await _parse_and_analyze_file(file_path, project_root, unused_index)
+
+
+async def analyze_files(
+    file_paths: list[Path], project_root: Path
+) -> dict[Path, ImportAnalysis]:
+    python_files = [f for f in file_paths if _is_valid_python_file(f)]
+    unused_index = UnusedSymbolIndex.build(python_files)
+    return {
+        file_path: await analyze_file(file_path, project_root, unused_index)
+        for file_path in file_paths
+    }
 
 
 def _is_valid_python_file(file_path: Path) -> bool:
@@ -232,7 +255,9 @@ def _create_empty_import_analysis(file_path: Path) -> ImportAnalysis:
 
 
 async def _parse_and_analyze_file(
-    file_path: Path, project_root: Path
+    file_path: Path,
+    project_root: Path,
+    unused_index: UnusedSymbolIndex | None = None,
 ) -> ImportAnalysis:
     try:
         with file_path.open(encoding="utf-8") as f:
@@ -241,7 +266,10 @@ async def _parse_and_analyze_file(
     except (SyntaxError, OSError):
         return _handle_parse_error(file_path)
 
-    unused_imports = await _detect_unused_imports(file_path, project_root)
+    if unused_index is not None and unused_index.covers(file_path):
+        unused_imports = unused_index.unused_imports(file_path)
+    else:
+        unused_imports = await _detect_unused_imports(file_path, project_root)
 
     return _analyze_imports(file_path, tree, content, unused_imports)
 
@@ -270,9 +298,14 @@ async def _detect_unused_imports(file_path: Path, project_root: Path) -> list[st
 def _run_vulture_analysis(
     file_path: Path, project_root: Path
 ) -> subprocess.CompletedProcess[str]:
+    cmd, env = resolve_command(
+        ["uv", "run", "vulture", "--min-confidence", "80", str(file_path)],
+        project_root,
+    )
     return subprocess.run(
-        ["uv", "run", "vulture", "--min-confidence", "80", file_path],
+        cmd,
         cwd=project_root,
+        env=env,
         check=False,
         capture_output=True,
         text=True,
@@ -709,7 +742,11 @@ def _is_local_import(module: str, base_module: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
-async def fix_import_issue(issue: Issue, project_root: Path) -> FixResult:
+async def fix_import_issue(
+    issue: Issue,
+    project_root: Path,
+    unused_index: UnusedSymbolIndex | None = None,
+) -> FixResult:
     validation_result = _validate_issue(issue)
     if validation_result:
         return validation_result
@@ -742,7 +779,7 @@ async def fix_import_issue(issue: Issue, project_root: Path) -> FixResult:
     if direct_fix is not None:
         return direct_fix
 
-    return await _process_import_optimization_issue(issue, project_root)
+    return await _process_import_optimization_issue(issue, project_root, unused_index)
 
 
 def _apply_safe_init_import_fallback(issue: Issue, file_path: Path) -> FixResult | None:
@@ -1572,7 +1609,9 @@ def _find_future_import_insertion_index(lines: list[str]) -> int:
 
 
 async def _process_import_optimization_issue(
-    issue: Issue, project_root: Path
+    issue: Issue,
+    project_root: Path,
+    unused_index: UnusedSymbolIndex | None = None,
 ) -> FixResult:
     if not issue.file_path:
         return FixResult(
@@ -1583,7 +1622,7 @@ async def _process_import_optimization_issue(
         )
     file_path = Path(issue.file_path)
 
-    analysis = await analyze_file(file_path, project_root)
+    analysis = await analyze_file(file_path, project_root, unused_index)
 
     if not _are_optimizations_needed(analysis):
         return _create_no_optimization_needed_result()
@@ -2253,8 +2292,11 @@ async def _analyze_file_sample(
         "pep8_violations": 0,
     }
 
+    unused_index = UnusedSymbolIndex.build(python_files)
     for file_path in python_files:
-        file_metrics = await _analyze_single_file_metrics(file_path, project_root)
+        file_metrics = await _analyze_single_file_metrics(
+            file_path, project_root, unused_index
+        )
         if file_metrics:
             _update_metrics(metrics, file_metrics)
 
@@ -2264,9 +2306,10 @@ async def _analyze_file_sample(
 async def _analyze_single_file_metrics(
     file_path: Path,
     project_root: Path,
+    unused_index: UnusedSymbolIndex | None = None,
 ) -> dict[str, int] | None:
     try:
-        analysis = await analyze_file(file_path, project_root)
+        analysis = await analyze_file(file_path, project_root, unused_index)
         return _extract_file_metrics(analysis)
     except Exception:
         return None
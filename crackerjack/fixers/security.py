@@ -100,6 +100,7 @@ from crackerjack.models.fix_plan import ChangeSpec, FixPlan
 from crackerjack.models.issues import FixResult, Issue, IssueType
 from crackerjack.services.regex_patterns import SAFE_PATTERNS, apply_security_fixes
 from crackerjack.services.regex_utils import replace_unsafe_regex_with_safe_patterns
+from crackerjack.services.tool_resolver import resolve_command
 
 
 def _read_file(file_path: str | Path) -> str | None:
@@ -123,9 +124,11 @@ async def _run_command(
     timeout: int = 300,
 ) -> tuple[int, str, str]:
     try:
+        cmd, env = resolve_command(cmd, cwd)
         process = await asyncio.create_subprocess_exec(
             *cmd,
             cwd=cwd,
+            env=env,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
@@ -87,6 +87,7 @@ from pathlib import Path
 
 from crackerjack.models.issues import FixResult, Issue
 from crackerjack.services.regex_patterns import SAFE_PATTERNS, apply_test_fixes
+from crackerjack.services.tool_resolver import resolve_command
 
 # Friendly failure-type name -> canonical crackerjack.services.regex_patterns
 # SAFE_PATTERNS key. Order matters: it is match-priority order when a
@@ -125,9 +126,11 @@ async def _run_command(
     timeout: int = 300,
 ) -> tuple[int, str, str]:
     try:
+        cmd, env = resolve_command(cmd, cwd)
         process = await asyncio.create_subprocess_exec(
             *cmd,
             cwd=cwd,
+            env=env,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
@@ -0,0 +1,105 @@
+"""Project-wide unused-symbol index shared by the fixers of one autofix iteration.
+
+``import_optimization._detect_unused_imports`` shells out to
+``uv run vulture --min-confidence 80 <file>`` once per analysed file, paying
+uv resolution plus interpreter and vulture start-up every time. This module
+runs vulture in-process instead, once per iteration over the whole set of
+affected files: each file is read once and fed to a single shared
+``vulture.Vulture`` scavenger, and the findings are indexed by file and line
+so every fixer in the iteration can look them up without re-running the
+analysis.
+
+Like a multi-file ``vulture a.py b.py ...`` invocation, names are resolved
+across the whole analysed set -- a symbol used in any of the files counts as
+used.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import typing as t
+from collections import defaultdict
+from contextlib import redirect_stderr
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_CONFIDENCE = 80
+
+
+@dataclass(frozen=True)
+class UnusedSymbol:
+    file_path: Path
+    line: int
+    kind: str
+    name: str
+    confidence: int
+
+
+class UnusedSymbolIndex:
+    def __init__(self, symbols: t.Iterable[UnusedSymbol] = ()) -> None:
+        self._by_file: dict[Path, dict[int, list[UnusedSymbol]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        self._analyzed: set[Path] = set()
+        for symbol in symbols:
+            self._add(symbol)
+
+    @classmethod
+    def build(
+        cls,
+        files: t.Iterable[Path],
+        min_confidence: int = DEFAULT_MIN_CONFIDENCE,
+    ) -> UnusedSymbolIndex:
+        import vulture
+
+        index = cls()
+        scavenger = vulture.Vulture(verbose=False)
+        for file_path in dict.fromkeys(Path(f).resolve() for f in files):
+            if file_path.suffix != ".py":
+                continue
+            try:
+                content = file_path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                logger.debug(f"Skipping {file_path} for unused-symbol scan: {e}")
+                continue
+            with redirect_stderr(io.StringIO()):
+                scavenger.scan(content, filename=file_path)
+            index._analyzed.add(file_path)
+
+        for item in scavenger.get_unused_code(min_confidence=min_confidence):
+            index._add(
+                UnusedSymbol(
+                    file_path=Path(item.filename).resolve(),
+                    line=item.first_lineno,
+                    kind=item.typ,
+                    name=item.name,
+                    confidence=item.confidence,
+                )
+            )
+        return index
+
+    def _add(self, symbol: UnusedSymbol) -> None:
+        self._analyzed.add(symbol.file_path)
+        self._by_file[symbol.file_path][symbol.line].append(symbol)
+
+    def covers(self, file_path: Path) -> bool:
+        return Path(file_path).resolve() in self._analyzed
+
+    def for_file(self, file_path: Path, kind: str | None = None) -> list[UnusedSymbol]:
+        lines = self._by_file.get(Path(file_path).resolve(), {})
+        return [
+            symbol
+            for line in sorted(lines)
+            for symbol in lines[line]
+            if kind is None or symbol.kind == kind
+        ]
+
+    def at(self, file_path: Path, line: int) -> list[UnusedSymbol]:
+        lines = self._by_file.get(Path(file_path).resolve(), {})
+        return list(lines.get(line, []))
+
+    def unused_imports(self, file_path: Path) -> list[str]:
+        return [symbol.name for symbol in self.for_file(file_path, kind="import")]
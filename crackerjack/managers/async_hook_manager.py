@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import sqlite3
 import typing as t
 from pathlib import Path
 
@@ -10,6 +12,9 @@ from crackerjack.models.protocols import (
     HookConfigLoaderProtocol,
 )
 from crackerjack.models.task import HookResult
+from crackerjack.services.run_history import RunHistory
+
+logger = logging.getLogger(__name__)
 
 
 class AsyncHookManager:
@@ -22,6 +27,7 @@ class AsyncHookManager:
         max_concurrent: int = 3,
         verbose: bool = False,
         test_dir: str = "tests",
+        fail_fast: bool = False,
     ) -> None:
         self.console = console
         self.pkg_path = pkg_path
@@ -38,6 +44,8 @@ class AsyncHookManager:
                 quiet=not verbose,
                 verbose=verbose,
                 test_dir=test_dir,
+                fail_fast=fail_fast,
+                run_history=self._open_run_history() if fail_fast else None,
             )
 
         if config_loader is None:
@@ -49,6 +57,16 @@ class AsyncHookManager:
         self.config_loader = config_loader
         self._config_path: Path | None = None
 
+    def _open_run_history(self) -> RunHistory | None:
+        # Fail-fast orders hooks by the history the sync hook manager records.
+        try:
+            return RunHistory(
+                self.pkg_path / ".crackerjack" / "cache" / "run_history.db"
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Run history unavailable for hook ordering: {e}")
+            return None
+
     def set_config_path(self, config_path: Path) -> None:
         self._config_path = config_path
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import logging
+import sqlite3
 import typing as t
 from contextlib import suppress
 from pathlib import Path
@@ -13,6 +15,9 @@ from crackerjack.models.protocols import (
     HookExecutorProtocol,
 )
 from crackerjack.models.task import HookResult
+from crackerjack.services.adaptive_timeouts import AdaptiveTimeouts
+from crackerjack.services.run_history import RunHistory, RunRecorder
+from crackerjack.services.tool_resolver import get_tool_resolver
 
 try:
     from crackerjack.orchestration.config import OrchestrationConfig  # type: ignore
@@ -32,6 +37,8 @@ else:
     HookOrchestratorSettings = None
     orchestration_available = False
 
+logger = logging.getLogger(__name__)
+
 
 class HookManagerImpl:
     executor: HookExecutorProtocol
@@ -254,9 +261,20 @@ class HookManagerImpl:
         file_filter: t.Any | None = None,
         enable_hooks: list[str] | None = None,
         adapter_learner_integration: t.Any | None = None,
+        record_run_history: bool = True,
+        adaptive_timeouts: bool = True,
+        fail_fast: bool = False,
+        prewarm_tools: bool = True,
     ) -> None:
         self.pkg_path = pkg_path
         self.debug = debug
+        self.run_history: RunHistory | None = None
+        self.timeout_model: AdaptiveTimeouts | None = None
+        self._run_recorder: RunRecorder | None = None
+        self._record_run_history = record_run_history
+        self._adaptive_timeouts = adaptive_timeouts
+        self.fail_fast = fail_fast
+        self._prewarm_tools = prewarm_tools
         self._settings = settings
         self._adapter_learner_integration = adapter_learner_integration
 
@@ -423,8 +441,7 @@ class HookManagerImpl:
                 completed_cb=getattr(self, "_progress_callback", None),
                 total=len(strategy.hooks),
             )
-        execution_result = self.executor.execute_strategy(strategy)
-        return execution_result.results
+        return self._execute_strategy(strategy)
 
     def run_comprehensive_hooks(self) -> list[HookResult]:
         if self.orchestration_enabled:
@@ -456,9 +473,44 @@ class HookManagerImpl:
                 completed_cb=getattr(self, "_progress_callback", None),
                 total=len(strategy.hooks),
             )
+        return self._execute_strategy(strategy)
+
+    def _execute_strategy(self, strategy: t.Any) -> list[HookResult]:
+        with suppress(AttributeError):
+            self.executor.fail_fast = self.fail_fast  # type: ignore[attr-defined]
+        if self._prewarm_tools:
+            # Syncs once per lockfile change (a fast-stage uv-lock included)
+            # so hooks can exec their tools directly instead of via uv run.
+            get_tool_resolver(self.pkg_path).prepare()
+        recorder = self._get_run_recorder()
+        if recorder is not None:
+            with suppress(AttributeError):
+                self.executor.run_recorder = recorder  # type: ignore[attr-defined]
+                self.executor.timeout_model = self.timeout_model  # type: ignore[attr-defined]
+
         execution_result = self.executor.execute_strategy(strategy)
+
+        if recorder is not None:
+            try:
+                recorder.record_execution(execution_result, strategy)
+            except Exception as e:
+                logger.warning(f"Failed to record run history: {e}")
         return execution_result.results
 
+    def _get_run_recorder(self) -> RunRecorder | None:
+        if self._run_recorder is None and self._record_run_history:
+            try:
+                self.run_history = RunHistory(
+                    self.pkg_path / ".crackerjack" / "cache" / "run_history.db"
+                )
+                self._run_recorder = self.run_history.start_run()
+                if self._adaptive_timeouts:
+                    self.timeout_model = AdaptiveTimeouts(self.run_history)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Run history disabled: {e}")
+                self._record_run_history = False
+        return self._run_recorder
+
     async def _run_hooks_parallel(self) -> list[HookResult]:
         import asyncio
 
@@ -8,6 +8,7 @@ from rich.console import Console
 
 from crackerjack.config.settings import CrackerjackSettings
 from crackerjack.models.protocols import OptionsProtocol
+from crackerjack.services.repo_snapshot import get_repo_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -63,18 +64,12 @@ class TestCommandBuilder:
         try:
             import subprocess
 
-            result = subprocess.run(
-                ["git", "diff", "--name-only", "HEAD~10"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            changed_files = get_repo_snapshot(Path.cwd()).changed_since("HEAD~10")
 
-            if result.returncode != 0:
+            if changed_files is None:
                 logger.debug("Not in git repo or no git changes, skipping incremental")
                 return None
 
-            changed_files = result.stdout.strip().split("\n")
             logger.debug(f"Found {len(changed_files)} changed files")
 
             changed_py_files = [
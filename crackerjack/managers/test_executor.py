@@ -14,6 +14,7 @@ from rich.console import Console as RichConsole
 from rich.live import Live
 
 from crackerjack.models.protocols import ConsoleInterface
+from crackerjack.services.tool_resolver import resolve_command
 
 from .test_progress import TestProgress
 
@@ -121,16 +122,18 @@ class TestExecutor:
             transient=True,
         ) as live:
             env = self._setup_test_environment()
+            cwd = self._detect_target_project_dir(cmd)
+            run_cmd, tool_env = resolve_command(cmd, cwd, env)
 
             process = subprocess.Popen(
-                cmd,
-                cwd=self._detect_target_project_dir(cmd),
+                run_cmd,
+                cwd=cwd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
                 bufsize=1,
                 universal_newlines=True,
-                env=env,
+                env=tool_env or env,
             )
 
             stdout_thread, stderr_thread, monitor_thread = self._start_reader_threads(
@@ -548,13 +551,15 @@ class TestExecutor:
         progress_callback: t.Callable[[dict[str, t.Any]], None],
         timeout: int = 1800,
     ) -> subprocess.CompletedProcess[str]:
+        cwd = self._detect_target_project_dir(cmd)
+        run_cmd, tool_env = resolve_command(cmd, cwd, env)
         process = subprocess.Popen(
-            cmd,
-            cwd=self._detect_target_project_dir(cmd),
+            run_cmd,
+            cwd=cwd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
-            env=env,
+            env=tool_env or env,
         )
 
         stdout_lines = self._read_stdout_with_progress(
@@ -1,18 +1,43 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
+import logging
+import sqlite3
 import time
 import typing as t
+import weakref
+from collections import defaultdict, deque
 from contextlib import suppress
 from dataclasses import asdict, dataclass
+from functools import partial
 from pathlib import Path
 from typing import Final
 from uuid import UUID, uuid4
 
+from crackerjack.services.sqlite_batch_writer import SQLiteBatchWriter
+
 MODULE_ID: Final[UUID] = uuid4()
 MODULE_STATUS: Final[str] = "stable"
 
+logger = logging.getLogger(__name__)
+
+
+def _prune_fix_results(conn: sqlite3.Connection, keep: int) -> None:
+    conn.execute(
+        """
+        DELETE FROM fix_results
+        WHERE id <= (SELECT MAX(id) FROM fix_results) - ?
+        """,
+        (keep,),
+    )
+
+
+def _close_cache(writer: SQLiteBatchWriter, conn: sqlite3.Connection) -> None:
+    writer.close()
+    conn.close()
+
 
 @dataclass
 class ErrorPattern:
@@ -50,24 +75,87 @@ class FixResult:
 
 
 class ErrorCache:
-    def __init__(self, cache_dir: Path | None = None) -> None:
+    _PATTERN_UPSERT = """
+        INSERT INTO error_patterns
+        (pattern_id, error_type, error_code, message_pattern, file_pattern,
+         common_fixes, auto_fixable, frequency, last_seen)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(pattern_id) DO UPDATE SET
+            common_fixes = excluded.common_fixes,
+            auto_fixable = excluded.auto_fixable,
+            frequency = excluded.frequency,
+            last_seen = excluded.last_seen
+    """
+
+    _FIX_INSERT = """
+        INSERT INTO fix_results
+        (fix_id, pattern_id, success, files_affected, time_taken,
+         error_message, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    _FIX_STATS_UPSERT = """
+        INSERT INTO fix_stats (pattern_id, attempts, successes)
+        VALUES (?, 1, ?)
+        ON CONFLICT(pattern_id) DO UPDATE SET
+            attempts = attempts + 1,
+            successes = successes + excluded.successes
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_fix_results: int = 10_000,
+        max_patterns: int = 5_000,
+        batch_size: int = 256,
+        flush_interval_ms: float = 50.0,
+    ) -> None:
         self._lock = asyncio.Lock()
         self.cache_dir = cache_dir or Path.home() / ".cache" / "crackerjack-mcp"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / "error_cache.db"
         self.patterns_file = self.cache_dir / "error_patterns.json"
         self.fixes_file = self.cache_dir / "fix_results.json"
+        self.max_fix_results = max(1, max_fix_results)
+        self.max_patterns = max(1, max_patterns)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval_ms) / 1000.0
+
         self.patterns: dict[str, ErrorPattern] = {}
-        self.fix_results: list[FixResult] = []
+        self.fix_results: deque[FixResult] = deque(maxlen=self.max_fix_results)
+        self._by_type: dict[str, set[str]] = defaultdict(set)
+        self._by_code: dict[str, set[str]] = defaultdict(set)
+        self._fix_stats: dict[str, list[int]] = {}
+        self._total_fixes = 0
+        self._successful_fixes = 0
+
+        self._conn = self._connect()
+        self._init_database()
         self._load_cache()
 
+        self._writer = SQLiteBatchWriter(
+            self._conn,
+            name="error-cache",
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+            after_batch=partial(_prune_fix_results, keep=self.max_fix_results),
+        )
+        # Caches built by decorators are never closed explicitly; drain the
+        # daemon writer when the cache is collected or the interpreter exits.
+        # Nothing the writer holds may refer back to the cache for that.
+        self._finalizer = weakref.finalize(self, _close_cache, self._writer, self._conn)
+
     async def add_pattern(self, pattern: ErrorPattern) -> None:
         async with self._lock:
             existing = self.patterns.get(pattern.pattern_id)
             if existing:
                 self._update_existing_pattern(existing, pattern)
             else:
-                self.patterns[pattern.pattern_id] = pattern
-            self._save_patterns()
+                self._index_pattern(pattern)
+                existing = pattern
+            self._enqueue_pattern(existing)
+            if len(self.patterns) > self.max_patterns * 1.1:
+                self._evict_patterns(len(self.patterns) - self.max_patterns)
 
     def _update_existing_pattern(
         self,
@@ -86,27 +174,39 @@ class ErrorCache:
                     existing.common_fixes = []
                 existing.common_fixes.append(fix)
 
+    def _index_pattern(self, pattern: ErrorPattern) -> None:
+        self.patterns[pattern.pattern_id] = pattern
+        self._by_type[pattern.error_type].add(pattern.pattern_id)
+        self._by_code[pattern.error_code].add(pattern.pattern_id)
+
+    def _unindex_pattern(self, pattern_id: str) -> None:
+        pattern = self.patterns.pop(pattern_id)
+        self._by_type[pattern.error_type].discard(pattern_id)
+        self._by_code[pattern.error_code].discard(pattern_id)
+
+    def _evict_patterns(self, count: int) -> None:
+        oldest = heapq.nsmallest(
+            count, self.patterns.values(), key=lambda p: p.last_seen or 0
+        )
+        pattern_ids = [pattern.pattern_id for pattern in oldest]
+        for pattern_id in pattern_ids:
+            self._unindex_pattern(pattern_id)
+        self._enqueue(
+            "DELETE FROM error_patterns WHERE pattern_id = ?",
+            *((pattern_id,) for pattern_id in pattern_ids),
+        )
+
     def get_pattern(self, pattern_id: str) -> ErrorPattern | None:
         return self.patterns.get(pattern_id)
 
     def find_patterns_by_type(self, error_type: str) -> list[ErrorPattern]:
-        return [
-            pattern
-            for pattern in self.patterns.values()
-            if pattern.error_type == error_type
-        ]
+        return [self.patterns[pid] for pid in self._by_type.get(error_type, ())]
 
     def find_patterns_by_code(self, error_code: str) -> list[ErrorPattern]:
-        return [
-            pattern
-            for pattern in self.patterns.values()
-            if pattern.error_code == error_code
-        ]
+        return [self.patterns[pid] for pid in self._by_code.get(error_code, ())]
 
     def get_common_patterns(self, limit: int = 20) -> list[ErrorPattern]:
-        patterns = list[t.Any](self.patterns.values())
-        patterns.sort(key=lambda p: p.frequency, reverse=True)
-        return patterns[:limit]
+        return heapq.nlargest(limit, self.patterns.values(), key=lambda p: p.frequency)
 
     def get_auto_fixable_patterns(self) -> list[ErrorPattern]:
         return [pattern for pattern in self.patterns.values() if pattern.auto_fixable]
@@ -114,6 +214,12 @@ class ErrorCache:
     async def add_fix_result(self, result: FixResult) -> None:
         async with self._lock:
             self.fix_results.append(result)
+            self._record_fix_stats(result.pattern_id, result.success)
+            self._enqueue(self._FIX_INSERT, self._fix_row(result))
+            self._enqueue(
+                self._FIX_STATS_UPSERT, (result.pattern_id, int(result.success))
+            )
+
             pattern = self.patterns.get(result.pattern_id)
             if pattern and result.success:
                 pattern.auto_fixable = True
@@ -122,17 +228,20 @@ class ErrorCache:
                     pattern.common_fixes = []
                 if fix_command not in pattern.common_fixes:
                     pattern.common_fixes.append(fix_command)
-            self._save_fixes()
-        self._save_patterns()
+                self._enqueue_pattern(pattern)
+
+    def _record_fix_stats(self, pattern_id: str, success: bool) -> None:
+        stats = self._fix_stats.setdefault(pattern_id, [0, 0])
+        stats[0] += 1
+        stats[1] += int(success)
+        self._total_fixes += 1
+        self._successful_fixes += int(success)
 
     def get_fix_success_rate(self, pattern_id: str) -> float:
-        pattern_fixes = [
-            result for result in self.fix_results if result.pattern_id == pattern_id
-        ]
-        if not pattern_fixes:
+        stats = self._fix_stats.get(pattern_id)
+        if not stats or not stats[0]:
             return 0.0
-        successful = sum(1 for result in pattern_fixes if result.success)
-        return successful / len(pattern_fixes)
+        return stats[1] / stats[0]
 
     def get_recent_patterns(self, hours: int = 24) -> list[ErrorPattern]:
         cutoff_time = time.time() - (hours * 3600)
@@ -255,13 +364,15 @@ class ErrorCache:
     def get_cache_stats(self) -> dict[str, t.Any]:
         total_patterns = len(self.patterns)
         auto_fixable = len(self.get_auto_fixable_patterns())
-        total_fixes = len(self.fix_results)
-        successful_fixes = sum(1 for result in self.fix_results if result.success)
+        total_fixes = self._total_fixes
+        successful_fixes = self._successful_fixes
         frequencies = [pattern.frequency for pattern in self.patterns.values()]
         avg_frequency = sum(frequencies) / len(frequencies) if frequencies else 0
-        type_counts: dict[str, int] = {}
-        for pattern in self.patterns.values():
-            type_counts[pattern.error_type] = type_counts.get(pattern.error_type, 0) + 1
+        type_counts = {
+            error_type: len(pattern_ids)
+            for error_type, pattern_ids in self._by_type.items()
+            if pattern_ids
+        }
 
         return {
             "total_patterns": total_patterns,
@@ -286,9 +397,11 @@ class ErrorCache:
             if (pattern.last_seen or 0) < cutoff_time
         ]
         for pattern_id in old_patterns:
-            del self.patterns[pattern_id]
+            self._unindex_pattern(pattern_id)
         if old_patterns:
-            self._save_patterns()
+            self._enqueue(
+                "DELETE FROM error_patterns WHERE last_seen < ?", (cutoff_time,)
+            )
 
         return len(old_patterns)
 
@@ -303,37 +416,156 @@ class ErrorCache:
         with file_path.open("w") as f:
             json.dump(export_data, f, indent=2)
 
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_database(self) -> None:
+        with self._conn as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS error_patterns (
+                    pattern_id TEXT PRIMARY KEY,
+                    error_type TEXT NOT NULL,
+                    error_code TEXT NOT NULL,
+                    message_pattern TEXT NOT NULL,
+                    file_pattern TEXT,
+                    common_fixes TEXT NOT NULL,
+                    auto_fixable INTEGER NOT NULL,
+                    frequency INTEGER NOT NULL,
+                    last_seen REAL
+                );
+
+                CREATE TABLE IF NOT EXISTS fix_results (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    fix_id TEXT NOT NULL,
+                    pattern_id TEXT NOT NULL,
+                    success INTEGER NOT NULL,
+                    files_affected TEXT NOT NULL,
+                    time_taken REAL NOT NULL,
+                    error_message TEXT,
+                    created_at REAL NOT NULL
+                );
+
+                -- Running totals survive fix_results retention trimming
+                CREATE TABLE IF NOT EXISTS fix_stats (
+                    pattern_id TEXT PRIMARY KEY,
+                    attempts INTEGER NOT NULL,
+                    successes INTEGER NOT NULL
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_error_patterns_error_type ON error_patterns(error_type);
+                CREATE INDEX IF NOT EXISTS idx_error_patterns_error_code ON error_patterns(error_code);
+                CREATE INDEX IF NOT EXISTS idx_error_patterns_last_seen ON error_patterns(last_seen);
+                CREATE INDEX IF NOT EXISTS idx_fix_results_pattern_id ON fix_results(pattern_id);
+            """)
+
     def _load_cache(self) -> None:
-        if self.patterns_file.exists():
-            try:
-                with self.patterns_file.open("r") as f:
-                    patterns_data = json.load(f)
-                self.patterns = {
-                    pid: ErrorPattern(**data) for pid, data in patterns_data.items()
-                }
-            except Exception:
-                self.patterns = {}
-        if self.fixes_file.exists():
-            try:
-                with self.fixes_file.open("r") as f:
-                    fixes_data = json.load(f)
-                self.fix_results = [FixResult(**data) for data in fixes_data]
-            except Exception:
-                self.fix_results = []
-
-    def _save_patterns(self) -> None:
-        with suppress(OSError, json.JSONDecodeError):
-            patterns_data = {
-                pid: pattern.to_dict() for pid, pattern in self.patterns.items()
-            }
-            with self.patterns_file.open("w") as f:
-                json.dump(patterns_data, f, indent=2)
-
-    def _save_fixes(self) -> None:
-        with suppress(OSError, json.JSONDecodeError):
-            fixes_data = [result.to_dict() for result in self.fix_results]
-            with self.fixes_file.open("w") as f:
-                json.dump(fixes_data, f, indent=2)
+        self._migrate_json_cache()
+
+        for row in self._conn.execute("SELECT * FROM error_patterns"):
+            data = dict(row)
+            data["common_fixes"] = json.loads(data["common_fixes"])
+            data["auto_fixable"] = bool(data["auto_fixable"])
+            self._index_pattern(ErrorPattern(**data))
+
+        for row in self._conn.execute("SELECT * FROM fix_stats"):
+            self._fix_stats[row["pattern_id"]] = [row["attempts"], row["successes"]]
+            self._total_fixes += row["attempts"]
+            self._successful_fixes += row["successes"]
+
+        recent = self._conn.execute(
+            "SELECT * FROM fix_results ORDER BY id DESC LIMIT ?",
+            (self.max_fix_results,),
+        ).fetchall()
+        for row in reversed(recent):
+            self.fix_results.append(
+                FixResult(
+                    fix_id=row["fix_id"],
+                    pattern_id=row["pattern_id"],
+                    success=bool(row["success"]),
+                    files_affected=json.loads(row["files_affected"]),
+                    time_taken=row["time_taken"],
+                    error_message=row["error_message"],
+                )
+            )
+
+    def _migrate_json_cache(self) -> None:
+        if not (self.patterns_file.exists() or self.fixes_file.exists()):
+            return
+        try:
+            patterns_data: dict[str, dict[str, t.Any]] = (
+                json.loads(self.patterns_file.read_text())
+                if self.patterns_file.exists()
+                else {}
+            )
+            fixes_data: list[dict[str, t.Any]] = (
+                json.loads(self.fixes_file.read_text())
+                if self.fixes_file.exists()
+                else []
+            )
+            with self._conn as conn:
+                conn.executemany(
+                    self._PATTERN_UPSERT,
+                    [
+                        self._pattern_row(ErrorPattern(**data))
+                        for data in patterns_data.values()
+                    ],
+                )
+                for data in fixes_data:
+                    result = FixResult(**data)
+                    conn.execute(self._FIX_INSERT, self._fix_row(result))
+                    conn.execute(
+                        self._FIX_STATS_UPSERT,
+                        (result.pattern_id, int(result.success)),
+                    )
+        except (OSError, ValueError, TypeError, sqlite3.Error):
+            return
+
+        for legacy in (self.patterns_file, self.fixes_file):
+            with suppress(OSError):
+                legacy.rename(legacy.with_suffix(".json.migrated"))
+
+    @staticmethod
+    def _pattern_row(pattern: ErrorPattern) -> tuple[t.Any, ...]:
+        return (
+            pattern.pattern_id,
+            pattern.error_type,
+            pattern.error_code,
+            pattern.message_pattern,
+            pattern.file_pattern,
+            json.dumps(pattern.common_fixes or []),
+            int(pattern.auto_fixable),
+            pattern.frequency,
+            pattern.last_seen,
+        )
+
+    @staticmethod
+    def _fix_row(result: FixResult) -> tuple[t.Any, ...]:
+        return (
+            result.fix_id,
+            result.pattern_id,
+            int(result.success),
+            json.dumps(result.files_affected),
+            result.time_taken,
+            result.error_message,
+            time.time(),
+        )
+
+    def _enqueue_pattern(self, pattern: ErrorPattern) -> None:
+        self._enqueue(self._PATTERN_UPSERT, self._pattern_row(pattern))
+
+    def _enqueue(self, sql: str, *params: tuple[t.Any, ...]) -> None:
+        for item in params:
+            self._writer.put(sql, item)
+
+    def flush(self) -> None:
+        self._writer.flush()
+
+    def close(self) -> None:
+        self._finalizer()
 
     @property
     def module_id(self) -> UUID:
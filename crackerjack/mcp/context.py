@@ -306,6 +306,9 @@ class MCPServerContext:
 
         await self.batched_saver.stop()
 
+        if self.error_cache:
+            self.error_cache.close()
+
         try:
             await self.resource_manager.cleanup_all()
         except Exception as e:
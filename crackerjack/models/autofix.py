@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .issues import Issue
+
+
+@dataclass
+class StepResult:
+    success: bool
+    fixes_applied: int = 0
+    files_modified: list[Path] = field(default_factory=list)
+    failure_reason: str = ""
+
+
+@dataclass
+class RouterOutcome:
+    remaining_issues: list[Issue] = field(default_factory=list)
+    fixes_applied: int = 0
+    fully_resolved: bool = False
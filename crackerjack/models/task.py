@@ -55,6 +55,8 @@ class HookResult:
     error: str | None = None
     qa_result: t.Any | None = None
     advisory_issues: list[str] = field(default_factory=list)
+    resource_usage: dict[str, float] = field(default_factory=dict)
+    cache_hit: bool | None = None
 
     def __post_init__(self) -> None:
         if self.hook_name and not self.name:
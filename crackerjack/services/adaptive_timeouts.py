@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import logging
+import threading
+import typing as t
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+
+from crackerjack.services.run_history import BATCH
+
+if t.TYPE_CHECKING:
+    from crackerjack.services.run_history import RunHistory
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TimeoutPolicy:
+    percentile: float = 99.0
+    margin: float = 1.5
+    floor: float = 10.0
+    # Adaptive timeouts may exceed a hook's configured timeout by this factor.
+    ceiling_factor: float = 2.0
+    min_samples: int = 5
+    # After a timeout the next limit is at least this multiple of the last one.
+    timeout_backoff: float = 1.5
+    window: int = 200
+
+
+@dataclass
+class _HookModel:
+    durations: npt.NDArray[np.float64]
+    files: npt.NDArray[np.int64]
+    timed_out_at: float | None = None
+    _fit: tuple[float, float, float] | None = field(default=None, repr=False)
+
+    def estimate(self, files: int, policy: TimeoutPolicy) -> float | None:
+        if files > 0:
+            fit = self._size_fit(policy)
+            if fit is not None:
+                intercept, slope, ratio = fit
+                return (intercept + slope * files) * ratio
+        # A whole-project run bounds any subset of it.
+        whole = self.durations[self.files == 0]
+        if len(whole) < policy.min_samples:
+            return None
+        return float(np.percentile(whole, policy.percentile))
+
+    def _size_fit(self, policy: TimeoutPolicy) -> tuple[float, float, float] | None:
+        if self._fit is not None:
+            return self._fit
+        mask = self.files > 0
+        if mask.sum() < policy.min_samples:
+            return None
+
+        x = self.files[mask].astype(np.float64)
+        y = self.durations[mask]
+        slope, intercept = (
+            np.polyfit(x, y, 1).tolist() if np.ptp(x) > 0 else (0.0, float(y.mean()))
+        )
+        if intercept < 0:
+            intercept, slope = 0.0, float((x @ y) / (x @ x))
+        if slope < 0:
+            intercept, slope = float(y.mean()), 0.0
+
+        # Spread is taken relative to the fitted cost so that it scales with
+        # the size of the change set.
+        fitted = np.maximum(intercept + slope * x, 1e-3)
+        ratio = float(np.percentile(y / fitted, policy.percentile))
+        self._fit = (intercept, slope, ratio)
+        return self._fit
+
+    def add(self, duration: float, files: int) -> None:
+        self.durations = np.append(self.durations, duration)
+        self.files = np.append(self.files, files)
+        self._fit = None
+
+
+class AdaptiveTimeouts:
+    def __init__(
+        self, history: RunHistory, policy: TimeoutPolicy | None = None
+    ) -> None:
+        self.history = history
+        self.policy = policy or TimeoutPolicy()
+        self._models: dict[str, _HookModel] = {}
+        self._lock = threading.Lock()
+
+    def timeout(self, name: str, default: float, files: int = 0) -> float:
+        policy = self.policy
+        with self._lock:
+            model = self._model(name)
+            estimate = model.estimate(files, policy)
+            timed_out_at = model.timed_out_at
+
+        if estimate is None and timed_out_at is None:
+            return default
+
+        value = default if estimate is None else estimate * policy.margin
+        if timed_out_at is not None:
+            value = max(value, timed_out_at * policy.timeout_backoff)
+        ceiling = max(default * policy.ceiling_factor, policy.floor)
+        return float(min(max(value, policy.floor), ceiling))
+
+    def observe_timeout(self, name: str, timeout: float, files: int = 0) -> None:
+        with self._lock:
+            model = self._model(name)
+            # The tool ran for at least this long; keeping it as a sample
+            # pushes the percentile up as well as triggering the backoff.
+            model.add(timeout, files)
+            model.timed_out_at = max(model.timed_out_at or 0.0, timeout)
+        logger.debug(f"{name}: timed out after {timeout:.1f}s with {files} files")
+
+    def _model(self, name: str) -> _HookModel:
+        model = self._models.get(name)
+        if model is None:
+            rows = self.history.recent(name, BATCH, last=self.policy.window)
+            model = _HookModel(
+                durations=np.array([row[0] for row in rows], dtype=np.float64),
+                files=np.array([row[1] for row in rows], dtype=np.int64),
+                # Only a timeout on the latest invocation counts; a later
+                # success means the limit was right again.
+                timed_out_at=rows[-1][0] if rows and rows[-1][2] == "timeout" else None,
+            )
+            self._models[name] = model
+        return model
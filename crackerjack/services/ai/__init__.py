@@ -3,3 +3,4 @@ from .contextual_ai_assistant import *
 from .embeddings import *
 from .intelligent_commit import *
 from .predictive_analytics import *
+from .timeseries_store import *
@@ -14,6 +14,8 @@ from pathlib import Path
 
 import psutil
 
+from .timeseries_store import DATA_TYPES, TimeSeriesStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -184,6 +186,13 @@ class DataCompactionManager:
         self.storage_dir = Path(storage_dir)
         self.max_storage_bytes = max_storage_gb * 1024**3
         self.compaction_rules = self._load_compaction_rules()
+        self.timeseries = TimeSeriesStore(
+            self.storage_dir,
+            retention_days={
+                resolution: self.compaction_rules[data_type]["retention_days"]
+                for resolution, data_type in DATA_TYPES.items()
+            },
+        )
 
     def _load_compaction_rules(self) -> dict[str, dict[str, t.Any]]:
         rules = {}
@@ -245,12 +254,24 @@ class DataCompactionManager:
             return {"status": "error", "message": f"Unknown data type: {data_type}"}
 
         rules = self.compaction_rules[data_type]
-        cutoff_date = self._calculate_cutoff_date(rules)
-
-        compaction_stats = self._process_data_directory(data_type, cutoff_date)
+        resolution = next(
+            (res for res, name in DATA_TYPES.items() if name == data_type), None
+        )
+        if resolution is not None:
+            compaction_stats = self._compact_timeseries(resolution)
+        else:
+            cutoff_date = self._calculate_cutoff_date(rules)
+            compaction_stats = self._process_data_directory(data_type, cutoff_date)
 
         return self._build_compaction_result(data_type, rules, compaction_stats)
 
+    def _compact_timeseries(self, resolution: str) -> dict[str, int | float]:
+        stats = self.timeseries.compact(resolution)
+        return {
+            "compacted_records": stats["rolled_up"] + stats["removed"],
+            "freed_space_mb": stats["freed_bytes"] / (1024**2),
+        }
+
     @staticmethod
     def _calculate_cutoff_date(rules: dict[str, t.Any]) -> datetime:
         return datetime.now() - timedelta(days=rules["retention_days"])
@@ -4,15 +4,41 @@ import logging
 import statistics
 import typing as t
 from collections import defaultdict, deque
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+import numpy.typing as npt
+
+from .timeseries_store import RAW, TimeSeriesStore, rollup_mean
+
 logger = logging.getLogger(__name__)
 
+Series = Sequence[float] | npt.NDArray[np.float64]
+
 
 class PredictorProtocol(t.Protocol):
-    def predict(self, values: list[float], periods: int = 1) -> list[float]: ...
+    def predict(self, values: Series, periods: int = 1) -> list[float]: ...
+
+
+def _as_array(values: Series) -> npt.NDArray[np.float64]:
+    return np.asarray(values, dtype=np.float64)
+
+
+def _fallback(y: npt.NDArray[np.float64], periods: int) -> list[float]:
+    return [float(y[-1]) if len(y) else 0.0] * periods
+
+
+def _linear_fit(
+    y: npt.NDArray[np.float64],
+) -> tuple[float, npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    x_centered = np.arange(len(y), dtype=np.float64) - (len(y) - 1) / 2
+    y_centered = y - y.mean()
+    denominator = float(x_centered @ x_centered)
+    slope = float(x_centered @ y_centered) / denominator if denominator else 0.0
+    return slope, x_centered, y_centered
 
 
 @dataclass
@@ -53,71 +79,51 @@ class MovingAveragePredictor:
     def __init__(self, window_size: int = 10) -> None:
         self.window_size = window_size
 
-    def predict(self, values: list[float], periods: int = 1) -> list[float]:
-        if len(values) < self.window_size:
-            return [values[-1]] * periods if values else [0.0] * periods
+    def predict(self, values: Series, periods: int = 1) -> list[float]:
+        y = _as_array(values)
+        if len(y) < self.window_size:
+            return _fallback(y, periods)
 
-        recent_values = values[-self.window_size :]
-        ma = statistics.mean(recent_values)
-
-        return [ma] * periods
+        return [float(y[-self.window_size :].mean())] * periods
 
 
 class LinearTrendPredictor:
-    def predict(self, values: list[float], periods: int = 1) -> list[float]:
-        if len(values) < 2:
-            return [values[-1]] * periods if values else [0.0] * periods
-
-        n = len(values)
-        x = list[t.Any](range(n))
-        y = values
+    def predict(self, values: Series, periods: int = 1) -> list[float]:
+        y = _as_array(values)
+        if len(y) < 2:
+            return _fallback(y, periods)
 
-        x_mean = statistics.mean(x)
-        y_mean = statistics.mean(y)
-
-        numerator = sum((x[i] - x_mean) * (y[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-
-        if denominator == 0:
-            return [y_mean] * periods
-
-        slope = numerator / denominator
-        intercept = y_mean - slope * x_mean
-
-        predictions = []
-        for i in range(1, periods + 1):
-            future_x = n + i - 1
-            prediction = slope * future_x + intercept
-            predictions.append(prediction)
-
-        return predictions
+        n = len(y)
+        slope, _, _ = _linear_fit(y)
+        intercept = float(y.mean()) - slope * (n - 1) / 2
+        future_x = np.arange(n, n + periods, dtype=np.float64)
+        return (slope * future_x + intercept).tolist()
 
 
 class SeasonalPredictor:
     def __init__(self, season_length: int = 24) -> None:
         self.season_length = season_length
 
-    def predict(self, values: list[float], periods: int = 1) -> list[float]:
-        if len(values) < self.season_length:
-            return [values[-1]] * periods if values else [0.0] * periods
+    def predict(self, values: Series, periods: int = 1) -> list[float]:
+        y = _as_array(values)
+        if len(y) < self.season_length:
+            return _fallback(y, periods)
 
-        predictions = []
-        for i in range(periods):
-            season_index = (len(values) + i) % self.season_length
-            if season_index < len(values):
-                seasonal_value = values[-(self.season_length - season_index)]
-                predictions.append(seasonal_value)
-            else:
-                predictions.append(values[-1])
-
-        return predictions
+        n = len(y)
+        season_index = (n + np.arange(periods)) % self.season_length
+        return y[n - self.season_length + season_index].tolist()
 
 
 class PredictiveAnalyticsEngine:
     metric_configs: dict[str, dict[str, float | tuple[float, float] | str]]
 
-    def __init__(self, history_limit: int = 1000) -> None:
+    def __init__(
+        self,
+        history_limit: int = 1000,
+        store: TimeSeriesStore | None = None,
+    ) -> None:
         self.history_limit = history_limit
+        self.store = store
 
         self.metric_history: dict[str, deque[tuple[datetime, float]]] = defaultdict(
             lambda: deque[tuple[datetime, float]](maxlen=history_limit),
@@ -167,14 +173,48 @@ class PredictiveAnalyticsEngine:
             timestamp = datetime.now()
 
         self.metric_history[metric_type].append((timestamp, value))
+        if self.store is not None:
+            self.store.append(metric_type, [value], [timestamp])
 
         if len(self.metric_history[metric_type]) >= 10:
             self._update_trend_analysis(metric_type)
 
+    def load_history(
+        self,
+        metric_type: str,
+        resolution: str = RAW,
+        since: datetime | None = None,
+    ) -> int:
+        if self.store is None:
+            return 0
+
+        records = self.store.read(metric_type, resolution, start=since)
+        records = records[-self.history_limit :]
+        values = records["value"] if resolution == RAW else rollup_mean(records)
+
+        history = self.metric_history[metric_type]
+        history.clear()
+        history.extend(
+            zip(
+                (datetime.fromtimestamp(ts) for ts in records["ts"].tolist()),
+                values.tolist(),
+                strict=True,
+            )
+        )
+        if len(history) >= 10:
+            self._update_trend_analysis(metric_type)
+        return len(history)
+
+    def _values(self, metric_type: str) -> npt.NDArray[np.float64]:
+        history = self.metric_history[metric_type]
+        return np.fromiter(
+            (value for _, value in history), dtype=np.float64, count=len(history)
+        )
+
     def _update_trend_analysis(self, metric_type: str) -> None:
-        history: list[tuple[datetime, float]] = list(self.metric_history[metric_type])
-        values = [point[1] for point in history]
-        timestamps = [point[0] for point in history]
+        history = self.metric_history[metric_type]
+        values = self._values(metric_type)
+        timestamps = (history[0][0], history[-1][0])
 
         trend_direction, trend_strength = self._calculate_trend(values)
 
@@ -199,28 +239,15 @@ class PredictiveAnalyticsEngine:
             last_updated=datetime.now(),
         )
 
-    def _calculate_trend(self, values: list[float]) -> tuple[str, float]:
-        if len(values) < 3:
+    def _calculate_trend(self, values: Series) -> tuple[str, float]:
+        y = _as_array(values)
+        if len(y) < 3:
             return "stable", 0.0
 
-        n = len(values)
-        x: list[int] = list(range(n))
-        y = values
-
-        x_mean = statistics.mean(x)
-        y_mean = statistics.mean(y)
-
-        numerator = sum((x[i] - x_mean) * (y[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-
-        if denominator == 0:
-            return "stable", 0.0
-
-        slope = numerator / denominator
-
-        y_pred = [slope * xi + (y_mean - slope * x_mean) for xi in x]
-        ss_res = sum((y[i] - y_pred[i]) ** 2 for i in range(n))
-        ss_tot = sum((y[i] - y_mean) ** 2 for i in range(n))
+        slope, x_centered, y_centered = _linear_fit(y)
+        residuals = y_centered - slope * x_centered
+        ss_res = float(residuals @ residuals)
+        ss_tot = float(y_centered @ y_centered)
 
         r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
         trend_strength = max(0.0, min(1.0, r_squared))
@@ -233,8 +260,8 @@ class PredictiveAnalyticsEngine:
             direction = "decreasing"
 
         if trend_strength < 0.3:
-            recent_std = statistics.stdev(values[-10:]) if len(values) >= 10 else 0
-            overall_std = statistics.stdev(values)
+            recent_std = float(y[-10:].std(ddof=1)) if len(y) >= 10 else 0
+            overall_std = float(y.std(ddof=1))
             if recent_std > overall_std * 1.5:
                 direction = "volatile"
 
@@ -242,22 +269,17 @@ class PredictiveAnalyticsEngine:
 
     def _calculate_confidence_intervals(
         self,
-        historical: list[float],
+        historical: Series,
         predictions: list[float],
     ) -> list[tuple[float, float]]:
         if len(historical) < 2:
             return [(pred, pred) for pred in predictions]
 
-        std_dev = statistics.stdev(historical)
-        confidence_multiplier = 1.96
-
-        intervals = []
-        for pred in predictions:
-            lower = pred - confidence_multiplier * std_dev
-            upper = pred + confidence_multiplier * std_dev
-            intervals.append((lower, upper))
-
-        return intervals
+        margin = 1.96 * float(_as_array(historical).std(ddof=1))
+        centers = np.asarray(predictions, dtype=np.float64)
+        return list(
+            zip((centers - margin).tolist(), (centers + margin).tolist(), strict=True)
+        )
 
     def predict_metric(
         self,
@@ -268,8 +290,8 @@ class PredictiveAnalyticsEngine:
         if metric_type not in self.metric_history:
             return []
 
-        history: list[tuple[datetime, float]] = list(self.metric_history[metric_type])
-        values = [point[1] for point in history]
+        history = self.metric_history[metric_type]
+        values = self._values(metric_type)
         last_timestamp = history[-1][0] if history else datetime.now()
 
         if predictor_name is None:
@@ -312,8 +334,7 @@ class PredictiveAnalyticsEngine:
         if len(self.metric_history[metric_type]) < 20:
             return 0.5
 
-        history: list[tuple[datetime, float]] = list(self.metric_history[metric_type])
-        values = [point[1] for point in history]
+        values = self._values(metric_type)
 
         train_data = values[:-10]
         validation_data = values[-10:]
@@ -324,15 +345,12 @@ class PredictiveAnalyticsEngine:
         predictor = self.predictors[predictor_name]
         predictions = predictor.predict(train_data, periods=len(validation_data))
 
-        mae = statistics.mean(
-            abs(pred - actual)
-            for pred, actual in zip(predictions, validation_data, strict=False)
-        )
+        mae = float(np.abs(np.asarray(predictions) - validation_data).mean())
 
         if mae == 0:
             return 1.0
 
-        avg_value = statistics.mean(validation_data)
+        avg_value = float(validation_data.mean())
         relative_error = mae / abs(avg_value) if avg_value != 0 else mae
 
         return max(0.1, min(1.0, 1.0 - relative_error))
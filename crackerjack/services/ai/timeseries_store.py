@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import logging
+import math
+import os
+import re
+import time
+import typing as t
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+logger = logging.getLogger(__name__)
+
+RAW = "raw"
+HOURLY = "hourly"
+DAILY = "daily"
+
+# Resolution -> storage sub-directory, matching DataCompactionManager's rules.
+DATA_TYPES: dict[str, str] = {
+    RAW: "metrics_raw",
+    HOURLY: "metrics_hourly",
+    DAILY: "metrics_daily",
+}
+DEFAULT_RETENTION_DAYS: dict[str, int] = {RAW: 7, HOURLY: 30, DAILY: 365}
+
+# Resolution that each level is rolled up into, and that level's bucket size.
+ROLLUP_TARGETS: dict[str, tuple[str, int]] = {
+    RAW: (HOURLY, 3600),
+    HOURLY: (DAILY, 86400),
+}
+SEGMENT_SECONDS: dict[str, int] = {RAW: 86400, HOURLY: 7 * 86400, DAILY: 91 * 86400}
+
+RAW_DTYPE = np.dtype([("ts", "<f8"), ("value", "<f8")])
+ROLLUP_DTYPE = np.dtype(
+    [
+        ("ts", "<f8"),
+        ("count", "<i8"),
+        ("sum", "<f8"),
+        ("sumsq", "<f8"),
+        ("min", "<f8"),
+        ("max", "<f8"),
+    ]
+)
+
+SEGMENT_SUFFIX = ".seg"
+WATERMARK_FILE = ".rolled_through"
+_METRIC_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+Timestamps = npt.NDArray[np.datetime64] | Sequence[datetime | float] | None
+
+
+def to_epoch_seconds(timestamps: Timestamps, count: int) -> npt.NDArray[np.float64]:
+    if timestamps is None:
+        return np.full(count, time.time())
+    if isinstance(timestamps, np.ndarray) and timestamps.dtype.kind == "M":
+        micros = timestamps.astype("datetime64[us]").astype(np.int64)
+        return micros.astype(np.float64) / 1e6
+    return np.fromiter(
+        (
+            ts.timestamp() if isinstance(ts, datetime) else float(ts)
+            for ts in timestamps
+        ),
+        dtype=np.float64,
+        count=count,
+    )
+
+
+def rollup_records(
+    records: npt.NDArray[t.Any], bucket_seconds: int
+) -> npt.NDArray[t.Any]:
+    if records.dtype == RAW_DTYPE:
+        values = records["value"]
+        expanded = np.empty(len(records), dtype=ROLLUP_DTYPE)
+        expanded["ts"] = records["ts"]
+        expanded["count"] = 1
+        expanded["sum"] = values
+        expanded["sumsq"] = values * values
+        expanded["min"] = values
+        expanded["max"] = values
+        records = expanded
+    if not len(records):
+        return np.empty(0, dtype=ROLLUP_DTYPE)
+
+    records = records[np.argsort(records["ts"], kind="stable")]
+    buckets = np.floor(records["ts"] / bucket_seconds) * bucket_seconds
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+
+    rolled = np.empty(len(starts), dtype=ROLLUP_DTYPE)
+    rolled["ts"] = buckets[starts]
+    for column in ("count", "sum", "sumsq"):
+        rolled[column] = np.add.reduceat(records[column], starts)
+    rolled["min"] = np.minimum.reduceat(records["min"], starts)
+    rolled["max"] = np.maximum.reduceat(records["max"], starts)
+    return rolled
+
+
+def rollup_mean(records: npt.NDArray[t.Any]) -> npt.NDArray[np.float64]:
+    return records["sum"] / np.maximum(records["count"], 1)
+
+
+def rollup_std(records: npt.NDArray[t.Any]) -> npt.NDArray[np.float64]:
+    count = records["count"].astype(np.float64)
+    mean = rollup_mean(records)
+    variance = (records["sumsq"] - count * mean * mean) / np.maximum(count - 1, 1)
+    return np.sqrt(np.maximum(variance, 0.0))
+
+
+class TimeSeriesStore:
+    def __init__(
+        self,
+        root: Path,
+        retention_days: Mapping[str, int] | None = None,
+    ) -> None:
+        self.root = Path(root)
+        self.retention_days = {**DEFAULT_RETENTION_DAYS, **(retention_days or {})}
+
+    @staticmethod
+    def dtype_for(resolution: str) -> np.dtype[t.Any]:
+        if resolution not in DATA_TYPES:
+            msg = f"Unknown resolution: {resolution}"
+            raise ValueError(msg)
+        return RAW_DTYPE if resolution == RAW else ROLLUP_DTYPE
+
+    def metric_dir(self, metric: str, resolution: str) -> Path:
+        if not _METRIC_NAME.match(metric):
+            msg = f"Invalid metric name: {metric!r}"
+            raise ValueError(msg)
+        return self.root / DATA_TYPES[resolution] / metric
+
+    def metrics(self, resolution: str = RAW) -> list[str]:
+        base = self.root / DATA_TYPES[resolution]
+        if not base.is_dir():
+            return []
+        return sorted(p.name for p in base.iterdir() if p.is_dir())
+
+    def append(
+        self,
+        metric: str,
+        values: npt.ArrayLike,
+        timestamps: Timestamps = None,
+    ) -> int:
+        series = np.atleast_1d(np.asarray(values, dtype=np.float64))
+        if timestamps is not None and not isinstance(timestamps, np.ndarray | Sequence):
+            timestamps = [timestamps]
+        stamps = to_epoch_seconds(timestamps, len(series))
+        if len(stamps) != len(series):
+            msg = f"Got {len(series)} values but {len(stamps)} timestamps"
+            raise ValueError(msg)
+
+        records = np.empty(len(series), dtype=RAW_DTYPE)
+        records["ts"] = stamps
+        records["value"] = series
+        self._write(metric, RAW, records)
+        return len(records)
+
+    def read(
+        self,
+        metric: str,
+        resolution: str = RAW,
+        start: datetime | float | None = None,
+        end: datetime | float | None = None,
+    ) -> npt.NDArray[t.Any]:
+        dtype = self.dtype_for(resolution)
+        lower = _seconds(start, -math.inf)
+        upper = _seconds(end, math.inf)
+        span = SEGMENT_SECONDS[resolution]
+
+        chunks = [
+            segment
+            for seg_start, path in self._segments(metric, resolution)
+            if seg_start + span > lower and seg_start < upper
+            if len(segment := self._open(path, dtype))
+        ]
+        if not chunks:
+            return np.empty(0, dtype=dtype)
+        records = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+        if lower == -math.inf and upper == math.inf:
+            return records
+        stamps = records["ts"]
+        return records[(stamps >= lower) & (stamps < upper)]
+
+    def values(
+        self,
+        metric: str,
+        resolution: str = RAW,
+        start: datetime | float | None = None,
+        end: datetime | float | None = None,
+    ) -> npt.NDArray[np.float64]:
+        records = self.read(metric, resolution, start, end)
+        if resolution == RAW:
+            return np.asarray(records["value"])
+        return rollup_mean(records)
+
+    def rollup(self, metric: str, resolution: str, now: float | None = None) -> int:
+        target, bucket_seconds = ROLLUP_TARGETS[resolution]
+        watermark_path = self.metric_dir(metric, target) / WATERMARK_FILE
+        try:
+            rolled_through = float(watermark_path.read_text())
+        except (OSError, ValueError):
+            rolled_through = -math.inf
+
+        # Only buckets that have fully elapsed are rolled up. Points that
+        # arrive for a bucket after it was rolled up stay in the source level
+        # only.
+        now = time.time() if now is None else now
+        cutoff = math.floor(now / bucket_seconds) * bucket_seconds
+        if cutoff <= rolled_through:
+            return 0
+
+        source = self.read(metric, resolution, rolled_through, cutoff)
+        rolled = rollup_records(source, bucket_seconds)
+        if len(rolled):
+            self._write(metric, target, rolled)
+        watermark_path.parent.mkdir(parents=True, exist_ok=True)
+        watermark_path.write_text(repr(float(cutoff)))
+        return len(source)
+
+    def expire(
+        self, metric: str, resolution: str, now: float | None = None
+    ) -> tuple[int, int]:
+        now = time.time() if now is None else now
+        cutoff = now - self.retention_days[resolution] * 86400
+        dtype = self.dtype_for(resolution)
+        span = SEGMENT_SECONDS[resolution]
+        removed_records = freed_bytes = 0
+
+        for seg_start, path in self._segments(metric, resolution):
+            if seg_start >= cutoff:
+                continue
+            size = path.stat().st_size
+            if seg_start + span <= cutoff:
+                removed_records += size // dtype.itemsize
+                freed_bytes += size
+                path.unlink()
+                continue
+            segment = self._open(path, dtype)
+            keep = np.asarray(segment[segment["ts"] >= cutoff])
+            del segment
+            if len(keep) == size // dtype.itemsize:
+                continue
+            self._replace(path, keep)
+            removed_records += size // dtype.itemsize - len(keep)
+            freed_bytes += size - keep.nbytes
+        return removed_records, freed_bytes
+
+    def compact(self, resolution: str, now: float | None = None) -> dict[str, int]:
+        now = time.time() if now is None else now
+        rolled_up = removed = freed = 0
+        for metric in self.metrics(resolution):
+            if resolution in ROLLUP_TARGETS:
+                rolled_up += self.rollup(metric, resolution, now)
+            records, size = self.expire(metric, resolution, now)
+            removed += records
+            freed += size
+        logger.debug(
+            f"Compacted {resolution} metrics: rolled up {rolled_up}, "
+            f"expired {removed} records ({freed} bytes)"
+        )
+        return {"rolled_up": rolled_up, "removed": removed, "freed_bytes": freed}
+
+    def _segments(self, metric: str, resolution: str) -> list[tuple[float, Path]]:
+        directory = self.metric_dir(metric, resolution)
+        if not directory.is_dir():
+            return []
+        segments = []
+        for path in directory.glob(f"*{SEGMENT_SUFFIX}"):
+            try:
+                segments.append((float(path.stem), path))
+            except ValueError:
+                continue
+        return sorted(segments)
+
+    @staticmethod
+    def _open(path: Path, dtype: np.dtype[t.Any]) -> npt.NDArray[t.Any]:
+        try:
+            # A record cut short by a crash mid-append is ignored.
+            count = path.stat().st_size // dtype.itemsize
+        except OSError:
+            count = 0
+        if not count:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+
+    def _write(self, metric: str, resolution: str, records: npt.NDArray[t.Any]) -> None:
+        directory = self.metric_dir(metric, resolution)
+        directory.mkdir(parents=True, exist_ok=True)
+        span = SEGMENT_SECONDS[resolution]
+        seg_starts = np.floor(records["ts"] / span) * span
+        for seg_start in np.unique(seg_starts):
+            chunk = records[seg_starts == seg_start]
+            path = directory / f"{int(seg_start)}{SEGMENT_SUFFIX}"
+            with path.open("ab") as f:
+                # Drop a record torn by a crash mid-append first; anything
+                # written after it would be misaligned for good.
+                torn = f.tell() % records.dtype.itemsize
+                if torn:
+                    f.truncate(f.tell() - torn)
+                    f.seek(0, os.SEEK_END)
+                f.write(chunk.tobytes())
+
+    @staticmethod
+    def _replace(path: Path, records: npt.NDArray[t.Any]) -> None:
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(records.tobytes())
+        os.replace(tmp_path, path)
+
+
+def _seconds(value: datetime | float | None, default: float) -> float:
+    if value is None:
+        return default
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
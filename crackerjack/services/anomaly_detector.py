@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import json
 import logging
-import statistics
+import math
+import os
 import typing as t
 from collections import defaultdict, deque
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+import numpy.typing as npt
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +49,87 @@ class BaselineModel:
     seasonal_patterns: dict[str, float] = field(default_factory=dict[str, t.Any])
 
 
+STATE_VERSION = 1
+_SEASONAL_MIN_HISTORY = 24
+_SEASONAL_MIN_SAMPLES = 3
+
+
+@dataclass
+class _WindowStats:
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    removals: int = 0
+    hour_sums: list[float] = field(default_factory=lambda: [0.0] * 24)
+    hour_counts: list[int] = field(default_factory=lambda: [0] * 24)
+    # Monotonic (sequence, value) deques for the sliding minimum and maximum.
+    lows: deque[tuple[int, float]] = field(default_factory=deque)
+    highs: deque[tuple[int, float]] = field(default_factory=deque)
+    next_seq: int = 0
+
+    def add(self, value: float, hour: int) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.hour_sums[hour] += value
+        self.hour_counts[hour] += 1
+
+        seq = self.next_seq
+        self.next_seq += 1
+        while self.lows and self.lows[-1][1] >= value:
+            self.lows.pop()
+        self.lows.append((seq, value))
+        while self.highs and self.highs[-1][1] <= value:
+            self.highs.pop()
+        self.highs.append((seq, value))
+
+    def remove(self, value: float, hour: int) -> None:
+        self.removals += 1
+        self.hour_sums[hour] -= value
+        self.hour_counts[hour] -= 1
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+        else:
+            previous_mean = self.mean
+            self.count -= 1
+            self.mean = (previous_mean * (self.count + 1) - value) / self.count
+            self.m2 = max(0.0, self.m2 - (value - previous_mean) * (value - self.mean))
+
+        window_start = self.next_seq - self.count
+        for extremes in (self.lows, self.highs):
+            while extremes and extremes[0][0] < window_start:
+                extremes.popleft()
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    @property
+    def min_value(self) -> float:
+        return self.lows[0][1]
+
+    @property
+    def max_value(self) -> float:
+        return self.highs[0][1]
+
+    def seasonal_patterns(self) -> dict[str, float]:
+        if self.count < _SEASONAL_MIN_HISTORY:
+            return {}
+        return {
+            f"hour_{hour}": self.hour_sums[hour] / count
+            for hour, count in enumerate(self.hour_counts)
+            if count >= _SEASONAL_MIN_SAMPLES
+        }
+
+    @classmethod
+    def from_points(cls, points: Iterable[MetricPoint]) -> _WindowStats:
+        stats = cls()
+        for point in points:
+            stats.add(point.value, point.timestamp.hour)
+        return stats
+
+
 class AnomalyDetector:
     def __init__(
         self,
@@ -59,6 +146,7 @@ class AnomalyDetector:
         )
         self.baselines: dict[str, BaselineModel] = {}
         self.anomalies: list[AnomalyDetection] = []
+        self._stats: dict[str, _WindowStats] = defaultdict(_WindowStats)
 
         self.metric_configs = {
             "test_pass_rate": {"critical_threshold": 0.8, "direction": "both"},
@@ -85,56 +173,83 @@ class AnomalyDetector:
             metric_type=metric_type,
             metadata=metadata or {},
         )
+        self._ingest(point, detect=True)
 
-        self.metric_history[metric_type].append(point)
-
-        if len(self.metric_history[metric_type]) >= self.min_samples:
+    def add_metrics(
+        self,
+        metric_type: str,
+        values: npt.ArrayLike,
+        timestamps: npt.NDArray[np.datetime64] | Sequence[datetime] | None = None,
+        detect_anomalies: bool = False,
+    ) -> int:
+        series = np.asarray(values, dtype=np.float64).ravel()
+        if timestamps is None:
+            stamps: list[datetime] = [datetime.now()] * len(series)
+        elif isinstance(timestamps, np.ndarray):
+            stamps = timestamps.astype("datetime64[us]").tolist()
+        else:
+            stamps = list(timestamps)
+        if len(stamps) != len(series):
+            msg = f"Got {len(series)} values but {len(stamps)} timestamps"
+            raise ValueError(msg)
+
+        if not detect_anomalies:
+            # Only the trailing window can influence the baseline.
+            series = series[-self.baseline_window :]
+            stamps = stamps[len(stamps) - len(series) :]
+
+        anomaly_count = len(self.anomalies)
+        for timestamp, value in zip(stamps, series.tolist(), strict=True):
+            self._ingest(
+                MetricPoint(timestamp=timestamp, value=value, metric_type=metric_type),
+                detect=detect_anomalies,
+            )
+        if not detect_anomalies and len(series):
             self._update_baseline(metric_type)
+        return len(self.anomalies) - anomaly_count
 
-            anomaly = self._detect_anomaly(point)
-            if anomaly:
-                self.anomalies.append(anomaly)
-                logger.info(f"Anomaly detected: {anomaly.description}")
+    def _ingest(self, point: MetricPoint, detect: bool) -> None:
+        metric_type = point.metric_type
+        history = self.metric_history[metric_type]
+        stats = self._stats[metric_type]
 
-    def _update_baseline(self, metric_type: str) -> None:
-        history = list[t.Any](self.metric_history[metric_type])
-        values = [point.value for point in history]
+        if len(history) == history.maxlen:
+            evicted = history[0]
+            stats.remove(evicted.value, evicted.timestamp.hour)
+        history.append(point)
+        stats.add(point.value, point.timestamp.hour)
 
-        mean = statistics.mean(values)
-        std_dev = statistics.stdev(values) if len(values) > 1 else 0
-        min_val = min(values)
-        max_val = max(values)
+        if stats.removals >= self.baseline_window:
+            # Resynchronise periodically so floating-point drift from the
+            # running removals cannot build up.
+            self._stats[metric_type] = _WindowStats.from_points(history)
 
-        seasonal_patterns = self._detect_seasonal_patterns(history)
+        if not detect or len(history) < self.min_samples:
+            return
+
+        self._update_baseline(metric_type)
+
+        anomaly = self._detect_anomaly(point)
+        if anomaly:
+            self.anomalies.append(anomaly)
+            logger.info(f"Anomaly detected: {anomaly.description}")
+
+    def _update_baseline(self, metric_type: str) -> None:
+        stats = self._stats[metric_type]
+        if stats.count < self.min_samples:
+            return
 
         self.baselines[metric_type] = BaselineModel(
             metric_type=metric_type,
-            mean=mean,
-            std_dev=std_dev,
-            min_value=min_val,
-            max_value=max_val,
-            sample_count=len(values),
+            mean=stats.mean,
+            std_dev=stats.std_dev,
+            min_value=stats.min_value,
+            max_value=stats.max_value,
+            sample_count=stats.count,
             last_updated=datetime.now(),
-            seasonal_patterns=seasonal_patterns,
+            seasonal_patterns=stats.seasonal_patterns(),
         )
 
-    def _detect_seasonal_patterns(self, history: list[MetricPoint]) -> dict[str, float]:
-        patterns: dict[str, float] = {}
-
-        if len(history) < 24:
-            return patterns
-
-        hourly_values = defaultdict(list)
-        for point in history:
-            hour = point.timestamp.hour
-            hourly_values[hour].append(point.value)
-
-        for hour, values in hourly_values.items():
-            if len(values) >= 3:
-                patterns[f"hour_{hour}"] = statistics.mean(values)
-
-        return patterns
-
     def _detect_anomaly(self, point: MetricPoint) -> AnomalyDetection | None:
         metric_type = point.metric_type
         baseline = self.baselines.get(metric_type)
@@ -326,8 +441,6 @@ class AnomalyDetector:
         return summary
 
     def export_model(self, output_path: str | Path) -> None:
-        import json
-
         model_data = {
             "baselines": {
                 metric_type: {
@@ -352,3 +465,48 @@ class AnomalyDetector:
 
         with Path(output_path).open("w", encoding="utf-8") as f:
             json.dump(model_data, f, indent=2)
+
+    def save_state(self, path: str | Path) -> None:
+        state = {
+            "version": STATE_VERSION,
+            "config": {
+                "baseline_window": self.baseline_window,
+                "sensitivity": self.sensitivity,
+                "min_samples": self.min_samples,
+            },
+            "metrics": {
+                metric_type: {
+                    "timestamps": [point.timestamp.isoformat() for point in history],
+                    "values": [point.value for point in history],
+                }
+                for metric_type, history in self.metric_history.items()
+                if history
+            },
+            "saved_at": datetime.now().isoformat(),
+        }
+
+        target = Path(path)
+        tmp_path = target.with_name(target.name + ".tmp")
+        tmp_path.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp_path, target)
+
+    def load_state(self, path: str | Path) -> bool:
+        try:
+            state = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load anomaly model state from {path}: {e}")
+            return False
+        if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+            logger.warning(f"Ignoring incompatible anomaly model state in {path}")
+            return False
+
+        for metric_type, window in state.get("metrics", {}).items():
+            self.metric_history.pop(metric_type, None)
+            self._stats.pop(metric_type, None)
+            self.baselines.pop(metric_type, None)
+            self.add_metrics(
+                metric_type,
+                window["values"],
+                [datetime.fromisoformat(stamp) for stamp in window["timestamps"]],
+            )
+        return True
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import os
 import shutil
 import time
 import typing as t
@@ -53,9 +55,19 @@ class PackageBackupService(BaseModel):
             self.security_logger = get_security_logger()
 
         if self.backup_root is None:
-            import tempfile
+            self.backup_root = Path.cwd() / ".crackerjack" / "backups"
 
-            self.backup_root = Path(tempfile.gettempdir()) / "crackerjack_backups"
+    @property
+    def objects_directory(self) -> Path:
+        return self._objects_dir_for(t.cast(Path, self.backup_root))
+
+    @staticmethod
+    def _objects_dir_for(backup_root: Path) -> Path:
+        return backup_root / "objects"
+
+    @property
+    def _index_path(self) -> Path:
+        return t.cast(Path, self.backup_root) / "index.json"
 
     def create_package_backup(
         self,
@@ -219,6 +231,38 @@ class PackageBackupService(BaseModel):
                 backup_id=backup_metadata.backup_id,
             )
 
+        if backup_dir.parent == self.backup_root:
+            self.collect_garbage()
+
+    def collect_garbage(self) -> int:
+        objects_dir = self.objects_directory
+        if not objects_dir.exists():
+            return 0
+
+        referenced = set(self._load_index().referenced_digests())
+        for manifest_path in t.cast(Path, self.backup_root).glob(
+            "backup_*/manifest.json"
+        ):
+            try:
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+                referenced.update(manifest.get("file_checksums", {}).values())
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Keeping all objects, unreadable manifest: {e}")
+                return 0
+
+        removed = 0
+        for blob in objects_dir.glob("*/*"):
+            if blob.parent.name + blob.name not in referenced:
+                try:
+                    blob.unlink()
+                    removed += 1
+                except OSError as e:
+                    self.logger.warning(f"Failed to remove backup object {blob}: {e}")
+
+        if removed:
+            self.logger.debug(f"Removed {removed} unreferenced backup objects")
+        return removed
+
     def _generate_backup_id(self) -> str:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         random_hash = hashlib.md5(
@@ -308,23 +352,26 @@ class PackageBackupService(BaseModel):
     ) -> BackupMetadata:
         file_checksums: dict[str, str] = {}
         total_size = 0
+        stored = 0
+        index = self._load_index()
 
         for file_path in files_to_backup:
             try:
                 relative_path = file_path.relative_to(package_directory)
-                backup_file_path = backup_dir / relative_path
-
-                backup_file_path.parent.mkdir(parents=True, exist_ok=True)
-
-                content = file_path.read_bytes()
-                total_size += len(content)
-
-                checksum = hashlib.sha256(content, usedforsecurity=False).hexdigest()
-                file_checksums[relative_path] = checksum  # type: ignore
+                stat = file_path.stat()
+                total_size += stat.st_size
 
-                AtomicFileOperations.atomic_write(backup_file_path, content)
+                checksum = index.lookup(file_path, stat)
+                if checksum is None or not self._blob_path(checksum).exists():
+                    content = file_path.read_bytes()
+                    checksum = hashlib.sha256(
+                        content, usedforsecurity=False
+                    ).hexdigest()
+                    if self._store_blob(checksum, content):
+                        stored += 1
+                    index.update(file_path, stat, checksum)
 
-                self.logger.debug(f"Backed up file: {relative_path}")
+                file_checksums[str(relative_path)] = checksum
 
             except Exception as e:
                 raise ExecutionError(
@@ -332,18 +379,63 @@ class PackageBackupService(BaseModel):
                     error_code=ErrorCode.FILE_WRITE_ERROR,
                 ) from e
 
-        overall_checksum = self._calculate_backup_checksum(file_checksums)
+        self._save_index(index)
+        self.logger.debug(
+            f"Backup {backup_id}: stored {stored} new objects, "
+            f"reused {len(files_to_backup) - stored}",
+        )
 
-        return BackupMetadata(
+        metadata = BackupMetadata(
             backup_id=backup_id,
             timestamp=datetime.now(),
             package_directory=package_directory,
             backup_directory=backup_dir,
             total_files=len(files_to_backup),
             total_size=total_size,
-            checksum=overall_checksum,
+            checksum=self._calculate_backup_checksum(file_checksums),
             file_checksums=file_checksums,
         )
+        AtomicFileOperations.atomic_write(
+            backup_dir / "manifest.json",
+            metadata.model_dump_json(indent=2),
+        )
+        return metadata
+
+    def _blob_path(self, checksum: str, backup_root: Path | None = None) -> Path:
+        objects_dir = self._objects_dir_for(
+            backup_root or t.cast(Path, self.backup_root)
+        )
+        return objects_dir / checksum[:2] / checksum[2:]
+
+    def _store_blob(self, checksum: str, content: bytes) -> bool:
+        blob_path = self._blob_path(checksum)
+        if blob_path.exists():
+            return False
+
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        AtomicFileOperations.atomic_write(blob_path, content)
+        blob_path.chmod(0o400)
+        return True
+
+    def _load_index(self) -> _StatIndex:
+        try:
+            return _StatIndex(json.loads(self._index_path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return _StatIndex({})
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable backup index: {e}")
+            return _StatIndex({})
+
+    def _save_index(self, index: _StatIndex) -> None:
+        if not index.dirty:
+            return
+        try:
+            AtomicFileOperations.atomic_write(
+                self._index_path,
+                json.dumps(index.entries, separators=(",", ":")),
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to save backup index: {e}")
 
     def _calculate_backup_checksum(self, file_checksums: dict[str, str]) -> str:
         sorted_items = sorted(file_checksums.items())
@@ -353,6 +445,7 @@ class PackageBackupService(BaseModel):
     def _validate_backup(
         self,
         backup_metadata: BackupMetadata,
+        verify_content: bool = False,
     ) -> BackupValidationResult:
         missing_files: list[Path] = []
         corrupted_files: list[Path] = []
@@ -375,32 +468,34 @@ class PackageBackupService(BaseModel):
             relative_path_str,
             expected_checksum,
         ) in backup_metadata.file_checksums.items():
-            backup_file_path = backup_dir / relative_path_str
+            blob_path = self._blob_path(expected_checksum, backup_dir.parent)
 
-            if not backup_file_path.exists():
-                missing_files.append(backup_file_path)
+            if not blob_path.exists():
+                missing_files.append(blob_path)
                 validation_errors.append(f"Missing backup file: {relative_path_str}")
                 continue
 
-            try:
-                content = backup_file_path.read_bytes()
-                actual_checksum = hashlib.sha256(
-                    content,
-                    usedforsecurity=False,
-                ).hexdigest()
+            if verify_content:
+                try:
+                    actual_checksum = hashlib.sha256(
+                        blob_path.read_bytes(),
+                        usedforsecurity=False,
+                    ).hexdigest()
+                except Exception as e:
+                    validation_errors.append(
+                        f"Error validating {relative_path_str}: {e}"
+                    )
+                    continue
 
                 if actual_checksum != expected_checksum:
-                    corrupted_files.append(backup_file_path)
+                    corrupted_files.append(blob_path)
                     validation_errors.append(
                         f"Corrupted backup file: {relative_path_str} "
                         f"(expected: {expected_checksum}, actual: {actual_checksum})",
                     )
                     continue
 
-                total_validated += 1
-
-            except Exception as e:
-                validation_errors.append(f"Error validating {relative_path_str}: {e}")
+            total_validated += 1
 
         if not validation_errors:
             recalculated_checksum = self._calculate_backup_checksum(
@@ -432,15 +527,18 @@ class PackageBackupService(BaseModel):
         backup_metadata: BackupMetadata,
         temp_restore_dir: Path,
     ) -> None:
-        backup_dir = backup_metadata.backup_directory
+        backup_root = backup_metadata.backup_directory.parent
 
-        for relative_path_str in backup_metadata.file_checksums:
-            backup_file_path = backup_dir / relative_path_str
+        for relative_path_str, checksum in backup_metadata.file_checksums.items():
+            blob_path = self._blob_path(checksum, backup_root)
             staging_file_path = temp_restore_dir / relative_path_str
 
             staging_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            shutil.copy2(backup_file_path, staging_file_path)
+            try:
+                os.link(blob_path, staging_file_path)
+            except OSError:
+                shutil.copy2(blob_path, staging_file_path)
 
     def _commit_restoration(
         self,
@@ -472,3 +570,22 @@ class PackageBackupService(BaseModel):
                 shutil.rmtree(directory)
             except Exception as e:
                 self.logger.warning(f"Failed to cleanup directory {directory}: {e}")
+
+
+class _StatIndex:
+    def __init__(self, entries: dict[str, list[t.Any]]) -> None:
+        self.entries = entries
+        self.dirty = False
+
+    def lookup(self, file_path: Path, stat: os.stat_result) -> str | None:
+        entry = self.entries.get(str(file_path))
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return t.cast(str, entry[2])
+        return None
+
+    def update(self, file_path: Path, stat: os.stat_result, checksum: str) -> None:
+        self.entries[str(file_path)] = [stat.st_mtime_ns, stat.st_size, checksum]
+        self.dirty = True
+
+    def referenced_digests(self) -> list[str]:
+        return [entry[2] for entry in self.entries.values()]
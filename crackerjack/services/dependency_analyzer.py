@@ -8,8 +8,24 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+EXCLUDED_DIRS = frozenset(
+    {
+        "__pycache__",
+        ".git",
+        ".crackerjack",
+        ".pytest_cache",
+        "node_modules",
+        "venv",
+        ".venv",
+        "build",
+        "dist",
+    }
+)
+
 
 @dataclass
 class DependencyNode:
@@ -38,6 +54,10 @@ class DependencyNode:
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, t.Any]) -> DependencyNode:
+        return cls(**data)
+
 
 @dataclass
 class DependencyEdge:
@@ -56,6 +76,10 @@ class DependencyEdge:
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, t.Any]) -> DependencyEdge:
+        return cls(**data)
+
 
 @dataclass
 class DependencyGraph:
@@ -75,23 +99,212 @@ class DependencyGraph:
         }
 
 
+@dataclass
+class ImportGraph:
+    modules: list[str] = field(default_factory=list)
+    offsets: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int32))
+    targets: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    reverse_offsets: np.ndarray = field(
+        default_factory=lambda: np.zeros(1, dtype=np.int32)
+    )
+    reverse_targets: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.int32)
+    )
+    _ids: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self._ids:
+            self._ids = {name: idx for idx, name in enumerate(self.modules)}
+
+    @classmethod
+    def from_adjacency(cls, adjacency: dict[str, set[str]]) -> ImportGraph:
+        names = set(adjacency)
+        for imported in adjacency.values():
+            names.update(imported)
+        modules = sorted(names)
+        ids = {name: idx for idx, name in enumerate(modules)}
+
+        sources = np.fromiter(
+            (ids[src] for src, dsts in adjacency.items() for _ in dsts),
+            dtype=np.int32,
+        )
+        targets = np.fromiter(
+            (ids[dst] for dsts in adjacency.values() for dst in dsts),
+            dtype=np.int32,
+        )
+        offsets, ordered_targets = cls._to_csr(sources, targets, len(modules))
+        reverse_offsets, reverse_targets = cls._to_csr(targets, sources, len(modules))
+        return cls(
+            modules=modules,
+            offsets=offsets,
+            targets=ordered_targets,
+            reverse_offsets=reverse_offsets,
+            reverse_targets=reverse_targets,
+            _ids=ids,
+        )
+
+    @staticmethod
+    def _to_csr(
+        sources: np.ndarray, targets: np.ndarray, size: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        order = np.lexsort((targets, sources))
+        counts = np.bincount(sources, minlength=size)
+        offsets = np.zeros(size + 1, dtype=np.int32)
+        np.cumsum(counts, out=offsets[1:])
+        return offsets, targets[order].astype(np.int32)
+
+    def node_id(self, module: str) -> int | None:
+        return self._ids.get(module)
+
+    def _neighbours(
+        self, module: str, offsets: np.ndarray, targets: np.ndarray
+    ) -> list[str]:
+        idx = self._ids.get(module)
+        if idx is None:
+            return []
+        return [
+            self.modules[i] for i in targets[offsets[idx] : offsets[idx + 1]].tolist()
+        ]
+
+    def imports_of(self, module: str) -> list[str]:
+        return self._neighbours(module, self.offsets, self.targets)
+
+    def importers_of(self, module: str) -> list[str]:
+        return self._neighbours(module, self.reverse_offsets, self.reverse_targets)
+
+    def transitive_importers(self, module: str) -> set[str]:
+        start = self._ids.get(module)
+        if start is None:
+            return set()
+
+        seen = {start}
+        stack = [start]
+        while stack:
+            idx = stack.pop()
+            lo, hi = self.reverse_offsets[idx], self.reverse_offsets[idx + 1]
+            for importer in self.reverse_targets[lo:hi].tolist():
+                if importer not in seen:
+                    seen.add(importer)
+                    stack.append(importer)
+
+        seen.discard(start)
+        return {self.modules[i] for i in seen}
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            np.savez_compressed(
+                f,
+                modules=np.array(self.modules, dtype=np.str_),
+                offsets=self.offsets,
+                targets=self.targets,
+                reverse_offsets=self.reverse_offsets,
+                reverse_targets=self.reverse_targets,
+            )
+
+    @classmethod
+    def load(cls, path: Path) -> ImportGraph:
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                modules=data["modules"].tolist(),
+                offsets=data["offsets"],
+                targets=data["targets"],
+                reverse_offsets=data["reverse_offsets"],
+                reverse_targets=data["reverse_targets"],
+            )
+
+
+@dataclass
+class FileRecord:
+    mtime_ns: int
+    size: int
+    module: str
+    is_package: bool
+    nodes: list[DependencyNode] = field(default_factory=list)
+    edges: list[DependencyEdge] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, t.Any]:
+        return {
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "module": self.module,
+            "is_package": self.is_package,
+            "nodes": [node.to_dict() for node in self.nodes],
+            "edges": [edge.to_dict() for edge in self.edges],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, t.Any]) -> FileRecord:
+        return cls(
+            mtime_ns=data["mtime_ns"],
+            size=data["size"],
+            module=data["module"],
+            is_package=data["is_package"],
+            nodes=[DependencyNode.from_dict(n) for n in data["nodes"]],
+            edges=[DependencyEdge.from_dict(e) for e in data["edges"]],
+        )
+
+    def imported_modules(self, known_modules: set[str]) -> set[str]:
+        imported: set[str] = set()
+        for edge in self.edges:
+            if edge.type == "import":
+                imported.add(edge.target.removeprefix("module:"))
+            elif edge.type == "import_from":
+                base = self._resolve_from(
+                    edge.metadata.get("module"), edge.metadata.get("level", 0)
+                )
+                if not base:
+                    continue
+                candidate = f"{base}.{edge.metadata.get('symbol')}"
+                imported.add(candidate if candidate in known_modules else base)
+        imported.discard(self.module)
+        return imported
+
+    def _resolve_from(self, module: str | None, level: int) -> str | None:
+        if not level:
+            return module
+
+        parts = self.module.split(".")
+        if not self.is_package:
+            parts = parts[:-1]
+        if level > 1:
+            parts = parts[: len(parts) - (level - 1)]
+        if module:
+            parts = [*parts, module]
+        return ".".join(parts) or None
+
+
 class DependencyAnalyzer:
-    def __init__(self, project_root: Path) -> None:
+    CACHE_VERSION = 1
+
+    def __init__(self, project_root: Path, cache_dir: Path | None = None) -> None:
         self.project_root = Path(project_root)
+        self.cache_dir = cache_dir or self.project_root / ".crackerjack" / "cache"
         self.python_files: list[Path] = []
         self.dependency_graph = DependencyGraph()
+        self.import_graph = ImportGraph()
+        self.file_records: dict[str, FileRecord] = {}
+        self.reparsed_files: list[str] = []
+        self._cache_loaded = False
+
+    @property
+    def _records_path(self) -> Path:
+        return self.cache_dir / "dependency_files.json"
+
+    @property
+    def _import_graph_path(self) -> Path:
+        return self.cache_dir / "import_graph.npz"
 
     def analyze_project(self) -> DependencyGraph:
         logger.info(f"Starting dependency analysis for {self.project_root}")
 
-        self._discover_python_files()
+        self.refresh_file_records()
 
-        for file_path in self.python_files:
-            try:
-                self._analyze_file(file_path)
-            except Exception as e:
-                logger.warning(f"Failed to analyze {file_path}: {e}")
-                continue
+        self.dependency_graph = DependencyGraph()
+        for record in self.file_records.values():
+            for node in record.nodes:
+                self.dependency_graph.nodes[node.id] = node
+            self.dependency_graph.edges.extend(record.edges)
 
         self._generate_clusters()
         self._calculate_metrics()
@@ -104,43 +317,154 @@ class DependencyAnalyzer:
 
         return self.dependency_graph
 
-    def _discover_python_files(self) -> None:
-        self.python_files = list[t.Any](self.project_root.rglob("*.py"))
-
-        excluded_patterns = {
-            "__pycache__",
-            ".git",
-            ".pytest_cache",
-            "node_modules",
-            "venv",
-            ".venv",
-            "build",
-            "dist",
+    def refresh_file_records(self) -> dict[str, FileRecord]:
+        self._load_cache()
+        self._discover_python_files()
+        changed = self._refresh_file_records()
+        if changed or not self._import_graph_path.exists():
+            self._build_import_graph()
+            self._save_cache()
+        return self.file_records
+
+    def get_importers(self, module: str, transitive: bool = False) -> set[str]:
+        if transitive:
+            return self.import_graph.transitive_importers(module)
+        return set(self.import_graph.importers_of(module))
+
+    def get_imports(self, module: str) -> set[str]:
+        return set(self.import_graph.imports_of(module))
+
+    def module_for_path(self, file_path: Path) -> str | None:
+        try:
+            relative = str(
+                Path(file_path).resolve().relative_to(self.project_root.resolve())
+            )
+        except ValueError:
+            return None
+        record = self.file_records.get(relative)
+        return record.module if record else None
+
+    def _refresh_file_records(self) -> bool:
+        self.reparsed_files = []
+        current: dict[str, FileRecord] = {}
+
+        for file_path in self.python_files:
+            relative = str(file_path.relative_to(self.project_root))
+            try:
+                stat = file_path.stat()
+            except OSError as e:
+                logger.warning(f"Failed to stat {file_path}: {e}")
+                continue
+
+            cached = self.file_records.get(relative)
+            if (
+                cached is not None
+                and cached.mtime_ns == stat.st_mtime_ns
+                and cached.size == stat.st_size
+            ):
+                current[relative] = cached
+                continue
+
+            try:
+                current[relative] = self._parse_file(file_path, stat)
+                self.reparsed_files.append(relative)
+            except Exception as e:
+                logger.warning(f"Failed to analyze {file_path}: {e}")
+                continue
+
+        changed = (
+            bool(self.reparsed_files) or current.keys() != self.file_records.keys()
+        )
+        self.file_records = current
+        if self.reparsed_files:
+            logger.info(f"Re-parsed {len(self.reparsed_files)} changed Python files")
+        return changed
+
+    def _build_import_graph(self) -> None:
+        known_modules = {record.module for record in self.file_records.values()}
+        adjacency = {
+            record.module: record.imported_modules(known_modules)
+            for record in self.file_records.values()
         }
+        self.import_graph = ImportGraph.from_adjacency(adjacency)
 
-        self.python_files = [
-            f
-            for f in self.python_files
-            if not any(pattern in f.parts for pattern in excluded_patterns)
-        ]
+    def _load_cache(self) -> None:
+        if self._cache_loaded:
+            return
+        self._cache_loaded = True
 
-        logger.info(f"Discovered {len(self.python_files)} Python files")
+        try:
+            data = json.loads(self._records_path.read_text(encoding="utf-8"))
+            if data.get("version") != self.CACHE_VERSION:
+                return
+            self.file_records = {
+                relative: FileRecord.from_dict(record)
+                for relative, record in data["files"].items()
+            }
+            if self._import_graph_path.exists():
+                self.import_graph = ImportGraph.load(self._import_graph_path)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable dependency cache: {e}")
+            self.file_records = {}
+            self.import_graph = ImportGraph()
 
-    def _analyze_file(self, file_path: Path) -> None:
+    def _save_cache(self) -> None:
         try:
-            content = file_path.read_text(encoding="utf-8")
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            payload = {
+                "version": self.CACHE_VERSION,
+                "files": {
+                    relative: record.to_dict()
+                    for relative, record in self.file_records.items()
+                },
+            }
+            tmp_path = self._records_path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps(payload, separators=(",", ":")), encoding="utf-8"
+            )
+            tmp_path.replace(self._records_path)
+            self.import_graph.save(self._import_graph_path)
+        except OSError as e:
+            logger.warning(f"Failed to persist dependency cache: {e}")
 
-            tree = ast.parse(content)
-            visitor = DependencyVisitor(file_path, self.project_root)
-            visitor.visit(tree)
+    def _discover_python_files(self) -> None:
+        self.python_files = discover_python_files(self.project_root)
 
-            for node in visitor.nodes:
-                self.dependency_graph.nodes[node.id] = node
+        logger.info(f"Discovered {len(self.python_files)} Python files")
 
-            self.dependency_graph.edges.extend(visitor.edges)
+    def _parse_file(self, file_path: Path, stat: t.Any) -> FileRecord:
+        visitor = DependencyVisitor(file_path, self.project_root)
+        is_package = file_path.name == "__init__.py"
+        module = visitor.module_name.removesuffix(".__init__")
+        record = FileRecord(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            module=module if is_package else visitor.module_name,
+            is_package=is_package,
+        )
 
+        try:
+            tree = ast.parse(file_path.read_text(encoding="utf-8"))
         except SyntaxError as e:
             logger.warning(f"Syntax error in {file_path}: {e}")
+            return record
+
+        visitor.visit(tree)
+        record.nodes = visitor.nodes
+        record.edges = visitor.edges
+        return record
+
+    def _analyze_file(self, file_path: Path) -> None:
+        try:
+            record = self._parse_file(file_path, file_path.stat())
+
+            for node in record.nodes:
+                self.dependency_graph.nodes[node.id] = node
+
+            self.dependency_graph.edges.extend(record.edges)
+
         except Exception as e:
             logger.exception(f"Error analyzing {file_path}: {e}")
 
@@ -254,10 +578,10 @@ class DependencyVisitor(ast.NodeVisitor):
             self.edges.append(edge)
 
     def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
-        if node.module:
+        if node.module or node.level:
             for alias in node.names:
                 imported_name = alias.asname or alias.name
-                full_name = f"{node.module}.{alias.name}"
+                full_name = f"{node.module}.{alias.name}" if node.module else alias.name
                 self.imports[imported_name] = full_name
 
                 edge = DependencyEdge(
@@ -269,6 +593,7 @@ class DependencyVisitor(ast.NodeVisitor):
                         "module": node.module,
                         "symbol": alias.name,
                         "alias": alias.asname,
+                        "level": node.level,
                     },
                 )
                 self.edges.append(edge)
@@ -399,6 +724,14 @@ class DependencyVisitor(ast.NodeVisitor):
         return f"module:{self.module_name}"
 
 
+def discover_python_files(project_root: Path) -> list[Path]:
+    return [
+        f
+        for f in project_root.rglob("*.py")
+        if not any(pattern in f.parts for pattern in EXCLUDED_DIRS)
+    ]
+
+
 def analyze_project_dependencies(project_root: str | Path) -> DependencyGraph:
     analyzer = DependencyAnalyzer(Path(project_root))
     return analyzer.analyze_project()
@@ -6,6 +6,7 @@ from pathlib import Path
 
 from crackerjack.errors import ErrorCode, FileError, ResourceError
 from crackerjack.models.protocols import FileSystemInterface
+from crackerjack.services.repo_snapshot import invalidate_repo_snapshots
 
 
 class FileSystemService(FileSystemInterface):
@@ -128,6 +129,7 @@ class FileSystemService(FileSystemInterface):
 
         try:
             path_obj.write_text(content, encoding="utf-8")
+            invalidate_repo_snapshots()
         except PermissionError as e:
             raise FileError(
                 message=f"Permission denied writing file: {path}",
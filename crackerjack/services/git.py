@@ -8,6 +8,7 @@ from pathlib import Path
 from crackerjack.core.console import CrackerjackConsole
 from crackerjack.models.protocols import ConsoleInterface, GitInterface
 
+from .repo_snapshot import RepoSnapshot, invalidate_repo_snapshots
 from .secure_subprocess import execute_secure_subprocess
 from .security_logger import get_security_logger
 
@@ -27,6 +28,10 @@ GIT_COMMANDS = {
     "commits_ahead": ["rev-list", "--count", "@{u}..HEAD"],
 }
 
+INDEX_MUTATING_COMMANDS = frozenset(
+    {"add", "commit", "reset", "checkout", "restore", "rm", "mv", "stash"}
+)
+
 
 class FailedGitResult:
     def __init__(self, command: list[str], error: str) -> None:
@@ -55,6 +60,7 @@ class GitService(GitInterface):
         pkg_path: Path | None = None,
         auth_fallback: bool = True,
         persist_fallback: bool = False,
+        snapshot: RepoSnapshot | None = None,
     ) -> None:
         if isinstance(console, Path) and pkg_path is None:
             pkg_path = console
@@ -65,6 +71,7 @@ class GitService(GitInterface):
         self.pkg_path = pkg_path or Path.cwd()
         self.auth_fallback = auth_fallback
         self.persist_fallback = persist_fallback
+        self.snapshot = snapshot
 
     def _run_git_command(
         self, args: list[str]
@@ -85,6 +92,11 @@ class GitService(GitInterface):
                 command=cmd, exit_code=-1, error_output=str(e)
             )
             return FailedGitResult(cmd, str(e))
+        finally:
+            # After the command, so a snapshot reloaded while it ran is
+            # dropped too.
+            if args and args[0] in INDEX_MUTATING_COMMANDS:
+                invalidate_repo_snapshots()
 
     def is_git_repo(self) -> bool:
         try:
@@ -94,6 +106,8 @@ class GitService(GitInterface):
             return False
 
     def get_changed_files(self) -> list[str]:
+        if self.snapshot is not None:
+            return self.snapshot.changed()
         try:
             staged_result = self._run_git_command(GIT_COMMANDS["staged_files"])
             staged_files = (
@@ -120,6 +134,8 @@ class GitService(GitInterface):
             return []
 
     def get_staged_files(self) -> list[str]:
+        if self.snapshot is not None:
+            return self.snapshot.staged(include_deleted=True)
         try:
             result = self._run_git_command(GIT_COMMANDS["staged_files_simple"])
             return result.stdout.strip().split("\n") if result.stdout.strip() else []
@@ -495,6 +511,12 @@ class GitService(GitInterface):
         include_staged: bool = True,
         include_unstaged: bool = True,
     ) -> list[Path]:
+        if self.snapshot is not None:
+            return self.snapshot.by_extension(
+                extensions,
+                include_staged=include_staged,
+                include_unstaged=include_unstaged,
+            )
         try:
             all_changed: set[str] = set()
             if include_staged:
@@ -565,6 +587,9 @@ class GitService(GitInterface):
             return False
 
     def get_changed_files_since(self, since: str, project_root: Path) -> list[str]:
+        if self.snapshot is not None:
+            files = self.snapshot.changed_since(since, "HEAD") or []
+            return [str(project_root / f) for f in files]
         try:
             result = self._run_git_command(["diff", "--name-only", since, "HEAD"])
             if result.returncode == 0:
@@ -578,6 +603,11 @@ class GitService(GitInterface):
             return []
 
     def get_unstaged_files(self) -> list[str]:
+        if self.snapshot is not None:
+            return [
+                str(self.pkg_path / f)
+                for f in self.snapshot.unstaged(include_deleted=True)
+            ]
         try:
             result = self._run_git_command(["diff", "--name-only"])
             if result.returncode == 0:
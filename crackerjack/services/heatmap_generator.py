@@ -3,15 +3,19 @@ from __future__ import annotations
 import json
 import logging
 import typing as t
-from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from .dependency_analyzer import DependencyGraph
+import numpy as np
+import numpy.typing as npt
+
+from .dependency_analyzer import DependencyAnalyzer
 
 logger = logging.getLogger(__name__)
 
+COMPLEXITY_NODE_TYPES = ("function", "method", "class")
+
 
 @dataclass
 class HeatMapCell:
@@ -55,11 +59,102 @@ class HeatMapData:
         }
 
 
+class ErrorColumns:
+    def __init__(self, capacity: int = 1024) -> None:
+        self.size = 0
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._files = np.empty(capacity, dtype=np.int32)
+        self._types = np.empty(capacity, dtype=np.int32)
+        self._sorted = True
+
+    def append(self, timestamp: float, file_code: int, type_code: int) -> None:
+        if self.size == len(self._timestamps):
+            capacity = max(2 * self.size, 1024)
+            self._timestamps = np.resize(self._timestamps, capacity)
+            self._files = np.resize(self._files, capacity)
+            self._types = np.resize(self._types, capacity)
+        if self.size and timestamp < self._timestamps[self.size - 1]:
+            self._sorted = False
+        self._timestamps[self.size] = timestamp
+        self._files[self.size] = file_code
+        self._types[self.size] = type_code
+        self.size += 1
+
+    def window(
+        self,
+        start: float,
+        end: float | None = None,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int32], npt.NDArray[np.int32]]:
+        self._sort()
+        stamps = self._timestamps[: self.size]
+        lo = int(np.searchsorted(stamps, start, side="left"))
+        hi = (
+            self.size
+            if end is None
+            else int(np.searchsorted(stamps, end, side="right"))
+        )
+        return stamps[lo:hi], self._files[lo:hi], self._types[lo:hi]
+
+    def _sort(self) -> None:
+        # Errors normally arrive in time order; back-filled history is sorted
+        # once, on the next query, rather than on every insert.
+        if self._sorted:
+            return
+        order = np.argsort(self._timestamps[: self.size], kind="stable")
+        self._timestamps[: self.size] = self._timestamps[order]
+        self._files[: self.size] = self._files[order]
+        self._types[: self.size] = self._types[order]
+        self._sorted = True
+
+
+class ComplexityIndex:
+    # Served from the dependency analyzer's per-file records, so the
+    # heat map and the import graph share one parse and one cache.
+    def __init__(self, project_root: Path, cache_dir: Path | None = None) -> None:
+        self.analyzer = DependencyAnalyzer(project_root, cache_dir)
+
+    @property
+    def reparsed_files(self) -> list[str]:
+        return self.analyzer.reparsed_files
+
+    def refresh(self) -> dict[str, list[dict[str, t.Any]]]:
+        file_complexity: dict[str, list[dict[str, t.Any]]] = {}
+        for relative, record in self.analyzer.refresh_file_records().items():
+            nodes = {
+                node.id: node
+                for node in record.nodes
+                if node.type in COMPLEXITY_NODE_TYPES
+            }
+            if nodes:
+                file_complexity[relative] = [
+                    {
+                        "name": node.name,
+                        "complexity": node.complexity,
+                        "type": node.type,
+                        "line": node.line_number,
+                    }
+                    for node in nodes.values()
+                ]
+        return file_complexity
+
+
 class HeatMapGenerator:
     def __init__(self) -> None:
-        self.error_data: dict[str, list[dict[str, t.Any]]] = defaultdict(list)
+        self.error_data: dict[str, list[dict[str, t.Any]]] = {}
         self.metric_data: dict[str, dict[str, t.Any]] = {}
 
+        # Columnar view of error_data, with files and error types coded as
+        # integers when they are first seen, so heat maps are built with
+        # searchsorted/bincount instead of walking every record.
+        self._error_columns = ErrorColumns()
+        self._file_codes: dict[str, int] = {}
+        self._file_names: list[str] = []
+        self._file_is_test: list[bool] = []
+        self._type_codes: dict[str, int] = {}
+        self._error_types: list[str] = []
+        self._type_is_test: list[bool] = []
+        self._complexity_indexes: dict[Path, ComplexityIndex] = {}
+
         self.color_schemes = {
             "error_intensity": {
                 "low": "#90EE90",
@@ -104,7 +199,20 @@ class HeatMapGenerator:
             "metadata": metadata or {},
         }
 
+        file_code = self._file_codes.get(file_path)
+        if file_code is None:
+            file_code = self._file_codes[file_path] = len(self._file_names)
+            self.error_data[file_path] = []
+            self._file_names.append(Path(file_path).name)
+            self._file_is_test.append("test" in file_path.lower())
+        type_code = self._type_codes.get(error_type)
+        if type_code is None:
+            type_code = self._type_codes[error_type] = len(self._error_types)
+            self._error_types.append(error_type)
+            self._type_is_test.append("test" in error_type.lower())
+
         self.error_data[file_path].append(error_record)
+        self._error_columns.append(timestamp.timestamp(), file_code, type_code)
 
     def add_metric_data(
         self,
@@ -127,7 +235,7 @@ class HeatMapGenerator:
         start_time = now - time_window
 
         bucket_config = self._get_time_bucket_config(time_window, granularity)
-        file_paths = list[t.Any](self.error_data.keys())
+        file_paths = list(self._file_codes)
         time_buckets = self._create_time_buckets(start_time, bucket_config)
         error_matrix = self._build_error_matrix(
             start_time,
@@ -198,64 +306,47 @@ class HeatMapGenerator:
         end_time: datetime,
         time_buckets: list[datetime],
         bucket_config: dict[str, t.Any],
-    ) -> dict[str, t.Any]:
-        from collections import defaultdict
-
-        error_matrix: dict[str, t.Any] = defaultdict(
-            lambda: defaultdict(int),  # type: ignore[call-overload]
-        )
-
-        for file_path, errors in self.error_data.items():
-            for error in errors:
-                error_time = error["timestamp"]
-                if start_time <= error_time <= end_time:
-                    bucket_index = self._find_time_bucket_index(
-                        error_time,
-                        start_time,
-                        time_buckets,
-                        bucket_config["size"],
-                    )
-                    error_matrix[file_path][bucket_index] += 1
-
-        return error_matrix
-
-    def _find_time_bucket_index(
-        self,
-        error_time: datetime,
-        start_time: datetime,
-        time_buckets: list[datetime],
-        bucket_size: timedelta,
-    ) -> int:
-        return min(
-            len(time_buckets) - 1,
-            int(
-                (error_time - start_time).total_seconds() / bucket_size.total_seconds(),
-            ),
+    ) -> npt.NDArray[np.int64]:
+        bucket_count = len(time_buckets)
+        file_count = len(self._file_names)
+        if not bucket_count:
+            return np.zeros((file_count, 0), dtype=np.int64)
+
+        start = start_time.timestamp()
+        stamps, files, _ = self._error_columns.window(start, end_time.timestamp())
+        # The last bucket is open-ended up to end_time, like the old
+        # min(count - 1, ...) clamp.
+        edges = start + bucket_config["size"].total_seconds() * np.arange(bucket_count)
+        buckets = np.searchsorted(edges, stamps, side="right") - 1
+        cells = files.astype(np.int64) * bucket_count + buckets
+        return np.bincount(cells, minlength=file_count * bucket_count).reshape(
+            file_count, bucket_count
         )
 
     def _create_frequency_cells(
         self,
         file_paths: list[str],
         time_buckets: list[datetime],
-        error_matrix: dict[str, t.Any],
+        error_matrix: npt.NDArray[np.int64],
     ) -> list[HeatMapCell]:
         cells = []
         max_errors = self._calculate_max_errors(error_matrix)
+        bucket_labels = [bucket.isoformat() for bucket in time_buckets]
 
-        for y, file_path in enumerate(file_paths):
-            for x in range(len(time_buckets)):
-                error_count = error_matrix[file_path][x]
-                intensity = error_count / max_errors
-
+        for y, (file_path, counts) in enumerate(
+            zip(file_paths, error_matrix.tolist(), strict=True)
+        ):
+            name = Path(file_path).name
+            for x, error_count in enumerate(counts):
                 cell = HeatMapCell(
                     x=x,
                     y=y,
                     value=error_count,
-                    label=f"{Path(file_path).name}: {error_count} errors",
-                    color_intensity=intensity,
+                    label=f"{name}: {error_count} errors",
+                    color_intensity=error_count / max_errors,
                     metadata={
                         "file_path": file_path,
-                        "time_bucket": time_buckets[x].isoformat(),
+                        "time_bucket": bucket_labels[x],
                         "error_count": error_count,
                     },
                 )
@@ -273,25 +364,17 @@ class HeatMapGenerator:
         y_labels = [Path(fp).name for fp in file_paths]
         return x_labels, y_labels
 
-    def _calculate_max_errors(self, error_matrix: dict[str, t.Any]) -> int:
-        return (
-            max(
-                max(bucket_counts.values()) if bucket_counts else 0
-                for bucket_counts in error_matrix.values()
-            )
-            or 1
-        )
+    def _calculate_max_errors(self, error_matrix: npt.NDArray[np.int64]) -> int:
+        return int(error_matrix.max(initial=0)) or 1
 
     def generate_code_complexity_heatmap(self, project_root: str | Path) -> HeatMapData:
-        from .dependency_analyzer import analyze_project_dependencies
-
         project_root = Path(project_root)
-        dependency_graph = analyze_project_dependencies(project_root)
-
-        file_complexity = self._extract_file_complexity_data(
-            dependency_graph,
-            project_root,
-        )
+        index = self._complexity_indexes.get(project_root)
+        if index is None:
+            index = self._complexity_indexes[project_root] = ComplexityIndex(
+                project_root
+            )
+        file_complexity = index.refresh()
         cells = self._create_complexity_cells(file_complexity)
         x_labels, y_labels = self._create_complexity_labels(file_complexity, cells)
         max_complexity = self._calculate_max_complexity(file_complexity)
@@ -309,26 +392,6 @@ class HeatMapGenerator:
             },
         )
 
-    def _extract_file_complexity_data(
-        self,
-        dependency_graph: DependencyGraph,
-        project_root: Path,
-    ) -> dict[str, t.Any]:
-        file_complexity = defaultdict(list)
-
-        for node in dependency_graph.nodes.values():
-            if node.type in ("function", "method", "class"):
-                relative_path = str(Path(node.file_path).relative_to(project_root))
-                file_complexity[relative_path].append(
-                    {
-                        "name": node.name,
-                        "complexity": node.complexity,
-                        "type": node.type,
-                        "line": node.line_number,
-                    },
-                )
-        return file_complexity
-
     def _create_complexity_cells(
         self,
         file_complexity: dict[str, t.Any],
@@ -519,11 +582,10 @@ class HeatMapGenerator:
         self,
         time_window: timedelta = timedelta(days=14),
     ) -> HeatMapData:
-        test_errors = self._filter_test_errors(time_window)
-        test_matrix = self._group_test_errors_by_matrix(test_errors)
-        test_files = list[t.Any](test_matrix.keys())
-        error_types = self._collect_error_types(test_matrix)
-        max_failures = self._calculate_max_test_failures(test_matrix)
+        test_files, error_types, test_matrix = self._build_test_failure_matrix(
+            time_window
+        )
+        max_failures = int(test_matrix.max(initial=0)) or 1
         cells = self._create_test_failure_cells(
             test_matrix,
             test_files,
@@ -546,79 +608,55 @@ class HeatMapGenerator:
             metadata=metadata,
         )
 
-    def _filter_test_errors(self, time_window: timedelta) -> list[dict[str, t.Any]]:
-        test_errors: list[dict[str, t.Any]] = []
-        now = datetime.now()
-        start_time = now - time_window
-
-        for file_path, errors in self.error_data.items():
-            for error in errors:
-                if error["timestamp"] >= start_time and (
-                    "test" in error["error_type"].lower() or "test" in file_path.lower()
-                ):
-                    test_errors.append(error | {"file_path": file_path})
-        return test_errors
-
-    def _group_test_errors_by_matrix(
+    def _build_test_failure_matrix(
         self,
-        test_errors: list[dict[str, t.Any]],
-    ) -> defaultdict[str, defaultdict[str, int]]:
-        from collections import defaultdict as dd
-
-        def make_inner_defaultdict() -> defaultdict[str, int]:
-            return dd(int)
+        time_window: timedelta,
+    ) -> tuple[list[str], list[str], npt.NDArray[np.int64]]:
+        start_time = datetime.now() - time_window
+        _, files, types = self._error_columns.window(start_time.timestamp())
 
-        test_matrix: defaultdict[str, defaultdict[str, int]] = defaultdict(
-            make_inner_defaultdict,
+        is_test = (
+            np.array(self._file_is_test, dtype=bool)[files]
+            | np.array(self._type_is_test, dtype=bool)[types]
         )
+        files, types = files[is_test], types[is_test]
 
-        for error in test_errors:
-            file_name = Path(error["file_path"]).name
-            error_type = error["error_type"]
-            test_matrix[file_name][error_type] += 1
+        # Rows are file names (so same-named files share a row) in the order
+        # their files were first seen; columns are error types by name.
+        rows: dict[str, int] = {}
+        row_of_file = np.zeros(len(self._file_names), dtype=np.int64)
+        for code in np.unique(files).tolist():
+            row_of_file[code] = rows.setdefault(self._file_names[code], len(rows))
 
-        return test_matrix
+        error_types = sorted(self._error_types[code] for code in np.unique(types))
+        column_of_type = np.zeros(len(self._error_types), dtype=np.int64)
+        for column, error_type in enumerate(error_types):
+            column_of_type[self._type_codes[error_type]] = column
 
-    def _collect_error_types(
-        self,
-        test_matrix: defaultdict[str, defaultdict[str, int]],
-    ) -> list[str]:
-        all_error_types: set[str] = set()
-        for error_types in test_matrix.values():
-            all_error_types.update(error_types.keys())
-        return list[t.Any](all_error_types)
-
-    def _calculate_max_test_failures(
-        self,
-        test_matrix: defaultdict[str, defaultdict[str, int]],
-    ) -> int:
-        return (
-            max(
-                max(error_counts.values()) if error_counts else 0
-                for error_counts in test_matrix.values()
-            )
-            or 1
-        )
+        cells = row_of_file[files] * len(error_types) + column_of_type[types]
+        matrix = np.bincount(cells, minlength=len(rows) * len(error_types))
+        return list(rows), error_types, matrix.reshape(len(rows), len(error_types))
 
     def _create_test_failure_cells(
         self,
-        test_matrix: defaultdict[str, defaultdict[str, int]],
+        test_matrix: npt.NDArray[np.int64],
         test_files: list[str],
         error_types: list[str],
         max_failures: int,
     ) -> list[HeatMapCell]:
         cells = []
-        for y, test_file in enumerate(test_files):
-            for x, error_type in enumerate(error_types):
-                failure_count = test_matrix[test_file][error_type]
-                intensity = failure_count / max_failures
-
+        for y, (test_file, counts) in enumerate(
+            zip(test_files, test_matrix.tolist(), strict=True)
+        ):
+            for x, (error_type, failure_count) in enumerate(
+                zip(error_types, counts, strict=True)
+            ):
                 cell = HeatMapCell(
                     x=x,
                     y=y,
                     value=failure_count,
                     label=f"{test_file}: {error_type} ({failure_count} failures)",
-                    color_intensity=intensity,
+                    color_intensity=failure_count / max_failures,
                     metadata={
                         "test_file": test_file,
                         "error_type": error_type,
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import logging
-import subprocess
 import typing as t
 from datetime import datetime
 from pathlib import Path
 
+from crackerjack.services.repo_snapshot import get_repo_snapshot
+
 logger = logging.getLogger(__name__)
 
 ScanStrategy = t.Literal["incremental", "full"]
@@ -40,31 +41,14 @@ class IncrementalScanner:
         return "full", self._get_all_python_files()
 
     def _get_changed_files_git(self) -> list[Path] | None:
-        try:
-            result = subprocess.run(
-                ["git", "diff", "--name-only", "HEAD~1", "HEAD"],
-                capture_output=True,
-                text=True,
-                cwd=self.repo_path,
-                check=False,
-            )
-
-            if result.returncode != 0:
-                logger.debug(f"Git diff failed: {result.stderr.strip()}")
-                return None
-
-            changed_files = [
-                self.repo_path / f
-                for f in result.stdout.strip().split("\n")
-                if f and f.endswith(".py")
-            ]
-
-            return changed_files or None
-
-        except (subprocess.SubprocessError, FileNotFoundError, OSError) as e:
-            logger.debug(f"Git unavailable: {e}")
+        snapshot = get_repo_snapshot(self.repo_path)
+        files = snapshot.changed_since(snapshot.base_ref, "HEAD")
+        if files is None:
             return None
 
+        changed_files = [self.repo_path / f for f in files if f.endswith(".py")]
+        return changed_files or None
+
     def _should_force_full_scan(self, tool_name: str) -> bool:
         marker_file = self.repo_path / ".crackerjack" / f"{tool_name}_last_full.txt"
 
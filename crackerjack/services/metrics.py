@@ -1,25 +1,47 @@
 from __future__ import annotations
 
+import atexit
+import logging
 import sqlite3
 import threading
-from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 
+from crackerjack.services.sqlite_batch_writer import SQLiteBatchWriter
+
+logger = logging.getLogger(__name__)
+
 
 class MetricsCollector:
-    def __init__(self, db_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        batch_size: int = 256,
+        flush_interval_ms: float = 50.0,
+    ) -> None:
         if db_path is None:
             db_dir = Path.home() / ".cache" / "crackerjack"
             db_dir.mkdir(parents=True, exist_ok=True)
             db_path = db_dir / "metrics.db"
 
         self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval_ms) / 1000.0
         self._lock = threading.Lock()
+
+        self._write_conn = self._connect()
         self._init_database()
+        self._read_conn = self._connect()
+
+        self._writer = SQLiteBatchWriter(
+            self._write_conn,
+            name="metrics",
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+        )
 
     def _init_database(self) -> None:
-        with self._get_connection() as conn:
+        with self._write_conn as conn:
             conn.executescript("""
                 -- Agent executions table
                 CREATE TABLE IF NOT EXISTS agent_executions (
@@ -63,26 +85,24 @@ class MetricsCollector:
                 CREATE INDEX IF NOT EXISTS idx_provider_performance_provider_id ON provider_performance(provider_id);
             """)
 
-    @contextmanager
-    def _get_connection(self):
+    def _connect(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
 
     def execute(self, sql: str, params: tuple = ()) -> None:
-        with self._lock, self._get_connection() as conn:
-            conn.execute(sql, params)
+        if not self._writer.put(sql, params):
+            raise RuntimeError("MetricsCollector is closed")
+
+    def flush(self) -> None:
+        self._writer.flush()
 
     def execute_query(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
-        with self._lock, self._get_connection() as conn:
-            cursor = conn.execute(sql, params)
+        self.flush()
+        with self._lock:
+            cursor = self._read_conn.execute(sql, params)
             return cursor.fetchall()
 
     def track_provider_selection(
@@ -239,7 +259,12 @@ class MetricsCollector:
         return distribution
 
     def close(self) -> None:
-        pass
+        if self._writer.closed:
+            return
+        self._writer.close()
+        with self._lock:
+            self._write_conn.close()
+            self._read_conn.close()
 
 
 _metrics_collector: MetricsCollector | None = None
@@ -257,3 +282,7 @@ def reset_metrics() -> None:
     if _metrics_collector is not None:
         _metrics_collector.close()
     _metrics_collector = None
+
+
+# The writer is a daemon thread; drain it before the interpreter exits.
+atexit.register(reset_metrics)
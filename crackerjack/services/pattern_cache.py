@@ -1,14 +1,42 @@
 from __future__ import annotations
 
+import atexit
+import heapq
 import json
 import logging
+import os
+import re
 import time
 import typing as t
+import weakref
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
 from crackerjack.models.issues import FixResult, Issue, IssueType
 
+_QUOTED = re.compile(r"""(['"`]).*?\1""")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SPACE = re.compile(r"\s+")
+
+
+# No owner in the tree closes its cache, so whatever is still unsaved is
+# written when the interpreter exits.
+_live_caches: weakref.WeakSet[PatternCache] = weakref.WeakSet()
+
+
+def _flush_live_caches() -> None:
+    for cache in list(_live_caches):
+        cache.flush()
+
+
+atexit.register(_flush_live_caches)
+
+
+def message_signature(message: str) -> str:
+    signature = _QUOTED.sub("X", message.lower())
+    signature = _NUMBER.sub("N", signature)
+    return _SPACE.sub(" ", signature).strip()
+
 
 @dataclass
 class CachedPattern:
@@ -25,18 +53,122 @@ class CachedPattern:
     fixes_applied: list[str]
     metadata: dict[str, t.Any]
 
+    @property
+    def signature(self) -> str:
+        return message_signature(str(self.metadata.get("issue_message") or ""))
+
+    @property
+    def rank(self) -> tuple[float, float]:
+        return (self.success_rate, self.confidence)
+
+    @property
+    def retention(self) -> tuple[int, float]:
+        return (self.usage_count, self.last_used or self.created_at)
+
+
+def _discard[K](
+    index: dict[K, dict[str, CachedPattern]], key: K, pattern_id: str
+) -> None:
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.pop(pattern_id, None)
+        if not bucket:
+            del index[key]
+
 
 class PatternCache:
-    def __init__(self, project_path: Path) -> None:
+    def __init__(
+        self,
+        project_path: Path,
+        max_patterns: int = 500,
+        flush_interval: float = 30.0,
+    ) -> None:
         self.project_path = project_path
         self.cache_dir = project_path / ".crackerjack" / "patterns"
         self.cache_file = self.cache_dir / "pattern_cache.json"
         self.logger = logging.getLogger(__name__)
+        self.max_patterns = max_patterns
+        self.flush_interval = flush_interval
 
         self._patterns: dict[str, CachedPattern] = {}
+        self._by_type: dict[IssueType, dict[str, CachedPattern]] = {}
+        self._by_signature: dict[tuple[IssueType, str], dict[str, CachedPattern]] = {}
+        self._ranked: dict[t.Hashable, list[CachedPattern]] = {}
         self._loaded = False
+        self._dirty = False
+        self._last_flush = time.monotonic()
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        _live_caches.add(self)
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def _add(self, pattern: CachedPattern) -> None:
+        if pattern.pattern_id in self._patterns:
+            self._remove(pattern.pattern_id)
+        self._patterns[pattern.pattern_id] = pattern
+        self._by_type.setdefault(pattern.issue_type, {})[pattern.pattern_id] = pattern
+        signature_key = (pattern.issue_type, pattern.signature)
+        self._by_signature.setdefault(signature_key, {})[pattern.pattern_id] = pattern
+        self._invalidate(pattern)
+
+    def _remove(self, pattern_id: str) -> None:
+        pattern = self._patterns.pop(pattern_id)
+        _discard(self._by_type, pattern.issue_type, pattern_id)
+        _discard(
+            self._by_signature, (pattern.issue_type, pattern.signature), pattern_id
+        )
+        self._invalidate(pattern)
+
+    def _invalidate(self, pattern: CachedPattern) -> None:
+        self._ranked.pop(pattern.issue_type, None)
+        self._ranked.pop((pattern.issue_type, pattern.signature), None)
+
+    def _ranked_bucket(
+        self,
+        key: t.Hashable,
+        bucket: dict[str, CachedPattern] | None,
+    ) -> list[CachedPattern]:
+        if not bucket:
+            return []
+        ranked = self._ranked.get(key)
+        if ranked is None:
+            ranked = sorted(bucket.values(), key=lambda p: p.rank, reverse=True)
+            self._ranked[key] = ranked
+        return ranked
+
+    def _evict(self, keep: str | None = None) -> int:
+        excess = len(self._patterns) - self.max_patterns
+        if excess <= 0:
+            return 0
+        candidates = (p for p in self._patterns.values() if p.pattern_id != keep)
+        victims = heapq.nsmallest(excess, candidates, key=lambda p: p.retention)
+        for pattern in victims:
+            self._remove(pattern.pattern_id)
+        self.logger.debug(f"Evicted {len(victims)} least used patterns")
+        return len(victims)
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> bool:
+        if not self._dirty:
+            return False
+        self._last_flush = time.monotonic()
+        if not self._save_patterns():
+            return False
+        self._dirty = False
+        return True
 
     def _load_patterns(self) -> None:
         if self._loaded:
@@ -62,8 +194,9 @@ class PatternCache:
                         fixes_applied=pattern_data["fixes_applied"],
                         metadata=pattern_data.get("metadata", {}),
                     )
-                    self._patterns[pattern.pattern_id] = pattern
+                    self._add(pattern)
 
+                self._evict()
                 self.logger.info(f"Loaded {len(self._patterns)} cached patterns")
             else:
                 self.logger.info("No existing pattern cache found")
@@ -73,7 +206,7 @@ class PatternCache:
 
         self._loaded = True
 
-    def _save_patterns(self) -> None:
+    def _save_patterns(self) -> bool:
         try:
             data = {
                 "version": "1.0",
@@ -84,13 +217,17 @@ class PatternCache:
                 ],
             }
 
-            with self.cache_file.open("w") as f:
+            tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+            with tmp_file.open("w") as f:
                 json.dump(data, f, indent=2)
+            os.replace(tmp_file, self.cache_file)
 
             self.logger.debug(f"Saved {len(self._patterns)} patterns to cache")
+            return True
 
         except Exception as e:
             self.logger.exception(f"Failed to save pattern cache: {e}")
+            return False
 
     def cache_successful_pattern(
         self,
@@ -128,8 +265,9 @@ class PatternCache:
             },
         )
 
-        self._patterns[pattern_id] = cached_pattern
-        self._save_patterns()
+        self._add(cached_pattern)
+        self._evict(keep=pattern_id)
+        self._mark_dirty()
 
         self.logger.info(f"Cached successful pattern: {pattern_id}")
         return pattern_id
@@ -137,26 +275,25 @@ class PatternCache:
     def get_patterns_for_issue(self, issue: Issue) -> list[CachedPattern]:
         self._load_patterns()
 
-        matching_patterns = [
-            pattern
-            for pattern in self._patterns.values()
-            if pattern.issue_type == issue.type
-        ]
-
-        matching_patterns.sort(
-            key=lambda p: (p.success_rate, p.confidence),
-            reverse=True,
-        )
+        same_message = self._signature_matches(issue)
+        by_type = self._ranked_bucket(issue.type, self._by_type.get(issue.type))
+        if not same_message:
+            return list(by_type)
 
-        return matching_patterns
+        seen = {p.pattern_id for p in same_message}
+        return same_message + [p for p in by_type if p.pattern_id not in seen]
 
     def get_best_pattern_for_issue(self, issue: Issue) -> CachedPattern | None:
-        patterns = self.get_patterns_for_issue(issue)
+        self._load_patterns()
 
-        if not patterns:
-            return None
+        patterns = self._signature_matches(issue) or self._ranked_bucket(
+            issue.type, self._by_type.get(issue.type)
+        )
+        return patterns[0] if patterns else None
 
-        return patterns[0]
+    def _signature_matches(self, issue: Issue) -> list[CachedPattern]:
+        key = (issue.type, message_signature(issue.message))
+        return self._ranked_bucket(key, self._by_signature.get(key))
 
     def use_pattern(self, pattern_id: str) -> bool:
         self._load_patterns()
@@ -168,7 +305,7 @@ class PatternCache:
         pattern.usage_count += 1
         pattern.last_used = time.time()
 
-        self._save_patterns()
+        self._mark_dirty()
         self.logger.debug(
             f"Used pattern {pattern_id} (usage count: {pattern.usage_count})",
         )
@@ -185,12 +322,14 @@ class PatternCache:
 
         total_uses = pattern.usage_count
         if total_uses > 0:
-            current_successes = pattern.success_rate * total_uses
+            previous_uses = max(total_uses - 1, 0)
+            current_successes = pattern.success_rate * previous_uses
             if success:
                 current_successes += 1
             pattern.success_rate = current_successes / total_uses
+            self._invalidate(pattern)
 
-        self._save_patterns()
+        self._mark_dirty()
         self.logger.debug(
             f"Updated pattern {pattern_id} success rate: {pattern.success_rate:.2f}",
         )
@@ -219,6 +358,7 @@ class PatternCache:
             "total_usage": total_usage,
             "average_success_rate": avg_success_rate,
             "cache_file": str(self.cache_file),
+            "pending_flush": self._dirty,
             "most_used_patterns": self._get_most_used_patterns(),
         }
 
@@ -260,17 +400,21 @@ class PatternCache:
         ]
 
         for pattern_id in patterns_to_remove:
-            del self._patterns[pattern_id]
+            self._remove(pattern_id)
 
         if patterns_to_remove:
-            self._save_patterns()
+            self._mark_dirty()
             self.logger.info(f"Cleaned up {len(patterns_to_remove)} old patterns")
 
         return len(patterns_to_remove)
 
     def clear_cache(self) -> None:
         self._patterns.clear()
+        self._by_type.clear()
+        self._by_signature.clear()
+        self._ranked.clear()
         self._loaded = False
+        self._dirty = False
 
         if self.cache_file.exists():
             self.cache_file.unlink()
@@ -304,6 +448,8 @@ class PatternCache:
             return False
 
     def import_patterns(self, import_path: Path, merge: bool = True) -> bool:
+        self._load_patterns()
+
         try:
             with import_path.open() as f:
                 data = json.load(f)
@@ -327,11 +473,12 @@ class PatternCache:
                 )
 
                 if not merge or pattern.pattern_id not in self._patterns:
-                    self._patterns[pattern.pattern_id] = pattern
+                    self._add(pattern)
                     imported_count += 1
 
             if imported_count > 0:
-                self._save_patterns()
+                self._evict()
+                self._mark_dirty()
                 self.logger.info(
                     f"Imported {imported_count} patterns from {import_path}",
                 )
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from multiprocessing.context import BaseContext
+
+
+def resolve_worker_count(item_count: int, max_workers: int, threshold: int) -> int:
+    # Below the threshold a process pool costs more than it saves.
+    if item_count < max(2, threshold):
+        return 1
+    workers = max_workers or os.cpu_count() or 1
+    return max(1, min(workers, item_count))
+
+
+def shard_items[T](items: list[T], workers: int) -> list[list[T]]:
+    # A few contiguous shards per worker keep the load balanced while
+    # results can still be stitched back together in input order.
+    shard_count = min(len(items), workers * 4)
+    if not shard_count:
+        return []
+    size, remainder = divmod(len(items), shard_count)
+    shards: list[list[T]] = []
+    start = 0
+    for index in range(shard_count):
+        end = start + size + (1 if index < remainder else 0)
+        shards.append(items[start:end])
+        start = end
+    return shards
+
+
+def process_context() -> BaseContext:
+    # Never fork: workers would inherit this process's threads and locks.
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
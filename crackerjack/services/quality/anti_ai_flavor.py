@@ -3,8 +3,10 @@ from __future__ import annotations
 import importlib
 import re
 import typing as t
+from bisect import bisect_right
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 DEFAULT_PHRASES: tuple[str, ...] = (
@@ -48,6 +50,39 @@ class AntiAIFlavorMatch:
 WhitelistEntry = str | Callable[[str, str], bool]
 
 
+def _fold(text: str) -> str:
+    # Same folding as re.IGNORECASE, without the one character whose
+    # lowercase form is longer and would shift match offsets.
+    return text.replace("\u0130", "i").lower()
+
+
+@dataclass(frozen=True)
+class _PhraseMatcher:
+    pattern: re.Pattern[str] | None
+    # Matched text -> indices of every phrase that can match there: the phrase
+    # itself and any phrases that are its prefixes.
+    candidates: dict[str, tuple[int, ...]]
+    bounded: dict[int, re.Pattern[str]]
+
+
+@lru_cache(maxsize=32)
+def _build_matcher(phrases: tuple[str, ...], active: frozenset[int]) -> _PhraseMatcher:
+    if not active:
+        return _PhraseMatcher(None, {}, {})
+
+    # Longest alternatives first, so a hit is the longest phrase starting at
+    # that position. Word boundaries are checked per hit rather than inside
+    # the alternation, which keeps the scan over the document a literal search.
+    texts = sorted({phrases[i] for i in active}, key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(text) for text in texts))
+    candidates = {
+        text: tuple(i for i in sorted(active) if text.startswith(phrases[i]))
+        for text in texts
+    }
+    bounded = {i: re.compile(rf"\b{re.escape(phrases[i])}\b") for i in active}
+    return _PhraseMatcher(pattern, candidates, bounded)
+
+
 class AntiAIFlavorDetector:
     def __init__(
         self,
@@ -69,37 +104,62 @@ class AntiAIFlavorDetector:
             self.whitelist = tuple(whitelist)
         self.case_sensitive = case_sensitive
 
-        flags = 0 if case_sensitive else re.IGNORECASE
-
-        self._patterns: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
-            (phrase, re.compile(rf"\b{re.escape(phrase)}\b", flags))
-            for phrase in self.phrases
+        ignored = {entry for entry in self.whitelist if isinstance(entry, str)}
+        self._checks: tuple[Callable[[str, str], bool], ...] = tuple(
+            entry for entry in self.whitelist if not isinstance(entry, str)
+        )
+        # Case-insensitive scans run over a folded copy of the text, which is
+        # much faster than an IGNORECASE alternation.
+        self._matcher = _build_matcher(
+            self.phrases
+            if case_sensitive
+            else tuple(_fold(phrase) for phrase in self.phrases),
+            frozenset(
+                i for i, phrase in enumerate(self.phrases) if phrase not in ignored
+            ),
         )
 
     def detect(self, text: str) -> list[AntiAIFlavorMatch]:
-        matches: list[AntiAIFlavorMatch] = []
-        for line_num, line_text in enumerate(text.splitlines(), start=1):
-            for phrase, pattern in self._patterns:
-                for m in pattern.finditer(line_text):
-                    if self._is_whitelisted(phrase, line_text):
-                        continue
-                    matches.append(
-                        AntiAIFlavorMatch(
-                            phrase=phrase,
-                            line=line_num,
-                            column=m.start() + 1,
-                        )
-                    )
-        return matches
+        matcher = self._matcher
+        if matcher.pattern is None:
+            return []
+        haystack = text if self.case_sensitive else _fold(text)
+
+        lines = text.splitlines()
+        line_starts = [0]
+        for line_with_end in text.splitlines(keepends=True):
+            line_starts.append(line_starts[-1] + len(line_with_end))
+
+        found: list[tuple[int, int, int]] = []
+        # Where each phrase's last hit ended: like finditer, a phrase never
+        # reports a hit overlapping its previous one.
+        ends: dict[int, int] = {}
+        pos = 0
+        while m := matcher.pattern.search(haystack, pos):
+            start = m.start()
+            pos = start + 1
+            line_index = bisect_right(line_starts, start) - 1
+            line_end = line_starts[line_index] + len(lines[line_index])
+            for index in matcher.candidates[m.group()]:
+                if start < ends.get(index, 0):
+                    continue
+                hit = matcher.bounded[index].match(haystack, start)
+                if hit is None or hit.end() > line_end:
+                    continue
+                ends[index] = hit.end()
+                if self._is_whitelisted(self.phrases[index], lines[line_index]):
+                    continue
+                found.append((line_index + 1, index, start - line_starts[line_index]))
+
+        # Report in the same order as a per-line, per-phrase scan.
+        found.sort()
+        return [
+            AntiAIFlavorMatch(phrase=self.phrases[index], line=line, column=column + 1)
+            for line, index, column in found
+        ]
 
     def _is_whitelisted(self, phrase: str, line_text: str) -> bool:
-        for entry in self.whitelist:
-            if isinstance(entry, str):
-                if entry == phrase:
-                    return True
-            elif callable(entry) and entry(phrase, line_text):
-                return True
-        return False
+        return any(check(phrase, line_text) for check in self._checks)
 
     @staticmethod
     def load_phrases_from_yaml(path: Path) -> tuple[str, ...]:
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import logging
+import subprocess
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CHANGE_CODES: frozenset[str] = frozenset("ACMRT")
+DEFAULT_BASE_REF = "HEAD~1"
+
+
+@dataclass(frozen=True)
+class FileStatus:
+    path: str
+    index: str
+    worktree: str
+    original_path: str | None = None
+
+    @property
+    def is_untracked(self) -> bool:
+        return self.index == "?"
+
+    def is_staged(self, include_deleted: bool = False) -> bool:
+        if self.is_untracked or self.index == ".":
+            return False
+        return include_deleted or self.index in CHANGE_CODES
+
+    def is_unstaged(self, include_deleted: bool = False) -> bool:
+        if self.is_untracked or self.worktree == ".":
+            return False
+        return include_deleted or self.worktree in CHANGE_CODES
+
+
+def parse_porcelain_v2(output: str) -> list[FileStatus]:
+    entries: list[FileStatus] = []
+    tokens = iter(output.split("\0"))
+    for token in tokens:
+        if not token:
+            continue
+        kind = token[0]
+        if kind == "?":
+            entries.append(FileStatus(path=token[2:], index="?", worktree="?"))
+        elif kind == "1":
+            fields = token.split(" ", 8)
+            entries.append(FileStatus(fields[8], fields[1][0], fields[1][1]))
+        elif kind == "2":
+            fields = token.split(" ", 9)
+            entries.append(
+                FileStatus(
+                    fields[9],
+                    fields[1][0],
+                    fields[1][1],
+                    original_path=next(tokens, None),
+                )
+            )
+        elif kind == "u":
+            fields = token.split(" ", 10)
+            entries.append(FileStatus(fields[10], "U", "U"))
+    return entries
+
+
+class RepoSnapshot:
+    def __init__(
+        self,
+        repo_path: Path,
+        base_ref: str = DEFAULT_BASE_REF,
+        timeout: int = 60,
+    ) -> None:
+        self.repo_path = Path(repo_path)
+        self.base_ref = base_ref
+        self.timeout = timeout
+        self._lock = threading.RLock()
+        self._status: list[FileStatus] | None = None
+        self._diffs: dict[tuple[str, str | None], list[str]] = {}
+        self.git_calls = 0
+
+    def refresh(self) -> None:
+        with self._lock:
+            self.invalidate()
+            self._load_status()
+            self.changed_since(self.base_ref, "HEAD")
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._status = None
+            self._diffs.clear()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._status is not None
+
+    def entries(self) -> list[FileStatus]:
+        with self._lock:
+            if self._status is None:
+                self._load_status()
+            return list(self._status or [])
+
+    def staged(self, include_deleted: bool = False) -> list[str]:
+        return [e.path for e in self.entries() if e.is_staged(include_deleted)]
+
+    def unstaged(self, include_deleted: bool = False) -> list[str]:
+        return [e.path for e in self.entries() if e.is_unstaged(include_deleted)]
+
+    def untracked(self) -> list[str]:
+        return [e.path for e in self.entries() if e.is_untracked]
+
+    def changed(self) -> list[str]:
+        return [
+            e.path
+            for e in self.entries()
+            if e.is_untracked or e.is_staged() or e.is_unstaged()
+        ]
+
+    def by_extension(
+        self,
+        extensions: Iterable[str],
+        include_staged: bool = True,
+        include_unstaged: bool = True,
+        include_untracked: bool = False,
+    ) -> list[Path]:
+        suffixes = tuple(extensions)
+        files = [
+            self.repo_path / e.path
+            for e in self.entries()
+            if e.path.endswith(suffixes)
+            and (
+                (include_staged and e.is_staged())
+                or (include_unstaged and e.is_unstaged())
+                or (include_untracked and e.is_untracked)
+            )
+        ]
+        return [f for f in files if f.exists()]
+
+    def changed_since(self, ref: str, until: str | None = None) -> list[str] | None:
+        if ref == "HEAD" and until is None:
+            # Working tree against HEAD is exactly what the status lists.
+            return [
+                e.path
+                for e in self.entries()
+                if e.is_staged(include_deleted=True)
+                or e.is_unstaged(include_deleted=True)
+            ]
+
+        key = (ref, until)
+        with self._lock:
+            if key in self._diffs:
+                return list(self._diffs[key])
+
+            args = ["-c", "core.quotePath=false", "diff", "--name-only", ref]
+            if until:
+                args.append(until)
+            result = self._run_git(args)
+            if result is None:
+                return None
+
+            files = [name for name in result.splitlines() if name]
+            self._diffs[key] = files
+            return list(files)
+
+    def _load_status(self) -> None:
+        output = self._run_git(
+            ["status", "--porcelain=v2", "-z", "--untracked-files=all"]
+        )
+        self._status = parse_porcelain_v2(output) if output is not None else []
+
+    def _run_git(self, args: list[str]) -> str | None:
+        self.git_calls += 1
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+                check=False,
+            )
+        except (subprocess.SubprocessError, FileNotFoundError, OSError) as e:
+            logger.debug(f"git {' '.join(args)} unavailable: {e}")
+            return None
+
+        if result.returncode != 0:
+            logger.debug(
+                f"git {' '.join(args)} failed: {(result.stderr or '').strip()}"
+            )
+            return None
+        return result.stdout
+
+
+_snapshots: dict[Path, RepoSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def get_repo_snapshot(
+    repo_path: Path | None = None, base_ref: str | None = None
+) -> RepoSnapshot:
+    key = Path(repo_path or Path.cwd()).resolve()
+    with _snapshots_lock:
+        snapshot = _snapshots.get(key)
+        if snapshot is None:
+            snapshot = RepoSnapshot(key, base_ref=base_ref or DEFAULT_BASE_REF)
+            _snapshots[key] = snapshot
+        elif base_ref is not None:
+            snapshot.base_ref = base_ref
+        return snapshot
+
+
+def invalidate_repo_snapshots() -> None:
+    with _snapshots_lock:
+        snapshots = list(_snapshots.values())
+    for snapshot in snapshots:
+        snapshot.invalidate()
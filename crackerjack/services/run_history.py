@@ -0,0 +1,472 @@
+from __future__ import annotations
+
+import importlib.metadata
+import itertools
+import logging
+import sqlite3
+import threading
+import time
+import typing as t
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+import numpy.typing as npt
+
+if t.TYPE_CHECKING:
+    from crackerjack.config.hooks import HookStrategy
+    from crackerjack.executors.hook_executor import HookExecutionResult
+    from crackerjack.models.task import HookResult
+
+logger = logging.getLogger(__name__)
+
+HOOK = "hook"
+BATCH = "batch"
+PHASE = "phase"
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0)
+SAMPLE_COLUMNS = frozenset({"duration", "cpu_seconds", "peak_rss_mb"})
+PASSING_STATUSES = ("passed", "skipped")
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS runs (
+        run_id TEXT PRIMARY KEY,
+        started_at REAL NOT NULL,
+        finished_at REAL,
+        success INTEGER
+    );
+
+    CREATE TABLE IF NOT EXISTS samples (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_id TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        name TEXT NOT NULL,
+        tool_version TEXT,
+        status TEXT NOT NULL,
+        exit_code INTEGER,
+        duration REAL NOT NULL,
+        cpu_seconds REAL,
+        peak_rss_mb REAL,
+        cache_hit INTEGER,
+        files INTEGER NOT NULL DEFAULT 0,
+        recorded_at REAL NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_runs_started_at ON runs(started_at);
+    CREATE INDEX IF NOT EXISTS idx_samples_run_id ON samples(run_id);
+    CREATE INDEX IF NOT EXISTS idx_samples_kind_name
+        ON samples(kind, name, recorded_at);
+"""
+
+_SAMPLE_INSERT = """
+    INSERT INTO samples
+    (run_id, kind, name, tool_version, status, exit_code, duration,
+     cpu_seconds, peak_rss_mb, cache_hit, files, recorded_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+@dataclass
+class RunSample:
+    kind: str
+    name: str
+    duration: float
+    status: str = "passed"
+    exit_code: int | None = None
+    cpu_seconds: float | None = None
+    peak_rss_mb: float | None = None
+    cache_hit: bool | None = None
+    files: int = 0
+    tool_version: str | None = None
+    recorded_at: float = field(default_factory=time.time)
+
+    def row(self, run_id: str) -> tuple[t.Any, ...]:
+        return (
+            run_id,
+            self.kind,
+            self.name,
+            self.tool_version,
+            self.status,
+            self.exit_code,
+            self.duration,
+            self.cpu_seconds,
+            self.peak_rss_mb,
+            None if self.cache_hit is None else int(self.cache_hit),
+            self.files,
+            self.recorded_at,
+        )
+
+
+@dataclass
+class VersionRegression:
+    name: str
+    kind: str
+    previous_version: str
+    version: str
+    previous_median: float
+    median: float
+    samples: int
+
+    @property
+    def ratio(self) -> float:
+        return self.median / self.previous_median if self.previous_median else 0.0
+
+
+def tool_version(command: Sequence[str]) -> str | None:
+    name = _tool_name(command)
+    return _distribution_version(name) if name else None
+
+
+def _tool_name(command: Sequence[str]) -> str | None:
+    args = list(command)
+    if len(args) > 2 and Path(args[0]).name == "uv" and args[1] == "run":
+        args = args[2:]
+    if len(args) > 2 and args[1] == "-m":
+        return args[2].split(".", 1)[0]
+    return Path(args[0]).name if args else None
+
+
+@lru_cache(maxsize=128)
+def _distribution_version(name: str) -> str | None:
+    try:
+        return importlib.metadata.version(name)
+    except (importlib.metadata.PackageNotFoundError, ValueError):
+        return None
+
+
+class RunHistory:
+    def __init__(self, db_path: Path | None = None, retention_days: int = 90) -> None:
+        if db_path is None:
+            db_path = Path.cwd() / ".crackerjack" / "cache" / "run_history.db"
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.db_path = db_path
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._pending: list[tuple[t.Any, ...]] = []
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn as conn:
+            conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def start_run(self, started_at: float | None = None) -> RunRecorder:
+        run_id = uuid4().hex
+        started_at = time.time() if started_at is None else started_at
+        with self._lock, self._conn as conn:
+            conn.execute(
+                "INSERT INTO runs (run_id, started_at) VALUES (?, ?)",
+                (run_id, started_at),
+            )
+        self.prune(now=started_at)
+        return RunRecorder(self, run_id)
+
+    def record(self, run_id: str, sample: RunSample) -> None:
+        # Samples arrive from hook worker threads; they are written in one
+        # transaction when a phase finishes rather than one commit per hook.
+        with self._lock:
+            self._pending.append(sample.row(run_id))
+
+    def finish_phase(self, run_id: str, success: bool) -> None:
+        with self._lock, self._conn as conn:
+            conn.execute(
+                "UPDATE runs SET finished_at = ?, "
+                "success = COALESCE(success, 1) AND ? WHERE run_id = ?",
+                (time.time(), int(success), run_id),
+            )
+        self.flush()
+
+    def flush(self) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if not pending:
+                return 0
+            try:
+                with self._conn as conn:
+                    conn.executemany(_SAMPLE_INSERT, pending)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to write {len(pending)} run samples: {e}")
+                return 0
+        return len(pending)
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+    def prune(self, now: float | None = None) -> int:
+        now = time.time() if now is None else now
+        cutoff = now - self.retention_days * 86400
+        with self._lock, self._conn as conn:
+            conn.execute(
+                "DELETE FROM samples WHERE run_id IN "
+                "(SELECT run_id FROM runs WHERE started_at < ?)",
+                (cutoff,),
+            )
+            return conn.execute(
+                "DELETE FROM runs WHERE started_at < ?", (cutoff,)
+            ).rowcount
+
+    def names(self, kind: str = HOOK) -> list[str]:
+        rows = self._query(
+            "SELECT DISTINCT name FROM samples WHERE kind = ? ORDER BY name", (kind,)
+        )
+        return [row[0] for row in rows]
+
+    def durations(
+        self,
+        name: str,
+        kind: str = HOOK,
+        *,
+        since: datetime | float | None = None,
+        tool_version: str | None = None,
+        column: str = "duration",
+        include_cache_hits: bool = False,
+    ) -> npt.NDArray[np.float64]:
+        if column not in SAMPLE_COLUMNS:
+            msg = f"Unknown sample column: {column}"
+            raise ValueError(msg)
+
+        sql = (
+            f"SELECT {column} FROM samples "  # nosec B608
+            f"WHERE kind = ? AND name = ? AND {column} IS NOT NULL"
+        )
+        params: list[t.Any] = [kind, name]
+        if since is not None:
+            sql += " AND recorded_at >= ?"
+            params.append(since.timestamp() if isinstance(since, datetime) else since)
+        if tool_version is not None:
+            sql += " AND tool_version = ?"
+            params.append(tool_version)
+        if not include_cache_hits:
+            sql += " AND cache_hit IS NOT 1"
+        sql += " ORDER BY recorded_at"
+
+        rows = self._query(sql, tuple(params))
+        return np.fromiter((row[0] for row in rows), dtype=np.float64, count=len(rows))
+
+    def recent(
+        self, name: str, kind: str = BATCH, last: int = 200
+    ) -> list[tuple[float, int, str]]:
+        rows = self._query(
+            "SELECT duration, files, status FROM samples "
+            "WHERE kind = ? AND name = ? AND cache_hit IS NOT 1 "
+            "ORDER BY recorded_at DESC LIMIT ?",
+            (kind, name, last),
+        )
+        return [(row[0], row[1], row[2]) for row in reversed(rows)]
+
+    def percentiles(
+        self,
+        name: str,
+        kind: str = HOOK,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        **filters: t.Any,
+    ) -> dict[float, float]:
+        values = self.durations(name, kind, **filters)
+        if not len(values):
+            return {}
+        return dict(
+            zip(percentiles, np.percentile(values, percentiles).tolist(), strict=True)
+        )
+
+    def trend(self, name: str, kind: str = HOOK, last: int = 50) -> float | None:
+        values = self.durations(name, kind)[-last:]
+        if len(values) < 2:
+            return None
+        # Least-squares slope in seconds per run.
+        slope = np.polyfit(np.arange(len(values), dtype=np.float64), values, 1)[0]
+        return float(slope)
+
+    def regressions(
+        self,
+        kind: str = HOOK,
+        threshold: float = 1.2,
+        min_samples: int = 3,
+    ) -> list[VersionRegression]:
+        rows = self._query(
+            "SELECT name, tool_version, duration FROM samples "
+            "WHERE kind = ? AND tool_version IS NOT NULL AND cache_hit IS NOT 1 "
+            "ORDER BY name, recorded_at",
+            (kind,),
+        )
+
+        regressions: list[VersionRegression] = []
+        for name, group in itertools.groupby(rows, key=lambda row: row[0]):
+            # Versions in the order they were first seen, so "previous" is the
+            # release the tool was upgraded from.
+            by_version: dict[str, list[float]] = {}
+            for _, version, duration in group:
+                by_version.setdefault(version, []).append(duration)
+            medians = [
+                (version, float(np.median(values)), len(values))
+                for version, values in by_version.items()
+                if len(values) >= min_samples
+            ]
+            for (prev_version, prev_median, _), (
+                version,
+                median,
+                count,
+            ) in itertools.pairwise(medians):
+                if prev_median > 0 and median / prev_median >= threshold:
+                    regressions.append(
+                        VersionRegression(
+                            name=name,
+                            kind=kind,
+                            previous_version=prev_version,
+                            version=version,
+                            previous_median=prev_median,
+                            median=median,
+                            samples=count,
+                        )
+                    )
+        return regressions
+
+    def summary(
+        self,
+        kind: str = HOOK,
+        since: datetime | float | None = None,
+    ) -> dict[str, dict[str, float]]:
+        sql = (
+            "SELECT name, duration, status, cache_hit, cpu_seconds, peak_rss_mb "
+            "FROM samples WHERE kind = ?"
+        )
+        params: list[t.Any] = [kind]
+        if since is not None:
+            sql += " AND recorded_at >= ?"
+            params.append(since.timestamp() if isinstance(since, datetime) else since)
+        rows = self._query(sql + " ORDER BY name", tuple(params))
+
+        summary: dict[str, dict[str, float]] = {}
+        for name, group in itertools.groupby(rows, key=lambda row: row[0]):
+            samples = list(group)
+            executed = [row for row in samples if row[3] != 1]
+            durations = np.array([row[1] for row in executed], dtype=np.float64)
+            cpu = [row[4] for row in executed if row[4] is not None]
+            rss = [row[5] for row in executed if row[5] is not None]
+            cache_known = [row[3] for row in samples if row[3] is not None]
+            p50, p90, p99 = (
+                np.percentile(durations, DEFAULT_PERCENTILES).tolist()
+                if len(durations)
+                else (0.0, 0.0, 0.0)
+            )
+            summary[name] = {
+                "count": len(samples),
+                "p50": p50,
+                "p90": p90,
+                "p99": p99,
+                "failure_rate": sum(row[2] not in PASSING_STATUSES for row in samples)
+                / len(samples),
+                "cache_hit_rate": sum(cache_known) / len(cache_known)
+                if cache_known
+                else 0.0,
+                "mean_cpu_seconds": float(np.mean(cpu)) if cpu else 0.0,
+                "max_peak_rss_mb": max(rss, default=0.0),
+            }
+        return summary
+
+    def _query(
+        self, sql: str, params: tuple[t.Any, ...] = ()
+    ) -> list[tuple[t.Any, ...]]:
+        self.flush()
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+
+class RunRecorder:
+    def __init__(self, history: RunHistory, run_id: str) -> None:
+        self.history = history
+        self.run_id = run_id
+
+    def record(self, sample: RunSample) -> None:
+        self.history.record(self.run_id, sample)
+
+    def record_batch(
+        self,
+        name: str,
+        duration: float,
+        files: int,
+        exit_code: int | None,
+        usage: dict[str, float] | None = None,
+        version: str | None = None,
+        timed_out: bool = False,
+    ) -> None:
+        usage = usage or {}
+        if timed_out:
+            status = "timeout"
+        else:
+            status = "passed" if exit_code == 0 else "failed"
+        self.record(
+            RunSample(
+                kind=BATCH,
+                name=name,
+                duration=duration,
+                status=status,
+                exit_code=exit_code,
+                cpu_seconds=usage.get("cpu_seconds"),
+                peak_rss_mb=usage.get("peak_memory_mb"),
+                files=files,
+                tool_version=version,
+            )
+        )
+
+    def record_hook(self, result: HookResult, version: str | None = None) -> None:
+        usage = result.resource_usage
+        self.record(
+            RunSample(
+                kind=HOOK,
+                name=result.name,
+                # A cache hit cost this run nothing; the stored duration is the
+                # one from the run that produced the cached result.
+                duration=0.0 if result.cache_hit else result.duration,
+                status=result.status,
+                exit_code=result.exit_code,
+                cpu_seconds=usage.get("cpu_seconds"),
+                peak_rss_mb=usage.get("peak_memory_mb"),
+                cache_hit=result.cache_hit,
+                files=result.files_processed,
+                tool_version=version,
+            )
+        )
+
+    def record_execution(
+        self,
+        execution: HookExecutionResult,
+        strategy: HookStrategy | None = None,
+    ) -> None:
+        hooks = {hook.name: hook for hook in strategy.hooks} if strategy else {}
+        for result in execution.results:
+            hook = hooks.get(result.name)
+            version = None
+            if hook is not None:
+                try:
+                    version = tool_version(hook.get_command())
+                except ValueError:
+                    pass
+            self.record_hook(result, version)
+
+        usages = [result.resource_usage for result in execution.results]
+        cpu = [u["cpu_seconds"] for u in usages if "cpu_seconds" in u]
+        rss = [u["peak_memory_mb"] for u in usages if "peak_memory_mb" in u]
+        self.record(
+            RunSample(
+                kind=PHASE,
+                name=execution.strategy_name,
+                duration=execution.total_duration,
+                status="passed" if execution.success else "failed",
+                cpu_seconds=sum(cpu) if cpu else None,
+                peak_rss_mb=max(rss) if rss else None,
+                files=sum(result.files_processed for result in execution.results),
+            )
+        )
+        self.history.finish_phase(self.run_id, execution.success)
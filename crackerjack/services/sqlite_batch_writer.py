@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import typing as t
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+Statement = tuple[str, tuple[t.Any, ...]]
+
+
+class SQLiteBatchWriter:
+    """Background writer that commits queued statements in batches.
+
+    A batch shares one transaction. When that transaction fails the batch is
+    replayed one statement at a time, so a single bad or locked row is
+    logged and dropped on its own instead of taking its batch with it.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        name: str,
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+        after_batch: t.Callable[[sqlite3.Connection], None] | None = None,
+    ) -> None:
+        self.conn = conn
+        self.name = name
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+        self.after_batch = after_batch
+        self._lock = threading.Lock()
+        self._closed = False
+        self._queue: queue.Queue[t.Any] = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._writer_loop, name=f"crackerjack-{name}-writer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, sql: str, params: tuple[t.Any, ...] = ()) -> bool:
+        # Checked under the lock so nothing lands behind the stop marker.
+        with self._lock:
+            if self._closed:
+                return False
+            self._queue.put((sql, params))
+            return True
+
+    def flush(self) -> None:
+        if not self._closed:
+            self._queue.join()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+
+    def _writer_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+
+            batch = [item]
+            stop = self._collect_batch(batch)
+            self._write_batch(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+            if stop:
+                self._queue.task_done()
+                return
+
+    def _collect_batch(self, batch: list[Statement]) -> bool:
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                return False
+            if item is _STOP:
+                return True
+            batch.append(item)
+        return False
+
+    def _write_batch(self, batch: list[Statement]) -> None:
+        try:
+            with self.conn as conn:
+                for sql, params in batch:
+                    conn.execute(sql, params)
+        except sqlite3.Error:
+            self._write_rows(batch)
+
+        if self.after_batch is not None:
+            try:
+                with self.conn as conn:
+                    self.after_batch(conn)
+            except sqlite3.Error as e:
+                logger.warning(f"{self.name}: post-batch maintenance failed: {e}")
+
+    def _write_rows(self, batch: list[Statement]) -> None:
+        failed = 0
+        for sql, params in batch:
+            try:
+                with self.conn as conn:
+                    conn.execute(sql, params)
+            except sqlite3.Error as e:
+                failed += 1
+                logger.warning(f"{self.name}: dropped row ({e}): {sql.split()[:3]}")
+        if failed:
+            logger.warning(f"{self.name}: {failed}/{len(batch)} rows not written")
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import typing as t
+from contextlib import suppress
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MARKER_VERSION = 1
+# Files whose contents decide what `uv run` would sync.
+_FINGERPRINT_FILES = ("uv.lock", "pyproject.toml")
+_SYNC_TIMEOUT = 300
+
+
+class ToolResolver:
+    """Execs `uv run <tool>` commands straight from the synced venv.
+
+    `uv run` re-resolves and re-checks the environment on every invocation.
+    Once a sync has been recorded for the current lockfile, the venv already
+    holds exactly what `uv run` would use, so the tool's executable can be run
+    directly. Commands are left unchanged whenever that is not known to hold.
+    """
+
+    def __init__(self, project_root: Path, marker_path: Path | None = None) -> None:
+        self.project_root = project_root
+        self.marker_path = marker_path or (
+            project_root / ".crackerjack" / "cache" / "tool_resolution.json"
+        )
+        override = os.environ.get("UV_PROJECT_ENVIRONMENT")
+        self.venv = Path(override) if override else project_root / ".venv"
+        self.bin_dir = self.venv / ("Scripts" if os.name == "nt" else "bin")
+        self._executables: dict[str, str | None] = {}
+        self._stats: tuple[tuple[int, int], ...] | None = None
+        self._current = False
+        self._lock = threading.Lock()
+
+    def resolve(
+        self, command: list[str], env: t.Mapping[str, str] | None = None
+    ) -> tuple[list[str], dict[str, str] | None]:
+        # Options such as --with or --no-project change what uv would run.
+        if command[:2] != ["uv", "run"] or len(command) < 3:
+            return command, None
+        if command[2].startswith("-") or not self.is_current():
+            return command, None
+
+        executable = self.executable(command[2])
+        if executable is None:
+            return command, None
+        return [executable, *command[3:]], self.environment(env)
+
+    def environment(self, env: t.Mapping[str, str] | None = None) -> dict[str, str]:
+        resolved = dict(os.environ if env is None else env)
+        resolved["VIRTUAL_ENV"] = str(self.venv)
+        resolved["PATH"] = os.pathsep.join(
+            filter(None, (str(self.bin_dir), resolved.get("PATH")))
+        )
+        resolved.pop("PYTHONHOME", None)
+        return resolved
+
+    def executable(self, tool: str) -> str | None:
+        with self._lock:
+            if tool not in self._executables:
+                self._executables[tool] = shutil.which(tool, path=str(self.bin_dir))
+            return self._executables[tool]
+
+    def is_current(self) -> bool:
+        stats = self._fingerprint_stats()
+        if stats is None or not self.bin_dir.is_dir():
+            return False
+        with self._lock:
+            if stats == self._stats:
+                return self._current
+            # Files were touched; only a content change makes the venv stale.
+            fingerprint = self._fingerprint()
+            self._current = (
+                fingerprint is not None and self._read_marker() == fingerprint
+            )
+            self._stats = stats
+            if not self._current:
+                self._executables.clear()
+            return self._current
+
+    def prepare(self) -> bool:
+        if self.is_current():
+            return True
+        return self.refresh()
+
+    def refresh(self) -> bool:
+        if self._fingerprint_stats() is None or shutil.which("uv") is None:
+            return False
+
+        try:
+            result = subprocess.run(
+                ["uv", "sync", "--inexact"],
+                cwd=self.project_root,
+                capture_output=True,
+                text=True,
+                timeout=_SYNC_TIMEOUT,
+                check=False,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Tool environment refresh failed: {e}")
+            return False
+        if result.returncode != 0:
+            logger.warning(
+                f"Tool environment refresh failed: {result.stderr.strip()[-500:]}"
+            )
+            return False
+
+        # The sync may have re-locked, so fingerprint what is on disk now.
+        fingerprint = self._fingerprint()
+        try:
+            self.marker_path.parent.mkdir(parents=True, exist_ok=True)
+            self.marker_path.write_text(
+                json.dumps(
+                    {
+                        "version": MARKER_VERSION,
+                        "fingerprint": fingerprint,
+                        "venv": str(self.venv),
+                    }
+                )
+            )
+        except OSError as e:
+            logger.warning(f"Could not record tool environment: {e}")
+            return False
+
+        with self._lock:
+            self._executables.clear()
+            self._stats = None
+        logger.debug(f"Tool environment refreshed for {self.project_root}")
+        return self.is_current()
+
+    def _fingerprint_stats(self) -> tuple[tuple[int, int], ...] | None:
+        try:
+            stats = [(self.project_root / name).stat() for name in _FINGERPRINT_FILES]
+        except OSError:
+            return None
+        # A marker written by another run must be picked up as well.
+        with suppress(OSError):
+            stats.append(self.marker_path.stat())
+        return tuple((stat.st_mtime_ns, stat.st_size) for stat in stats)
+
+    def _fingerprint(self) -> str | None:
+        digest = hashlib.sha256()
+        try:
+            for name in _FINGERPRINT_FILES:
+                digest.update((self.project_root / name).read_bytes())
+        except OSError:
+            return None
+        digest.update(str(self.venv).encode())
+        return digest.hexdigest()
+
+    def _read_marker(self) -> str | None:
+        try:
+            data = json.loads(self.marker_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != MARKER_VERSION:
+            return None
+        return data.get("fingerprint")
+
+
+_resolvers: dict[Path, ToolResolver] = {}
+_resolvers_lock = threading.Lock()
+
+
+def get_tool_resolver(project_root: Path) -> ToolResolver:
+    root = project_root.resolve()
+    with _resolvers_lock:
+        resolver = _resolvers.get(root)
+        if resolver is None:
+            resolver = _resolvers[root] = ToolResolver(root)
+        return resolver
+
+
+def resolve_command(
+    command: list[str], cwd: Path, env: t.Mapping[str, str] | None = None
+) -> tuple[list[str], dict[str, str] | None]:
+    return get_tool_resolver(cwd).resolve(command, env)
@@ -179,3 +179,14 @@ def get_files_by_extension(
     for ext in extensions:
         result.extend(cwd.rglob(f"*{ext}"))
     return [f for f in result if f.is_file()]
+
+
+def split_path_arguments(argv: list[str]) -> tuple[list[str], list[Path]]:
+    options: list[str] = []
+    paths: list[Path] = []
+    for arg in argv:
+        if not arg.startswith("-") and Path(arg).is_file():
+            paths.append(Path(arg))
+        else:
+            options.append(arg)
+    return options, paths
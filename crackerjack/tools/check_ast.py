@@ -8,15 +8,20 @@ from pathlib import Path
 from ._git_utils import get_files_by_extension
 
 
-def validate_ast_file(file_path: Path) -> tuple[bool, str | None]:
+def validate_ast_content(content: str) -> tuple[bool, str | None]:
     try:
-        with file_path.open(encoding="utf-8") as f:
-            content = f.read()
-
         ast.parse(content)
         return True, None
     except SyntaxError as e:
         return False, f"Syntax error at line {e.lineno}: {e.msg}"
+
+
+def validate_ast_file(file_path: Path) -> tuple[bool, str | None]:
+    try:
+        with file_path.open(encoding="utf-8") as f:
+            content = f.read()
+
+        return validate_ast_content(content)
     except Exception as e:
         return False, f"Error reading file: {e}"
 
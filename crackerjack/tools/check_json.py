@@ -8,6 +8,14 @@ from pathlib import Path
 from ._git_utils import get_files_by_extension
 
 
+def validate_json_content(content: str) -> tuple[bool, str | None]:
+    try:
+        json.loads(content)
+        return True, None
+    except json.JSONDecodeError as e:
+        return False, str(e)
+
+
 def validate_json_file(file_path: Path) -> tuple[bool, str | None]:
     try:
         with file_path.open(encoding="utf-8") as f:
@@ -8,6 +8,14 @@ from pathlib import Path
 from ._git_utils import get_files_by_extension
 
 
+def validate_toml_content(content: str) -> tuple[bool, str | None]:
+    try:
+        tomllib.loads(content)
+        return True, None
+    except tomllib.TOMLDecodeError as e:
+        return False, str(e)
+
+
 def validate_toml_file(file_path: Path) -> tuple[bool, str | None]:
     try:
         with file_path.open("rb") as f:
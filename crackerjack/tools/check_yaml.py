@@ -22,6 +22,14 @@ class _UniqueKeyLoader(yaml.SafeLoader):
 from ._git_utils import get_files_by_extension
 
 
+def validate_yaml_content(content: str) -> tuple[bool, str | None]:
+    try:
+        list(yaml.load_all(content, Loader=_UniqueKeyLoader))
+        return True, None
+    except yaml.YAMLError as e:
+        return False, str(e)
+
+
 def validate_yaml_file(file_path: Path) -> tuple[bool, str | None]:
     try:
         with file_path.open(encoding="utf-8") as f:
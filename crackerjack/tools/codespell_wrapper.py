@@ -5,7 +5,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-from ._git_utils import get_git_tracked_files
+from ._git_utils import get_git_tracked_files, split_path_arguments
 
 _SKIP_DIRS = {"htmlcov", ".git", ".venv", "node_modules", "__pycache__"}
 
@@ -35,7 +35,8 @@ def _is_ignored_file(path: Path) -> bool:
 
 
 def main(argv: list[str] | None = None) -> int:
-    files = get_git_tracked_files()
+    options, paths = split_path_arguments(argv or [])
+    files = paths or get_git_tracked_files()
 
     files = [f for f in files if not _is_ignored_file(f)]
 
@@ -50,8 +51,8 @@ def main(argv: list[str] | None = None) -> int:
         resolved = shutil.which("codespell")
         cmd = [resolved or "codespell", "--write-changes"]
 
-    if argv:
-        cmd.extend(argv)
+    if options:
+        cmd.extend(options)
 
     cmd.extend([str(f) for f in files])
 
@@ -8,23 +8,28 @@ from pathlib import Path
 from ._git_utils import get_files_by_extension
 
 
-def format_json_file(file_path: Path) -> tuple[bool, str | None]:
-    try:
-        with file_path.open(encoding="utf-8") as f:
-            content = f.read().strip()
-            if not content:
-                return True, "File is empty, nothing to format"
+def format_json_content(content: str) -> str:
+    data = json.loads(content)
 
-        data = json.loads(content)
-
-        formatted_content = json.dumps(
+    return (
+        json.dumps(
             data,
             indent=2,
             ensure_ascii=False,
             sort_keys=True,
         )
+        + "\n"
+    )
+
+
+def format_json_file(file_path: Path) -> tuple[bool, str | None]:
+    try:
+        with file_path.open(encoding="utf-8") as f:
+            content = f.read().strip()
+            if not content:
+                return True, "File is empty, nothing to format"
 
-        formatted_content += "\n"
+        formatted_content = format_json_content(content)
 
         with file_path.open("w", encoding="utf-8") as f:
             f.write(formatted_content)
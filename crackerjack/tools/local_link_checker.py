@@ -129,6 +129,12 @@ def check_file(file_path: Path, repo_root: Path) -> list[tuple[str, int, str]]:
     except Exception as e:
         return [(file_path, 0, f"Failed to read file: {e}")]  # type: ignore
 
+    return check_content(content, file_path, repo_root)
+
+
+def check_content(
+    content: str, file_path: Path, repo_root: Path
+) -> list[tuple[str, int, str]]:
     links = extract_markdown_links(content)
     broken_links = []
 
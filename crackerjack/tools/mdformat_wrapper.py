@@ -6,7 +6,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-from ._git_utils import get_git_tracked_files
+from ._git_utils import get_git_tracked_files, split_path_arguments
 
 
 def should_skip_file(file_path: Path) -> bool:
@@ -40,9 +40,13 @@ def should_skip_file(file_path: Path) -> bool:
 
 
 def main(argv: list[str] | None = None) -> int:
-    md_files = get_git_tracked_files("*.md")
-    markdown_files = get_git_tracked_files("*.markdown")
-    all_files = md_files + markdown_files
+    options, paths = split_path_arguments(argv or [])
+    if paths:
+        all_files = [f for f in paths if f.suffix in (".md", ".markdown")]
+    else:
+        md_files = get_git_tracked_files("*.md")
+        markdown_files = get_git_tracked_files("*.markdown")
+        all_files = md_files + markdown_files
 
     files = [f for f in all_files if not should_skip_file(f)]
 
@@ -57,8 +61,8 @@ def main(argv: list[str] | None = None) -> int:
         resolved = shutil.which("mdformat")
         cmd = [resolved or "mdformat", "--no-codeformatters"]
 
-    if argv:
-        cmd.extend(argv)
+    if options:
+        cmd.extend(options)
 
     cmd.extend([str(f) for f in files])
 
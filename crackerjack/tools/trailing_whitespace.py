@@ -24,24 +24,28 @@ def _fix_line_whitespace(line: str) -> str:
     return stripped
 
 
+def strip_trailing_whitespace(content: str) -> tuple[bool, str]:
+    modified = False
+    new_lines = []
+    for line in content.splitlines(keepends=True):
+        if has_trailing_whitespace(line):
+            new_lines.append(_fix_line_whitespace(line))
+            modified = True
+        else:
+            new_lines.append(line)
+
+    return modified, "".join(new_lines)
+
+
 def fix_trailing_whitespace(file_path: Path) -> bool:
     try:
         binary_content = file_path.read_bytes()
 
         content = binary_content.decode("utf-8")
-        lines = content.splitlines(keepends=True)
-
-        modified = False
-        new_lines = []
-        for line in lines:
-            if has_trailing_whitespace(line):
-                new_lines.append(_fix_line_whitespace(line))
-                modified = True
-            else:
-                new_lines.append(line)
+        modified, new_content = strip_trailing_whitespace(content)
 
         if modified:
-            file_path.write_text("".join(new_lines), encoding="utf-8", newline="")
+            file_path.write_text(new_content, encoding="utf-8", newline="")
             print(f"Fixed trailing whitespace: {file_path}")
 
         return modified
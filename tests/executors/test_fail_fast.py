@@ -0,0 +1,201 @@
+"""Tests for the opt-in fail-fast mode of the hook executors."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crackerjack.config.hooks import HookDefinition, HookStrategy, RetryPolicy
+from crackerjack.executors.async_hook_executor import AsyncHookExecutor
+from crackerjack.executors.fail_fast import (
+    CANCELLED,
+    is_blocking_failure,
+    order_for_fail_fast,
+    restore_order,
+)
+from crackerjack.executors.hook_executor import HookExecutor
+from crackerjack.models.task import HookResult
+
+
+def _python(name: str, code: str) -> HookDefinition:
+    return HookDefinition(name=name, command=[sys.executable, "-c", code], timeout=60)
+
+
+def _result(name: str, status: str) -> HookResult:
+    return HookResult(id=name, name=name, status=status, duration=0.1)
+
+
+def _strategy(hooks: list[HookDefinition], **kwargs: object) -> HookStrategy:
+    return HookStrategy(name="comprehensive", hooks=hooks, **kwargs)  # type: ignore[arg-type]
+
+
+FAIL = _python("bandit", "import sys; sys.exit(1)")
+SLOW = _python("zuban", "import time; time.sleep(30)")
+PASS = _python("ruff-check", "pass")
+
+
+@pytest.mark.unit
+class TestPolicy:
+    """Verdict and ordering rules."""
+
+    def test_blocking_failures_respect_retry_policy(self) -> None:
+        formatter = HookDefinition(name="ruff-format", is_formatting=True)
+        check = HookDefinition(name="bandit")
+        failed = _result("x", "failed")
+
+        assert is_blocking_failure(check, failed, RetryPolicy.NONE)
+        assert is_blocking_failure(check, failed, RetryPolicy.FORMATTING_ONLY)
+        assert not is_blocking_failure(formatter, failed, RetryPolicy.FORMATTING_ONLY)
+        assert not is_blocking_failure(check, failed, RetryPolicy.ALL_HOOKS)
+        assert is_blocking_failure(
+            check, _result("x", "timeout"), RetryPolicy.ALL_HOOKS
+        )
+        assert not is_blocking_failure(check, _result("x", "passed"), RetryPolicy.NONE)
+
+    def test_orders_checks_by_failures_per_second(self) -> None:
+        hooks = [
+            HookDefinition(name="slow-flaky"),
+            HookDefinition(name="unknown"),
+            HookDefinition(name="ruff-format", is_formatting=True),
+            HookDefinition(name="fast-flaky"),
+        ]
+        stats = {
+            "slow-flaky": {"failure_rate": 0.5, "p50": 50.0},
+            "fast-flaky": {"failure_rate": 0.2, "p50": 0.5},
+        }
+
+        ordered = order_for_fail_fast(hooks, stats)
+
+        assert [hook.name for hook in ordered] == [
+            "ruff-format",
+            "fast-flaky",
+            "slow-flaky",
+            "unknown",
+        ]
+        results = [_result(hook.name, "passed") for hook in ordered]
+        assert [r.name for r in restore_order(hooks, results)] == [
+            hook.name for hook in hooks
+        ]
+
+
+def _executor(tmp_path: Path) -> HookExecutor:
+    executor = HookExecutor(MagicMock(), tmp_path, quiet=True, fail_fast=True)
+    executor._get_clean_environment = MagicMock(return_value=dict(os.environ))  # type: ignore[method-assign]
+    return executor
+
+
+@pytest.mark.unit
+class TestHookExecutorFailFast:
+    """Cancellation in the thread-pool executor."""
+
+    def test_sequential_skips_remaining_hooks_and_retries(self, tmp_path: Path) -> None:
+        executor = _executor(tmp_path)
+        strategy = _strategy([FAIL, PASS], retry_policy=RetryPolicy.ALL_HOOKS)
+        strategy.hooks[0] = HookDefinition(name="gitleaks", command=["gitleaks"])
+
+        with patch.object(
+            executor,
+            "execute_single_hook",
+            return_value=_result("gitleaks", "timeout"),
+        ) as run:
+            result = executor.execute_strategy(strategy)
+
+        run.assert_called_once()
+        assert [r.status for r in result.results] == ["timeout", CANCELLED]
+        assert result.success is False
+
+    def test_parallel_kills_running_and_drops_pending(self, tmp_path: Path) -> None:
+        executor = _executor(tmp_path)
+        other_slow = _python("refurb", "import time; time.sleep(30)")
+        strategy = _strategy([SLOW, FAIL, other_slow], parallel=True, max_workers=2)
+
+        start = time.monotonic()
+        result = executor.execute_strategy(strategy)
+
+        assert time.monotonic() - start < 15
+        statuses = {r.name: r.status for r in result.results}
+        assert statuses == {
+            "zuban": CANCELLED,
+            "bandit": "failed",
+            "refurb": CANCELLED,
+        }
+        assert [r.name for r in result.results] == ["zuban", "bandit", "refurb"]
+
+    def test_timeout_keeps_partial_output(self, tmp_path: Path) -> None:
+        hook = HookDefinition(
+            name="zuban",
+            command=[
+                sys.executable,
+                "-c",
+                "import sys, time; print('partial', flush=True); time.sleep(30)",
+            ],
+            timeout=1,
+        )
+
+        start = time.monotonic()
+        result = _executor(tmp_path).execute_single_hook(hook)
+
+        assert result.status == "timeout"
+        assert time.monotonic() - start < 15
+
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        executor = HookExecutor(MagicMock(), tmp_path, quiet=True)
+        strategy = _strategy([FAIL, PASS])
+
+        with patch.object(
+            executor,
+            "execute_single_hook",
+            side_effect=[
+                _result("bandit", "failed"),
+                _result("ruff-check", "passed"),
+            ],
+        ):
+            result = executor.execute_strategy(strategy)
+
+        assert [r.status for r in result.results] == ["failed", "passed"]
+
+
+@pytest.mark.unit
+class TestAsyncHookExecutorFailFast:
+    """Cancellation in the asyncio executor."""
+
+    def test_parallel_cancels_running_tasks(self, tmp_path: Path) -> None:
+        executor = AsyncHookExecutor(
+            MagicMock(), tmp_path, max_concurrent=4, quiet=True, fail_fast=True
+        )
+        strategy = _strategy([SLOW, FAIL, PASS], parallel=True)
+
+        start = time.monotonic()
+        result = asyncio.run(executor.execute_strategy(strategy))
+
+        assert time.monotonic() - start < 15
+        statuses = {r.name: r.status for r in result.results}
+        assert statuses["zuban"] == CANCELLED
+        assert statuses["bandit"] == "failed"
+        assert not executor._running_processes
+
+    def test_manager_orders_by_recorded_history(self, tmp_path: Path) -> None:
+        from crackerjack.managers.async_hook_manager import AsyncHookManager
+        from crackerjack.services.run_history import HOOK, RunHistory, RunSample
+
+        with RunHistory(tmp_path / ".crackerjack" / "cache" / "run_history.db") as h:
+            recorder = h.start_run()
+            for status in ("failed", "passed"):
+                recorder.record(
+                    RunSample(kind=HOOK, name="bandit", duration=0.5, status=status)
+                )
+
+        manager = AsyncHookManager(MagicMock(), tmp_path, fail_fast=True)
+        executor = manager.async_executor
+
+        stats = executor._hook_stats()  # type: ignore[attr-defined]
+        assert stats is not None
+        assert stats["bandit"]["failure_rate"] == 0.5
+        ordered = order_for_fail_fast([SLOW, FAIL], stats)
+        assert [hook.name for hook in ordered] == ["bandit", "zuban"]
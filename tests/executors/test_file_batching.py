@@ -0,0 +1,150 @@
+"""Tests for ARG_MAX-aware file batching of file-accepting hooks."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crackerjack.config.hooks import HookDefinition
+from crackerjack.executors.file_batching import (
+    command_length,
+    merge_completed_processes,
+    partition_files,
+)
+from crackerjack.executors.hook_executor import HookExecutor
+
+
+def _files(count: int) -> list[Path]:
+    return [Path(f"pkg/module_{i:03d}.py") for i in range(count)]
+
+
+def _completed(returncode: int, stdout: str = "", stderr: str = ""):
+    return subprocess.CompletedProcess(["tool"], returncode, stdout, stderr)
+
+
+@pytest.mark.unit
+class TestPartitionFiles:
+    """Size-balanced, command-length bounded partitioning."""
+
+    def test_small_change_sets_stay_in_one_batch(self) -> None:
+        files = _files(5)
+
+        assert partition_files(["tool"], files, max_batches=4) == [files]
+
+    def test_balances_cost_across_batches(self) -> None:
+        files = _files(32)
+        costs = {path: (100 if i < 4 else 1) for i, path in enumerate(files)}
+
+        batches = partition_files(
+            ["tool"], files, max_batches=4, budget=10**6, cost=costs.__getitem__
+        )
+
+        assert len(batches) == 4
+        assert sorted(p for batch in batches for p in batch) == sorted(files)
+        assert all(sum(costs[p] for p in batch) == 107 for batch in batches)
+
+    def test_respects_command_budget(self) -> None:
+        files = _files(200)
+        budget = 2000
+
+        batches = partition_files(["tool", "--flag"], files, budget=budget)
+
+        assert len(batches) > 1
+        for batch in batches:
+            assert command_length(["tool", "--flag", *map(str, batch)]) <= budget
+        assert sorted(p for batch in batches for p in batch) == sorted(files)
+
+    def test_preserves_input_order_within_batches(self) -> None:
+        files = _files(40)
+
+        for batch in partition_files(["tool"], files, max_batches=3, budget=10**6):
+            assert batch == sorted(batch)
+
+
+@pytest.mark.unit
+class TestMergeCompletedProcesses:
+    """Batch outputs and exit codes collapse into one process result."""
+
+    def test_nonzero_exit_code_wins(self) -> None:
+        merged = merge_completed_processes(
+            ["tool"],
+            [_completed(0, "a\n"), _completed(2, "b", "err\n"), _completed(1)],
+        )
+
+        assert merged.returncode == 2
+        assert merged.stdout == "a\nb\n"
+        assert merged.stderr == "err\n"
+
+    def test_json_list_outputs_are_concatenated(self) -> None:
+        merged = merge_completed_processes(
+            ["tool"],
+            [_completed(1, '[{"a": 1}]'), _completed(0, "[]"), _completed(1, "")],
+        )
+
+        assert json.loads(merged.stdout) == [{"a": 1}]
+
+
+@pytest.mark.unit
+class TestHookExecutorBatching:
+    """HookExecutor runs batchable hooks as concurrent file batches."""
+
+    def _executor(self, tmp_path: Path, files: list[Path]) -> HookExecutor:
+        executor = HookExecutor(MagicMock(), tmp_path, quiet=True)
+        executor._get_changed_files_for_hook = MagicMock(return_value=files)  # type: ignore[method-assign]
+        executor._get_clean_environment = MagicMock(return_value={})  # type: ignore[method-assign]
+        return executor
+
+    def test_batchable_hook_runs_each_batch(self, tmp_path: Path) -> None:
+        hook = HookDefinition(
+            name="codespell",
+            command=["codespell"],
+            accepts_file_paths=True,
+            max_batches=4,
+        )
+        files = _files(64)
+        executor = self._executor(tmp_path, files)
+
+        with patch(
+            "crackerjack.executors.hook_executor.subprocess.run",
+            side_effect=lambda cmd, **_: _completed(0, f"{len(cmd) - 1}\n"),
+        ) as run:
+            result = executor._run_hook_subprocess(hook)
+
+        assert run.call_count == 4
+        assert sum(int(n) for n in result.stdout.split()) == 64
+        assert hook.get_command() == ["codespell"]
+
+    def test_oversized_unbatchable_hook_falls_back_to_full_run(
+        self, tmp_path: Path
+    ) -> None:
+        hook = HookDefinition(
+            name="refurb", command=["refurb"], accepts_file_paths=True
+        )
+        executor = self._executor(tmp_path, _files(64))
+
+        with (
+            patch(
+                "crackerjack.executors.hook_executor.command_budget",
+                return_value=200,
+            ),
+            patch(
+                "crackerjack.executors.hook_executor.subprocess.run",
+                return_value=_completed(0),
+            ) as run,
+        ):
+            executor._run_hook_subprocess(hook)
+
+        assert run.call_args.args[0] == ["refurb"]
+
+
+@pytest.mark.unit
+def test_build_command_does_not_mutate_cached_command() -> None:
+    hook = HookDefinition(name="x", command=["tool"], accepts_file_paths=True)
+
+    assert hook.build_command([Path("a.py")]) == ["tool", "a.py"]
+    assert hook.build_command([Path("b.py")]) == ["tool", "b.py"]
+    assert hook.get_command() == ["tool"]
@@ -0,0 +1,200 @@
+"""Tests for the in-process fused runner behind the built-in file-check hooks."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crackerjack.config.hooks import FAST_HOOKS, HookDefinition, HookStrategy
+from crackerjack.executors.fused_file_checks import (
+    FUSED_HOOKS,
+    FusedFileCheckRunner,
+    check_file,
+)
+from crackerjack.executors.hook_executor import HookExecutor
+
+
+def _hooks(*names: str) -> list[HookDefinition]:
+    by_name = {hook.name: hook for hook in FAST_HOOKS}
+    return [by_name[name] for name in names]
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "ok.py").write_text("x = 1\n")
+    (tmp_path / "messy.py").write_text("x = 1   \n\n\n")
+    (tmp_path / "broken.py").write_text("def f(:\n")
+    (tmp_path / "config.yaml").write_text("a: 1\na: 2\n")
+    (tmp_path / "data.json").write_text('{"b": 1, "a": 2}')
+    (tmp_path / "README.md").write_text("[doc](missing.md)\n")
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestCheckFile:
+    """Per-file dispatch of every applicable check in a single pass."""
+
+    def test_reads_file_once_and_applies_all_fixers(self, repo: Path) -> None:
+        path = repo / "messy.py"
+        original_read = Path.read_bytes
+        reads: list[Path] = []
+
+        def tracking_read(self: Path) -> bytes:
+            reads.append(self)
+            return original_read(self)
+
+        with patch.object(Path, "read_bytes", tracking_read):
+            outcome = check_file(
+                path,
+                ("trailing-whitespace", "end-of-file-fixer", "check-ast"),
+                repo,
+            )
+
+        assert reads == [path]
+        assert outcome.fixed == ["trailing-whitespace", "end-of-file-fixer"]
+        assert outcome.issues == {}
+        assert path.read_text() == "x = 1\n"
+
+    def test_validators_see_fixed_content(self, repo: Path) -> None:
+        outcome = check_file(repo / "data.json", ("format-json", "check-json"), repo)
+
+        assert outcome.fixed == ["format-json"]
+        assert (repo / "data.json").read_text() == '{\n  "a": 2,\n  "b": 1\n}\n'
+        assert "check-json" not in outcome.issues
+
+    def test_reports_validation_errors_per_hook(self, repo: Path) -> None:
+        yaml_outcome = check_file(repo / "config.yaml", ("check-yaml",), repo)
+        ast_outcome = check_file(repo / "broken.py", ("check-ast",), repo)
+
+        assert "Duplicate key" in yaml_outcome.issues["check-yaml"][0]
+        assert "Syntax error at line 1" in ast_outcome.issues["check-ast"][0]
+
+    def test_large_file_check_does_not_read_content(self, repo: Path) -> None:
+        big = repo / "blob.bin"
+        big.write_bytes(b"\0" * 2048)
+
+        with patch.object(Path, "read_bytes", side_effect=AssertionError):
+            outcome = check_file(
+                big, ("check-added-large-files",), repo, max_size_bytes=1024
+            )
+
+        assert "2.0 KB" in outcome.issues["check-added-large-files"][0]
+
+
+@pytest.mark.unit
+class TestFusedFileCheckRunner:
+    """Aggregation into one HookResult per logical hook."""
+
+    def test_returns_one_result_per_hook(self, repo: Path) -> None:
+        hooks = _hooks(
+            "trailing-whitespace",
+            "end-of-file-fixer",
+            "check-yaml",
+            "check-ast",
+            "check-local-links",
+        )
+        files = sorted(repo.iterdir())
+
+        with patch(
+            "crackerjack.executors.fused_file_checks._list_tracked_files",
+            return_value=files,
+        ):
+            results = FusedFileCheckRunner(repo).run(hooks)
+
+        by_name = {result.name: result for result in results}
+        assert [result.name for result in results] == [h.name for h in hooks]
+        assert by_name["trailing-whitespace"].status == "passed"
+        assert "messy.py" in by_name["trailing-whitespace"].output
+        assert by_name["check-yaml"].status == "failed"
+        assert by_name["check-ast"].issues_count == 1
+        assert by_name["check-local-links"].status == "failed"
+        assert by_name["check-yaml"].files_processed == 1
+
+    def test_explicit_files_override_discovery(self, repo: Path) -> None:
+        with patch(
+            "crackerjack.executors.fused_file_checks._list_tracked_files"
+        ) as discover:
+            results = FusedFileCheckRunner(repo).run(
+                _hooks("check-ast"), {"check-ast": [Path("ok.py")]}
+            )
+
+        discover.assert_not_called()
+        assert results[0].status == "passed"
+        assert results[0].files_processed == 1
+
+    def test_discovers_tracked_files_in_one_listing(self, repo: Path) -> None:
+        subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+        subprocess.run(["git", "add", "ok.py", "config.yaml"], cwd=repo, check=True)
+        (repo / "gone.py").write_text("x = 1\n")
+        subprocess.run(["git", "add", "gone.py"], cwd=repo, check=True)
+        (repo / "gone.py").unlink()
+
+        runner = FusedFileCheckRunner(repo)
+        files = runner._resolve_files(
+            ["check-ast", "check-yaml"], {"check-ast": None, "check-yaml": None}
+        )
+
+        assert files == {
+            "check-ast": [repo / "ok.py"],
+            "check-yaml": [repo / "config.yaml"],
+        }
+
+    def test_process_pool_matches_in_process_results(self, repo: Path) -> None:
+        for i in range(8):
+            (repo / f"mod_{i}.py").write_text(f"x = {i}  \n")
+        hook_files: dict[str, list[Path] | None] = {
+            "trailing-whitespace": sorted(repo.glob("*.py")),
+            "check-ast": sorted(repo.glob("*.py")),
+        }
+
+        results = FusedFileCheckRunner(repo, max_workers=2, parallel_threshold=2).run(
+            _hooks("trailing-whitespace", "check-ast"), hook_files
+        )
+
+        assert results[0].output.count("Fixed trailing whitespace") == 9
+        assert results[1].issues_count == 1
+        assert (repo / "mod_3.py").read_text() == "x = 3\n"
+
+
+@pytest.mark.unit
+class TestHookExecutorFusedHooks:
+    """HookExecutor runs fused hooks in-process instead of via subprocess."""
+
+    def test_strategy_runs_fused_hooks_without_subprocesses(self, repo: Path) -> None:
+        executor = HookExecutor(MagicMock(), repo, quiet=True)
+        strategy = HookStrategy(
+            name="fast", hooks=_hooks("check-yaml", "check-json", "check-ast")
+        )
+
+        with (
+            patch(
+                "crackerjack.executors.fused_file_checks._list_tracked_files",
+                return_value=sorted(repo.iterdir()),
+            ),
+            patch("crackerjack.executors.hook_executor.subprocess.run") as run,
+        ):
+            result = executor.execute_strategy(strategy)
+
+        run.assert_not_called()
+        assert {r.name for r in result.results} == {
+            "check-yaml",
+            "check-json",
+            "check-ast",
+        }
+        assert not result.success
+
+    def test_all_builtin_file_checks_are_fused(self) -> None:
+        assert FUSED_HOOKS == {
+            "trailing-whitespace",
+            "end-of-file-fixer",
+            "check-yaml",
+            "check-toml",
+            "check-json",
+            "check-ast",
+            "format-json",
+            "check-added-large-files",
+            "check-local-links",
+        }
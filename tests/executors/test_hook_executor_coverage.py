@@ -441,42 +441,41 @@ class TestRunWithMonitoring:
     def test_normal_exit_returns_completed_process(
         self, executor: HookExecutor
     ) -> None:
-        """Popen exits cleanly -> CompletedProcess is returned."""
+        """The shared supervisor's result is returned and its usage recorded."""
+        from crackerjack.executors.process_monitor import ProcessMetrics
+
         hook = HookDefinition(name="slow", command=["sleep", "1"], timeout=200)
-        proc = MagicMock()
-        proc.communicate.return_value = ("ok-out", "ok-err")
-        proc.returncode = 0
-
-        with patch("subprocess.Popen", return_value=proc):
-            with patch(
-                "crackerjack.executors.process_monitor.ProcessMonitor"
-            ) as Monitor:
-                monitor_inst = Monitor.return_value
-                result = executor._run_with_monitoring(
-                    ["x"], hook, Path("."), {"PATH": "/bin"}
-                )
+        completed = subprocess.CompletedProcess(["x"], 0, "ok-out", "ok-err")
+        metrics = ProcessMetrics(pid=1, cpu_seconds=2.5, peak_memory_mb=64.0)
+
+        with patch(
+            "crackerjack.executors.process_monitor.get_process_monitor"
+        ) as get_monitor:
+            get_monitor.return_value.run.return_value = (completed, metrics)
+            result = executor._run_with_monitoring(
+                ["x"], hook, Path("."), {"PATH": "/bin"}
+            )
+
         assert result.returncode == 0
         assert result.stdout == "ok-out"
         assert result.stderr == "ok-err"
-        monitor_inst.stop_monitoring.assert_called_once()
+        usage = executor._pop_resource_usage("slow")
+        assert usage["cpu_seconds"] == 2.5
+        assert usage["peak_memory_mb"] == 64.0
 
-    def test_timeout_kills_and_reraises(
-        self, executor: HookExecutor
-    ) -> None:
-        """On TimeoutExpired, Popen is killed and the exception re-raised."""
+    def test_timeout_propagates(self, executor: HookExecutor) -> None:
+        """TimeoutExpired from the supervisor reaches the caller."""
         hook = HookDefinition(name="slow", command=["sleep", "999"], timeout=1)
-        proc = MagicMock()
-        proc.communicate.side_effect = [
-            subprocess.TimeoutExpired(cmd="x", timeout=1),
-            ("partial", "partial-err"),
-        ]
-        with patch("subprocess.Popen", return_value=proc):
-            with patch("crackerjack.executors.process_monitor.ProcessMonitor"):
-                with pytest.raises(subprocess.TimeoutExpired):
-                    executor._run_with_monitoring(
-                        ["x"], hook, Path("."), {"PATH": "/bin"}
-                    )
-        proc.kill.assert_called_once()
+        with patch(
+            "crackerjack.executors.process_monitor.get_process_monitor"
+        ) as get_monitor:
+            get_monitor.return_value.run.side_effect = subprocess.TimeoutExpired(
+                cmd="x", timeout=1
+            )
+            with pytest.raises(subprocess.TimeoutExpired):
+                executor._run_with_monitoring(
+                    ["x"], hook, Path("."), {"PATH": "/bin"}
+                )
 
 
 # ---------------------------------------------------------------------------
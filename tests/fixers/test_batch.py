@@ -0,0 +1,141 @@
+"""Tests for crackerjack.fixers.batch -- per-file batched autofix transactions."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from crackerjack.fixers.ast_transform.engine import ChangeSpec, LineEdit
+from crackerjack.fixers.batch import BatchAutofixEngine, content_fixer
+from crackerjack.models.issues import Issue, IssueType, Priority
+from crackerjack.services.secure_path_utils import AtomicFileOperations
+
+
+def _issue(file_path: Path, line: int, message: str = "") -> Issue:
+    return Issue(
+        type=IssueType.REFURB,
+        severity=Priority.HIGH,
+        message=message,
+        file_path=str(file_path),
+        line_number=line,
+    )
+
+
+def _replace_line(content: str, issue: Issue) -> tuple[str, str]:
+    lines = content.splitlines(keepends=True)
+    index = (issue.line_number or 1) - 1
+    lines[index] = lines[index].replace("old", "new")
+    return "".join(lines), f"Replaced line {issue.line_number}"
+
+
+def _replace_block(content: str, issue: Issue) -> tuple[str, str]:
+    lines = content.splitlines(keepends=True)
+    start = (issue.line_number or 1) - 1
+    lines[start : start + 2] = ["merged = True\n"]
+    return "".join(lines), "Collapsed block"
+
+
+@pytest.fixture
+def module(tmp_path: Path) -> Path:
+    path = tmp_path / "mod.py"
+    path.write_text("".join(f"value_{i} = 'old'\n" for i in range(6)))
+    return path
+
+
+@pytest.mark.unit
+class TestLineEdits:
+    """ChangeSpec diffing and overlap detection."""
+
+    def test_line_edits_are_localised_hunks(self) -> None:
+        spec = ChangeSpec(
+            file_path=Path("x.py"),
+            original_content="a\nb\nc\nd\n",
+            transformed_content="a\nB\nc\nd\ne\n",
+            line_start=2,
+            line_end=2,
+            pattern_name="p",
+            complexity_reduction=0,
+        )
+
+        assert spec.line_edits() == [
+            LineEdit(1, 2, ("B\n",)),
+            LineEdit(4, 4, ("e\n",)),
+        ]
+
+    def test_overlap_rules(self) -> None:
+        assert LineEdit(0, 2, ()).overlaps(LineEdit(1, 3, ()))
+        assert not LineEdit(0, 2, ()).overlaps(LineEdit(2, 3, ()))
+        assert LineEdit(2, 2, ("x\n",)).overlaps(LineEdit(2, 3, ()))
+
+
+@pytest.mark.unit
+class TestBatchAutofixEngine:
+    """One read, one validation and one write per file per iteration."""
+
+    @pytest.mark.asyncio
+    async def test_applies_all_issues_with_single_write(self, module: Path) -> None:
+        issues = [_issue(module, line) for line in (1, 3, 5, 6)]
+        engine = BatchAutofixEngine(content_fixer(_replace_line), module.parent)
+
+        with patch(
+            "crackerjack.fixers.batch.AtomicFileOperations.atomic_write",
+            wraps=AtomicFileOperations.atomic_write,
+        ) as write:
+            result = await engine.run(issues)
+
+        assert write.call_count == 1
+        assert result.fixed_count == 4
+        assert result.file_reads == result.file_writes == 1
+        assert module.read_text().count("'new'") == 4
+        assert module.with_suffix(".py.bak").read_text().count("'new'") == 0
+
+    @pytest.mark.asyncio
+    async def test_overlapping_edits_are_deferred_to_next_iteration(
+        self, module: Path
+    ) -> None:
+        line_issue = _issue(module, 2, "line")
+        block_issue = _issue(module, 1, "block")
+
+        def produce(content: str, issue: Issue) -> ChangeSpec | None:
+            fix = _replace_line if issue.message == "line" else _replace_block
+            return content_fixer(fix)(content, issue)
+
+        engine = BatchAutofixEngine(produce, module.parent, create_backup=False)
+        result = await engine.run([line_issue, block_issue])
+
+        assert result.iterations == 2
+        assert result.results[line_issue.id].success
+        assert result.results[block_issue.id].success
+        assert module.read_text().startswith("merged = True\nvalue_2 = 'old'\n")
+
+    @pytest.mark.asyncio
+    async def test_identical_whole_file_rewrites_are_merged(self, module: Path) -> None:
+        def replace_all(content: str, issue: Issue) -> tuple[str, str]:
+            return content.replace("old", "new"), "Replaced every occurrence"
+
+        issues = [_issue(module, line) for line in (1, 4)]
+        engine = BatchAutofixEngine(
+            content_fixer(replace_all), module.parent, create_backup=False
+        )
+
+        result = await engine.run(issues)
+
+        assert result.iterations == 1
+        assert result.fixed_count == 2
+        assert "old" not in module.read_text()
+
+    @pytest.mark.asyncio
+    async def test_invalid_combined_result_is_not_written(self, module: Path) -> None:
+        original = module.read_text()
+
+        def break_syntax(content: str, issue: Issue) -> tuple[str, str]:
+            return content.replace("value_0 =", "def ("), "broken"
+
+        engine = BatchAutofixEngine(content_fixer(break_syntax), module.parent)
+        result = await engine.run([_issue(module, 1)])
+
+        assert result.file_writes == 0
+        assert module.read_text() == original
+        assert "Syntax error" in next(iter(result.results.values())).remaining_issues[0]
@@ -1048,7 +1048,9 @@ class TestFixIssueEndToEnd:
             ["Import 'os' should come before previous imports"],
         )
 
-        async def _fake_analyze(fp: Path, pr: Path) -> io.ImportAnalysis:
+        async def _fake_analyze(
+            fp: Path, pr: Path, unused_index: object = None
+        ) -> io.ImportAnalysis:
             return analysis
 
         async def _fake_optimize(content: str, a: io.ImportAnalysis) -> str:
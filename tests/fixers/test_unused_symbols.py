@@ -0,0 +1,80 @@
+"""Tests for crackerjack.fixers.unused_symbols and its use by the import fixer."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from crackerjack.fixers import import_optimization as io
+from crackerjack.fixers.unused_symbols import UnusedSymbolIndex
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "a.py").write_text("import os\nimport sys\n\nprint(sys.argv)\n")
+    (tmp_path / "b.py").write_text("import json\n\n\ndef unused_helper():\n    pass\n")
+    (tmp_path / "broken.py").write_text("def f(:\n")
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestUnusedSymbolIndex:
+    """One in-process vulture pass indexed by file and line."""
+
+    def test_indexes_findings_by_file_and_line(self, project: Path) -> None:
+        index = UnusedSymbolIndex.build(sorted(project.glob("*.py")), 60)
+
+        assert index.unused_imports(project / "a.py") == ["os"]
+        assert index.unused_imports(project / "b.py") == ["json"]
+        assert [s.name for s in index.at(project / "b.py", 4)] == ["unused_helper"]
+        assert index.for_file(project / "b.py", kind="function")[0].confidence == 60
+
+    def test_tracks_analysed_files_without_findings(self, project: Path) -> None:
+        (project / "clean.py").write_text("print('ok')\n")
+
+        index = UnusedSymbolIndex.build([project / "clean.py"])
+
+        assert index.covers(project / "clean.py")
+        assert not index.covers(project / "a.py")
+        assert index.for_file(project / "clean.py") == []
+
+    def test_does_not_spawn_subprocesses(self, project: Path) -> None:
+        with patch.object(subprocess, "run", side_effect=AssertionError):
+            index = UnusedSymbolIndex.build(sorted(project.glob("*.py")))
+
+        assert index.covers(project / "broken.py")
+
+
+@pytest.mark.unit
+class TestImportOptimizationWithIndex:
+    """The import fixer consumes the shared index instead of per-file vulture."""
+
+    @pytest.mark.asyncio
+    async def test_analyze_files_runs_no_vulture_subprocess(
+        self, project: Path
+    ) -> None:
+        files = [project / "a.py", project / "b.py"]
+
+        with patch.object(io, "_run_vulture_analysis", side_effect=AssertionError):
+            analyses = await io.analyze_files(files, project)
+
+        assert analyses[project / "a.py"].unused_imports == ["os"]
+        assert analyses[project / "b.py"].unused_imports == ["json"]
+
+    @pytest.mark.asyncio
+    async def test_uncovered_files_fall_back_to_subprocess(self, project: Path) -> None:
+        calls: list[Path] = []
+
+        def fake_run(file_path: Path, project_root: Path):
+            calls.append(file_path)
+            return subprocess.CompletedProcess([], 0, "", "")
+
+        with patch.object(io, "_run_vulture_analysis", side_effect=fake_run):
+            await io.analyze_file(
+                project / "a.py", project, UnusedSymbolIndex.build([project / "b.py"])
+            )
+
+        assert calls == [project / "a.py"]
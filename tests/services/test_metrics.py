@@ -0,0 +1,78 @@
+"""Tests for MetricsCollector pooled connections and batched writes."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from crackerjack.services.metrics import MetricsCollector
+
+
+@pytest.fixture
+def collector(tmp_path: Path):
+    c = MetricsCollector(db_path=tmp_path / "metrics.db", flush_interval_ms=5)
+    yield c
+    c.close()
+
+
+class TestMetricsCollector:
+    def test_uses_wal_mode(self, collector: MetricsCollector) -> None:
+        row = collector.execute_query("PRAGMA journal_mode")[0]
+        assert row[0].lower() == "wal"
+
+    def test_reads_see_queued_writes(self, collector: MetricsCollector) -> None:
+        for i in range(10):
+            collector.track_provider_selection("p1", success=i % 2 == 0, latency_ms=i)
+
+        stats = collector.get_provider_stats("p1")
+        assert stats[0]["total_selections"] == 10
+        assert stats[0]["successful_selections"] == 5
+
+    def test_batches_more_rows_than_batch_size(self, tmp_path: Path) -> None:
+        c = MetricsCollector(db_path=tmp_path / "m.db", batch_size=8)
+        try:
+            for _ in range(50):
+                c.track_agent_execution("job", "agent", "TYPE", True, 0.9, 1, 1, 0)
+            assert c.get_agent_success_rate("agent") == 1.0
+            assert c.get_agent_stats("agent")[0]["total_executions"] == 50
+        finally:
+            c.close()
+
+    def test_close_flushes_pending_writes(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "m.db"
+        c = MetricsCollector(db_path=db_path, flush_interval_ms=10_000)
+        for _ in range(5):
+            c.track_provider_selection("p", success=True)
+        c.close()
+
+        with sqlite3.connect(db_path) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM provider_performance").fetchone()
+        assert count[0] == 5
+
+    def test_close_is_idempotent_and_rejects_writes(self, tmp_path: Path) -> None:
+        c = MetricsCollector(db_path=tmp_path / "m.db")
+        c.close()
+        c.close()
+        with pytest.raises(RuntimeError):
+            c.track_provider_selection("p", success=True)
+
+    def test_bad_statement_does_not_kill_writer(
+        self, collector: MetricsCollector
+    ) -> None:
+        collector.execute("INSERT INTO missing_table VALUES (?)", (1,))
+        collector.flush()
+        collector.track_provider_selection("p", success=True)
+        assert collector.get_provider_availability("p") == 1.0
+
+    def test_bad_statement_does_not_drop_its_batch(self, tmp_path: Path) -> None:
+        c = MetricsCollector(db_path=tmp_path / "m.db", flush_interval_ms=200)
+        try:
+            c.track_provider_selection("p", success=True)
+            c.execute("INSERT INTO missing_table VALUES (?)", (1,))
+            c.track_provider_selection("p", success=False)
+            stats = c.get_provider_stats("p")
+            assert stats[0]["total_selections"] == 2
+        finally:
+            c.close()
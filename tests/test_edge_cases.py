@@ -335,10 +335,10 @@ class TestHookExecutorEdgeCases:
 
             result = executor.execute_single_hook(hook)
 
-            # The TimeoutExpired is caught inside _run_hook_subprocess, which returns
-            # a CompletedProcess with returncode=1, resulting in "failed" status
-            assert result.status == "failed"
-            assert result.exit_code == 1
+            # The TimeoutExpired propagates out of _run_hook_subprocess so the
+            # timeout is recorded and reported as such
+            assert result.status == "timeout"
+            assert result.is_timeout
 
     def test_hook_executor_with_hook_that_fails(self) -> None:
         """Test hook executor when hook command fails."""
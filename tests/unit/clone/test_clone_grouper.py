@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -171,6 +172,107 @@ class TestCloneGrouperTypeMapping:
         assert groups == [], "Groups with Dhara handled key must be skipped"
 
 
+def _pair(a: tuple[str, int, int], b: tuple[str, int, int], type_: int = 1) -> dict:
+    def loc(spec: tuple[str, int, int]) -> dict:
+        return {
+            "location": {
+                "file_path": spec[0],
+                "start_line": spec[1],
+                "end_line": spec[2],
+            }
+        }
+
+    return {"clone1": loc(a), "clone2": loc(b), "similarity": 0.95, "type": type_}
+
+
+@pytest.mark.unit
+class TestCloneGrouperTransitiveMerging:
+    def test_n_way_clone_becomes_single_group(self) -> None:
+        """All pairs of a 4-way clone collapse into one family."""
+        members = [("a.py", 1, 10), ("b.py", 1, 10), ("c.py", 5, 14), ("d.py", 2, 11)]
+        raw_pairs = [
+            _pair(members[i], members[j])
+            for i in range(len(members))
+            for j in range(i + 1, len(members))
+        ]
+
+        groups = CloneGrouper().group_pairs(raw_pairs)
+
+        assert len(groups) == 1
+        assert len(groups[0].locations) == 4
+        assert "4 locations across 4 files" in groups[0].pattern_description
+
+    def test_chain_of_pairs_is_merged_transitively(self) -> None:
+        """a~b and b~c form one component even without an a~c pair."""
+        raw_pairs = [
+            _pair(("a.py", 1, 10), ("b.py", 1, 10), type_=1),
+            _pair(("b.py", 1, 10), ("c.py", 1, 12), type_=2),
+            _pair(("x.py", 1, 5), ("y.py", 1, 5)),
+        ]
+
+        groups = CloneGrouper().group_pairs(raw_pairs)
+
+        sizes = sorted(len(g.locations) for g in groups)
+        assert sizes == [2, 3]
+        family = next(g for g in groups if len(g.locations) == 3)
+        assert family.clone_type == CloneType.RENAMED
+        assert family.line_count == 12
+
+    def test_group_id_is_independent_of_pair_order(self) -> None:
+        raw_pairs = [
+            _pair(("a.py", 1, 10), ("b.py", 1, 10)),
+            _pair(("b.py", 1, 10), ("c.py", 1, 10)),
+        ]
+        reversed_pairs = [
+            _pair(("c.py", 1, 10), ("b.py", 1, 10)),
+            _pair(("b.py", 1, 10), ("a.py", 1, 10)),
+        ]
+
+        first = CloneGrouper().group_pairs(raw_pairs)
+        second = CloneGrouper().group_pairs(reversed_pairs)
+
+        assert first[0].group_id == second[0].group_id
+
+    def test_plain_pair_keeps_its_original_id(self) -> None:
+        """Two-member groups reuse the per-pair id their dhara entries use."""
+        pair = _pair(("b.py", 1, 10), ("a.py", 1, 10))
+        key = "b.py:1-10|a.py:1-10|type1"
+
+        (group,) = CloneGrouper().group_pairs([pair])
+
+        assert group.group_id == hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    async def test_handled_lookups_run_once_per_family(self) -> None:
+        raw_pairs = [
+            _pair(("a.py", 1, 10), ("b.py", 1, 10)),
+            _pair(("a.py", 1, 10), ("c.py", 1, 10)),
+            _pair(("x.py", 1, 5), ("y.py", 1, 5)),
+        ]
+        handled_id = CloneGrouper().group_pairs(raw_pairs[2:])[0].group_id
+
+        async def get_async(key: str) -> dict | None:
+            return {"handled": True} if key.endswith(handled_id) else None
+
+        mock_dhara = MagicMock()
+        mock_dhara.get_async = AsyncMock(side_effect=get_async)
+
+        groups = await CloneGrouper(dhara=mock_dhara).group_pairs_filtered(raw_pairs)
+
+        assert mock_dhara.get_async.await_count == 2
+        assert len(groups) == 1
+        assert len(groups[0].locations) == 3
+
+    async def test_lookup_errors_keep_group(self) -> None:
+        mock_dhara = MagicMock()
+        mock_dhara.get_async = AsyncMock(side_effect=RuntimeError("offline"))
+
+        groups = await CloneGrouper(dhara=mock_dhara).group_pairs_filtered(
+            [_pair(("a.py", 1, 10), ("b.py", 1, 10))]
+        )
+
+        assert len(groups) == 1
+
+
 @pytest.mark.unit
 class TestCloneGrouperDataModel:
     def test_clone_location_from_dict(self) -> None:
@@ -0,0 +1,206 @@
+"""Tests for AIFixEventBus per-sink queues and batched file sinks."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+from crackerjack.core.ai_fix_event_bus import AIFixEventBus, SinkQueueConfig
+from crackerjack.core.ai_fix_events import AIFixEvent, IterationStarted, RunStarted
+from crackerjack.core.ai_fix_sinks import DebugFileSink, JsonlSink
+
+RUN_ID = "2026-07-07-1200-abcd"
+
+
+class CaptureSink:
+    def __init__(self) -> None:
+        self.received: list[AIFixEvent] = []
+
+    async def handle(self, event: AIFixEvent) -> None:
+        self.received.append(event)
+
+
+class BatchCaptureSink(CaptureSink):
+    def __init__(self, gate: asyncio.Event | None = None) -> None:
+        super().__init__()
+        self.batches: list[int] = []
+        self._gate = gate
+
+    async def handle_batch(self, events: Sequence[AIFixEvent]) -> None:
+        if self._gate is not None:
+            await self._gate.wait()
+        self.batches.append(len(events))
+        self.received.extend(events)
+
+
+def _iteration(i: int) -> IterationStarted:
+    return IterationStarted(run_id=RUN_ID, iteration=i, issue_count=i)
+
+
+@pytest.mark.unit
+class TestQueuedSinks:
+    """Queued subscriptions are delivered by a background consumer."""
+
+    @pytest.mark.asyncio
+    async def test_unqueued_sink_is_delivered_inline(self) -> None:
+        bus = AIFixEventBus()
+        sink = CaptureSink()
+        bus.subscribe(sink)
+
+        await bus.emit(_iteration(0))
+
+        assert len(sink.received) == 1
+
+    @pytest.mark.asyncio
+    async def test_queued_sink_receives_batches_after_flush(self) -> None:
+        bus = AIFixEventBus()
+        sink = BatchCaptureSink()
+        bus.subscribe(sink, SinkQueueConfig(batch_size=10, flush_interval_s=0.01))
+
+        for i in range(25):
+            await bus.emit(_iteration(i))
+        await bus.flush()
+
+        assert [e.iteration for e in sink.received] == list(range(25))
+        assert max(sink.batches) <= 10
+        assert len(sink.batches) < 25
+        await bus.aclose()
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_keeps_latest_events(self) -> None:
+        gate = asyncio.Event()
+        bus = AIFixEventBus()
+        sink = BatchCaptureSink(gate)
+        bus.subscribe(
+            sink,
+            SinkQueueConfig(maxsize=3, policy="drop_oldest", flush_interval_s=0),
+        )
+
+        await bus.emit(_iteration(0))
+        await asyncio.sleep(0)  # consumer takes event 0 and waits on the gate
+        for i in range(1, 8):
+            bus.emit_nowait(_iteration(i))
+        gate.set()
+        await bus.flush()
+
+        assert [e.iteration for e in sink.received] == [0, 5, 6, 7]
+        assert bus.dropped == {"BatchCaptureSink": 4}
+        await bus.aclose()
+
+    @pytest.mark.asyncio
+    async def test_block_policy_applies_back_pressure(self) -> None:
+        gate = asyncio.Event()
+        bus = AIFixEventBus()
+        sink = BatchCaptureSink(gate)
+        bus.subscribe(
+            sink, SinkQueueConfig(maxsize=2, policy="block", flush_interval_s=0)
+        )
+
+        await bus.emit(_iteration(0))
+        await asyncio.sleep(0)
+        await bus.emit(_iteration(1))
+        await bus.emit(_iteration(2))
+        blocked = asyncio.create_task(bus.emit(_iteration(3)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        gate.set()
+        await blocked
+        await bus.flush()
+
+        assert [e.iteration for e in sink.received] == [0, 1, 2, 3]
+        assert bus.dropped == {"BatchCaptureSink": 0}
+        await bus.aclose()
+
+    @pytest.mark.asyncio
+    async def test_block_policy_drops_on_sync_emit_when_full(self) -> None:
+        gate = asyncio.Event()
+        bus = AIFixEventBus()
+        sink = BatchCaptureSink(gate)
+        bus.subscribe(
+            sink, SinkQueueConfig(maxsize=2, policy="block", flush_interval_s=0)
+        )
+
+        await bus.emit(_iteration(0))
+        await asyncio.sleep(0)
+        for i in range(1, 6):
+            bus.emit_nowait(_iteration(i))
+        assert len(asyncio.all_tasks()) == 2  # this test and the consumer
+        gate.set()
+        await bus.flush()
+
+        assert [e.iteration for e in sink.received] == [0, 1, 2]
+        assert bus.dropped == {"BatchCaptureSink": 3}
+        await bus.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failing_sink_does_not_stop_consumer(self) -> None:
+        class FlakySink(CaptureSink):
+            async def handle(self, event: AIFixEvent) -> None:
+                if isinstance(event, IterationStarted) and event.iteration == 0:
+                    raise RuntimeError("boom")
+                await super().handle(event)
+
+        bus = AIFixEventBus()
+        sink = FlakySink()
+        bus.subscribe(sink, SinkQueueConfig(batch_size=1))
+
+        await bus.emit(_iteration(0))
+        await bus.emit(_iteration(1))
+        await bus.flush()
+
+        assert [e.iteration for e in sink.received] == [1]
+        await bus.aclose()
+
+
+@pytest.mark.unit
+class TestBatchedFileSinks:
+    """File sinks write a whole batch with one write and one flush."""
+
+    @pytest.mark.asyncio
+    async def test_jsonl_batch_opens_run_and_writes_all_lines(
+        self, tmp_path: Path
+    ) -> None:
+        sink = JsonlSink(base_dir=tmp_path)
+        await sink.handle_batch(
+            [RunStarted(run_id=RUN_ID, iteration=0), _iteration(1), _iteration(2)]
+        )
+        sink.close()
+
+        restored = list(JsonlSink.restore_run(RUN_ID, base_dir=tmp_path))
+        assert [type(e).__name__ for e in restored] == [
+            "RunStarted",
+            "IterationStarted",
+            "IterationStarted",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_jsonl_through_queued_bus(self, tmp_path: Path) -> None:
+        bus = AIFixEventBus()
+        sink = JsonlSink(base_dir=tmp_path)
+        bus.subscribe(sink, SinkQueueConfig())
+
+        await bus.emit(RunStarted(run_id=RUN_ID, iteration=0))
+        for i in range(1, 50):
+            await bus.emit(_iteration(i))
+        await bus.flush()
+        sink.close()
+
+        events_path = tmp_path / ".crackerjack" / "runs" / RUN_ID / "events.jsonl"
+        lines = events_path.read_text().splitlines()
+        assert len(lines) == 50
+        assert json.loads(lines[-1])["iteration"] == 49
+        await bus.aclose()
+
+    @pytest.mark.asyncio
+    async def test_debug_sink_batch(self, tmp_path: Path) -> None:
+        sink = DebugFileSink(base_dir=tmp_path, run_id=RUN_ID)
+        await sink.handle_batch([_iteration(0), _iteration(1)])
+        sink.close()
+
+        log = tmp_path / ".crackerjack" / "runs" / RUN_ID / "debug.log"
+        assert len(log.read_text().splitlines()) == 2
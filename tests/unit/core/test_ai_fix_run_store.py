@@ -0,0 +1,167 @@
+"""Tests for the indexed, compressible AI-fix run store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from crackerjack.core import ai_fix_run_store
+from crackerjack.core.ai_fix_events import (
+    AIFixEvent,
+    FixSessionFinished,
+    FixSessionStarted,
+    IterationStarted,
+    RunFinished,
+    RunStarted,
+)
+from crackerjack.core.ai_fix_run_store import (
+    COMPRESSED_FILE,
+    EVENTS_FILE,
+    INDEX_FILE,
+    RunIndex,
+    RunReader,
+    compact_run,
+)
+from crackerjack.core.ai_fix_sinks import JsonlSink
+
+RUN_ID = "2026-07-07-1200-abcd"
+
+
+def _run_events(iterations: int = 3, per_iteration: int = 4) -> list[AIFixEvent]:
+    events: list[AIFixEvent] = [RunStarted(run_id=RUN_ID, iteration=0)]
+    for i in range(iterations):
+        events.append(IterationStarted(run_id=RUN_ID, iteration=i, issue_count=i))
+        for n in range(per_iteration):
+            sig = f"sig-{n}"
+            events.append(
+                FixSessionStarted(
+                    run_id=RUN_ID, iteration=i, issue_signature=sig, file="a.py"
+                )
+            )
+            events.append(
+                FixSessionFinished(
+                    run_id=RUN_ID, iteration=i, issue_signature=sig, no_op_count=n
+                )
+            )
+    return events
+
+
+async def _record(
+    tmp_path: Path, events: list[AIFixEvent], *, finish: bool = False
+) -> Path:
+    sink = JsonlSink(base_dir=tmp_path)
+    await sink.handle_batch(events)
+    if finish:
+        await sink.handle(RunFinished(run_id=RUN_ID, iteration=0))
+    sink.close()
+    return tmp_path / ".crackerjack" / "runs" / RUN_ID
+
+
+@pytest.mark.unit
+class TestRunIndex:
+    """The sidecar index locates events without scanning the log."""
+
+    @pytest.mark.asyncio
+    async def test_sink_writes_index_on_close(self, tmp_path: Path) -> None:
+        run_dir = await _record(tmp_path, _run_events())
+
+        index = RunIndex.load(run_dir / INDEX_FILE)
+
+        assert index is not None
+        assert index.count == 1 + 3 * 9
+        assert index.indexed_bytes == (run_dir / EVENTS_FILE).stat().st_size
+
+    @pytest.mark.asyncio
+    async def test_reader_filters_by_iteration_kind_and_issue(
+        self, tmp_path: Path
+    ) -> None:
+        run_dir = await _record(tmp_path, _run_events())
+        reader = RunReader(run_dir)
+
+        in_iteration = list(reader.events(iteration=2))
+        finished = list(reader.events(kind=FixSessionFinished.kind))
+        one_issue = list(reader.events(issue="sig-1", iteration=1))
+
+        assert {e.iteration for e in in_iteration} == {2}
+        assert len(in_iteration) == 9
+        assert len(finished) == 12
+        assert [type(e).__name__ for e in one_issue] == [
+            "FixSessionStarted",
+            "FixSessionFinished",
+        ]
+        assert reader.counts_by_kind()[IterationStarted.kind] == 3
+
+    @pytest.mark.asyncio
+    async def test_stale_index_catches_up_and_ignores_torn_line(
+        self, tmp_path: Path
+    ) -> None:
+        run_dir = await _record(tmp_path, _run_events(iterations=1))
+        log = run_dir / EVENTS_FILE
+        with log.open("a", encoding="utf-8") as f:
+            f.write(ai_fix_run_store.encode_event(IterationStarted(RUN_ID, 7)))
+            f.write('{"run_id": "torn')
+
+        reader = RunReader(run_dir)
+
+        assert [e.iteration for e in reader.events(kind="iteration_started")] == [
+            0,
+            7,
+        ]
+
+    def test_index_round_trips_through_bytes(self) -> None:
+        index = RunIndex()
+        for ordinal in range(6):
+            index.record(ordinal * 10, 10, ordinal // 3, "k", f"s{ordinal % 2}")
+
+        restored = RunIndex.from_bytes(index.to_bytes())
+
+        assert restored is not None
+        assert restored.offsets == index.offsets
+        assert restored.select(iteration=1, issue="s1") == [3, 5]
+
+
+@pytest.mark.unit
+class TestCompaction:
+    """Finished runs are stored as block-compressed gzip."""
+
+    @pytest.mark.asyncio
+    async def test_finished_run_is_compacted_and_still_queryable(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(ai_fix_run_store, "BLOCK_EVENTS", 5)
+        events = _run_events()
+        run_dir = await _record(tmp_path, events, finish=True)
+
+        assert not (run_dir / EVENTS_FILE).exists()
+        assert (run_dir / COMPRESSED_FILE).exists()
+
+        reader = RunReader(run_dir)
+        assert len(reader) == len(events) + 1
+        assert [e.iteration for e in reader.events(kind="iteration_started")] == [
+            0,
+            1,
+            2,
+        ]
+        restored = list(JsonlSink.restore_run(RUN_ID, base_dir=tmp_path))
+        assert [type(e) for e in restored[:-1]] == [type(e) for e in events]
+
+    @pytest.mark.asyncio
+    async def test_unfinished_run_is_left_plain(self, tmp_path: Path) -> None:
+        run_dir = await _record(tmp_path, _run_events(iterations=1))
+
+        assert (run_dir / EVENTS_FILE).exists()
+        assert not (run_dir / COMPRESSED_FILE).exists()
+
+    @pytest.mark.asyncio
+    async def test_missing_index_is_rebuilt_for_compressed_run(
+        self, tmp_path: Path
+    ) -> None:
+        run_dir = await _record(tmp_path, _run_events(iterations=1))
+        assert compact_run(run_dir)
+        (run_dir / INDEX_FILE).unlink()
+
+        reader = RunReader(run_dir)
+
+        assert len(reader) == 10
+        assert len(list(reader.events(issue="sig-0"))) == 2
@@ -497,3 +497,90 @@ class TestFileChangeTracker:
         (tmp_path / "a.py").write_text("x = 1")
         tracker = _FileChangeTracker(tmp_path)
         assert tracker.delta() == 0
+
+    def test_changed_files_for_explicit_paths(self, tmp_path: Path) -> None:
+        """capture(paths) tracks only the given files and reports which changed."""
+        a, b = tmp_path / "a.py", tmp_path / "b.py"
+        a.write_text("x = 1")
+        b.write_text("y = 1")
+        tracker = _FileChangeTracker(tmp_path)
+        tracker.capture([a, b])
+        b.write_text("y = 22")
+        assert tracker.changed_files() == [b]
+
+
+class TestTargetedReverification:
+    """Re-checks after a native fix cover only the files the fix modified."""
+
+    @pytest.mark.asyncio
+    async def test_refurb_recheck_limited_to_modified_files(
+        self, tmp_path: Path
+    ) -> None:
+        a, b = tmp_path / "a.py", tmp_path / "b.py"
+        a.write_text("x = 1")
+        b.write_text("y = 1")
+        coordinator = AutofixCoordinator(pkg_path=tmp_path)
+        adapter = MagicMock()
+        adapter.check = AsyncMock(return_value=SimpleNamespace(parsed_issues=[]))
+
+        def fix(paths: list[Path]) -> bool:
+            b.write_text("y = 2")
+            return True
+
+        with (
+            patch.object(coordinator, "_collect_refurb_files", return_value=[a, b]),
+            patch.object(coordinator, "_run_refurb_safe_fixes", side_effect=fix),
+            patch.object(
+                coordinator, "_create_type_tool_adapter", return_value=adapter
+            ),
+        ):
+            refreshed = await coordinator._apply_refurb_fix_prepasses([])
+
+        adapter.check.assert_awaited_once_with(files=[b])
+        assert refreshed == {"refurb": []}
+
+    @pytest.mark.asyncio
+    async def test_recheck_skipped_when_fix_changed_nothing(
+        self, tmp_path: Path
+    ) -> None:
+        a = tmp_path / "a.py"
+        a.write_text("x = 1")
+        coordinator = AutofixCoordinator(pkg_path=tmp_path)
+        adapter = MagicMock()
+        adapter.check = AsyncMock()
+
+        with (
+            patch.object(coordinator, "_collect_refurb_files", return_value=[a]),
+            patch.object(coordinator, "_run_refurb_safe_fixes", return_value=True),
+            patch.object(
+                coordinator, "_create_type_tool_adapter", return_value=adapter
+            ),
+        ):
+            refreshed = await coordinator._apply_refurb_fix_prepasses([])
+
+        adapter.check.assert_not_awaited()
+        assert refreshed == {}
+
+    def test_issues_in_unchecked_files_are_kept(self, tmp_path: Path) -> None:
+        coordinator = AutofixCoordinator(pkg_path=tmp_path)
+        kept = Issue(
+            type=IssueType.REFURB,
+            severity=Priority.MEDIUM,
+            message="FURB1",
+            file_path=str(tmp_path / "a.py"),
+            stage="refurb",
+        )
+        stale = Issue(
+            type=IssueType.REFURB,
+            severity=Priority.MEDIUM,
+            message="FURB2",
+            file_path=str(tmp_path / "b.py"),
+            stage="refurb",
+        )
+        coordinator._rechecked_files = {"refurb": {(tmp_path / "b.py").resolve()}}
+
+        result = coordinator._replace_refreshed_type_issues(
+            [kept, stale], {"refurb": []}
+        )
+
+        assert result == [kept]
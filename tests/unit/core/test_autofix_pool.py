@@ -0,0 +1,83 @@
+"""Unit tests for the concurrent per-file autofix worker pool."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from crackerjack.core.autofix_pool import AutofixWorkerPool
+from crackerjack.models.autofix import StepResult
+from crackerjack.models.issues import Issue, IssueType, Priority
+
+
+def _append_marker(path: Path) -> int:
+    path.write_text(path.read_text() + "# fixed\n")
+    return 1
+
+
+def _issue(path: Path, message: str = "") -> Issue:
+    return Issue(
+        type=IssueType.FORMATTING,
+        severity=Priority.LOW,
+        message=message,
+        file_path=str(path),
+    )
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> list[Path]:
+    paths = [tmp_path / f"mod_{i}.py" for i in range(6)]
+    for path in paths:
+        path.write_text("x = 1\n")
+    return paths
+
+
+@pytest.mark.unit
+class TestMapFiles:
+    """File-level fixers run concurrently and report a StepResult."""
+
+    @pytest.mark.asyncio
+    async def test_thread_mode_runs_files_concurrently(self, files: list[Path]) -> None:
+        active = 0
+        peak = 0
+        guard = threading.Lock()
+
+        def slow_fix(path: Path) -> bool:
+            nonlocal active, peak
+            with guard:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with guard:
+                active -= 1
+            return path.name != "mod_0.py"
+
+        result = await AutofixWorkerPool(max_concurrency=4).map_files(files, slow_fix)
+
+        assert isinstance(result, StepResult)
+        assert peak > 1
+        assert result.fixes_applied == 5
+        assert files[0] not in result.files_modified
+
+    @pytest.mark.asyncio
+    async def test_process_mode_applies_fixes(self, files: list[Path]) -> None:
+        pool = AutofixWorkerPool(process_workers=2, process_threshold=2)
+
+        result = await pool.map_files(files, _append_marker, mode="process")
+
+        assert result.success
+        assert result.fixes_applied == len(files)
+        assert all(path.read_text().endswith("# fixed\n") for path in files)
+
+    @pytest.mark.asyncio
+    async def test_errors_are_reported_not_raised(self, files: list[Path]) -> None:
+        def broken(path: Path) -> int:
+            raise RuntimeError("boom")
+
+        result = await AutofixWorkerPool().map_files(files[:2], broken)
+
+        assert not result.success
+        assert "boom" in result.failure_reason
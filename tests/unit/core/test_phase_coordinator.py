@@ -47,6 +47,15 @@ class TestPhaseCoordinatorInitialization:
         assert coordinator.session is session
         assert coordinator._settings is settings
 
+    def test_cleaning_workers_reach_code_cleaner(self) -> None:
+        """The cleaning.cleaning_workers setting sizes the cleaner's pool."""
+        settings = CrackerjackSettings()
+        settings.cleaning.cleaning_workers = 3
+
+        coordinator = PhaseCoordinator(pkg_path=Path("/tmp/test"), settings=settings)
+
+        assert coordinator.code_cleaner.max_workers == 3
+
 
 class TestPhaseCoordinatorProperties:
     """Test PhaseCoordinator properties."""
@@ -0,0 +1,61 @@
+"""Unit tests for the post-autofix verification planner."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from crackerjack.core.verification_planner import VerificationPlanner
+
+
+@pytest.fixture
+def planner(tmp_path: Path) -> VerificationPlanner:
+    return VerificationPlanner(tmp_path)
+
+
+@pytest.mark.unit
+class TestVerificationPlanner:
+    """Scope re-verification to modified files where the tool allows it."""
+
+    def test_file_scoped_hooks_get_only_relevant_modified_files(
+        self, planner: VerificationPlanner, tmp_path: Path
+    ) -> None:
+        modified = [tmp_path / "pkg" / "a.py", tmp_path / "README.md"]
+
+        plan = planner.plan(modified, ["refurb", "mdformat", "ruff"])
+
+        assert plan.step_for("refurb").files == (tmp_path / "pkg" / "a.py",)
+        assert plan.step_for("mdformat").files == (tmp_path / "README.md",)
+        assert plan.step_for("ruff").files == (tmp_path / "pkg" / "a.py",)
+        assert plan.full_runs == []
+
+    def test_whole_project_tools_fall_back_to_full_run(
+        self, planner: VerificationPlanner, tmp_path: Path
+    ) -> None:
+        plan = planner.plan([tmp_path / "a.py"], ["ty", "zuban", "creosote"])
+
+        assert plan.full_runs == ["ty", "zuban", "creosote"]
+
+    def test_hooks_without_relevant_changes_are_skipped(
+        self, planner: VerificationPlanner, tmp_path: Path
+    ) -> None:
+        plan = planner.plan([tmp_path / "notes.md"], ["refurb", "zuban"])
+
+        assert plan.steps == []
+        assert plan.skipped == ["refurb", "zuban"]
+
+    def test_config_changes_force_full_run(
+        self, planner: VerificationPlanner, tmp_path: Path
+    ) -> None:
+        plan = planner.plan([tmp_path / "mypy.ini"], ["zuban", "refurb"])
+
+        assert plan.full_runs == ["zuban", "refurb"]
+
+    def test_nothing_modified_means_nothing_to_verify(
+        self, planner: VerificationPlanner
+    ) -> None:
+        plan = planner.plan([], ["ruff-check", "ty"])
+
+        assert plan.steps == []
+        assert plan.skipped == ["ruff-check", "ty"]
@@ -0,0 +1,182 @@
+"""Unit tests for the SQLite-backed MCP ErrorCache.
+
+Tests indexed lookups, incremental success rates, write-behind
+persistence, retention bounds and migration from the JSON cache files.
+"""
+
+import gc
+import json
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from crackerjack.mcp.cache import ErrorCache, ErrorPattern, FixResult
+
+
+def _pattern(
+    pattern_id: str, error_type: str = "ruff", code: str = "F401"
+) -> ErrorPattern:
+    return ErrorPattern(
+        pattern_id=pattern_id,
+        error_type=error_type,
+        error_code=code,
+        message_pattern=f"message for {pattern_id}",
+    )
+
+
+def _fix(pattern_id: str, success: bool, fix_id: str = "fix") -> FixResult:
+    return FixResult(
+        fix_id=fix_id,
+        pattern_id=pattern_id,
+        success=success,
+        files_affected=["a.py"],
+        time_taken=0.1,
+    )
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[ErrorCache]:
+    cache = ErrorCache(tmp_path)
+    yield cache
+    cache.close()
+
+
+@pytest.mark.unit
+class TestIndexedLookups:
+    """Secondary indexes on error_type and error_code."""
+
+    @pytest.mark.asyncio
+    async def test_find_by_type_and_code(self, cache: ErrorCache) -> None:
+        await cache.add_pattern(_pattern("a", "ruff", "F401"))
+        await cache.add_pattern(_pattern("b", "ruff", "E501"))
+        await cache.add_pattern(_pattern("c", "bandit", "B101"))
+
+        assert {p.pattern_id for p in cache.find_patterns_by_type("ruff")} == {"a", "b"}
+        assert [p.pattern_id for p in cache.find_patterns_by_code("B101")] == ["c"]
+        assert cache.get_cache_stats()["error_types"] == {"ruff": 2, "bandit": 1}
+
+    @pytest.mark.asyncio
+    async def test_repeat_pattern_bumps_frequency(self, cache: ErrorCache) -> None:
+        await cache.add_pattern(_pattern("a"))
+        await cache.add_pattern(_pattern("a"))
+
+        assert cache.get_pattern("a").frequency == 2
+        assert len(cache.find_patterns_by_type("ruff")) == 1
+
+
+@pytest.mark.unit
+class TestFixResults:
+    """Incremental success rates and bounded retention."""
+
+    @pytest.mark.asyncio
+    async def test_success_rate_is_incremental(self, cache: ErrorCache) -> None:
+        await cache.add_pattern(_pattern("a"))
+        for success in (True, False, True, True):
+            await cache.add_fix_result(_fix("a", success))
+
+        assert cache.get_fix_success_rate("a") == 0.75
+        assert cache.get_fix_success_rate("missing") == 0.0
+        assert cache.get_pattern("a").auto_fixable
+
+    @pytest.mark.asyncio
+    async def test_retention_keeps_rates_for_trimmed_results(
+        self, tmp_path: Path
+    ) -> None:
+        cache = ErrorCache(tmp_path, max_fix_results=3)
+        for i in range(10):
+            await cache.add_fix_result(_fix("a", i % 2 == 0, fix_id=str(i)))
+        cache.close()
+
+        reopened = ErrorCache(tmp_path, max_fix_results=3)
+        try:
+            assert [r.fix_id for r in reopened.fix_results] == ["7", "8", "9"]
+            assert reopened.get_fix_success_rate("a") == 0.5
+            assert reopened.get_cache_stats()["total_fix_attempts"] == 10
+        finally:
+            reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_pattern_count_is_bounded(self, tmp_path: Path) -> None:
+        cache = ErrorCache(tmp_path, max_patterns=10)
+        try:
+            for i in range(25):
+                pattern = _pattern(f"p{i}")
+                pattern.last_seen = float(i)
+                await cache.add_pattern(pattern)
+
+            assert len(cache.patterns) <= 11
+            assert "p24" in cache.patterns
+            assert "p0" not in cache.patterns
+        finally:
+            cache.close()
+
+
+@pytest.mark.unit
+class TestPersistence:
+    """Writes are batched off the request path and survive a restart."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_through_database(self, tmp_path: Path) -> None:
+        cache = ErrorCache(tmp_path)
+        await cache.add_pattern(_pattern("a"))
+        await cache.add_fix_result(_fix("a", True))
+        cache.close()
+
+        reopened = ErrorCache(tmp_path)
+        try:
+            pattern = reopened.get_pattern("a")
+            assert pattern is not None
+            assert pattern.auto_fixable
+            assert pattern.common_fixes == ["Auto-fix applied for a"]
+            assert reopened.get_fix_success_rate("a") == 1.0
+        finally:
+            reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_unclosed_cache_drains_on_collection(self, tmp_path: Path) -> None:
+        cache = ErrorCache(tmp_path, flush_interval_ms=10_000)
+        await cache.add_pattern(_pattern("a"))
+        del cache
+        gc.collect()
+
+        reopened = ErrorCache(tmp_path)
+        try:
+            assert reopened.get_pattern("a") is not None
+        finally:
+            reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_old_patterns_is_persisted(self, tmp_path: Path) -> None:
+        cache = ErrorCache(tmp_path)
+        stale = _pattern("old")
+        stale.last_seen = time.time() - 90 * 24 * 3600
+        await cache.add_pattern(stale)
+        await cache.add_pattern(_pattern("new"))
+
+        assert cache.cleanup_old_patterns(days=30) == 1
+        cache.close()
+
+        reopened = ErrorCache(tmp_path)
+        try:
+            assert set(reopened.patterns) == {"new"}
+        finally:
+            reopened.close()
+
+    def test_migrates_legacy_json_files(self, tmp_path: Path) -> None:
+        (tmp_path / "error_patterns.json").write_text(
+            json.dumps({"a": _pattern("a").to_dict()})
+        )
+        (tmp_path / "fix_results.json").write_text(
+            json.dumps([_fix("a", True).to_dict(), _fix("a", False).to_dict()])
+        )
+
+        cache = ErrorCache(tmp_path)
+        try:
+            assert cache.get_pattern("a") is not None
+            assert cache.get_fix_success_rate("a") == 0.5
+            assert not (tmp_path / "error_patterns.json").exists()
+            assert (tmp_path / "error_patterns.json.migrated").exists()
+        finally:
+            cache.close()
@@ -0,0 +1,182 @@
+"""Unit tests for TimeSeriesStore.
+
+Tests columnar segment storage, rollups, retention and the compaction and
+predictive analytics integrations.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from crackerjack.services.ai.advanced_optimizer import DataCompactionManager
+from crackerjack.services.ai.predictive_analytics import PredictiveAnalyticsEngine
+from crackerjack.services.ai.timeseries_store import (
+    DAILY,
+    HOURLY,
+    RAW,
+    RAW_DTYPE,
+    TimeSeriesStore,
+    rollup_std,
+)
+
+DAY = 86400.0
+NOW = datetime(2026, 6, 1, tzinfo=UTC).timestamp()
+
+
+def _fill(store: TimeSeriesStore, days: float, step: float = 600.0) -> np.ndarray:
+    stamps = np.arange(NOW - days * DAY, NOW, step)
+    values = np.sin(stamps / 3600.0) + 10.0
+    store.append("execution_time", values, stamps)
+    return values
+
+
+@pytest.mark.unit
+class TestStorage:
+    """Test appending and reading segments."""
+
+    def test_append_and_read_round_trip(self, tmp_path: Path) -> None:
+        """Values come back in order, split across daily raw segments."""
+        store = TimeSeriesStore(tmp_path)
+        values = _fill(store, days=3)
+
+        records = store.read("execution_time")
+
+        assert records.dtype == RAW_DTYPE
+        np.testing.assert_array_equal(records["value"], values)
+        segments = list((tmp_path / "metrics_raw" / "execution_time").glob("*.seg"))
+        assert len(segments) == 3
+
+    def test_read_filters_by_time_range(self, tmp_path: Path) -> None:
+        """start is inclusive and end is exclusive."""
+        store = TimeSeriesStore(tmp_path)
+        store.append("x", [1.0, 2.0, 3.0], [NOW, NOW + 60, NOW + 120])
+
+        values = store.values("x", start=NOW + 60, end=NOW + 120)
+
+        assert values.tolist() == [2.0]
+
+    def test_scalar_append_with_datetime(self, tmp_path: Path) -> None:
+        """A single value and datetime are accepted."""
+        store = TimeSeriesStore(tmp_path)
+        store.append("x", 4.5, datetime.fromtimestamp(NOW, tz=UTC))
+
+        assert store.read("x")["ts"].tolist() == [NOW]
+
+    def test_truncated_record_ignored(self, tmp_path: Path) -> None:
+        """A partial trailing record from an interrupted append is skipped."""
+        store = TimeSeriesStore(tmp_path)
+        store.append("x", [1.0, 2.0], [NOW, NOW + 1])
+        (segment,) = (tmp_path / "metrics_raw" / "x").glob("*.seg")
+        with segment.open("ab") as f:
+            f.write(b"\x00" * 5)
+
+        assert store.values("x").tolist() == [1.0, 2.0]
+
+    def test_append_after_truncated_record(self, tmp_path: Path) -> None:
+        """Appends after a crash drop the partial record and stay aligned."""
+        store = TimeSeriesStore(tmp_path)
+        store.append("x", [1.0, 2.0], [NOW, NOW + 1])
+        (segment,) = (tmp_path / "metrics_raw" / "x").glob("*.seg")
+        with segment.open("ab") as f:
+            f.write(b"\x00" * 5)
+
+        store.append("x", [3.0], [NOW + 2])
+
+        assert store.values("x").tolist() == [1.0, 2.0, 3.0]
+        assert store.read("x")["ts"].tolist() == [NOW, NOW + 1, NOW + 2]
+
+    def test_invalid_metric_name_rejected(self, tmp_path: Path) -> None:
+        """Metric names cannot escape the storage directory."""
+        store = TimeSeriesStore(tmp_path)
+        with pytest.raises(ValueError, match="Invalid metric name"):
+            store.append("../x", [1.0], [NOW])
+
+
+@pytest.mark.unit
+class TestRollups:
+    """Test hourly and daily rollups and retention."""
+
+    def test_hourly_rollup_statistics(self, tmp_path: Path) -> None:
+        """Each completed hour keeps count, mean, min, max and spread."""
+        store = TimeSeriesStore(tmp_path)
+        store.append("x", [1.0, 2.0, 3.0, 10.0], [NOW, NOW + 60, NOW + 120, NOW + 3600])
+
+        assert store.rollup("x", RAW, now=NOW + 7200) == 4
+
+        hourly = store.read("x", HOURLY)
+        assert hourly["count"].tolist() == [3, 1]
+        assert store.values("x", HOURLY).tolist() == [2.0, 10.0]
+        assert hourly["min"].tolist() == [1.0, 10.0]
+        assert hourly["max"].tolist() == [3.0, 10.0]
+        assert rollup_std(hourly)[0] == pytest.approx(1.0)
+
+    def test_rollup_is_incremental(self, tmp_path: Path) -> None:
+        """The current hour is left alone and rolled up on a later pass."""
+        store = TimeSeriesStore(tmp_path)
+        store.append("x", [1.0, 5.0], [NOW, NOW + 3600])
+
+        assert store.rollup("x", RAW, now=NOW + 3700) == 1
+        assert store.rollup("x", RAW, now=NOW + 3800) == 0
+        assert store.rollup("x", RAW, now=NOW + 7200) == 1
+        assert store.values("x", HOURLY).tolist() == [1.0, 5.0]
+
+    def test_compaction_applies_retention(self, tmp_path: Path) -> None:
+        """Raw data past retention is dropped once rolled up to hourly and daily."""
+        store = TimeSeriesStore(tmp_path)
+        values = _fill(store, days=10)
+
+        store.compact(RAW, now=NOW)
+        store.compact(HOURLY, now=NOW)
+
+        raw = store.read("execution_time")
+        assert raw["ts"].min() >= NOW - 7 * DAY
+        hourly = store.read("execution_time", HOURLY)
+        assert hourly["count"].sum() == len(values)
+        daily = store.read("execution_time", DAILY)
+        assert daily["count"].sum() == len(values)
+        assert daily["sum"].sum() == pytest.approx(values.sum())
+
+
+@pytest.mark.unit
+class TestIntegrations:
+    """Test the compaction manager and analytics engine on top of the store."""
+
+    def test_compaction_manager_rolls_up_metrics(self, tmp_path: Path) -> None:
+        """compact_data on a metrics type rolls up and reports what it did."""
+        manager = DataCompactionManager(storage_dir=tmp_path)
+        manager.timeseries.append(
+            "execution_time", [1.0, 2.0], [NOW - 9 * DAY, NOW - 9 * DAY + 60]
+        )
+
+        result = manager.compact_data("metrics_raw")
+
+        assert result["status"] == "success"
+        assert result["compacted_records"] == 4
+        assert manager.timeseries.read("execution_time").size == 0
+        assert manager.timeseries.values("execution_time", HOURLY).tolist() == [1.5]
+
+    def test_engine_loads_history_from_store(self, tmp_path: Path) -> None:
+        """History loaded from rollups feeds the vectorised predictors."""
+        store = TimeSeriesStore(tmp_path)
+        stamps = NOW - np.arange(48, 0, -1) * 3600.0
+        store.append("memory_usage", np.arange(48, dtype=float), stamps)
+        store.rollup("memory_usage", RAW, now=NOW)
+
+        engine = PredictiveAnalyticsEngine(store=store)
+        assert engine.load_history("memory_usage", HOURLY) == 48
+
+        analysis = engine.trend_analyses["memory_usage"]
+        assert analysis.trend_direction == "increasing"
+        assert analysis.predicted_values[0] == pytest.approx(48.0)
+
+    def test_engine_writes_through_to_store(self, tmp_path: Path) -> None:
+        """Metrics added to the engine are persisted in the store."""
+        store = TimeSeriesStore(tmp_path)
+        engine = PredictiveAnalyticsEngine(store=store)
+        engine.add_metric("x", 3.0, datetime.fromtimestamp(NOW, tz=UTC))
+
+        assert store.values("x").tolist() == [3.0]
@@ -263,6 +263,46 @@ class TestMixedFlaggedAndCleanContent:
         assert len(matches) == 3
 
 
+class TestSinglePassMatching:
+    """All phrases are found in one scan of the whole document."""
+
+    def test_overlapping_phrases_all_reported(self):
+        detector = AntiAIFlavorDetector(phrases=("robust", "robust design", "design"))
+        matches = detector.detect("A Robust Design.")
+        assert [(m.phrase, m.column) for m in matches] == [
+            ("robust", 3),
+            ("robust design", 3),
+            ("design", 10),
+        ]
+
+    def test_prefix_phrase_still_needs_word_boundary(self):
+        detector = AntiAIFlavorDetector(phrases=("robust", "robustness"))
+        matches = detector.detect("robustness matters")
+        assert [m.phrase for m in matches] == ["robustness"]
+
+    def test_phrase_does_not_span_lines(self):
+        detector = AntiAIFlavorDetector(phrases=("delve",))
+        matches = detector.detect("first line\r\nthen we delve\nagain delve")
+        assert [(m.line, m.column) for m in matches] == [(2, 9), (3, 7)]
+
+    @pytest.mark.parametrize(
+        "phrase, text, expected",
+        [
+            ("very very", "very very very", [(1, 1)]),
+            ("a a", "a a a a", [(1, 1), (1, 5)]),
+        ],
+    )
+    def test_repeated_phrase_hits_do_not_overlap(self, phrase, text, expected):
+        detector = AntiAIFlavorDetector(phrases=(phrase,))
+        matches = detector.detect(text)
+        assert [(m.line, m.column) for m in matches] == expected
+
+    def test_columns_unaffected_by_case_folding(self):
+        detector = AntiAIFlavorDetector(phrases=("synergy",))
+        matches = detector.detect("İstanbul SYNERGY")
+        assert [(m.line, m.column) for m in matches] == [(1, 10)]
+
+
 @pytest.mark.parametrize(
     "phrase, sample",
     [
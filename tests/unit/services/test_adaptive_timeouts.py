@@ -0,0 +1,147 @@
+"""Unit tests for AdaptiveTimeouts.
+
+Tests timeouts derived from recorded command durations, the timeout feedback
+loop and the hook executor integration.
+"""
+
+import itertools
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from crackerjack.config.hooks import HookDefinition
+from crackerjack.executors.hook_executor import HookExecutor
+from crackerjack.services.adaptive_timeouts import AdaptiveTimeouts, TimeoutPolicy
+from crackerjack.services.run_history import BATCH, RunHistory, RunSample
+
+_clock = itertools.count(1_000_000)
+
+
+def _record(
+    history: RunHistory,
+    name: str,
+    durations: list[float],
+    files: list[int],
+    status: str = "passed",
+) -> None:
+    recorder = history.start_run()
+    for duration, count in zip(durations, files, strict=True):
+        recorder.record(
+            RunSample(
+                kind=BATCH,
+                name=name,
+                duration=duration,
+                files=count,
+                status=status,
+                recorded_at=float(next(_clock)),
+            )
+        )
+    history.flush()
+
+
+@pytest.fixture
+def history(tmp_path: Path) -> RunHistory:
+    with RunHistory(tmp_path / "history.db") as history:
+        yield history
+
+
+@pytest.mark.unit
+class TestTimeoutModel:
+    """Test timeouts computed from the duration distribution."""
+
+    def test_default_without_history(self, history: RunHistory) -> None:
+        """Hooks with too few samples keep their configured timeout."""
+        _record(history, "ruff-check", [1.0, 1.0], [0, 0])
+        timeouts = AdaptiveTimeouts(history)
+
+        assert timeouts.timeout("ruff-check", 60.0) == 60.0
+        assert timeouts.timeout("unknown", 90.0, files=3) == 90.0
+
+    def test_whole_project_uses_percentile(self, history: RunHistory) -> None:
+        """A whole-project run gets p99 times the margin, above the floor."""
+        durations = np.linspace(10.0, 20.0, 50).tolist()
+        _record(history, "zuban", durations, [0] * 50)
+        timeouts = AdaptiveTimeouts(history, TimeoutPolicy(margin=1.5, floor=5.0))
+
+        expected = float(np.percentile(durations, 99.0)) * 1.5
+        assert timeouts.timeout("zuban", 240.0) == pytest.approx(expected)
+
+    def test_scales_with_input_size(self, history: RunHistory) -> None:
+        """Small change sets get short timeouts and large ones long timeouts."""
+        files = [1, 2, 5, 10, 20, 50, 100, 200] * 3
+        _record(history, "codespell", [0.5 + 0.1 * n for n in files], files)
+        timeouts = AdaptiveTimeouts(history, TimeoutPolicy(margin=2.0, floor=1.0))
+
+        assert timeouts.timeout("codespell", 60.0, files=1) == pytest.approx(1.2)
+        assert timeouts.timeout("codespell", 60.0, files=300) == pytest.approx(61.0)
+
+    def test_clamped_to_floor_and_ceiling(self, history: RunHistory) -> None:
+        """The floor and ceiling bound whatever the history suggests."""
+        _record(history, "fast", [0.1] * 10, [0] * 10)
+        _record(history, "slow", [500.0] * 10, [0] * 10)
+        timeouts = AdaptiveTimeouts(history, TimeoutPolicy(floor=10.0))
+
+        assert timeouts.timeout("fast", 60.0) == 10.0
+        assert timeouts.timeout("slow", 60.0) == 120.0
+
+
+@pytest.mark.unit
+class TestTimeoutFeedback:
+    """Test that timeouts raise the next limit."""
+
+    def test_observed_timeout_backs_off(self, history: RunHistory) -> None:
+        """A timeout in this run raises the limit for the next attempt."""
+        _record(history, "refurb", [10.0] * 10, [0] * 10)
+        timeouts = AdaptiveTimeouts(history, TimeoutPolicy(floor=1.0))
+        assert timeouts.timeout("refurb", 120.0) == pytest.approx(15.0)
+
+        timeouts.observe_timeout("refurb", 15.0)
+
+        assert timeouts.timeout("refurb", 120.0) == pytest.approx(22.5)
+
+    def test_recorded_timeout_carries_over(self, history: RunHistory) -> None:
+        """A timeout recorded by the previous run is applied to the next one."""
+        _record(history, "ty", [10.0] * 10, [0] * 10)
+        _record(history, "ty", [30.0], [0], status="timeout")
+
+        timeouts = AdaptiveTimeouts(history, TimeoutPolicy(floor=1.0))
+
+        assert timeouts.timeout("ty", 120.0) == pytest.approx(45.0)
+
+        # Once the hook succeeds again only the distribution is used.
+        _record(history, "ty", [10.0], [0])
+        assert (
+            AdaptiveTimeouts(history, TimeoutPolicy(floor=1.0)).timeout("ty", 120.0)
+            < 45.0
+        )
+
+
+@pytest.mark.unit
+class TestExecutorIntegration:
+    """Test the executor applying and feeding back adaptive timeouts."""
+
+    def test_adaptive_timeout_applied_and_fed_back(
+        self, history: RunHistory, tmp_path: Path
+    ) -> None:
+        """The computed timeout reaches subprocess.run and timeouts are recorded."""
+        _record(history, "quick", [2.0] * 10, [0] * 10)
+        hook = HookDefinition(name="quick", command=["quick"], timeout=60)
+        executor = HookExecutor(MagicMock(), tmp_path, quiet=True)
+        executor._get_clean_environment = MagicMock(return_value={})  # type: ignore[method-assign]
+        executor.timeout_model = AdaptiveTimeouts(history, TimeoutPolicy(floor=1.0))
+        executor.run_recorder = history.start_run()
+
+        with patch(
+            "crackerjack.executors.hook_executor.subprocess.run",
+            side_effect=subprocess.TimeoutExpired(["quick"], 3.0),
+        ) as mock_run:
+            result = executor.execute_single_hook(hook)
+
+        assert mock_run.call_args.kwargs["timeout"] == pytest.approx(3.0)
+        assert result.status == "timeout"
+        assert "timeout of 3s" in (result.error_message or "")
+        assert history.recent("quick")[-1][2] == "timeout"
+        assert executor._timeout_for(hook, 0) == pytest.approx(4.5)
@@ -0,0 +1,160 @@
+"""Unit tests for AnomalyDetector.
+
+Tests streaming baseline statistics, bulk backfill and model state
+persistence.
+"""
+
+import statistics
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from crackerjack.services.anomaly_detector import AnomalyDetector
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _series(count: int, seed: int = 0) -> tuple[list[float], list[datetime]]:
+    rng = np.random.default_rng(seed)
+    values = rng.normal(50.0, 5.0, count).tolist()
+    stamps = [BASE_TIME + timedelta(minutes=41 * i) for i in range(count)]
+    return values, stamps
+
+
+@pytest.mark.unit
+class TestStreamingBaseline:
+    """Test the sliding-window statistics."""
+
+    def test_baseline_matches_window_statistics(self) -> None:
+        """Running stats equal a full recomputation over the window."""
+        detector = AnomalyDetector(baseline_window=50)
+        values, stamps = _series(400)
+        for value, stamp in zip(values, stamps, strict=True):
+            detector.add_metric("execution_time", value, stamp)
+
+        window = values[-50:]
+        baseline = detector.baselines["execution_time"]
+        assert baseline.mean == pytest.approx(statistics.mean(window))
+        assert baseline.std_dev == pytest.approx(statistics.stdev(window))
+        assert baseline.min_value == min(window)
+        assert baseline.max_value == max(window)
+        assert baseline.sample_count == 50
+
+    def test_seasonal_patterns_track_window(self) -> None:
+        """Hourly means are kept for hours with enough samples in the window."""
+        detector = AnomalyDetector(baseline_window=48)
+        for i in range(96):
+            stamp = BASE_TIME + timedelta(hours=i)
+            detector.add_metric("execution_time", float(stamp.hour), stamp)
+
+        patterns = detector.baselines["execution_time"].seasonal_patterns
+        assert patterns == {}
+
+        for i in range(96, 96 + 48):
+            stamp = BASE_TIME + timedelta(minutes=20 * i)
+            detector.add_metric("execution_time", 10.0, stamp)
+
+        patterns = detector.baselines["execution_time"].seasonal_patterns
+        assert patterns
+        assert set(patterns.values()) == {10.0}
+
+    def test_outlier_is_reported(self) -> None:
+        """A value far outside the baseline is flagged."""
+        detector = AnomalyDetector()
+        values, stamps = _series(60)
+        for value, stamp in zip(values, stamps, strict=True):
+            detector.add_metric("execution_time", value, stamp)
+
+        detector.add_metric("execution_time", 500.0, stamps[-1] + timedelta(hours=1))
+
+        assert detector.anomalies[-1].value == 500.0
+        assert detector.anomalies[-1].severity == "critical"
+
+
+@pytest.mark.unit
+class TestBulkBackfill:
+    """Test add_metrics with NumPy input."""
+
+    def test_backfill_matches_streaming(self) -> None:
+        """Backfilling yields the same baseline as adding points one by one."""
+        values, stamps = _series(1000, seed=1)
+        streamed = AnomalyDetector()
+        for value, stamp in zip(values, stamps, strict=True):
+            streamed.add_metric("coverage_percentage", value, stamp)
+
+        backfilled = AnomalyDetector()
+        added = backfilled.add_metrics(
+            "coverage_percentage",
+            np.array(values),
+            np.array([s.replace(tzinfo=None) for s in stamps], dtype="datetime64[ns]"),
+        )
+
+        expected = streamed.baselines["coverage_percentage"]
+        actual = backfilled.baselines["coverage_percentage"]
+        assert added == 0
+        assert backfilled.anomalies == []
+        assert actual.mean == pytest.approx(expected.mean)
+        assert actual.std_dev == pytest.approx(expected.std_dev)
+        assert actual.seasonal_patterns == pytest.approx(expected.seasonal_patterns)
+
+    def test_backfill_can_detect_anomalies(self) -> None:
+        """With detection on, every point is checked as if streamed."""
+        values, stamps = _series(300, seed=2)
+        values[200] = 1000.0
+        streamed = AnomalyDetector()
+        for value, stamp in zip(values, stamps, strict=True):
+            streamed.add_metric("execution_time", value, stamp)
+
+        detector = AnomalyDetector()
+        found = detector.add_metrics(
+            "execution_time", values, stamps, detect_anomalies=True
+        )
+
+        assert found == len(streamed.anomalies)
+        assert [a.value for a in detector.anomalies] == [
+            a.value for a in streamed.anomalies
+        ]
+
+    def test_mismatched_lengths_rejected(self) -> None:
+        """Values and timestamps must line up."""
+        detector = AnomalyDetector()
+        with pytest.raises(ValueError, match="timestamps"):
+            detector.add_metrics("execution_time", [1.0, 2.0], [BASE_TIME])
+
+
+@pytest.mark.unit
+class TestModelState:
+    """Test saving and restoring the model."""
+
+    def test_state_round_trip(self, tmp_path: Path) -> None:
+        """A reloaded detector continues from the same window."""
+        values, stamps = _series(250, seed=3)
+        detector = AnomalyDetector()
+        detector.add_metrics("execution_time", values[:200], stamps[:200])
+        state_file = tmp_path / "anomaly_state.json"
+        detector.save_state(state_file)
+
+        restored = AnomalyDetector()
+        assert restored.load_state(state_file)
+        assert restored.get_baseline_summary().keys() == {"execution_time"}
+
+        for value, stamp in zip(values[200:], stamps[200:], strict=True):
+            detector.add_metric("execution_time", value, stamp)
+            restored.add_metric("execution_time", value, stamp)
+
+        expected = detector.baselines["execution_time"]
+        actual = restored.baselines["execution_time"]
+        assert actual.mean == pytest.approx(expected.mean)
+        assert actual.std_dev == pytest.approx(expected.std_dev)
+        assert len(restored.anomalies) == len(detector.anomalies)
+
+    def test_missing_or_incompatible_state(self, tmp_path: Path) -> None:
+        """Unreadable state is ignored rather than raising."""
+        detector = AnomalyDetector()
+        assert not detector.load_state(tmp_path / "missing.json")
+
+        stale = tmp_path / "stale.json"
+        stale.write_text('{"version": 0}')
+        assert not detector.load_state(stale)
@@ -0,0 +1,105 @@
+"""Unit tests for the content-addressed PackageBackupService."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from crackerjack.services.backup_service import PackageBackupService
+
+
+@pytest.fixture
+def package(tmp_path: Path) -> Path:
+    pkg = tmp_path / "project" / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("")
+    (pkg / "a.py").write_text("a = 1\n")
+    (pkg / "b.py").write_text("b = 2\n")
+    (pkg / "sub").mkdir()
+    (pkg / "sub" / "c.py").write_text("a = 1\n")
+    return pkg
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> PackageBackupService:
+    return PackageBackupService(backup_root=tmp_path / "backups")
+
+
+@pytest.mark.unit
+class TestContentAddressedBackups:
+    def test_backup_is_a_manifest_over_shared_objects(
+        self, service: PackageBackupService, package: Path
+    ) -> None:
+        metadata = service.create_package_backup(package)
+
+        assert (metadata.backup_directory / "manifest.json").exists()
+        assert not (metadata.backup_directory / "a.py").exists()
+        assert metadata.total_files == 4
+        # a.py and sub/c.py share content and therefore one object.
+        objects = list(service.objects_directory.glob("*/*"))
+        assert len(objects) == 3
+
+    def test_unchanged_files_are_not_reread(
+        self, service: PackageBackupService, package: Path
+    ) -> None:
+        service.create_package_backup(package)
+        (package / "b.py").write_text("b = 3\n")
+
+        original_read = Path.read_bytes
+        read_paths: list[Path] = []
+
+        def tracking_read(self: Path) -> bytes:
+            read_paths.append(self)
+            return original_read(self)
+
+        with patch.object(Path, "read_bytes", tracking_read):
+            metadata = service.create_package_backup(package)
+
+        assert read_paths == [package / "b.py"]
+        assert metadata.file_checksums["b.py"] != metadata.file_checksums["a.py"]
+
+    def test_restore_recovers_original_content(
+        self, service: PackageBackupService, package: Path
+    ) -> None:
+        metadata = service.create_package_backup(package)
+        (package / "a.py").write_text("broken\n")
+        (package / "sub" / "c.py").write_text("also broken\n")
+
+        service.restore_from_backup(metadata, package.parent)
+
+        assert (package / "a.py").read_text() == "a = 1\n"
+        assert (package / "sub" / "c.py").read_text() == "a = 1\n"
+
+    def test_validation_detects_missing_and_corrupted_objects(
+        self, service: PackageBackupService, package: Path
+    ) -> None:
+        metadata = service.create_package_backup(package)
+        blob = service._blob_path(metadata.file_checksums["b.py"])
+        blob.chmod(0o600)
+        blob.write_bytes(b"tampered")
+
+        assert service._validate_backup(metadata).is_valid
+        deep = service._validate_backup(metadata, verify_content=True)
+        assert not deep.is_valid
+        assert deep.corrupted_files == [blob]
+
+        blob.unlink()
+        assert not service._validate_backup(metadata).is_valid
+
+    def test_cleanup_keeps_objects_for_current_files(
+        self, service: PackageBackupService, package: Path
+    ) -> None:
+        first = service.create_package_backup(package)
+        (package / "b.py").write_text("b = 3\n")
+        second = service.create_package_backup(package)
+
+        service.cleanup_backup(first)
+        service.cleanup_backup(second)
+
+        old_blob = service._blob_path(first.file_checksums["b.py"])
+        new_blob = service._blob_path(second.file_checksums["b.py"])
+        assert not old_blob.exists()
+        assert new_blob.exists()
+        assert not first.backup_directory.exists()
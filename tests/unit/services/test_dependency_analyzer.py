@@ -572,3 +572,70 @@ def test_func():
         assert "edges" in graph_dict
         # Should have edge for import
         assert len(graph_dict["edges"]) >= 0
+
+
+@pytest.mark.unit
+class TestIncrementalDependencyAnalysis:
+    """Test persisted, incrementally updated import graph."""
+
+    def _make_package(self, root: Path) -> None:
+        pkg = root / "pkg"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        (pkg / "core.py").write_text("def helper():\n    pass\n")
+        (pkg / "api.py").write_text("from .core import helper\n")
+        (pkg / "cli.py").write_text("from pkg import api\nimport os\n")
+
+    def test_only_changed_files_are_reparsed(self, tmp_path: Path) -> None:
+        self._make_package(tmp_path)
+
+        first = DependencyAnalyzer(project_root=tmp_path)
+        first.analyze_project()
+        assert len(first.reparsed_files) == 4
+
+        second = DependencyAnalyzer(project_root=tmp_path)
+        graph = second.analyze_project()
+        assert second.reparsed_files == []
+        assert "function:pkg.core.helper" in graph.nodes
+
+        (tmp_path / "pkg" / "core.py").write_text("def helper2():\n    pass\n")
+        third = DependencyAnalyzer(project_root=tmp_path)
+        graph = third.analyze_project()
+        assert third.reparsed_files == ["pkg/core.py"]
+        assert "function:pkg.core.helper2" in graph.nodes
+        assert "function:pkg.core.helper" not in graph.nodes
+
+    def test_reverse_dependency_queries(self, tmp_path: Path) -> None:
+        self._make_package(tmp_path)
+
+        analyzer = DependencyAnalyzer(project_root=tmp_path)
+        analyzer.analyze_project()
+
+        assert analyzer.get_importers("pkg.core") == {"pkg.api"}
+        assert analyzer.get_importers("pkg.core", transitive=True) == {
+            "pkg.api",
+            "pkg.cli",
+        }
+        assert analyzer.get_imports("pkg.cli") == {"pkg.api", "os"}
+        assert analyzer.module_for_path(tmp_path / "pkg" / "api.py") == "pkg.api"
+
+    def test_import_graph_round_trips_through_cache(self, tmp_path: Path) -> None:
+        self._make_package(tmp_path)
+        DependencyAnalyzer(project_root=tmp_path).analyze_project()
+
+        reloaded = DependencyAnalyzer(project_root=tmp_path)
+        reloaded.analyze_project()
+
+        assert reloaded.import_graph.importers_of("pkg.api") == ["pkg.cli"]
+        assert reloaded.import_graph.node_id("pkg.core") is not None
+
+    def test_deleted_files_drop_out_of_graph(self, tmp_path: Path) -> None:
+        self._make_package(tmp_path)
+        DependencyAnalyzer(project_root=tmp_path).analyze_project()
+
+        (tmp_path / "pkg" / "cli.py").unlink()
+        analyzer = DependencyAnalyzer(project_root=tmp_path)
+        analyzer.analyze_project()
+
+        assert analyzer.get_importers("pkg.api") == set()
+        assert "pkg/cli.py" not in analyzer.file_records
@@ -467,3 +467,89 @@ class TestDetermineQualityLevel:
         level = generator._determine_quality_level(0.3)
 
         assert level == "poor"
+
+
+@pytest.mark.unit
+class TestVectorisedBucketing:
+    """Test the columnar error index behind the time-based heatmaps."""
+
+    def test_errors_counted_per_file_and_bucket(self) -> None:
+        """Out-of-order errors land in the right buckets; old ones are dropped."""
+        generator = HeatMapGenerator()
+        now = datetime.now()
+        generator.add_error_data("/src/a.py", 1, "E1", "low", now - timedelta(hours=1))
+        generator.add_error_data("/src/b.py", 1, "E1", "low", now - timedelta(hours=30))
+        generator.add_error_data("/src/a.py", 2, "E2", "low", now - timedelta(hours=5))
+        generator.add_error_data("/src/a.py", 3, "E1", "low", now - timedelta(days=9))
+
+        heatmap = generator.generate_error_frequency_heatmap(
+            timedelta(days=2), granularity="daily"
+        )
+
+        counts = {(cell.y, cell.x): cell.value for cell in heatmap.cells}
+        assert heatmap.y_labels == ["a.py", "b.py"]
+        assert counts == {(0, 0): 0, (0, 1): 2, (1, 0): 1, (1, 1): 0}
+        assert heatmap.metadata["max_errors"] == 2
+
+    def test_test_failures_grouped_by_file_name_and_type(self) -> None:
+        """Only test-related errors in the window are counted."""
+        generator = HeatMapGenerator()
+        now = datetime.now()
+        generator.add_error_data("/a/tests/test_x.py", 1, "AssertionError", "high")
+        generator.add_error_data("/b/tests/test_x.py", 1, "AssertionError", "high")
+        generator.add_error_data("/src/core.py", 1, "TestTimeout", "high")
+        generator.add_error_data("/src/core.py", 1, "TypeError", "high")
+        generator.add_error_data(
+            "/a/tests/test_x.py", 1, "KeyError", "high", now - timedelta(days=30)
+        )
+
+        heatmap = generator.generate_test_failure_heatmap()
+
+        counts = {
+            (cell.metadata["test_file"], cell.metadata["error_type"]): cell.value
+            for cell in heatmap.cells
+        }
+        assert heatmap.y_labels == ["test_x.py", "core.py"]
+        assert heatmap.x_labels == ["AssertionError", "TestTimeout"]
+        assert counts == {
+            ("test_x.py", "AssertionError"): 2,
+            ("test_x.py", "TestTimeout"): 0,
+            ("core.py", "AssertionError"): 0,
+            ("core.py", "TestTimeout"): 1,
+        }
+
+
+@pytest.mark.unit
+class TestComplexityIndex:
+    """Test complexity served from the dependency analyzer's file records."""
+
+    def test_unchanged_files_are_not_reparsed(self, tmp_path: Path) -> None:
+        """Only files that changed on disk are analysed again."""
+        (tmp_path / "a.py").write_text("def f(x):\n    return x\n")
+        (tmp_path / "b.py").write_text("def g(x):\n    if x:\n        return 1\n")
+        generator = HeatMapGenerator()
+
+        first = generator.generate_code_complexity_heatmap(tmp_path)
+        index = generator._complexity_indexes[tmp_path]
+        assert sorted(index.reparsed_files) == ["a.py", "b.py"]
+
+        (tmp_path / "b.py").write_text("def g(x):\n    return 2\n")
+        second = generator.generate_code_complexity_heatmap(tmp_path)
+
+        assert index.reparsed_files == ["b.py"]
+        assert len(first.cells) == len(second.cells) == 2
+        assert second.metadata["max_complexity"] < first.metadata["max_complexity"]
+
+    def test_index_persists_across_generators(self, tmp_path: Path) -> None:
+        """A new generator reuses the index written by the previous one."""
+        (tmp_path / "a.py").write_text("class A:\n    def m(self):\n        pass\n")
+        first = HeatMapGenerator().generate_code_complexity_heatmap(tmp_path)
+
+        generator = HeatMapGenerator()
+        second = generator.generate_code_complexity_heatmap(tmp_path)
+
+        assert generator._complexity_indexes[tmp_path].reparsed_files == []
+        assert [c.label for c in second.cells] == [c.label for c in first.cells]
+        cache_dir = tmp_path / ".crackerjack" / "cache"
+        assert (cache_dir / "dependency_files.json").exists()
+        assert not (cache_dir / "complexity_index.json").exists()
@@ -0,0 +1,165 @@
+"""Unit tests for PatternCache.
+
+Tests type and message-signature indexes, write-behind persistence,
+and usage-based eviction.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from crackerjack.models.issues import FixResult, Issue, IssueType, Priority
+from crackerjack.services.pattern_cache import (
+    PatternCache,
+    _flush_live_caches,
+    message_signature,
+)
+
+
+def _issue(message: str, issue_type: IssueType = IssueType.FORMATTING) -> Issue:
+    return Issue(type=issue_type, severity=Priority.MEDIUM, message=message)
+
+
+def _cache(
+    cache: PatternCache,
+    message: str,
+    strategy: str,
+    confidence: float = 0.8,
+    issue_type: IssueType = IssueType.FORMATTING,
+) -> str:
+    return cache.cache_successful_pattern(
+        _issue(message, issue_type),
+        {"strategy": strategy},
+        FixResult(success=True, confidence=confidence),
+    )
+
+
+@pytest.mark.unit
+class TestMessageSignature:
+    """Test issue message normalisation."""
+
+    def test_numbers_and_quoted_names_are_normalised(self) -> None:
+        """Messages differing only in names and numbers share a signature."""
+        assert message_signature("Line 12: unused import 'os'") == message_signature(
+            "line 40:  unused import `sys`"
+        )
+
+    def test_different_messages_differ(self) -> None:
+        """Unrelated messages keep distinct signatures."""
+        assert message_signature("unused import 'os'") != message_signature(
+            "missing return type"
+        )
+
+
+@pytest.mark.unit
+class TestPatternLookup:
+    """Test indexed pattern lookups."""
+
+    def test_patterns_filtered_by_type_and_ranked(self, tmp_path: Path) -> None:
+        """Only patterns of the issue type are returned, best first."""
+        cache = PatternCache(tmp_path)
+        low = _cache(cache, "a", "low", confidence=0.3)
+        high = _cache(cache, "b", "high", confidence=0.9)
+        _cache(cache, "c", "other", issue_type=IssueType.SECURITY)
+
+        patterns = cache.get_patterns_for_issue(_issue("z"))
+
+        assert [p.pattern_id for p in patterns] == [high, low]
+
+    def test_signature_match_ranks_first(self, tmp_path: Path) -> None:
+        """A pattern cached for the same message beats a higher-ranked one."""
+        cache = PatternCache(tmp_path)
+        _cache(cache, "line too long (120 > 88)", "wrap", confidence=0.9)
+        same = _cache(cache, "unused import 'os'", "drop", confidence=0.5)
+
+        best = cache.get_best_pattern_for_issue(_issue("unused import 'json'"))
+        patterns = cache.get_patterns_for_issue(_issue("unused import 'json'"))
+
+        assert best is not None
+        assert best.pattern_id == same
+        assert patterns[0].pattern_id == same
+        assert len(patterns) == 2
+
+    def test_success_rate_change_reorders(self, tmp_path: Path) -> None:
+        """Updating a success rate refreshes the cached ranking."""
+        cache = PatternCache(tmp_path)
+        first = _cache(cache, "a", "first", confidence=0.9)
+        second = _cache(cache, "b", "second", confidence=0.1)
+        assert cache.get_best_pattern_for_issue(_issue("z")).pattern_id == first
+
+        cache.use_pattern(first)
+        cache.update_pattern_success_rate(first, success=False)
+
+        assert cache._patterns[first].success_rate == 0.0
+        assert cache.get_best_pattern_for_issue(_issue("z")).pattern_id == second
+
+
+@pytest.mark.unit
+class TestWriteBehind:
+    """Test deferred persistence."""
+
+    def test_updates_are_not_written_until_flush(self, tmp_path: Path) -> None:
+        """Mutations mark the cache dirty instead of rewriting the file."""
+        cache = PatternCache(tmp_path)
+        pattern_id = _cache(cache, "a", "fix")
+        cache.use_pattern(pattern_id)
+
+        assert cache.dirty
+        assert not cache.cache_file.exists()
+
+        assert cache.flush()
+        assert not cache.dirty
+        assert not cache.flush()
+
+        data = json.loads(cache.cache_file.read_text())
+        assert data["patterns"][0]["usage_count"] == 1
+
+    def test_flush_interval_bounds_unsaved_work(self, tmp_path: Path) -> None:
+        """A zero interval writes through on every mutation."""
+        cache = PatternCache(tmp_path, flush_interval=0.0)
+        _cache(cache, "a", "fix")
+
+        assert cache.cache_file.exists()
+        assert not cache.dirty
+
+    def test_context_manager_flushes_and_reloads(self, tmp_path: Path) -> None:
+        """Leaving the context persists patterns for the next instance."""
+        with PatternCache(tmp_path) as cache:
+            pattern_id = _cache(cache, "unused import 'os'", "drop")
+
+        reloaded = PatternCache(tmp_path)
+        best = reloaded.get_best_pattern_for_issue(_issue("unused import 're'"))
+
+        assert best is not None
+        assert best.pattern_id == pattern_id
+
+    def test_unsaved_work_is_written_at_exit(self, tmp_path: Path) -> None:
+        """Caches nobody flushed are saved by the exit hook."""
+        cache = PatternCache(tmp_path)
+        pattern_id = _cache(cache, "a", "fix")
+
+        _flush_live_caches()
+
+        assert not cache.dirty
+        data = json.loads(cache.cache_file.read_text())
+        assert [p["pattern_id"] for p in data["patterns"]] == [pattern_id]
+
+
+@pytest.mark.unit
+class TestEviction:
+    """Test bounded cache size."""
+
+    def test_least_used_patterns_are_evicted(self, tmp_path: Path) -> None:
+        """Over capacity, the least used and least recent pattern goes first."""
+        cache = PatternCache(tmp_path, max_patterns=2)
+        used = _cache(cache, "a", "used")
+        idle = _cache(cache, "b", "idle")
+        cache.use_pattern(used)
+
+        newest = _cache(cache, "c", "newest")
+
+        assert set(cache._patterns) == {used, newest}
+        assert idle not in {
+            p.pattern_id for p in cache.get_patterns_for_issue(_issue("b"))
+        }
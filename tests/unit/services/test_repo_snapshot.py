@@ -0,0 +1,177 @@
+"""Unit tests for the shared per-run git status snapshot."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from crackerjack.services import git as git_module
+from crackerjack.services.git import GitService
+from crackerjack.services.incremental_scanner import IncrementalScanner
+from crackerjack.services.repo_snapshot import (
+    RepoSnapshot,
+    get_repo_snapshot,
+    invalidate_repo_snapshots,
+    parse_porcelain_v2,
+)
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "Dev")
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "b.md").write_text("# b\n")
+    (tmp_path / "gone.py").write_text("x = 1\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "first")
+    (tmp_path / "a.py").write_text("a = 2\n")
+    _git(tmp_path, "commit", "-qam", "second")
+
+    (tmp_path / "staged.py").write_text("s = 1\n")
+    _git(tmp_path, "add", "staged.py")
+    (tmp_path / "b.md").write_text("# changed\n")
+    (tmp_path / "gone.py").unlink()
+    (tmp_path / "new dir").mkdir()
+    (tmp_path / "new dir" / "untracked.py").write_text("u = 1\n")
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestParsePorcelainV2:
+    """Parsing of NUL-delimited porcelain v2 status output."""
+
+    def test_parses_all_entry_kinds(self) -> None:
+        output = (
+            "1 .M N... 100644 100644 100644 abc abc src/a.py\0"
+            "2 R. N... 100644 100644 100644 abc abc R100 new name.py\0old.py\0"
+            "u UU N... 100644 100644 100644 100644 a b c conflict.py\0"
+            "? docs/new.md\0"
+        )
+
+        entries = parse_porcelain_v2(output)
+
+        assert [e.path for e in entries] == [
+            "src/a.py",
+            "new name.py",
+            "conflict.py",
+            "docs/new.md",
+        ]
+        assert entries[1].original_path == "old.py"
+        assert entries[0].is_unstaged() and not entries[0].is_staged()
+        assert entries[1].is_staged()
+        assert entries[3].is_untracked
+
+
+@pytest.mark.unit
+class TestRepoSnapshot:
+    """One status call shared by every changed-file query."""
+
+    def test_serves_every_query_from_one_status_call(self, repo: Path) -> None:
+        snapshot = RepoSnapshot(repo)
+
+        assert snapshot.staged() == ["staged.py"]
+        assert snapshot.unstaged() == ["b.md"]
+        assert snapshot.unstaged(include_deleted=True) == ["b.md", "gone.py"]
+        assert snapshot.untracked() == ["new dir/untracked.py"]
+        assert snapshot.by_extension([".py"]) == [repo.resolve() / "staged.py"]
+        assert snapshot.git_calls == 1
+
+    def test_since_ref_queries_are_cached(self, repo: Path) -> None:
+        snapshot = RepoSnapshot(repo)
+
+        assert snapshot.changed_since("HEAD~1", "HEAD") == ["a.py"]
+        assert snapshot.changed_since("HEAD~1", "HEAD") == ["a.py"]
+        assert snapshot.git_calls == 1
+        assert snapshot.changed_since("no-such-ref") is None
+
+    def test_refresh_loads_status_and_base_diff(self, repo: Path) -> None:
+        snapshot = RepoSnapshot(repo, base_ref="HEAD~1")
+        snapshot.refresh()
+        calls = snapshot.git_calls
+
+        snapshot.changed()
+        snapshot.changed_since("HEAD~1", "HEAD")
+
+        assert snapshot.git_calls == calls == 2
+
+    def test_consumer_queries_after_refresh_run_no_git(self, repo: Path) -> None:
+        snapshot = get_repo_snapshot(repo)
+        snapshot.refresh()
+        calls = snapshot.git_calls
+
+        scanned = IncrementalScanner(repo)._get_changed_files_git()
+        uncommitted = snapshot.changed_since("HEAD")
+
+        assert snapshot.git_calls == calls
+        assert scanned == [repo.resolve() / "a.py"]
+        diff = subprocess.run(
+            ["git", "diff", "--name-only", "HEAD"],
+            cwd=repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert sorted(uncommitted or []) == diff.stdout.split()
+
+    def test_invalidation_picks_up_new_writes(self, repo: Path) -> None:
+        snapshot = get_repo_snapshot(repo)
+        assert "a.py" not in snapshot.unstaged()
+
+        (repo / "a.py").write_text("a = 3\n")
+        assert "a.py" not in snapshot.unstaged()
+
+        invalidate_repo_snapshots()
+        assert "a.py" in snapshot.unstaged()
+
+    def test_git_service_uses_snapshot_and_invalidates_on_add(self, repo: Path) -> None:
+        snapshot = get_repo_snapshot(repo)
+        service = GitService(pkg_path=repo, snapshot=snapshot)
+
+        assert sorted(service.get_changed_files()) == [
+            "b.md",
+            "new dir/untracked.py",
+            "staged.py",
+        ]
+
+        service.add_files(["b.md"])
+
+        assert not snapshot.is_loaded
+        assert "b.md" in service.get_staged_files()
+
+    def test_git_service_invalidates_after_the_command(
+        self, repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        snapshot = get_repo_snapshot(repo)
+        service = GitService(pkg_path=repo, snapshot=snapshot)
+        real = git_module.execute_secure_subprocess
+
+        def run_while_reloading(**kwargs: object) -> object:
+            result = real(**kwargs)
+            # Another thread reloads while git is still running.
+            snapshot.entries()
+            return result
+
+        monkeypatch.setattr(
+            git_module, "execute_secure_subprocess", run_while_reloading
+        )
+        service.add_files(["b.md"])
+
+        assert not snapshot.is_loaded
+
+    def test_base_ref_is_configurable(self, repo: Path) -> None:
+        snapshot = get_repo_snapshot(repo, base_ref="HEAD~1")
+        assert get_repo_snapshot(repo).base_ref == "HEAD~1"
+
+        get_repo_snapshot(repo, base_ref="HEAD")
+        snapshot.refresh()
+
+        assert snapshot.base_ref == "HEAD"
+        assert ("HEAD", "HEAD") in snapshot._diffs
@@ -0,0 +1,226 @@
+"""Unit tests for RunHistory.
+
+Tests sample recording, percentile/trend/regression queries, and the hook
+executor and child-process usage integrations.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crackerjack.config.hooks import HookDefinition, HookStrategy
+from crackerjack.executors.hook_executor import HookExecutionResult, HookExecutor
+from crackerjack.executors.process_monitor import ChildUsage
+from crackerjack.models.task import HookResult
+from crackerjack.services.run_history import (
+    BATCH,
+    HOOK,
+    PHASE,
+    RunHistory,
+    RunSample,
+    tool_version,
+)
+
+DAY = 86400.0
+
+
+def _sample(name: str, duration: float, **kwargs: object) -> RunSample:
+    return RunSample(kind=HOOK, name=name, duration=duration, **kwargs)  # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+class TestQueries:
+    """Test percentile, trend and regression queries."""
+
+    def test_percentiles_exclude_cache_hits(self, tmp_path: Path) -> None:
+        """Cache hits did no work and are left out of cost percentiles."""
+        with RunHistory(tmp_path / "history.db") as history:
+            recorder = history.start_run()
+            for duration in range(1, 101):
+                recorder.record(_sample("ruff-check", float(duration)))
+            recorder.record(_sample("ruff-check", 0.0, cache_hit=True))
+
+            pcts = history.percentiles("ruff-check")
+
+            assert pcts[50.0] == pytest.approx(50.5)
+            assert pcts[99.0] == pytest.approx(99.01)
+            assert len(history.durations("ruff-check", include_cache_hits=True)) == 101
+            assert history.percentiles("unknown") == {}
+
+    def test_trend_is_seconds_per_run(self, tmp_path: Path) -> None:
+        """A steadily slowing hook has a positive slope."""
+        with RunHistory(tmp_path / "history.db") as history:
+            recorder = history.start_run()
+            for i in range(10):
+                recorder.record(_sample("zuban", 10.0 + 0.5 * i, recorded_at=i))
+
+            assert history.trend("zuban") == pytest.approx(0.5)
+            assert history.trend("missing") is None
+
+    def test_regressions_by_tool_version(self, tmp_path: Path) -> None:
+        """A version whose median is over the threshold is reported."""
+        with RunHistory(tmp_path / "history.db") as history:
+            recorder = history.start_run()
+            stamp = 0.0
+            for version, duration in (("1.0", 2.0), ("1.1", 2.1), ("2.0", 3.0)):
+                for _ in range(3):
+                    stamp += 1
+                    recorder.record(
+                        _sample(
+                            "refurb",
+                            duration,
+                            tool_version=version,
+                            recorded_at=stamp,
+                        )
+                    )
+
+            (regression,) = history.regressions(threshold=1.2)
+
+            assert (regression.previous_version, regression.version) == ("1.1", "2.0")
+            assert regression.ratio == pytest.approx(3.0 / 2.1)
+
+    def test_summary_per_hook(self, tmp_path: Path) -> None:
+        """Summaries combine cost, failure and cache statistics."""
+        with RunHistory(tmp_path / "history.db") as history:
+            recorder = history.start_run()
+            recorder.record(_sample("ty", 4.0, cpu_seconds=3.0, cache_hit=False))
+            recorder.record(
+                _sample("ty", 2.0, status="failed", peak_rss_mb=120.0, cache_hit=False)
+            )
+            recorder.record(_sample("ty", 0.0, cache_hit=True))
+
+            summary = history.summary()["ty"]
+
+            assert summary["count"] == 3
+            assert summary["p50"] == pytest.approx(3.0)
+            assert summary["failure_rate"] == pytest.approx(1 / 3)
+            assert summary["cache_hit_rate"] == pytest.approx(1 / 3)
+            assert summary["mean_cpu_seconds"] == 3.0
+            assert summary["max_peak_rss_mb"] == 120.0
+
+
+@pytest.mark.unit
+class TestRecording:
+    """Test how runs, phases and hooks are stored."""
+
+    def test_execution_records_hooks_and_phase(self, tmp_path: Path) -> None:
+        """Each hook and the phase are stored; the run keeps its outcome."""
+        strategy = HookStrategy(
+            name="fast",
+            hooks=[HookDefinition(name="ruff-check", command=["ruff", "check"])],
+        )
+        execution = HookExecutionResult(
+            strategy_name="fast",
+            results=[
+                HookResult(
+                    name="ruff-check",
+                    status="failed",
+                    duration=1.5,
+                    exit_code=1,
+                    files_processed=7,
+                    resource_usage={"cpu_seconds": 1.2, "peak_memory_mb": 40.0},
+                )
+            ],
+            total_duration=2.0,
+            success=False,
+        )
+
+        with RunHistory(tmp_path / "history.db") as history:
+            recorder = history.start_run()
+            recorder.record_execution(execution, strategy)
+
+            assert history.durations("ruff-check").tolist() == [1.5]
+            assert history.durations("fast", PHASE).tolist() == [2.0]
+            assert history.durations("fast", PHASE, column="cpu_seconds").tolist() == [
+                1.2
+            ]
+            (row,) = history._query("SELECT success, finished_at FROM runs")
+            assert row[0] == 0
+            assert row[1] is not None
+
+    def test_samples_survive_reopen(self, tmp_path: Path) -> None:
+        """Pending samples are flushed on close and read back later."""
+        with RunHistory(tmp_path / "history.db") as history:
+            history.start_run().record(_sample("ruff-format", 0.3))
+
+        with RunHistory(tmp_path / "history.db") as history:
+            assert history.names() == ["ruff-format"]
+
+    def test_old_runs_are_pruned(self, tmp_path: Path) -> None:
+        """Runs past retention are dropped along with their samples."""
+        with RunHistory(tmp_path / "history.db", retention_days=30) as history:
+            old = history.start_run(started_at=time.time() - 40 * DAY)
+            old.record(_sample("old", 1.0))
+            history.flush()
+
+            history.start_run()
+
+            assert history.names() == []
+
+    def test_invalid_column_rejected(self, tmp_path: Path) -> None:
+        """Only known numeric columns can be queried."""
+        with RunHistory(tmp_path / "history.db") as history:
+            with pytest.raises(ValueError, match="Unknown sample column"):
+                history.durations("x", column="name; DROP TABLE runs")
+
+    def test_tool_version_from_command(self) -> None:
+        """Versions come from installed distribution metadata."""
+        assert (
+            tool_version([sys.executable, "-m", "pytest", "-q"]) == pytest.__version__
+        )
+        assert tool_version(["uv", "run", "pytest"]) == pytest.__version__
+        assert tool_version(["no-such-tool-xyz"]) is None
+
+
+@pytest.mark.unit
+class TestExecutorIntegration:
+    """Test usage measurement and per-batch samples in the hook executor."""
+
+    def test_file_batches_are_recorded(self, tmp_path: Path) -> None:
+        """Every batch of a batchable hook becomes a sample."""
+        hook = HookDefinition(
+            name="codespell",
+            command=["codespell"],
+            accepts_file_paths=True,
+            max_batches=4,
+        )
+        files = [Path(f"pkg/module_{i:03d}.py") for i in range(64)]
+        executor = HookExecutor(MagicMock(), tmp_path, quiet=True)
+        executor._get_changed_files_for_hook = MagicMock(return_value=files)  # type: ignore[method-assign]
+        executor._get_clean_environment = MagicMock(return_value={})  # type: ignore[method-assign]
+
+        with RunHistory(tmp_path / "history.db") as history:
+            executor.run_recorder = history.start_run()
+            with patch(
+                "crackerjack.executors.hook_executor.subprocess.run",
+                return_value=subprocess.CompletedProcess(["codespell"], 0, "", ""),
+            ):
+                executor._run_hook_subprocess(hook)
+
+            rows = history._query(
+                "SELECT files, exit_code FROM samples WHERE kind = ?", (BATCH,)
+            )
+            assert len(rows) == 4
+            assert sum(row[0] for row in rows) == 64
+            assert {row[1] for row in rows} == {0}
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs resource module")
+    def test_child_usage_measures_sequential_commands(self) -> None:
+        """A command run alone gets its CPU time attributed."""
+        with ChildUsage() as usage:
+            subprocess.run([sys.executable, "-c", "sum(range(3_000_000))"], check=True)
+
+        assert usage.usage["cpu_seconds"] > 0
+
+    def test_child_usage_skips_overlapping_commands(self) -> None:
+        """Overlapping measurements cannot be told apart and record nothing."""
+        with ChildUsage() as outer:
+            with ChildUsage() as inner:
+                subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+        assert outer.usage == {}
+        assert inner.usage == {}
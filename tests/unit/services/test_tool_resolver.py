@@ -0,0 +1,153 @@
+"""Unit tests for ToolResolver.
+
+Tests direct execution of `uv run` tools from a synced venv, lockfile
+staleness, the explicit refresh and the hook executor integration.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crackerjack.config.hooks import HookDefinition
+from crackerjack.executors.hook_executor import HookExecutor
+from crackerjack.services.tool_resolver import (
+    MARKER_VERSION,
+    ToolResolver,
+    get_tool_resolver,
+)
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.delenv("UV_PROJECT_ENVIRONMENT", raising=False)
+    (tmp_path / "uv.lock").write_text("version = 1\n")
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+    bin_dir = tmp_path / ".venv" / ("Scripts" if os.name == "nt" else "bin")
+    bin_dir.mkdir(parents=True)
+    tool = bin_dir / "mytool"
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(0o755)
+    return tmp_path
+
+
+def _mark_synced(resolver: ToolResolver) -> None:
+    resolver.marker_path.parent.mkdir(parents=True, exist_ok=True)
+    resolver.marker_path.write_text(
+        json.dumps({"version": MARKER_VERSION, "fingerprint": resolver._fingerprint()})
+    )
+
+
+@pytest.mark.unit
+class TestResolve:
+    """Test rewriting of `uv run` commands."""
+
+    def test_direct_exec_once_synced(self, project: Path) -> None:
+        """A recorded sync lets the tool run straight from the venv."""
+        resolver = ToolResolver(project)
+        command = ["uv", "run", "mytool", "--check"]
+
+        assert resolver.resolve(command) == (command, None)
+
+        _mark_synced(resolver)
+        resolved, env = resolver.resolve(command, {"PATH": "/usr/bin"})
+
+        assert resolved == [str(resolver.bin_dir / "mytool"), "--check"]
+        assert env is not None
+        assert env["VIRTUAL_ENV"] == str(project / ".venv")
+        assert env["PATH"].split(os.pathsep) == [str(resolver.bin_dir), "/usr/bin"]
+
+    def test_unsupported_commands_unchanged(self, project: Path) -> None:
+        """uv options, tools missing from the venv and plain commands pass through."""
+        resolver = ToolResolver(project)
+        _mark_synced(resolver)
+
+        for command in (
+            ["uv", "run", "--with", "rich", "mytool"],
+            ["uv", "run", "not-installed"],
+            ["ruff", "check"],
+            ["uv", "lock"],
+        ):
+            assert resolver.resolve(command) == (command, None)
+
+    def test_lockfile_change_makes_it_stale(self, project: Path) -> None:
+        """Only a content change invalidates the recorded sync."""
+        resolver = ToolResolver(project)
+        _mark_synced(resolver)
+        command = ["uv", "run", "mytool"]
+
+        (project / "uv.lock").touch()
+        os.utime(project / "uv.lock", ns=(1, 1))
+        assert resolver.resolve(command)[1] is not None
+
+        (project / "uv.lock").write_text("version = 2\n")
+        assert resolver.resolve(command) == (command, None)
+
+    def test_disabled_without_lockfile(self, tmp_path: Path) -> None:
+        """Projects that uv does not manage are left alone."""
+        resolver = ToolResolver(tmp_path)
+
+        assert not resolver.is_current()
+        assert not resolver.prepare()
+
+
+@pytest.mark.unit
+class TestRefresh:
+    """Test the explicit sync when the lockfile changed."""
+
+    @pytest.mark.skipif(shutil.which("uv") is None, reason="needs uv")
+    def test_prepare_syncs_once(self, project: Path) -> None:
+        """A stale environment is synced once and then recorded as current."""
+        resolver = ToolResolver(project)
+
+        with patch(
+            "crackerjack.services.tool_resolver.subprocess.run",
+            return_value=subprocess.CompletedProcess([], 0, "", ""),
+        ) as mock_run:
+            assert resolver.prepare()
+            assert resolver.prepare()
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == ["uv", "sync", "--inexact"]
+        assert ToolResolver(project).is_current()
+
+    @pytest.mark.skipif(shutil.which("uv") is None, reason="needs uv")
+    def test_failed_sync_keeps_uv_run(self, project: Path) -> None:
+        """A failed sync records nothing and commands keep going through uv."""
+        resolver = ToolResolver(project)
+
+        with patch(
+            "crackerjack.services.tool_resolver.subprocess.run",
+            return_value=subprocess.CompletedProcess([], 1, "", "boom"),
+        ):
+            assert not resolver.prepare()
+
+        assert not resolver.marker_path.exists()
+        assert resolver.resolve(["uv", "run", "mytool"])[1] is None
+
+
+@pytest.mark.unit
+class TestExecutorIntegration:
+    """Test hooks exec'ing resolved tools."""
+
+    def test_hook_runs_resolved_executable(self, project: Path) -> None:
+        """The executor spawns the venv executable with the venv environment."""
+        _mark_synced(get_tool_resolver(project))
+        hook = HookDefinition(name="mytool", command=["uv", "run", "mytool", "-q"])
+        executor = HookExecutor(MagicMock(), project, quiet=True)
+        executor._get_clean_environment = MagicMock(return_value={"PATH": "/usr/bin"})  # type: ignore[method-assign]
+
+        with patch(
+            "crackerjack.executors.hook_executor.subprocess.run",
+            return_value=subprocess.CompletedProcess([], 0, "", ""),
+        ) as mock_run:
+            executor._run_hook_subprocess(hook)
+
+        command = mock_run.call_args.args[0]
+        assert command[0] == str(project.resolve() / ".venv" / "bin" / "mytool")
+        assert command[1:] == ["-q"]
+        assert mock_run.call_args.kwargs["env"]["VIRTUAL_ENV"].endswith(".venv")
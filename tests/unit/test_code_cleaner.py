@@ -12,6 +12,7 @@ from crackerjack.code_cleaner import (
     PackageCleaningResult,
     SafePatternApplicator,
 )
+from crackerjack.services.process_pool import shard_items
 
 
 def create_mock_console() -> MagicMock:
@@ -407,3 +408,70 @@ class TestCodeCleanerEdgeCases:
         finally:
             # Clean up
             temp_file.unlink()
+
+
+class TestCodeCleanerParallel:
+    """Test process-pool cleaning mode."""
+
+    def _make_files(self, root: Path, count: int) -> list[Path]:
+        pkg = root / "pkg"
+        pkg.mkdir()
+        files = []
+        for i in range(count):
+            path = pkg / f"mod_{i:02d}.py"
+            path.write_text(f'"""Doc {i}."""\nx = {i}  # comment\n')
+            files.append(path)
+        return files
+
+    def test_small_batches_stay_in_process(self, tmp_path: Path) -> None:
+        cleaner = CodeCleaner(console=create_mock_console(), base_directory=tmp_path)
+        files = self._make_files(tmp_path, 3)
+
+        with patch("crackerjack.code_cleaner.ProcessPoolExecutor") as pool:
+            results = cleaner.clean_files_parallel(files)
+
+        pool.assert_not_called()
+        assert [r.file_path for r in results] == files
+
+    def test_shard_files_preserves_order(self) -> None:
+        files = [Path(f"f{i}.py") for i in range(10)]
+        shards = shard_items(files, 2)
+
+        assert len(shards) == 8
+        assert [f for shard in shards for f in shard] == files
+
+    def test_worker_pool_returns_results_in_input_order(self, tmp_path: Path) -> None:
+        cleaner = CodeCleaner(
+            console=create_mock_console(),
+            base_directory=tmp_path,
+            max_workers=2,
+            parallel_threshold=2,
+        )
+        files = self._make_files(tmp_path, 6)
+
+        with patch("crackerjack.code_cleaner.invalidate_repo_snapshots") as invalidate:
+            results = cleaner.clean_files_parallel(files, full_cleaning=True)
+
+        assert [r.file_path for r in results] == files
+        assert all(r.success for r in results)
+        assert files[0].read_text() == "x = 0\n"
+        # Worker rewrites are invisible to this process's snapshots.
+        invalidate.assert_called()
+
+    def test_pool_unavailable_falls_back_to_sequential(self, tmp_path: Path) -> None:
+        cleaner = CodeCleaner(
+            console=create_mock_console(),
+            base_directory=tmp_path,
+            max_workers=4,
+            parallel_threshold=2,
+        )
+        files = self._make_files(tmp_path, 4)
+
+        with patch(
+            "crackerjack.code_cleaner.ProcessPoolExecutor",
+            side_effect=OSError("no semaphores"),
+        ):
+            results = cleaner.clean_files_parallel(files)
+
+        assert [r.file_path for r in results] == files
+        assert all(r.success for r in results)
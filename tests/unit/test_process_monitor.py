@@ -1,15 +1,103 @@
-from unittest.mock import patch
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 
 from crackerjack.executors.process_monitor import ProcessMonitor
 
+PYTHON = sys.executable
+
+
+@pytest.fixture
+def monitor():
+    monitor = ProcessMonitor(check_interval=0.05, stall_timeout=0.2, kill_grace=0.3)
+    yield monitor
+    monitor.shutdown()
+
+
+def test_run_captures_output_and_usage(monitor: ProcessMonitor) -> None:
+    result, metrics = monitor.run(
+        [PYTHON, "-c", "import sys, time; print('out'); time.sleep(0.3); sys.exit(3)"],
+        "hook",
+        timeout=10,
+    )
+
+    assert result.returncode == 3
+    assert result.stdout.strip() == "out"
+    assert metrics.output_bytes >= 4
+    assert metrics.peak_memory_mb > 0
+    assert monitor.active_count == 0
+
+
+def test_timeout_terminates_and_raises(monitor: ProcessMonitor) -> None:
+    started = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+        monitor.run(
+            [PYTHON, "-c", "import time; print('partial', flush=True); time.sleep(30)"],
+            "hook",
+            timeout=0.5,
+        )
+
+    # Well short of the 30s sleep, with room for a loaded machine.
+    assert time.monotonic() - started < 20
+    assert b"partial" in exc_info.value.stdout
+
+
+def test_timeout_reaches_children_left_holding_the_pipes(
+    monitor: ProcessMonitor,
+) -> None:
+    started = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+        monitor.run(["sh", "-c", "echo hi; sleep 30 & exit 0"], "hook", timeout=0.5)
+
+    assert time.monotonic() - started < 20
+    assert exc_info.value.stdout == b"hi\n"
+    assert monitor.active_count == 0
+
+
+def test_stall_escalates_warn_then_terminate() -> None:
+    stalls: list[str] = []
+    monitor = ProcessMonitor(
+        check_interval=0.05, stall_timeout=0.2, terminate_after=0.6, kill_grace=0.3
+    )
+    try:
+        result, metrics = monitor.run(
+            [PYTHON, "-c", "import time; time.sleep(30)"],
+            "stuck",
+            timeout=20,
+            on_stall=lambda name, _: stalls.append(name),
+        )
+    finally:
+        monitor.shutdown()
+
+    assert stalls == ["stuck"]
+    assert metrics.escalation in {"terminated", "killed"}
+    assert result.returncode != 0
+
+
+def test_kill_follows_ignored_sigterm() -> None:
+    monitor = ProcessMonitor(
+        check_interval=0.05, stall_timeout=0.1, terminate_after=0.2, kill_grace=0.2
+    )
+    script = (
+        "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+        "time.sleep(30)"
+    )
+    try:
+        _, metrics = monitor.run([PYTHON, "-c", script], "stubborn", timeout=20)
+    finally:
+        monitor.shutdown()
+
+    assert metrics.escalation == "killed"
 
-def test_get_process_metrics_handles_permission_error() -> None:
-    monitor = ProcessMonitor(check_interval=1.0)
 
-    with patch(
-        "crackerjack.executors.process_monitor.subprocess.run",
-        side_effect=PermissionError("Operation not permitted"),
-    ):
-        metrics = monitor._get_process_metrics(1234, elapsed=5.0)
+def test_one_supervisor_serves_concurrent_hooks(monitor: ProcessMonitor) -> None:
+    command = [PYTHON, "-c", "import time; time.sleep(0.3); print('done')"]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(
+            pool.map(lambda i: monitor.run(command, f"hook-{i}", timeout=10), range(8))
+        )
 
-    assert metrics is None
+    assert all(result.stdout.strip() == "done" for result, _ in results)